@@ -0,0 +1,93 @@
+import random
+from timeit import repeat
+
+import click
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+from rovr.functions.ansi import ansi_to_rich_text
+
+console = Console()
+
+# roughly what bat emits with a truecolor theme and --style=numbers
+PALETTE = [
+    (216, 222, 233),
+    (129, 161, 193),
+    (163, 190, 140),
+    (235, 203, 139),
+    (180, 142, 173),
+    (191, 97, 106),
+    (136, 192, 208),
+]
+WORDS = [
+    "def",
+    "return",
+    "self",
+    "import",
+    "from",
+    "class",
+    "None",
+    "True",
+    "=",
+    "(",
+    ")",
+    ":",
+    "config",
+    "path",
+    "0",
+    "'text'",
+]
+
+
+def make_bat_output(lines: int, tokens_per_line: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    output: list[str] = []
+    for number in range(1, lines + 1):
+        line = [f"\x1b[38;2;76;86;106m{number:>4}\x1b[0m "]
+        for _ in range(tokens_per_line):
+            red, green, blue = rng.choice(PALETTE)
+            bold = "1;" if rng.random() < 0.1 else ""
+            line.append(
+                f"\x1b[{bold}38;2;{red};{green};{blue}m{rng.choice(WORDS)}\x1b[0m "
+            )
+        output.append("".join(line))
+    return "\n".join(output) + "\n"
+
+
+@click.command(help="Benchmark rovr's ANSI parser against rich's Text.from_ansi")
+@click.option("--lines", default=200, show_default=True, help="Lines of output")
+@click.option(
+    "--tokens", default=12, show_default=True, help="Highlighted tokens per line"
+)
+@click.option("--number", default=20, show_default=True, help="Conversions per round")
+@click.option("--rounds", default=5, show_default=True, help="Rounds (best is shown)")
+def main(lines: int, tokens: int, number: int, rounds: int) -> None:
+    sample = make_bat_output(lines, tokens)
+    console.print(
+        f"{len(sample):,} characters, {sample.count(chr(27)):,} escape sequences"
+    )
+
+    table = Table(title="ANSI to Rich Text", padding=(0, 2))
+    table.add_column("Parser")
+    table.add_column("Best per conversion", justify="right")
+    table.add_column("Relative", justify="right")
+
+    results = {
+        "rovr.functions.ansi": min(
+            repeat(lambda: ansi_to_rich_text(sample), number=number, repeat=rounds)
+        )
+        / number,
+        "rich Text.from_ansi": min(
+            repeat(lambda: Text.from_ansi(sample), number=number, repeat=rounds)
+        )
+        / number,
+    }
+    baseline = results["rovr.functions.ansi"]
+    for name, seconds in results.items():
+        table.add_row(name, f"{seconds * 1000:.3f} ms", f"{seconds / baseline:.2f}x")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+from os import path
+from time import perf_counter
+from timeit import repeat
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from rovr.functions import config
+from rovr.variables.maps import RovrVars
+
+console = Console()
+
+SNAPSHOT = path.join(RovrVars.ROVRTEMP, "config.marshal")
+# what the app imports before it can draw anything
+STARTUP_IMPORT = "import rovr.variables.constants"
+
+
+def drop_snapshot() -> None:
+    if path.isfile(SNAPSHOT):
+        os.remove(SNAPSHOT)
+
+
+def time_startup(cold: bool, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        if cold:
+            drop_snapshot()
+        start = perf_counter()
+        subprocess.run([sys.executable, "-c", STARTUP_IMPORT], check=True)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def time_load_config(cold: bool, number: int, rounds: int) -> float:
+    def load() -> None:
+        if cold:
+            drop_snapshot()
+        config.load_config()
+
+    # leave a snapshot behind for the warm rounds
+    config.load_config()
+    return min(repeat(load, number=number, repeat=rounds)) / number
+
+
+@click.command(help="Benchmark rovr's config loading, with and without a snapshot")
+@click.option("--number", default=20, show_default=True, help="Loads per round")
+@click.option("--rounds", default=5, show_default=True, help="Rounds (best is shown)")
+@click.option(
+    "--launches", default=10, show_default=True, help="Interpreter launches per case"
+)
+def main(number: int, rounds: int, launches: int) -> None:
+    console.print(f"snapshot: {SNAPSHOT}")
+
+    table = Table(title="Config loading", padding=(0, 2))
+    table.add_column("Case")
+    table.add_column("Best", justify="right")
+    table.add_column("Relative", justify="right")
+
+    results = {
+        "load_config, snapshot": time_load_config(False, number, rounds),
+        "load_config, parsed": time_load_config(True, number, rounds),
+    }
+    config.load_config()
+    results["launch, snapshot"] = time_startup(False, launches)
+    results["launch, parsed"] = time_startup(True, launches)
+    config.load_config()
+
+    for case in ("load_config", "launch"):
+        baseline = results[f"{case}, snapshot"]
+        for name in (f"{case}, snapshot", f"{case}, parsed"):
+            seconds = results[name]
+            table.add_row(
+                name, f"{seconds * 1000:.3f} ms", f"{seconds / baseline:.2f}x"
+            )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
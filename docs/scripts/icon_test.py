@@ -3,7 +3,8 @@ from rich.console import Console
 from rich.table import Table
 
 from rovr.functions.icons import get_icon_for_file, get_icon_for_folder
-from rovr.variables.maps import FILE_MAP, FILES_MAP, FOLDER_MAP, ICONS
+from rovr.variables.icon_maps import FILE_MAP, FILES_MAP, FOLDER_MAP
+from rovr.variables.maps import ICONS
 
 console = Console()
 
@@ -6,6 +6,8 @@
 # nuitka-project: --enable-plugin=options-nanny
 # nuitka-project: --enable-plugins=no-qt
 # nuitka-project: --include-data-dir=src/rovr=_rovr
+# nuitka-project: --include-package=rovr.components
+# nuitka-project: --include-package=rovr.screens
 # nuitka-project: --nofollow-import-to="tkinter"
 # nuitka-project: --nofollow-import-to=aiohttp
 # nuitka-project: --noinclude-custom-mode=pygments:bytecode
@@ -40,7 +42,7 @@ import os
 import sys
 import warnings
 from io import TextIOWrapper
-from typing import Callable, cast
+from typing import TYPE_CHECKING, Callable, cast
 
 from rovr import main, pprint
 from rovr.functions.cli import (
@@ -50,6 +52,9 @@ from rovr.functions.cli import (
     existing_dir,
 )
 
+if TYPE_CHECKING:
+    from rovr.functions.startup_profile import StartupProfile
+
 logging.getLogger("textual_image._terminal").setLevel(logging.FATAL)
 warnings.filterwarnings("ignore")
 
@@ -195,6 +200,12 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run rovr in development mode.",
     )
+    dev_group.add_argument(
+        "--profile-startup",
+        dest="profile_startup",
+        action="store_true",
+        help="Time every import and widget until the first frame, then exit.",
+    )
     dev_group.add_argument(
         "--list-preview-themes",
         dest="list_preview_themes",
@@ -246,6 +257,13 @@ def cli(argv: list[str] | None = None) -> None:
     parser = _build_parser()
     args = parser.parse_args(argv)
 
+    startup_profile: StartupProfile | None = None
+    if args.profile_startup:
+        from rovr.functions import startup_profile as profiler
+
+        startup_profile = profiler.StartupProfile()
+        startup_profile.install()
+
     eager_set_folder(args.config_folder)
 
     global is_dev
@@ -393,6 +411,9 @@ example_function(10)"""
     from rovr.functions.config import set_nested_value
     from rovr.variables.constants import config
 
+    if startup_profile is not None:
+        startup_profile.mark("config loaded")
+
     for feature_path in args.with_features:
         set_nested_value(cast(dict, config), feature_path, True)
 
@@ -408,6 +429,9 @@ example_function(10)"""
 
     from rovr.app import Application
 
+    if startup_profile is not None:
+        startup_profile.mark("app imported")
+
     if chooser_file == "__stdout__":
         chooser_file = backup_stdout
     elif chooser_file == "__stderr__":
@@ -424,7 +448,9 @@ example_function(10)"""
         chooser_file=chooser_file if chooser_file else None,
         show_keys=args.show_keys,
         force_crash_in=args.force_crash_in,
-        force_exit_on_shutdown=True,
+        # the report is printed after the app has shut down
+        force_exit_on_shutdown=startup_profile is None,
+        startup_profile=startup_profile,
     )
 
     if args.tree_dom:
@@ -484,6 +510,11 @@ example_function(10)"""
         print("Error: rovr needs a TTY to run in application.")
         exit(1)
 
+    if startup_profile is not None:
+        startup_profile.uninstall()
+        if not startup_profile.report():
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
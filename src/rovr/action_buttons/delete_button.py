@@ -1,7 +1,6 @@
 from textual.widgets import Button
 
 from rovr.functions.icons import get_icon
-from rovr.screens import DeleteFiles
 from rovr.variables.constants import config
 
 
@@ -19,6 +18,8 @@ class DeleteButton(Button):
 
     async def on_button_pressed(self) -> None:
         """Delete selected files or directories"""
+        from rovr.screens import DeleteFiles
+
         if self.disabled:
             return
         selected_files = await self.app.file_list.get_selected_objects()
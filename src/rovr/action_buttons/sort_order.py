@@ -158,6 +158,12 @@ class SortOrderPopup(PopupOptionList):
                 state_manager.custom_sort_enabled,
                 id="custom_sort",
             ),
+            SortOrderPopupOptions(
+                "",  # No keybind for this option
+                "And subfolders",
+                state_manager.custom_sort_recursive,
+                id="custom_sort_recursive",
+            ),
         ])
         # just do a quick width check
         width = 0
@@ -201,6 +207,9 @@ class SortOrderPopup(PopupOptionList):
         elif event.option.id == "custom_sort":
             # Toggle custom sort for this folder
             state_manager.toggle_custom_sort()
+        elif event.option.id == "custom_sort_recursive":
+            # Toggle whether the custom sort is inherited by subfolders
+            state_manager.toggle_custom_sort_recursive()
         else:
             state_manager.set_sort_preference(
                 sort_by=cast(SortByOptions, event.option.id)
@@ -209,11 +218,11 @@ class SortOrderPopup(PopupOptionList):
         # Refresh file list to apply the change
         self.app.file_list.update_file_list(add_to_session=False)
 
-        if event.option.id != "custom_sort":
+        if event.option.id not in ("custom_sort", "custom_sort_recursive"):
             self.go_hide()
         else:
             self.pre_show()
-            self.highlighted = self.get_option_index("custom_sort")
+            self.highlighted = self.get_option_index(event.option.id)
         self.button.update_icon()
 
     async def on_key(self, event: events.Key) -> None:
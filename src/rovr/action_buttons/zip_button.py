@@ -10,7 +10,6 @@ from rovr.classes.textual_validators import (
 from rovr.functions.cwd import getcwd
 from rovr.functions.icons import get_icon
 from rovr.functions.path import normalise
-from rovr.screens import ArchiveCreationScreen
 from rovr.variables.constants import config
 
 
@@ -24,6 +23,8 @@ class ZipButton(Button):
 
     @work
     async def on_button_pressed(self) -> None:
+        from rovr.screens import ArchiveCreationScreen
+
         if self.disabled:
             return
         selected_files = await self.app.file_list.get_selected_objects()
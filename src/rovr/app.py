@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import multiprocessing
 import os
 import sys
 import threading
@@ -9,7 +8,7 @@ from contextlib import suppress
 from io import TextIOWrapper
 from os import path
 from subprocess import Popen, TimeoutExpired
-from typing import Callable, Iterable
+from typing import TYPE_CHECKING, Callable, Iterable
 
 from rich.console import RenderableType
 from rich.protocol import is_renderable
@@ -52,6 +51,7 @@ from rovr.action_buttons import (
 from rovr.action_buttons.sort_order import SortOrderButton
 from rovr.classes.app_mixins import DragAndDrop, ThemeHandler
 from rovr.classes.mixins import Action, Actionable
+from rovr.classes.poller import Poller, PollJob
 from rovr.classes.theme import RovrStylesheet
 from rovr.components.popup_option_list import PopupOptionList
 from rovr.core import (
@@ -62,8 +62,9 @@ from rovr.core import (
     PreviewContainer,
 )
 from rovr.footer import Clipboard, MetadataContainer, ProcessContainer
-from rovr.functions import drive_workers, multiprocessing_utils
+from rovr.functions import drive_workers
 from rovr.functions.cwd import chdir, getcwd
+from rovr.functions.frecency import get_frecency_database
 from rovr.functions.path import (
     dump_exc,
     ensure_existing_directory,
@@ -71,6 +72,7 @@ from rovr.functions.path import (
     get_filtered_dir_names,
     normalise,
 )
+from rovr.functions.persistence import get_writer
 from rovr.functions.themes import (
     register_all_themes,
     resolve_theme_ansi,
@@ -96,6 +98,9 @@ from rovr.state_manager import StateManager
 from rovr.variables.constants import MaxPossible, config, log_name
 from rovr.variables.maps import RovrVars
 
+if TYPE_CHECKING:
+    from rovr.functions.startup_profile import StartupProfile
+
 console = get_console
 
 if constants.SCREENSHOT_LOCATION:
@@ -190,6 +195,7 @@ class Application(
         show_keys: bool = False,
         force_crash_in: float = 0,
         force_exit_on_shutdown: bool = False,
+        startup_profile: StartupProfile | None = None,
     ) -> None:
         super().__init__(watch_css=True)
         # replace the plain Stylesheet created by App.__init__ before any CSS
@@ -205,6 +211,7 @@ class Application(
         self._show_keys: bool = show_keys
         self._force_crash_in: float = force_crash_in
         self._force_exit_on_shutdown = force_exit_on_shutdown
+        self._startup_profile = startup_profile
         self._force_exit_timer: threading.Timer | None = None
         self._pins_mtime: float | None = None
         self._highlighted_file_mtime: float | None = None
@@ -213,6 +220,8 @@ class Application(
         self._pinned_sidebar_container = PinnedSidebarContainer()
         # shutdown event for bg thread
         self._shutdown_event = threading.Event()
+        self.poller = Poller(on_error=self._on_poll_error)
+        self._mount_monitor: drive_workers.MountMonitor | None = None
         self._background_processes: set[Popen] = set()
         # cannot use self.clipboard, reserved for Textual's clipboard
         self.Clipboard = Clipboard()
@@ -314,7 +323,6 @@ class Application(
     def on_mount(self) -> None:
         for error in self._theme_errors:
             self.notify(error, title="Theme Error", severity="warning", markup=False)
-        self.set_interval(1, self._poll_theme_files)
         # title for screenshots
 
         if self._force_crash_in > 0:
@@ -332,6 +340,11 @@ class Application(
                     "/dev/stderr", "w", encoding="utf-8", errors="ignore"
                 )
 
+    def on_ready(self) -> None:
+        if self._startup_profile is not None:
+            self._startup_profile.mark("first paint")
+            self.exit()
+
     def post_mount(self) -> None:
         # border titles
         self.query_one("#menu_wrapper").border_title = "Options"
@@ -352,8 +365,8 @@ class Application(
         state_manager.restore_state()
         # Apply folder-specific sort preferences for initial directory
         state_manager.apply_folder_sort_prefs(normalise(getcwd()))
-        # start mini watcher
-        self.watch_for_changes_and_update()
+        # start the background checks
+        self.start_poller()
         # disable scrollbars
         self.show_horizontal_scrollbar = False
         self.show_vertical_scrollbar = False
@@ -375,6 +388,11 @@ class Application(
 
     def on_unmount(self) -> None:
         self._shutdown_event.set()
+        self.poller.stop()
+        drive_workers.get_drive_probe().close()
+        if self._mount_monitor is not None:
+            self._mount_monitor.close()
+        get_writer().flush()
         for proc in tuple(self._background_processes):
             self._stop_background_process(proc)
 
@@ -491,9 +509,11 @@ class Application(
 
     def on_app_blur(self, event: events.AppBlur) -> None:
         self.app_blurred = True
+        self.poller.set_blurred(True)
 
     def on_app_focus(self, event: events.AppFocus) -> None:
         self.app_blurred = False
+        self.poller.set_blurred(False)
 
     def _set_mouse_over(
         self, widget: Widget | None, hover_widget: Widget | None
@@ -604,6 +624,11 @@ class Application(
             else:
                 chdir(directory)
                 self.last_available_cd = directory
+                if (
+                    config["plugins"]["zoxide"]["enabled"]
+                    and config["plugins"]["zoxide"]["backend"] == "builtin"
+                ):
+                    self.record_visit(getcwd())
         except PermissionError as exc:
             self.notify(
                 f"You cannot enter into {directory}!\n{exc.strerror}",
@@ -642,198 +667,211 @@ class Application(
                 # down, so we can just ignore this error
                 return
 
-    @work(thread=True)
-    def watch_for_changes_and_update(self) -> None:
-        cwd = getcwd()
-        file_list: FileList = self.query_one(FileList)
-        pins_path = path.join(RovrVars.ROVRCONFIG, "pins.json")
+    @work(thread=True, group="frecency")
+    def record_visit(self, directory: str) -> None:
+        # the first visit loads the log, or imports zoxide's database
+        get_frecency_database().add(directory)
+
+    def start_poller(self) -> None:
+        """Register every periodic check with the poller, and start it."""
+        self._watched_cwd = getcwd()
+        self._watched_cwd_mtime: float | None = None
         with suppress(OSError):
-            self._pins_mtime = path.getmtime(pins_path)
-        state_path = path.join(RovrVars.ROVRCONFIG, "state.toml")
-        state_mtime = None
+            self._pins_mtime = path.getmtime(
+                path.join(RovrVars.ROVRCONFIG, "pins.json")
+            )
+        self._state_mtime: float | None = None
         with suppress(OSError):
-            state_mtime = path.getmtime(state_path)
-        drive_update_every = int(config["interface"]["drive_watcher_frequency"])
-        count: int = -2
-        style_available: bool = self.CUSTOM_STYLE_AVAILABLE
-        custom_style_path = path.join(RovrVars.ROVRCONFIG, "style.tcss")
-        new_drives: list[str] | None = None
-        cwd_mtime: float | None = None
-        pin_sidebar = self.query_one(PinnedSidebar)
-
-        i_should_shut_down = lambda: (
-            self._shutdown_event.is_set() or self.return_code is not None
+            self._state_mtime = path.getmtime(
+                path.join(RovrVars.ROVRCONFIG, "state.toml")
+            )
+        self._custom_style_seen = self.CUSTOM_STYLE_AVAILABLE
+        self._pin_sidebar = self.query_one(PinnedSidebar)
+        self._mount_monitor = drive_workers.MountMonitor(sys.platform)
+
+        poller = self.poller
+        poller.add("working directory", self._check_cwd, 1)
+        poller.add("pins.json", self._check_pins, 1)
+        poller.add("state.toml", self._check_state, 1)
+        poller.add("highlighted file", self._check_highlighted_file, 1)
+        if not self.CUSTOM_STYLE_AVAILABLE:
+            poller.add("style.tcss", self._check_custom_style, 1)
+        poller.add("theme files", self._check_theme_files, 1, "moderate")
+        poller.add("clipboard", self.Clipboard.remove_missing_items, 5, "moderate")
+        poller.add(
+            "drives",
+            self._check_drives,
+            float(config["interface"]["drive_watcher_frequency"]),
+            "expensive",
         )
+        self._run_poller()
 
-        while True:
-            if self._shutdown_event.wait(timeout=1):
-                return
-            if i_should_shut_down():
-                return
-            count += 1
-            if count >= drive_update_every:
-                count = 0
-            try:
-                new_cwd = getcwd()
-                if not self.file_list.file_list_pause_check:
-                    if not path.exists(new_cwd):
-                        file_list.update_file_list(add_to_session=False)
-                    elif cwd != new_cwd:
-                        cwd = new_cwd
-                        cwd_mtime = None
-                        continue
-                    else:
-                        # only rescan when the directory mtime changed;
-                        # renames/creates/deletes always bump it
-                        new_cwd_mtime = None
-                        with suppress(OSError):
-                            new_cwd_mtime = path.getmtime(cwd)
-                        if new_cwd_mtime != cwd_mtime:
-                            cwd_mtime = new_cwd_mtime
-                            items = None
-                            with suppress(OSError):
-                                items = get_filtered_dir_names(
-                                    cwd,
-                                    config["interface"]["show_hidden_files"],
-                                )
-                            if items is not None and items != file_list.items_in_cwd:
-                                self.cd(cwd)
-            except FileNotFoundError:
-                self.file_list.set_options([
-                    Selection(
-                        " FileNotFoundError: Directory was removed while inside it.",
-                        value="",
-                        id="perm",
-                        disabled=True,
-                    )
-                ])
-
-            if i_should_shut_down():
-                return
-
-            # check pins.json
-            new_mtime = None
-            reload_called: bool = False
-            with suppress(OSError):
-                new_mtime = path.getmtime(pins_path)
-            if new_mtime != self._pins_mtime:
-                self._pins_mtime = new_mtime
-                if new_mtime is not None:
-                    # no, this doesn't need to be called from thread
-                    # this is _not_ a sync function, it is a worker
-                    # and workers run separate from a thread, so there
-                    # really is no issue here, thanks to any AI
-                    # models raising false issues on thread safety
-                    pin_sidebar.reload_pins()
-                    reload_called = True
-            if i_should_shut_down():
-                return
-
-            # check state.toml
-            new_state_mtime = None
-            with suppress(OSError):
-                new_state_mtime = path.getmtime(state_path)
-            if new_state_mtime != state_mtime:
-                state_mtime = new_state_mtime
-                if new_state_mtime is not None:
-                    state_manager: StateManager = self.query_one(StateManager)
-                    self.app.call_from_thread(state_manager._load_state)
-                    self.app.call_from_thread(state_manager.restore_state)
-            if i_should_shut_down():
-                return
+    @work(thread=True, group="poller")
+    def _run_poller(self) -> None:
+        self.poller.run(
+            lambda: self._shutdown_event.is_set() or self.return_code is not None
+        )
 
-            # check drives
-            if count == 0 and not reload_called:
-                try:
-                    if self.MULTIPROCESSING_PROCESS_ALLOWED:
-                        # Run drive check in a separate process using multiprocessing.Process
-                        # Using Queue to get the result back from the process
-                        result_queue: multiprocessing.Queue[list[str]] = (
-                            multiprocessing.Queue()
-                        )
+    def _on_poll_error(self, job: PollJob, exc: Exception) -> None:
+        self.notify(
+            f"{type(exc).__name__}: {exc}",
+            title=f"Watcher: {job.name}",
+            severity="warning",
+            markup=False,
+        )
+        dump_exc(self, exc)
 
-                        process = multiprocessing.Process(
-                            target=drive_workers.get_mounted_drives_worker,
-                            args=(result_queue, sys.platform, config),
-                        )
-                        multiprocessing_utils.start_process(process)
-                        process.join(timeout=2.0)
-
-                        if process.is_alive():
-                            # Timeout - terminate the process
-                            process.terminate()
-                            process.join(timeout=0.5)
-                            if process.is_alive():
-                                process.kill()
-                        elif not result_queue.empty():
-                            # Process completed successfully
-                            new_drives = result_queue.get_nowait()
-                    else:
-                        new_drives = drive_workers.get_mounted_drives(
-                            sys.platform, config
-                        )
-                    if new_drives is not None and new_drives != pin_sidebar.DRIVES:
-                        pin_sidebar.reload_pins()
-                except Exception as exc:
-                    if multiprocessing_process_error_checker(self, exc):
-                        count = -1  # try again immediately on next loop
-                    else:
-                        self.notify(
-                            f"{type(exc).__name__}: {exc}",
-                            title="Drives Watcher",
-                            severity="warning",
-                            markup=False,
+    def _check_cwd(self) -> None:
+        file_list = self.file_list
+        if file_list.file_list_pause_check:
+            return
+        try:
+            new_cwd = getcwd()
+            if not path.exists(new_cwd):
+                file_list.update_file_list(add_to_session=False)
+            elif self._watched_cwd != new_cwd:
+                self._watched_cwd = new_cwd
+                self._watched_cwd_mtime = None
+            else:
+                # only rescan when the directory mtime changed;
+                # renames/creates/deletes always bump it
+                new_cwd_mtime = None
+                with suppress(OSError):
+                    new_cwd_mtime = path.getmtime(new_cwd)
+                if new_cwd_mtime != self._watched_cwd_mtime:
+                    self._watched_cwd_mtime = new_cwd_mtime
+                    items = None
+                    with suppress(OSError):
+                        items = get_filtered_dir_names(
+                            new_cwd,
+                            config["interface"]["show_hidden_files"],
                         )
-                        dump_exc(self, exc)
-            if i_should_shut_down():
-                return
+                    if items is not None and items != file_list.items_in_cwd:
+                        self.cd(new_cwd)
+        except FileNotFoundError:
+            file_list.set_options([
+                Selection(
+                    " FileNotFoundError: Directory was removed while inside it.",
+                    value="",
+                    id="perm",
+                    disabled=True,
+                )
+            ])
 
-            # check highlighted file mtime
-            if not self.file_list.file_list_pause_check:
-                highlighted_option = file_list.highlighted_option
-                # TODO: The `file_list.highlighted_option` is modified at runtime
-                # and does not match the type checking.
-                # In `test_new_button` case, it becomes a `textual.widgets._selection_list.Selection` object
-                # instead of `FileListSelectionWidget`.
-                # It should be fixed to avoid surpising bug.
-                if highlighted_option is not None and isinstance(
-                    getattr(highlighted_option, "dir_entry", None), os.DirEntry
-                ):
-                    highlighted_path = highlighted_option.dir_entry.path
-                    if not highlighted_option.dir_entry.is_dir():
-                        new_highlighted_mtime = None
-                        with suppress(OSError):
-                            new_highlighted_mtime = path.getmtime(highlighted_path)
-                        if (
-                            new_highlighted_mtime is not None
-                            and new_highlighted_mtime != self._highlighted_file_mtime
-                        ):
-                            self._highlighted_file_mtime = new_highlighted_mtime
-                            self.query_one(PreviewContainer).show_preview(
-                                highlighted_path,
-                                new_highlighted_mtime,
-                            )
-                            dir_entry = get_direntry_for(highlighted_path)
-                            if dir_entry is not None:
-                                highlighted_option.dir_entry = dir_entry
-                                highlighted_option._invalidate_prompt_cache()
-                                file_list.call_next(file_list.refresh)
-                                self.query_one(MetadataContainer).update_metadata(
-                                    dir_entry
-                                )
-            if i_should_shut_down():
+    def _check_pins(self) -> None:
+        pins_path = path.join(RovrVars.ROVRCONFIG, "pins.json")
+        new_mtime = None
+        with suppress(OSError):
+            new_mtime = path.getmtime(pins_path)
+        if new_mtime != self._pins_mtime:
+            self._pins_mtime = new_mtime
+            if new_mtime is not None and not get_writer().is_own_write(pins_path):
+                # no, this doesn't need to be called from thread
+                # this is _not_ a sync function, it is a worker
+                # and workers run separate from a thread, so there
+                # really is no issue here, thanks to any AI
+                # models raising false issues on thread safety
+                self._pin_sidebar.reload_pins()
+
+    def _check_state(self) -> None:
+        state_path = path.join(RovrVars.ROVRCONFIG, "state.toml")
+        new_state_mtime = None
+        with suppress(OSError):
+            new_state_mtime = path.getmtime(state_path)
+        if new_state_mtime != self._state_mtime:
+            self._state_mtime = new_state_mtime
+            # rovr's own writes are already applied
+            if new_state_mtime is not None and not get_writer().is_own_write(
+                state_path
+            ):
+                state_manager: StateManager = self.query_one(StateManager)
+                self.call_from_thread(state_manager._load_state)
+                self.call_from_thread(state_manager.restore_state)
+
+    def _check_drives(self) -> None:
+        mount_monitor = self._mount_monitor
+        # free until the mount table actually changes
+        if mount_monitor is None or not mount_monitor.changed():
+            return
+        try:
+            new_drives = drive_workers.list_drives(
+                sys.platform, config, self.MULTIPROCESSING_PROCESS_ALLOWED
+            )
+        except Exception as exc:
+            if multiprocessing_process_error_checker(self, exc):
+                # the start method was changed (or processes were turned
+                # off), so try again on the next pass
+                mount_monitor.reset()
+                self.poller.run_soon("drives")
                 return
-
-            if not self.CUSTOM_STYLE_AVAILABLE:
-                if not style_available and path.exists(custom_style_path):
-                    style_available = True
-                    self.notify(
-                        "Custom [b]style.tcss[/] was detected.\nPlease relaunch rovr to apply the custom stylesheet.",
-                        title="Styles",
-                        severity="information",
-                    )
-                elif not path.exists(custom_style_path):
-                    style_available = False
+            raise
+        if new_drives is None:
+            # the probe timed out, so look again next time
+            mount_monitor.reset()
+        elif new_drives != self._pin_sidebar.DRIVES:
+            self._pin_sidebar.reload_pins()
+
+    def _check_highlighted_file(self) -> None:
+        file_list = self.file_list
+        if file_list.file_list_pause_check:
+            return
+        highlighted_option = file_list.highlighted_option
+        # TODO: The `file_list.highlighted_option` is modified at runtime
+        # and does not match the type checking.
+        # In `test_new_button` case, it becomes a `textual.widgets._selection_list.Selection` object
+        # instead of `FileListSelectionWidget`.
+        # It should be fixed to avoid surpising bug.
+        if highlighted_option is None or not isinstance(
+            getattr(highlighted_option, "dir_entry", None), os.DirEntry
+        ):
+            return
+        highlighted_path = highlighted_option.dir_entry.path
+        if highlighted_option.dir_entry.is_dir():
+            return
+        new_highlighted_mtime = None
+        with suppress(OSError):
+            new_highlighted_mtime = path.getmtime(highlighted_path)
+        if (
+            new_highlighted_mtime is not None
+            and new_highlighted_mtime != self._highlighted_file_mtime
+        ):
+            self._highlighted_file_mtime = new_highlighted_mtime
+            self.query_one(PreviewContainer).show_preview(
+                highlighted_path,
+                new_highlighted_mtime,
+            )
+            dir_entry = get_direntry_for(highlighted_path)
+            if dir_entry is not None:
+                highlighted_option.dir_entry = dir_entry
+                highlighted_option._invalidate_prompt_cache()
+                file_list.call_next(file_list.refresh)
+                self.query_one(MetadataContainer).update_metadata(dir_entry)
+
+    def _check_custom_style(self) -> None:
+        style_exists = path.exists(path.join(RovrVars.ROVRCONFIG, "style.tcss"))
+        if style_exists and not self._custom_style_seen:
+            self.notify(
+                "Custom [b]style.tcss[/] was detected.\nPlease relaunch rovr to apply the custom stylesheet.",
+                title="Styles",
+                severity="information",
+            )
+        self._custom_style_seen = style_exists
+
+    def _check_theme_files(self) -> None:
+        # globbing and stat-ing the theme folders happens here, off the event
+        # loop, and only a change is handed over to reload the themes
+        if theme_file_mtimes() != self._theme_file_mtimes:
+            self.call_from_thread(self._poll_theme_files)
+
+    def show_poller_metrics(self) -> None:
+        lines = [
+            f"[b]{name}[/]: {metrics['runs']:.0f} runs, "
+            f"{metrics['mean_ms']:.2f} ms mean, {metrics['max_ms']:.2f} ms max, "
+            f"every {metrics['interval']:g}s"
+            + (f", {metrics['errors']:.0f} errors" if metrics["errors"] else "")
+            for name, metrics in self.poller.metrics().items()
+        ]
+        self.notify("\n".join(lines), title="Background checks", timeout=10)
 
     @work(exclusive=True)
     async def on_resize(self, event: events.Resize) -> None:
@@ -920,6 +958,12 @@ class Application(
                 "Maximize", "Maximize the focused widget", screen.action_maximize
             )
 
+        yield SystemCommand(
+            "Show background checks",
+            "Show how often each background check runs, and how long it takes",
+            self.show_poller_metrics,
+        )
+
         yield SystemCommand(
             "Save screenshot",
             "Save an SVG 'screenshot' of the current screen",
@@ -1151,7 +1195,8 @@ class Application(
 
         if not config["plugins"]["zoxide"]["enabled"]:
             return
-        if shutil.which("zoxide") is None:
+        use_builtin = config["plugins"]["zoxide"]["backend"] == "builtin"
+        if not use_builtin and shutil.which("zoxide") is None:
             self.notify(
                 "Zoxide is not installed or not in PATH.",
                 title="Zoxide",
@@ -1170,7 +1215,7 @@ class Application(
 
         from rovr.screens import ZDToDirectory
 
-        self.push_screen(ZDToDirectory(), on_response)
+        self.push_screen(ZDToDirectory(use_builtin=use_builtin), on_response)
 
     def action_show_keybinds(self) -> None:
         from rovr.screens import Keybinds
@@ -1182,10 +1227,14 @@ class Application(
 
         if not config["plugins"]["fd"]["enabled"]:
             return
-        fd_exec = shutil.which(config["plugins"]["fd"]["executable"]) or shutil.which(
-            "fd"
+        backend = config["plugins"]["fd"]["backend"]
+        fd_exec = (
+            None
+            if backend == "builtin"
+            else shutil.which(config["plugins"]["fd"]["executable"])
+            or shutil.which("fd")
         )
-        if fd_exec is not None:
+        if fd_exec is not None or backend != "fd":
             try:
 
                 def on_response(selected: str | None) -> None:
@@ -1201,7 +1250,7 @@ class Application(
 
                 from rovr.screens import FileSearch
 
-                self.push_screen(FileSearch(), on_response)
+                self.push_screen(FileSearch(use_index=fd_exec is None), on_response)
             except Exception as exc:
                 dump_exc(self, exc)
                 self.notify(
@@ -1220,10 +1269,14 @@ class Application(
 
         if not config["plugins"]["rg"]["enabled"]:
             return
-        rg_exec = shutil.which(config["plugins"]["rg"]["executable"]) or shutil.which(
-            "rg"
+        backend = config["plugins"]["rg"]["backend"]
+        rg_exec = (
+            None
+            if backend == "builtin"
+            else shutil.which(config["plugins"]["rg"]["executable"])
+            or shutil.which("rg")
         )
-        if rg_exec is not None:
+        if rg_exec is not None or backend != "rg":
             try:
 
                 def on_response(selected: str | None) -> None:
@@ -1237,7 +1290,9 @@ class Application(
 
                 from rovr.screens import ContentSearch
 
-                self.push_screen(ContentSearch(), on_response)
+                self.push_screen(
+                    ContentSearch(use_builtin=rg_exec is None), on_response
+                )
             except Exception as exc:
                 dump_exc(self, exc)
                 self.notify(
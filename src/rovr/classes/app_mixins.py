@@ -628,8 +628,6 @@ class DragAndDrop:
                             existing_pins.add(normalized)
                             added = True
                     if added:
-                        with suppress(OSError):
-                            self._pins_mtime = path.getmtime(pin_utils.PIN_PATH)
                         self.query_one(PinnedSidebar).reload_pins()
                     return
                 if self._drop_conflicts(dropped_paths, destination):
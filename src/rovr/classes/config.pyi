@@ -162,6 +162,9 @@ r""" Default value of the field path 'Rovr Config plugins bat enabled' """
 _ROVR_CONFIG_PLUGINS_BAT_EXECUTABLE_DEFAULT = "bat"
 r""" Default value of the field path 'Rovr Config plugins bat executable' """
 
+_ROVR_CONFIG_PLUGINS_FD_BACKEND_DEFAULT = "auto"
+r""" Default value of the field path 'Rovr Config plugins fd backend' """
+
 _ROVR_CONFIG_PLUGINS_FD_DEFAULT_FILTER_TYPES_DEFAULT = ["file", "directory"]
 r""" Default value of the field path 'Rovr Config plugins fd default_filter_types' """
 
@@ -210,6 +213,9 @@ r""" Default value of the field path 'Rovr Config plugins poppler threads' """
 _ROVR_CONFIG_PLUGINS_POPPLER_USE_PDFTOCAIRO_DEFAULT = False
 r""" Default value of the field path 'Rovr Config plugins poppler use_pdftocairo' """
 
+_ROVR_CONFIG_PLUGINS_RG_BACKEND_DEFAULT = "auto"
+r""" Default value of the field path 'Rovr Config plugins rg backend' """
+
 _ROVR_CONFIG_PLUGINS_RG_CASE_SENSITIVE_DEFAULT = True
 r""" Default value of the field path 'Rovr Config plugins rg case_sensitive' """
 
@@ -234,6 +240,9 @@ r""" Default value of the field path 'Rovr Config plugins rg search_hidden' """
 _ROVR_CONFIG_PLUGINS_RG_TIMEOUT_DEFAULT = 60
 r""" Default value of the field path 'Rovr Config plugins rg timeout' """
 
+_ROVR_CONFIG_PLUGINS_ZOXIDE_BACKEND_DEFAULT = "builtin"
+r""" Default value of the field path 'Rovr Config plugins zoxide backend' """
+
 _ROVR_CONFIG_PLUGINS_ZOXIDE_ENABLED_DEFAULT = True
 r""" Default value of the field path 'Rovr Config plugins zoxide enabled' """
 
@@ -1210,6 +1219,13 @@ class _RovrConfigPluginsFd(TypedDict, total=False):
     default: fd
     """
 
+    backend: "_RovrConfigPluginsFdBackend"
+    r"""
+    The search backend to use. `fd` runs fd for every search, `builtin` searches rovr's own file index, which is kept in the cache folder and only rescans folders that changed, and `auto` uses fd when it can be found and the file index otherwise.
+
+    default: auto
+    """
+
     relative_paths: bool
     r"""
     Whether to show fd results as relative path or absolute path.
@@ -1255,6 +1271,19 @@ class _RovrConfigPluginsFd(TypedDict, total=False):
     uniqueItems: True
     """
 
+_RovrConfigPluginsFdBackend = Literal["auto"] | Literal["fd"] | Literal["builtin"]
+r"""
+The search backend to use. `fd` runs fd for every search, `builtin` searches rovr's own file index, which is kept in the cache folder and only rescans folders that changed, and `auto` uses fd when it can be found and the file index otherwise.
+
+default: auto
+"""
+_ROVRCONFIGPLUGINSFDBACKEND_AUTO: Literal["auto"] = "auto"
+r"""The values for the '_RovrConfigPluginsFdBackend' enum"""
+_ROVRCONFIGPLUGINSFDBACKEND_FD: Literal["fd"] = "fd"
+r"""The values for the '_RovrConfigPluginsFdBackend' enum"""
+_ROVRCONFIGPLUGINSFDBACKEND_BUILTIN: Literal["builtin"] = "builtin"
+r"""The values for the '_RovrConfigPluginsFdBackend' enum"""
+
 _RovrConfigPluginsFdDefaultFilterTypesItem = (
     Literal["file"]
     | Literal["directory"]
@@ -1360,6 +1389,13 @@ class _RovrConfigPluginsRg(TypedDict, total=False):
     default: rg
     """
 
+    backend: "_RovrConfigPluginsRgBackend"
+    r"""
+    The search backend to use. `rg` runs rg for every search, `builtin` searches the files in rovr's own file index (the same one the file search uses) with a pool of processes, and `auto` uses rg when it can be found and the built-in search otherwise.
+
+    default: auto
+    """
+
     case_sensitive: bool
     r"""
     Whether the search should be case sensitive by default.
@@ -1395,6 +1431,19 @@ class _RovrConfigPluginsRg(TypedDict, total=False):
     default: 60
     """
 
+_RovrConfigPluginsRgBackend = Literal["auto"] | Literal["rg"] | Literal["builtin"]
+r"""
+The search backend to use. `rg` runs rg for every search, `builtin` searches the files in rovr's own file index (the same one the file search uses) with a pool of processes, and `auto` uses rg when it can be found and the built-in search otherwise.
+
+default: auto
+"""
+_ROVRCONFIGPLUGINSRGBACKEND_AUTO: Literal["auto"] = "auto"
+r"""The values for the '_RovrConfigPluginsRgBackend' enum"""
+_ROVRCONFIGPLUGINSRGBACKEND_RG: Literal["rg"] = "rg"
+r"""The values for the '_RovrConfigPluginsRgBackend' enum"""
+_ROVRCONFIGPLUGINSRGBACKEND_BUILTIN: Literal["builtin"] = "builtin"
+r"""The values for the '_RovrConfigPluginsRgBackend' enum"""
+
 class _RovrConfigPluginsZoxide(TypedDict, total=False):
     enabled: bool
     r"""
@@ -1404,6 +1453,13 @@ class _RovrConfigPluginsZoxide(TypedDict, total=False):
     """
 
     keybinds: list[str]
+    backend: "_RovrConfigPluginsZoxideBackend"
+    r"""
+    The ranker to use. `builtin` ranks folders by how often and how recently rovr visited them, answering queries from memory (zoxide's database is imported the first time), and `zoxide` runs the zoxide executable for every query instead.
+
+    default: builtin
+    """
+
     show_scores: bool
     r"""
     Display zoxide frequency scores alongside directory paths.
@@ -1411,6 +1467,17 @@ class _RovrConfigPluginsZoxide(TypedDict, total=False):
     default: False
     """
 
+_RovrConfigPluginsZoxideBackend = Literal["builtin"] | Literal["zoxide"]
+r"""
+The ranker to use. `builtin` ranks folders by how often and how recently rovr visited them, answering queries from memory (zoxide's database is imported the first time), and `zoxide` runs the zoxide executable for every query instead.
+
+default: builtin
+"""
+_ROVRCONFIGPLUGINSZOXIDEBACKEND_BUILTIN: Literal["builtin"] = "builtin"
+r"""The values for the '_RovrConfigPluginsZoxideBackend' enum"""
+_ROVRCONFIGPLUGINSZOXIDEBACKEND_ZOXIDE: Literal["zoxide"] = "zoxide"
+r"""The values for the '_RovrConfigPluginsZoxideBackend' enum"""
+
 class _RovrConfigSettings(TypedDict, total=False):
     r"""Settings related to behavior of file operations"""
 
@@ -1,5 +1,16 @@
 from inspect import isawaitable
-from typing import Any, Awaitable, Callable, ClassVar, Iterable, NamedTuple, Self
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Self,
+    Sequence,
+)
 
 from rich.cells import cell_len
 from rich.segment import Segment
@@ -150,6 +161,77 @@ class SingleLineOptionLayoutMixin:
         )
 
 
+class _RowLines(Sequence[tuple[int, int]]):
+    """OptionList's line table when every option is one line: line n is row n."""
+
+    def __init__(self, count: int) -> None:
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [(row, 0) for row in range(self._count)[index]]
+        if not 0 <= index < self._count:
+            raise IndexError("line index out of range")
+        return (index, 0)
+
+
+class _RowMap(Mapping[int, int]):
+    """OptionList's row to line (or row to height) table, without the table."""
+
+    def __init__(self, count: int, height: int | None = None) -> None:
+        self._count = count
+        self._height = height
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._count))
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self._count:
+            raise KeyError(index)
+        return index if self._height is None else self._height
+
+
+class VirtualRowsMixin:
+    """OptionList/SelectionList layout for lists where every option is exactly
+    one line with no dividers, so the line of a row is its index and nothing
+    is measured, cached or looped over, however many options there are."""
+
+    @property
+    def _lines(self) -> Sequence[tuple[int, int]]:
+        return _RowLines(len(self._options))
+
+    @property
+    def _heights(self) -> Mapping[int, int]:
+        return _RowMap(len(self._options), height=1)
+
+    @property
+    def _index_to_line(self) -> Mapping[int, int]:
+        return _RowMap(len(self._options))
+
+    def _update_lines(self) -> None:
+        if not self.scrollable_content_region:
+            return
+        width = self.scrollable_content_region.width - self._get_left_gutter_width()
+        virtual_size = Size(width, len(self._options))
+        if virtual_size != self.virtual_size:
+            self.virtual_size = virtual_size
+            self._scroll_update(virtual_size)
+
+    def get_content_width(self, container: Size, viewport: Size) -> int:
+        del viewport
+        return container.width
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        del container, viewport, width
+        return len(self._options)
+
+
 class CheckboxRenderingMixin:
     CHECKED_COMPONENT_CLASS: ClassVar[str] = "selection-list--option-checked"
     COMPONENT_CLASSES: ClassVar[set[str]] = SelectionList.COMPONENT_CLASSES | {
@@ -0,0 +1,180 @@
+import threading
+from dataclasses import dataclass
+from time import monotonic, perf_counter
+from typing import Callable, Literal
+
+PollCost = Literal["cheap", "moderate", "expensive"]
+
+# the order jobs run in within a pass, so a slow check never holds up a
+# cheap one that was due at the same time
+COST_ORDER: tuple[PollCost, ...] = ("cheap", "moderate", "expensive")
+# how far each kind of job backs off while the terminal is unfocused, as a
+# multiple of its usual interval
+MAX_BLURRED_BACKOFF: dict[PollCost, float] = {
+    "cheap": 4.0,
+    "moderate": 8.0,
+    "expensive": 16.0,
+}
+
+
+@dataclass
+class PollJob:
+    """A check run periodically by the Poller, with its timings."""
+
+    name: str
+    check: Callable[[], None]
+    every: float
+    """Seconds between runs while the app is focused."""
+    cost: PollCost = "cheap"
+    runs: int = 0
+    errors: int = 0
+    last_duration: float = 0.0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    backoff: float = 1.0
+    next_run: float = 0.0
+
+    @property
+    def interval(self) -> float:
+        """Seconds until the next run, after backing off."""
+        return self.every * self.backoff
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.runs if self.runs else 0.0
+
+
+class Poller:
+    """Runs every periodic check of the app on a single background thread.
+
+    Jobs that are due together run cheapest first. While the terminal is
+    unfocused, each job waits twice as long after every run (up to its
+    cost's MAX_BLURRED_BACKOFF), and once it is focused again, every job
+    runs straight away.
+    """
+
+    def __init__(
+        self, on_error: Callable[[PollJob, Exception], None] | None = None
+    ) -> None:
+        self.jobs: list[PollJob] = []
+        self.blurred: bool = False
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+    def add(
+        self,
+        name: str,
+        check: Callable[[], None],
+        every: float,
+        cost: PollCost = "cheap",
+        delay: float | None = None,
+    ) -> PollJob:
+        """
+        Args:
+            name (str): shown in the metrics
+            check (Callable[[], None]): run on the poller thread
+            every (float): seconds between runs while focused
+            cost (PollCost): how expensive the check is
+            delay (float | None): seconds until the first run (defaults to
+                `every`)
+
+        Returns:
+            PollJob: the job, which also holds its metrics
+        """
+        job = PollJob(name, check, every, cost)
+        job.next_run = monotonic() + (every if delay is None else delay)
+        with self._lock:
+            self.jobs.append(job)
+        self._wake.set()
+        return job
+
+    def set_blurred(self, blurred: bool) -> None:
+        """Back off while the terminal is unfocused, and catch up on every
+        check once it is focused again."""
+        if blurred == self.blurred:
+            return
+        self.blurred = blurred
+        if not blurred:
+            now = monotonic()
+            with self._lock:
+                for job in self.jobs:
+                    job.backoff = 1.0
+                    job.next_run = now
+            self._wake.set()
+
+    def run_soon(self, name: str) -> None:
+        """Run a job on the next pass, instead of waiting for its interval."""
+        with self._lock:
+            for job in self.jobs:
+                if job.name == name:
+                    job.next_run = 0.0
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def run(self, should_stop: Callable[[], bool] = lambda: False) -> None:
+        """Run jobs as they come due, until stop is called or `should_stop`
+        returns True. Blocks, so call it from a thread.
+
+        Args:
+            should_stop (Callable[[], bool]): checked between jobs
+        """
+        while not self._stopped.is_set() and not should_stop():
+            # cleared before looking at the jobs, so a job added or made due
+            # from now on still wakes the wait below
+            self._wake.clear()
+            now = monotonic()
+            with self._lock:
+                due = [job for job in self.jobs if job.next_run <= now]
+            due.sort(key=lambda job: COST_ORDER.index(job.cost))
+            for job in due:
+                if self._stopped.is_set() or should_stop():
+                    return
+                self.run_job(job)
+            with self._lock:
+                next_run = min((job.next_run for job in self.jobs), default=None)
+            timeout = None if next_run is None else max(0.0, next_run - monotonic())
+            self._wake.wait(timeout)
+
+    def run_job(self, job: PollJob) -> None:
+        """Run a job once, and schedule its next run."""
+        start = perf_counter()
+        try:
+            job.check()
+        except Exception as exc:
+            job.errors += 1
+            if self._on_error is not None:
+                self._on_error(job, exc)
+        finally:
+            duration = perf_counter() - start
+            job.runs += 1
+            job.last_duration = duration
+            job.total_duration += duration
+            job.max_duration = max(job.max_duration, duration)
+            if self.blurred:
+                job.backoff = min(job.backoff * 2, MAX_BLURRED_BACKOFF[job.cost])
+            job.next_run = monotonic() + job.interval
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """
+        Returns:
+            dict[str, dict[str, float]]: for each job, its run and error
+            counts, its last, mean and max duration in milliseconds, and its
+            current interval in seconds
+        """
+        with self._lock:
+            return {
+                job.name: {
+                    "runs": job.runs,
+                    "errors": job.errors,
+                    "last_ms": job.last_duration * 1000,
+                    "mean_ms": job.mean_duration * 1000,
+                    "max_ms": job.max_duration * 1000,
+                    "interval": job.interval,
+                }
+                for job in self.jobs
+            }
@@ -0,0 +1,182 @@
+from typing import Any, Callable, Hashable, Iterator, MutableMapping
+
+# the positions of the set bits in every possible byte
+_BYTE_BITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+_INVERT: bytes = bytes(0xFF ^ byte for byte in range(256))
+
+
+class SelectionBits:
+    """A set of row indexes, stored as one bit per row.
+
+    Ranges are set, cleared or flipped a byte at a time, so selecting every
+    row of a huge folder costs about as much as copying a few kilobytes.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: bytes | bytearray = b"") -> None:
+        self._data = bytearray(data)
+
+    def _grow(self, index: int) -> None:
+        needed = (index >> 3) + 1
+        if len(self._data) < needed:
+            self._data.extend(bytes(needed - len(self._data)))
+
+    def __contains__(self, index: object) -> bool:
+        if not isinstance(index, int) or index < 0:
+            return False
+        byte = index >> 3
+        return byte < len(self._data) and bool(self._data[byte] >> (index & 7) & 1)
+
+    def add(self, index: int) -> bool:
+        """
+        Returns:
+            bool: whether the index was not in the set before
+        """
+        if index in self:
+            return False
+        self._grow(index)
+        self._data[index >> 3] |= 1 << (index & 7)
+        return True
+
+    def discard(self, index: int) -> bool:
+        """
+        Returns:
+            bool: whether the index was in the set before
+        """
+        if index not in self:
+            return False
+        self._data[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        return True
+
+    def set_range(self, first: int, last: int, selected: bool = True) -> None:
+        """Add (or remove) every index from `first` to `last`, inclusive."""
+        if selected:
+            self._apply_range(
+                first,
+                last,
+                lambda byte, mask: byte | mask,
+                lambda chunk: b"\xff" * len(chunk),
+            )
+        else:
+            self._apply_range(
+                first,
+                last,
+                lambda byte, mask: byte & ~mask & 0xFF,
+                lambda chunk: bytes(len(chunk)),
+            )
+
+    def invert_range(self, first: int, last: int) -> None:
+        """Flip every index from `first` to `last`, inclusive."""
+        self._apply_range(
+            first,
+            last,
+            lambda byte, mask: byte ^ mask,
+            lambda chunk: chunk.translate(_INVERT),
+        )
+
+    def _apply_range(
+        self,
+        first: int,
+        last: int,
+        edge: Callable[[int, int], int],
+        middle: Callable[[bytearray], bytes | bytearray],
+    ) -> None:
+        """Apply `edge` to the partly covered bytes at either end (with a mask
+        of the covered bits), and replace the whole bytes between them with
+        `middle` of them."""
+        if last < first:
+            return
+        self._grow(last)
+        data = self._data
+        first_byte, last_byte = first >> 3, last >> 3
+        head = (0xFF << (first & 7)) & 0xFF
+        tail = 0xFF >> (7 - (last & 7))
+        if first_byte == last_byte:
+            data[first_byte] = edge(data[first_byte], head & tail)
+            return
+        data[first_byte] = edge(data[first_byte], head)
+        data[last_byte] = edge(data[last_byte], tail)
+        if last_byte - first_byte > 1:
+            data[first_byte + 1 : last_byte] = middle(data[first_byte + 1 : last_byte])
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def copy(self) -> "SelectionBits":
+        return SelectionBits(self._data)
+
+    def __len__(self) -> int:
+        return int.from_bytes(self._data, "little").bit_count()
+
+    def __bool__(self) -> bool:
+        return self._data.count(0) != len(self._data)
+
+    def __iter__(self) -> Iterator[int]:
+        byte_bits = _BYTE_BITS
+        for byte_index, byte in enumerate(self._data):
+            if byte:
+                base = byte_index << 3
+                for bit in byte_bits[byte]:
+                    yield base + bit
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SelectionBits):
+            return NotImplemented
+        return self._data.rstrip(b"\0") == other._data.rstrip(b"\0")
+
+    def __repr__(self) -> str:
+        return f"SelectionBits({list(self)!r})"
+
+
+class RowSelection(MutableMapping[Hashable, None]):
+    """A drop-in for SelectionList's `_selected` dict, for lists whose values
+    are row indexes.
+
+    Integer values go into a SelectionBits, so bulk changes can work on it
+    directly. Any other value (like the empty value of a placeholder row)
+    is kept in a plain dict.
+    """
+
+    def __init__(self) -> None:
+        self.bits = SelectionBits()
+        self._others: dict[Hashable, None] = {}
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(value, int):
+            return value in self.bits
+        return value in self._others
+
+    def __getitem__(self, value: Hashable) -> None:
+        if value not in self:
+            raise KeyError(value)
+        return None
+
+    def __setitem__(self, value: Hashable, _: Any) -> None:
+        if isinstance(value, int):
+            self.bits.add(value)
+        else:
+            self._others[value] = None
+
+    def __delitem__(self, value: Hashable) -> None:
+        if isinstance(value, int):
+            if not self.bits.discard(value):
+                raise KeyError(value)
+        else:
+            del self._others[value]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        yield from self.bits
+        yield from self._others
+
+    def __len__(self) -> int:
+        return len(self.bits) + len(self._others)
+
+    def __bool__(self) -> bool:
+        return bool(self.bits) or bool(self._others)
+
+    def clear(self) -> None:
+        self.bits.clear()
+        self._others.clear()
@@ -1,6 +1,8 @@
 from collections import OrderedDict, deque
-from typing import Literal, TypedDict
+from typing import Literal, NamedTuple, Sequence, TypedDict
 
+from rovr.classes.selection import SelectionBits
+from rovr.functions.path import CWDObjectReturnDict
 from rovr.variables.constants import config
 
 
@@ -11,6 +13,13 @@ class SessionOptionDict(TypedDict):
     "Index of the option. Used as a fallback when `name` doesn't exist"
 
 
+class SessionSelection(NamedTuple):
+    listing: Sequence[CWDObjectReturnDict]
+    "The folder listing the selection was made in"
+    rows: SelectionBits
+    "The selected rows of `listing`"
+
+
 # What is textual reactive?
 class SessionManager:
     """Manages session-related variables.
@@ -28,8 +37,8 @@ class SessionManager:
                                  eviction). If a directory is not in the dictionary, the
                                  default is 0. Use `remember_highlight` to write to it.
         selectMode (False | "implicit" | "explicit"): Whether select mode is enabled for that directory.
-        selectedItems (list[SessionOptionDict]): A list of selected items within the
-                                                                      current directory
+        selectedItems (SessionSelection | None): The selected items within the
+                                                 current directory, as rows of its listing
         search (str): The current search string.
     """
 
@@ -38,7 +47,7 @@ class SessionManager:
         self.historyIndex: int = 0
         self.lastHighlighted: OrderedDict[str, SessionOptionDict] = OrderedDict()
         self.selectMode: Literal[False, "implicit", "explicit"] = False
-        self.selectedItems: list[SessionOptionDict] = []
+        self.selectedItems: SessionSelection | None = None
         self.search: str = ""
 
     def remember_highlight(self, cwd: str, value: SessionOptionDict) -> None:
@@ -2,7 +2,16 @@ from __future__ import annotations
 
 from functools import lru_cache
 from os import DirEntry, path
-from typing import Callable, Literal, Mapping, NamedTuple, TypeAlias
+from typing import (
+    Callable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    TypeAlias,
+    overload,
+)
 
 import rich.repr
 from textual.content import Content, ContentText
@@ -15,7 +24,7 @@ from textual_autocomplete import DropdownItem
 from rovr.functions import details as detail_utils
 from rovr.functions import icons as icon_utils
 from rovr.functions.cwd import getcwd
-from rovr.functions.path import is_hidden_file, normalise
+from rovr.functions.path import CWDObjectReturnDict, is_hidden_file, normalise
 
 IconFactory: TypeAlias = Callable[[], tuple[str, str]]
 
@@ -133,7 +142,11 @@ class LazySelection(LazyOption, Selection[SelectionType]):
 
 class PinnedSidebarOption(Option):
     def __init__(
-        self, icon: tuple[str, str], label: str, id: str | None = None
+        self,
+        icon: tuple[str, str],
+        label: str,
+        id: str | None = None,
+        stale: bool = False,
     ) -> None:
         """Initialise the option.
 
@@ -141,32 +154,73 @@ class PinnedSidebarOption(Option):
             icon: The icon for the option
             label: The text for the option
             id: An option ID for the option.
+            stale: Whether the path stopped responding when it was checked
         """
         super().__init__(
             prompt=Content.from_markup(
-                f" [{icon[1]}]{icon[0]}[/{icon[1]}] $name", name=label
+                f" [{icon[1]}]{icon[0]}[/{icon[1]}] [dim]$name (not responding)[/]"
+                if stale
+                else f" [{icon[1]}]{icon[0]}[/{icon[1]}] $name",
+                name=label,
             ),
             id=id,
         )
         self.label = label
+        self.stale = stale
 
 
 class ArchiveFileListSelection(LazySelection):
-    def __init__(self, icon_factory: IconFactory, label: str) -> None:
+    def __init__(
+        self,
+        icon_factory: IconFactory,
+        label: str,
+        archive_path: str | None = None,
+        is_dir: bool = False,
+        depth: int = 0,
+        detail: str = "",
+        expanded: bool = False,
+    ) -> None:
         """Initialise the option.
 
         Args:
             icon_factory: The icon for the option
             label: The text for the option
+            archive_path: The path of the member inside the archive
+            is_dir: Whether the member is a folder that can be expanded
+            depth: How deeply nested the member is, for indentation
+            detail: Dimmed text shown after the label, like the size
+            expanded: Whether the folder is currently expanded
         """
+        self.archive_path = archive_path
+        self.is_dir = is_dir
+        self.expanded = expanded
+        self.__icon_factory = icon_factory
+        self.__depth = depth
+        self.__detail = detail
 
         super().__init__(
-            prompt=lambda: _get_cached_icon(icon_factory()) + Content(label),
+            prompt=self.get_prompt,
             value="",
-            disabled=True,
+            # rows of the tree can be highlighted, to open folders from the
+            # keyboard. the flat listing shown while loading cannot
+            disabled=archive_path is None,
         )
         self.label = label
 
+    def get_prompt(self) -> Content:
+        if self.archive_path is None:
+            # flat listing, without a tree
+            return _get_cached_icon(self.__icon_factory()) + Content(self.label)
+        expander = ("\u25be " if self.expanded else "\u25b8 ") if self.is_dir else "  "
+        prompt = (
+            Content("  " * self.__depth + expander)
+            + _get_cached_icon(self.__icon_factory())
+            + Content(self.label)
+        )
+        if self.__detail:
+            prompt += Content.from_markup("  [dim]$detail[/]", detail=self.__detail)
+        return prompt
+
 
 class FileListSelectionWidget(LazySelection):
     def __init__(
@@ -175,6 +229,7 @@ class FileListSelectionWidget(LazySelection):
         label: str,
         dir_entry: DirEntry,
         clipboard: SelectionList,
+        index: int,
         disabled: bool = False,
     ) -> None:
         """
@@ -184,9 +239,12 @@ class FileListSelectionWidget(LazySelection):
             icon_factory: The icon list from a utils function or a lazy icon resolver.
             label: The label for the option.
             dir_entry: The os.DirEntry class
+            index: The position of the item in the folder listing, used as the value.
             disabled: The initial enabled/disabled state. Enabled by default.
         """
         self.dir_entry = dir_entry
+        self.version = 0
+        """Bumped whenever what the row shows changes, for FileList's line cache"""
         self.mime_type: str | None = None
         self.folder_item_count: int | None = None
         self.git_status: str = ""
@@ -199,11 +257,9 @@ class FileListSelectionWidget(LazySelection):
 
         super().__init__(
             prompt=self.get_prompt,
-            # this is kinda required for FileList.get_selected_object's select mode
-            # because it gets selected (which is dictionary of values)
-            # which it then queries for `id` (because there's no way to query for
-            # values directly)
-            value=this_id,
+            # the value is the row in the listing, so FileList can keep the
+            # selection as a bitset over the listing, even while searching
+            value=index,
             id=this_id,
             disabled=disabled,
         )
@@ -225,13 +281,16 @@ class FileListSelectionWidget(LazySelection):
     def set_folder_item_count(self, count: int) -> None:
         self.folder_item_count = count
         self._detail_cells = None
+        self.version += 1
 
     def set_git_status(self, status: str) -> None:
         self.git_status = status
         self._detail_cells = None
+        self.version += 1
 
     def _invalidate_prompt_cache(self) -> None:
         self._detail_cells = None
+        self.version += 1
         super()._invalidate_prompt_cache()
 
     def get_component_classes(self) -> list[str]:
@@ -266,6 +325,108 @@ class FileListSelectionWidget(LazySelection):
         self._invalidate_prompt_cache()
 
 
+class FileListRows(Sequence[FileListSelectionWidget]):
+    """The rows of a FileList, as indexes into the folder listing.
+
+    A row only becomes a FileListSelectionWidget the first time it is looked
+    up (drawn, highlighted, selected...), so handing a folder to the list
+    costs the same no matter how many items it has. `on_build` is called with
+    every row that gets built, so the list can index it.
+    """
+
+    def __init__(
+        self,
+        items: list[CWDObjectReturnDict],
+        clipboard: SelectionList,
+        on_build: Callable[[FileListSelectionWidget, int], None] | None = None,
+    ) -> None:
+        self.items = items
+        self.on_build = on_build
+        self._clipboard = clipboard
+        self._built: dict[int, FileListSelectionWidget] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @overload
+    def __getitem__(self, index: int) -> FileListSelectionWidget: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[FileListSelectionWidget]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> FileListSelectionWidget | Sequence[FileListSelectionWidget]:
+        if isinstance(index, slice):
+            return _RowsSlice(self, range(len(self.items))[index])
+        if index < 0:
+            index += len(self.items)
+        option = self._built.get(index)
+        if option is not None:
+            return option
+        if not 0 <= index < len(self.items):
+            raise IndexError("row index out of range")
+        item = self.items[index]
+        # setdefault, so a row built by a worker at the same time is not
+        # replaced by a second copy
+        option = self._built.setdefault(
+            index,
+            FileListSelectionWidget(
+                icon_factory=item["icon"],
+                label=item["name"],
+                dir_entry=item["dir_entry"],
+                clipboard=self._clipboard,
+                index=index,
+            ),
+        )
+        if self.on_build is not None:
+            self.on_build(option, index)
+        return option
+
+    def labels(self) -> list[str]:
+        """
+        Returns:
+            list[str]: the label of every row, without building any
+        """
+        return [item["name"] for item in self.items]
+
+    def built(self) -> list[tuple[int, FileListSelectionWidget]]:
+        """
+        Returns:
+            list[tuple[int, FileListSelectionWidget]]: the rows built so far, and their indexes
+        """
+        return list(self._built.items())
+
+
+class _RowsSlice(Sequence[FileListSelectionWidget]):
+    """A slice of FileListRows that builds rows as it is walked, not up front."""
+
+    def __init__(self, rows: FileListRows, indexes: range) -> None:
+        self._rows = rows
+        self._indexes = indexes
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    @overload
+    def __getitem__(self, index: int) -> FileListSelectionWidget: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[FileListSelectionWidget]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> FileListSelectionWidget | Sequence[FileListSelectionWidget]:
+        if isinstance(index, slice):
+            return _RowsSlice(self._rows, self._indexes[index])
+        return self._rows[self._indexes[index]]
+
+    def __iter__(self) -> Iterator[FileListSelectionWidget]:
+        rows = self._rows
+        for index in self._indexes:
+            yield rows[index]
+
+
 class ClipboardSelectionValue(NamedTuple):
     path: str
     type_of_selection: Literal["copy", "cut"]
@@ -375,8 +536,10 @@ class OptionWithValue(LazyOption):
 
 
 class PathDropdownItem(DropdownItem):
-    def __init__(self, completion: str, path: str) -> None:
-        icon = icon_utils.get_icon_for_folder(path)
+    def __init__(
+        self, completion: str, path: str, is_symlink: bool | None = None
+    ) -> None:
+        icon = icon_utils.get_icon_for_folder(path, is_symlink=is_symlink)
         prefix = _get_cached_icon(icon)
         super().__init__(completion, prefix)
         self.path = path
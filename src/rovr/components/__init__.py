@@ -1,10 +1,29 @@
-from .base_search_screen import ModalSearchScreen
-from .popup_option_list import PopupOptionList
-from .search_container import SearchInput
-from .special_option_lists import (
-    DoubleClickableOptionList,
-    PaddedOption,
-    SpecialOptionList,
+from typing import TYPE_CHECKING
+
+from rovr.functions.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_search_screen import ModalSearchScreen
+    from .popup_option_list import PopupOptionList
+    from .search_container import SearchInput
+    from .special_option_lists import (
+        DoubleClickableOptionList,
+        PaddedOption,
+        SpecialOptionList,
+    )
+
+# the search screens (and the file index behind them) are only needed once
+# one is opened, so nothing here is imported until it is first used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ModalSearchScreen": ".base_search_screen",
+        "PopupOptionList": ".popup_option_list",
+        "SearchInput": ".search_container",
+        "PaddedOption": ".special_option_lists",
+        "SpecialOptionList": ".special_option_lists",
+        "DoubleClickableOptionList": ".special_option_lists",
+    },
 )
 
 __all__ = [
@@ -1,15 +1,17 @@
 import asyncio
-from typing import Coroutine
+from typing import Coroutine, NamedTuple, Sequence
 
-from textual import events, on
+from textual import events, on, work
 from textual.dom import DOMNode
 from textual.screen import ModalScreen
 from textual.widgets import Input, OptionList
-from textual.worker import Worker
+from textual.widgets.option_list import Option
+from textual.worker import Worker, get_current_worker
 
 from rovr.classes.mixins import Action, Actionable
 from rovr.classes.textual_options import OptionWithValue
 from rovr.components.special_option_lists import DoubleClickableOptionList
+from rovr.functions.file_index import REGEX_CHARACTERS, IndexOptions, get_file_index
 from rovr.functions.utils import dismiss
 from rovr.variables.constants import config
 
@@ -18,11 +20,39 @@ def can_do_keybind(self: DOMNode) -> bool:
     return bool(isinstance(self.focused, Input) and self.search_options.options)
 
 
+class CachedSearch(NamedTuple):
+    key: tuple[str, ...]
+    """The working directory and every flag passed to the tool, except the term"""
+    term: str
+    options: list[OptionWithValue]
+
+
+def can_refine(previous: str, current: str, previous_case_sensitive: bool) -> bool:
+    """Whether everything matching `current` is guaranteed to match `previous`.
+
+    Only holds for plain strings, as a regex can match less once it is longer
+    (`a*` matches everything, `a*b` does not).
+
+    Returns:
+        bool: whether the results for `previous` can be narrowed down instead
+        of searching again
+    """
+    if not (
+        REGEX_CHARACTERS.isdisjoint(previous) and REGEX_CHARACTERS.isdisjoint(current)
+    ):
+        return False
+    if previous_case_sensitive:
+        return previous in current
+    return previous.lower() in current.lower()
+
+
 class ModalSearchScreen(Actionable, ModalScreen, inherit_bindings=False):
     """Base class for search-as-you-type modal screens."""
 
     border_subtitle_index: int = 0
     is_loading: bool = False
+    LAUNCH_DEBOUNCE: float = 0.15
+    """How long to wait for the next keystroke before starting a process"""
 
     def create_proc(
         self, program: str, *args: str
@@ -35,8 +65,85 @@ class ModalSearchScreen(Actionable, ModalScreen, inherit_bindings=False):
             stderr=asyncio.subprocess.PIPE,
         )
 
+    async def wait_for_typing(self) -> bool:
+        """Wait out the debounce, so a process is not started for every keystroke.
+
+        Returns:
+            bool: whether the current worker is still the newest search
+        """
+        await asyncio.sleep(self.LAUNCH_DEBOUNCE)
+        return self._active_worker is get_current_worker()
+
+    def show_empty(self) -> None:
+        self.search_options.add_class("empty")
+        self.search_options.clear_options()
+        self.search_options.border_subtitle = ""
+
+    def show_batch(
+        self,
+        worker: Worker,
+        options: list[OptionWithValue],
+        first: bool,
+        last: bool = True,
+    ) -> None:
+        """Show results streamed from a thread worker, batch by batch."""
+        if worker.is_cancelled:
+            # a newer search already took over the list
+            return
+        if first and not options and last:
+            self.show_results(options)
+            return
+        if first:
+            self.search_options.clear_options()
+            self.search_options.remove_class("empty")
+        self.search_options.add_options(options)
+        if self.search_options.highlighted is None and self.search_options.options:
+            self.search_options.highlighted = 0
+        self.is_loading = not last
+        self.update_subtitle()
+
+    def ensure_index(self, options: IndexOptions) -> None:
+        """Build the file index, or check a saved one for changes, once per screen."""
+        if options != self._index_options:
+            self._index_options = options
+            self.index_builder(options)
+
+    @work(thread=True, exclusive=True, group="file_index_update")
+    def index_builder(self, options: IndexOptions) -> None:
+        worker = get_current_worker()
+        index = get_file_index(options)
+        changed = index.update(should_stop=lambda: worker.is_cancelled)
+        if worker.is_cancelled:
+            return
+        if changed:
+            index.save()
+            self.app.call_from_thread(self.refresh_index_results, options)
+
+    def refresh_index_results(self, options: IndexOptions) -> None:
+        if options == self._index_options:
+            self.post_message(
+                Input.Changed(self.search_input, value=self.search_input.value)
+            )
+
+    def show_results(self, options: Sequence[Option]) -> None:
+        """Replace the options with a complete set of results."""
+        if not options:
+            self.search_options.set_options((
+                Option("  --No matches found--", disabled=True),
+            ))
+            self.search_options.add_class("empty")
+            self.search_options.border_subtitle = ""
+            return
+        self.search_options.clear_options()
+        self.search_options.remove_class("empty")
+        self.search_options.add_options(options)
+        self.search_options.highlighted = 0
+        self.update_subtitle()
+
     def on_mount(self) -> None:
         self._active_worker: Worker | None = None
+        self._last_search: CachedSearch | None = None
+        self._index_options: IndexOptions | None = None
         self.search_input: Input = self.query_one(Input)
         self.search_options: DoubleClickableOptionList = self.query_one(
             DoubleClickableOptionList
@@ -1,4 +1,7 @@
+import asyncio
 import contextlib
+from time import monotonic
+from typing import Sequence, cast
 
 from textual import events, work
 from textual.css.query import NoMatches
@@ -8,8 +11,12 @@ from textual.widgets.option_list import Option
 from textual.widgets.selection_list import Selection, SelectionError
 from textual_autocomplete.fuzzy_search import Matcher
 
+from rovr.functions.fuzzy import FilterIndex
 from rovr.functions.utils import set_scuffed_subtitle
 
+# how long scoring may hold the event loop before yielding (about a frame)
+SCORING_BUDGET: float = 1 / 60
+
 
 class SearchInput(Input):
     def __init__(self, always_add_disabled: bool = True, placeholder: str = "") -> None:
@@ -18,6 +25,7 @@ class SearchInput(Input):
         )
         self.always_add_disabled = always_add_disabled
         self.selected = set()
+        self._filter_index: FilterIndex | None = None
 
     def on_mount(self) -> None:
         assert self.parent
@@ -55,51 +63,62 @@ class SearchInput(Input):
             else:
                 self.items_list.highlighted = 0
             if self.item_list_type == "Selection":
-                for option_id in self.selected:
-                    with contextlib.suppress(OptionDoesNotExist):
-                        if not self.items_list.select_mode:
-                            with self.items_list.prevent(
-                                self.items_list.SelectedChanged
-                            ):
-                                self.items_list.select(
-                                    self.items_list.get_option(option_id)
-                                )
-                        else:
-                            self.items_list.select(
-                                self.items_list.get_option(option_id)
-                            )
+                self.reselect()
             return
-        self.items_list.clear_options()
         matcher = Matcher(
             event.value,
         )
         assert hasattr(self.items_list, "list_of_options")
-        assert isinstance(self.items_list.list_of_options, list)
+        assert isinstance(self.items_list.list_of_options, Sequence)
+        list_of_options = cast(Sequence[Option], self.items_list.list_of_options)
+        if self._filter_index is None or not self._filter_index.is_for(list_of_options):
+            self._filter_index = FilterIndex(list_of_options, self.always_add_disabled)
+        filter_index = self._filter_index
         output: list[Option] = []
+        matched: list[int] = []
         segment: list[
             tuple[Option, int | float, int]
         ] = []  # (option, score, original_index)
-        for idx, option in enumerate(self.items_list.list_of_options):
-            assert isinstance(option, Option)
-            if (
-                self.always_add_disabled
-                and option.disabled
-                or (hasattr(option, "pseudo_disabled") and option.pseudo_disabled)
-            ):
+        streamed = False
+        deadline = monotonic() + SCORING_BUDGET
+        labels = filter_index.labels
+        for idx in filter_index.candidates(event.value):
+            if filter_index.separators[idx]:
                 if segment:
                     segment.sort(key=lambda tup: (-tup[1], tup[2]))
                     output.extend(o for o, _, _ in segment)
                     segment = []
-                output.append(option)
+                output.append(list_of_options[idx])
+                matched.append(idx)
                 continue
-            score = matcher.match(option.label)
+            # scored on the label, so only the rows that match get built
+            score = matcher.match(labels[idx])
             if score > 0:
-                assert isinstance(option, Option)
-                segment.append((option, score, idx))
+                segment.append((list_of_options[idx], score, idx))
+                matched.append(idx)
+            if monotonic() > deadline:
+                if not streamed:
+                    # show what has been scored so far, the rest follows
+                    streamed = True
+                    self.items_list.clear_options()
+                    self.items_list.add_options([
+                        *output,
+                        *(
+                            o
+                            for o, _, _ in sorted(
+                                segment, key=lambda tup: (-tup[1], tup[2])
+                            )
+                        ),
+                    ])
+                # let the next keystroke cancel this worker
+                await asyncio.sleep(0)
+                deadline = monotonic() + SCORING_BUDGET
         if segment:
             segment.sort(key=lambda tup: (-tup[1], tup[2]))
             output.extend(o for o, _, _ in segment)
+        filter_index.remember(event.value, matched)
         matches = output
+        self.items_list.clear_options()
         if matches:
             self.items_list.add_options(matches)
         else:
@@ -128,15 +147,15 @@ class SearchInput(Input):
             else:
                 self.items_list.action_cursor_down()
         if self.item_list_type == "Selection":
-            for option_id in self.selected:
-                with contextlib.suppress(OptionDoesNotExist):
-                    if not self.items_list.select_mode:
-                        with self.items_list.prevent(self.items_list.SelectedChanged):
-                            self.items_list.select(
-                                self.items_list.get_option(option_id)
-                            )
-                    else:
-                        self.items_list.select(self.items_list.get_option(option_id))
+            self.reselect()
+
+    def reselect(self) -> None:
+        """Select the remembered values that are still in the list, in one go."""
+        if not self.items_list.select_mode:
+            with self.items_list.prevent(self.items_list.SelectedChanged):
+                self.items_list.select_values(self.selected)
+        else:
+            self.items_list.select_values(self.selected)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         self.items_list.focus()
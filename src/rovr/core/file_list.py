@@ -1,11 +1,12 @@
 import shlex
 from contextlib import suppress
 from os import path, scandir
-from typing import Callable, ClassVar, Literal, Sequence
+from typing import Callable, ClassVar, Iterable, Literal, Self, Sequence
 
 from rich.segment import Segment
 from textual import events, work
 from textual.binding import BindingType
+from textual.cache import LRUCache
 from textual.css.query import NoMatches
 from textual.errors import NoWidget
 from textual.strip import Strip
@@ -21,10 +22,19 @@ from rovr.classes.mixins import (
     DetailColumnRenderingMixin,
     ScrollOffMixin,
     SetOptionsSelectionList,
-    SingleLineOptionLayoutMixin,
+    VirtualRowsMixin,
+)
+from rovr.classes.selection import RowSelection
+from rovr.classes.session_manager import (
+    SessionManager,
+    SessionOptionDict,
+    SessionSelection,
+)
+from rovr.classes.textual_options import (
+    ArchiveFileListSelection,
+    FileListRows,
+    FileListSelectionWidget,
 )
-from rovr.classes.session_manager import SessionManager, SessionOptionDict
-from rovr.classes.textual_options import FileListSelectionWidget
 from rovr.functions import details as detail_utils
 from rovr.functions import path as path_utils
 from rovr.functions import pins as pin_utils
@@ -40,13 +50,16 @@ from rovr.variables.constants import (
 
 from .file_list_right_click_menu import FileListRightClickMenu
 
+# rendered rows kept around, a few screens worth even on tall terminals
+ROW_STRIP_CACHE_SIZE: int = 1024
+
 
 class FileList(
     Actionable,
     CheckboxRenderingMixin,
     DetailColumnRenderingMixin,
     ScrollOffMixin,
-    SingleLineOptionLayoutMixin,
+    VirtualRowsMixin,
     SetOptionsSelectionList,
     SelectionList,
     inherit_bindings=False,
@@ -138,7 +151,8 @@ class FileList(
             enter_into (str): The path to enter into when a folder is selected.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
-        self._options: list[FileListSelectionWidget] = []
+        self._selected: RowSelection = RowSelection()
+        self._options: list[FileListSelectionWidget] | FileListRows = []
         self.dummy = dummy
         self.enter_into = enter_into
         self.select_mode: Literal[False, "implicit", "explicit"] = False
@@ -148,6 +162,10 @@ class FileList(
         self._ignore_next_click: bool = False
         self._in_git_repo: bool = False
         self._folder_item_counts: dict[str, tuple[int, int]] = {}
+        # row -> (everything the row was rendered from, the rendered row)
+        self._row_strips: LRUCache[int, tuple[tuple, Strip]] = LRUCache(
+            ROW_STRIP_CACHE_SIZE
+        )
 
     def on_mount(self) -> None:
         if not self.dummy and self.parent:
@@ -178,6 +196,43 @@ class FileList(
         return columns
 
     def render_line(self, y: int) -> Strip:
+        """Render a line, reusing the last render of the row if nothing it
+        depends on has changed. Style changes (focus, theme...) and anything
+        that goes through `_clear_caches` drop every cached row.
+
+        Returns:
+            Strip: the rendered line
+        """
+        row = self.scroll_offset.y + y
+        if not 0 <= row < len(self._options):
+            return self._render_row(y)
+        option = self._options[row]
+        key = (
+            option,
+            getattr(option, "version", 0),
+            self.scrollable_content_region.width,
+            self.highlighted == row,
+            self._mouse_hovering_over == row,
+            option.value in self._selected,
+            bool(self.select_mode),
+            self._in_git_repo,
+        )
+        cached = self._row_strips.get(row)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        line = self._render_row(y)
+        self._row_strips[row] = (key, line)
+        return line
+
+    def _clear_caches(self) -> None:
+        self._row_strips.clear()
+        super()._clear_caches()
+
+    def notify_style_update(self) -> None:
+        self._row_strips.clear()
+        super().notify_style_update()
+
+    def _render_row(self, y: int) -> Strip:
         line = super().render_line(y)
         if self.dummy:
             return line
@@ -385,7 +440,7 @@ class FileList(
             preview = self.app.query_one("PreviewContainer")
 
             # Separate folders and files
-            self.list_of_options: list[FileListSelectionWidget | Selection] = []
+            self.list_of_options: list[Selection] | FileListRows = []
             self.items_in_cwd: set[str] = set()
 
             to_highlight_index: int = -1
@@ -409,28 +464,10 @@ class FileList(
                     preview.border_title = ""
                 else:
                     file_list_options = folders + files
-                    self.list_of_options = []
-                    name_to_index: dict[str, int] = {}
-
-                    # for i, item in enumerate(file_list_options):
-                    #     self.list_of_options.append(
-                    #         FileListSelectionWidget(
-                    #             icon=item["icon"],
-                    #             label=item["name"],
-                    #             dir_entry=item["dir_entry"],
-                    #             clipboard=self.app.Clipboard,
-                    #         )
-                    #     )
-                    #     name_to_index[item["name"]] = i
-                    self.list_of_options = [
-                        FileListSelectionWidget(
-                            icon_factory=item["icon"],
-                            label=item["name"],
-                            dir_entry=item["dir_entry"],
-                            clipboard=self.app.Clipboard,
-                        )
-                        for item in file_list_options
-                    ]
+                    # rows are only built when they are drawn or looked up
+                    self.list_of_options = FileListRows(
+                        file_list_options, self.app.Clipboard
+                    )
                     name_to_index = {
                         item["name"]: i for i, item in enumerate(file_list_options)
                     }
@@ -537,8 +574,9 @@ class FileList(
                 self.input.clear()
             if clear_search:
                 self.app.tabWidget.active_tab.session.search = ""
-            if not add_to_session:
-                self.input.clear_selected()
+            # the search remembers rows of this listing, which mean other
+            # files in the next one
+            self.input.clear_selected()
             if self.list_of_options[0].disabled:  # special option
                 if self.select_mode:
                     await self.toggle_mode()
@@ -552,12 +590,25 @@ class FileList(
         self, session: SessionManager, name_to_index: dict[str, int]
     ) -> None:
         self.log("Restoring selected items from session...")
-        self.log(session.selectedItems)
+        selection = session.selectedItems
         with self.prevent(SelectionList.SelectedChanged):
             self.deselect_all()
-            for item in session.selectedItems:
-                if item["name"] in name_to_index:
-                    self.select(self.list_of_options[name_to_index[item["name"]]])
+            if selection is None or not isinstance(self.list_of_options, FileListRows):
+                return
+            old_listing, new_listing = selection.listing, self.list_of_options.items
+            if len(old_listing) == len(new_listing) and all(
+                old_listing[row]["name"] == new_listing[row]["name"]
+                for row in selection.rows
+            ):
+                # nothing moved, so the rows can be taken as they are
+                self._selected.bits = selection.rows.copy()
+            else:
+                bits = self._selected.bits
+                for row in selection.rows:
+                    index = name_to_index.get(old_listing[row]["name"])
+                    if index is not None:
+                        bits.add(index)
+            self.refresh()
 
     async def file_selected_handler(self, paths: list[str]) -> None:
         if self.app._chooser_file:
@@ -645,12 +696,11 @@ class FileList(
             self.app.tabWidget.active_tab.selectedItems = []
         else:
             session: SessionManager = self.app.tabWidget.active_tab.session
-            selected_ids = set(self.selected)
-            session.selectedItems = [
-                {"name": option.dir_entry.name, "index": index}
-                for index, option in enumerate(self.options)
-                if option.value in selected_ids
-            ]
+            session.selectedItems = (
+                SessionSelection(self.list_of_options.items, self._selected.bits.copy())
+                if isinstance(self.list_of_options, FileListRows)
+                else None
+            )
 
     # No clue why I'm using an OptionList method for SelectionList
     async def on_option_list_option_highlighted(
@@ -712,6 +762,116 @@ class FileList(
     def options(self) -> Sequence[FileListSelectionWidget]:
         return self._options
 
+    def set_options(self, options: Iterable[Selection] | FileListRows) -> Self:  # ty: ignore[invalid-method-override]
+        """Set the options, without building or indexing every row of a listing.
+
+        Args:
+            options: The rows of a listing, or any other selections.
+
+        Returns:
+            Self: the FileList
+        """
+        self._detach_rows()
+        self._row_strips.clear()
+        if not isinstance(options, FileListRows):
+            self._options = []
+            return super().set_options(options)
+        self._selected.clear()
+        self._values.clear()
+        self._line_cache.clear()
+        self._option_render_cache.clear()
+        self._id_to_option.clear()
+        self._option_to_index.clear()
+        self._options = options
+        # rows built before (say, by a search) have to be found by id again
+        for index, option in options.built():
+            self._index_option(option, index)
+        options.on_build = self._index_option
+        self.highlighted = None
+        self.scroll_y = 0
+        if self.is_mounted:
+            self.refresh(layout=self.styles.auto_dimensions)
+            self._update_lines()
+        return self
+
+    def clear_options(self) -> Self:
+        self._detach_rows()
+        self._row_strips.clear()
+        self._options = []
+        return super().clear_options()
+
+    def _detach_rows(self) -> None:
+        if isinstance(self._options, FileListRows):
+            self._options.on_build = None
+
+    def _index_option(self, option: FileListSelectionWidget, index: int) -> None:
+        """Do what OptionList.add_options does for each option, for one row."""
+        # rows are always built with an id
+        assert option.id is not None
+        self._option_to_index[option] = index
+        self._id_to_option[option.id] = option
+        self._values[option.value] = index
+
+    def _set_all_rows(self, change: Literal["select", "deselect", "toggle"]) -> bool:
+        """Change every row of a listing at once, on the bitset.
+
+        Returns:
+            bool: whether the rows are a listing, so the change was made
+        """
+        if not isinstance(self._options, FileListRows):
+            return False
+        bits = self._selected.bits
+        last = len(self._options) - 1
+        if change == "toggle":
+            bits.invert_range(0, last)
+        else:
+            bits.set_range(0, last, change == "select")
+        # one message for the whole change, instead of one per row
+        self._message_changed()
+        self.refresh()
+        return True
+
+    def select_all(self) -> Self:
+        if not self._set_all_rows("select"):
+            super().select_all()
+        return self
+
+    def deselect_all(self) -> Self:
+        # only what is selected needs to be looked at, not every row
+        if self._selected:
+            self._selected.clear()
+            self._message_changed()
+        self.refresh()
+        return self
+
+    def toggle_all(self) -> Self:
+        if not self._set_all_rows("toggle"):
+            super().toggle_all()
+        return self
+
+    def select_values(self, values: Iterable[int | str]) -> None:
+        """Select the values that have a row in the list, with one message.
+
+        Args:
+            values: The values to select, like the ones from `selected`.
+        """
+        options = self._options
+        if isinstance(options, FileListRows):
+            count = len(options)
+            present = [
+                value for value in values if isinstance(value, int) and value < count
+            ]
+        else:
+            present = [value for value in values if value in self._values]
+        changed = False
+        for value in present:
+            if value not in self._selected:
+                self._selected[value] = None
+                changed = True
+        if changed:
+            self._message_changed()
+            self.refresh()
+
     async def toggle_mode(
         self, type: Literal["implicit", "explicit"] | None = "explicit"
     ) -> None:
@@ -756,14 +916,21 @@ class FileList(
         if not self.select_mode:
             return [str(path_utils.normalise(self.highlighted_option.dir_entry.path))]
         else:
-            values = self.selected
-            if not values:
-                return []
-            options = (self.get_option(value) for value in values)
-
+            options = self._options
+            if isinstance(options, FileListRows):
+                # straight from the listing, without building the rows
+                return [
+                    str(path_utils.normalise(options.items[row]["dir_entry"].path))
+                    for row in self._selected.bits
+                ]
+            selected = (
+                options[self._values[value]]
+                for value in self._selected
+                if value in self._values
+            )
             return [
                 str(path_utils.normalise(option.dir_entry.path))
-                for option in options
+                for option in selected
                 if isinstance(option, FileListSelectionWidget)
             ]
 
@@ -771,7 +938,13 @@ class FileList(
         """Update the dimmed items in the file list based on the cut items."""
         if self.option_count == 0 or self.get_option_at_index(0).disabled:
             return
-        for option in self.options:
+        options = self._options
+        built = (
+            (option for _, option in options.built())
+            if isinstance(options, FileListRows)
+            else options
+        )
+        for option in built:
             option._invalidate_prompt_cache()
         self._clear_caches()
         self._update_lines()
@@ -798,7 +971,7 @@ class FileList(
             self.app.tabWidget.active_tab.selectedItems = []
         else:
             utils.set_scuffed_subtitle(
-                self.parent, "SELECT", f"{len(self.selected)}/{len(self.options)}"
+                self.parent, "SELECT", f"{len(self._selected)}/{len(self.options)}"
             )
 
     # not exactly sure, but there's this issue where if I click the
@@ -883,8 +1056,6 @@ class FileList(
     # two items do you?)
     def action_toggle_pin(self) -> None:
         pin_utils.toggle_pin(path.basename(getcwd()), getcwd())
-        with suppress(OSError):
-            setattr(self.app, "_pins_mtime", path.getmtime(pin_utils.PIN_PATH))
         self.app.query_one("PinnedSidebar").reload_pins()
 
     def action_copy(self) -> None:
@@ -955,7 +1126,7 @@ class FileList(
                 return
             if not self.select_mode:
                 await self.toggle_mode()
-            if len(self.selected) == len(self.options):
+            if len(self._selected) == len(self.options):
                 self.deselect_all()
             else:
                 self.select_all()
@@ -965,18 +1136,17 @@ class FileList(
         if self.get_option_at_index(0).disabled:
             return
         first, last = sorted((start, end))
-        for index in range(first, last + 1):
-            self._selected[self._options[index].value] = None
+        if isinstance(self._options, FileListRows):
+            self._selected.bits.set_range(first, last)
+        else:
+            for index in range(first, last + 1):
+                self._selected[self._options[index].value] = None
         self._message_changed()
 
     async def implicit_selector(self, ver: Literal["pre", "post"]) -> bool:
         if config["interface"]["allow_auto_select_mode"] and (
             (ver == "pre" and not self.select_mode)
-            or (
-                ver == "post"
-                and self.select_mode == "implicit"
-                and len(self.selected) <= 0
-            )
+            or (ver == "post" and self.select_mode == "implicit" and not self._selected)
         ):
             await self.toggle_mode("implicit")
         return bool(self.select_mode)
@@ -1056,6 +1226,10 @@ class FileList(
             await self.select_range(old, new)
 
     def action_select(self) -> None:
+        if isinstance(self.highlighted_option, ArchiveFileListSelection):
+            # archive rows are only there to be highlighted, the preview
+            # opens their folders
+            return
         super().action_select()
         self.call_later(self.call_later, self.implicit_selector, "post")
 
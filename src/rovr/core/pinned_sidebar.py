@@ -1,6 +1,6 @@
-import multiprocessing
 import sys
-from os import R_OK, access, path
+from contextlib import suppress
+from os import path
 from threading import Lock
 from typing import ClassVar, cast
 
@@ -16,9 +16,9 @@ from rovr.classes.mixins import Action, Actionable
 from rovr.classes.textual_options import PinnedSidebarOption
 from rovr.functions import drive_workers as drive_utils
 from rovr.functions import icons as icon_utils
-from rovr.functions import multiprocessing_utils
 from rovr.functions import path as path_utils
 from rovr.functions import pins as pin_utils
+from rovr.functions import reachability
 from rovr.functions.utils import multiprocessing_process_error_checker
 from rovr.variables.constants import bindings, config
 
@@ -33,131 +33,164 @@ class PinnedSidebar(Actionable, OptionList, inherit_bindings=False):
     def reload_pins(self) -> None:
         """Reload pins shown
 
-        Raises:
-            FolderNotFileError: If the pin location is a file, and not a folder.
+        Every pin is checked at once, with a timeout, so one that stopped
+        responding (like a network mount) is only marked as such, instead of
+        holding up the rest. If every pin was checked before, that is shown
+        straight away while they are checked again.
         """
         self.tlock.acquire()
         available_pins = cast(
             pin_utils.PinsDict, globals().get("pins", pin_utils.load_pins())
         )
-        pins = available_pins["pins"]
-        default = available_pins["default"]
-        id_list = []
-        self.list_of_options = []
         # get current highlight
         prev_highlighted: int = 0 if self.highlighted is None else self.highlighted
         self.log(f"Reloading pins: {available_pins}")
-        self.log(f"Reloading default folders: {default}")
-        for default_folder in default:
-            if not isinstance(default_folder["path"], str):
-                continue
-            if default_folder["path"] == pin_utils.TRASH:
-                new_id = f"{path_utils.compress(pin_utils.TRASH)}-default"
-                if new_id not in id_list:
-                    self.list_of_options.append(
-                        PinnedSidebarOption(
-                            icon=icon_utils.get_icon("general", "trash"),
-                            label=default_folder["name"]
-                            if isinstance(default_folder["name"], str)
-                            else "Trash",
-                            id=new_id,
-                        )
-                    )
-                    id_list.append(new_id)
-                continue
-            if not path.isdir(default_folder["path"]) and path.exists(
-                default_folder["path"]
-            ):
-                raise FolderNotFileError(
-                    f"Expected a folder but got a file: {default_folder['path']}"
-                )
-            # we already ensured it, so just ignore ty errors
-            if (
-                "icon" in default_folder
-                and isinstance(default_folder["icon"], list)
-                and len(default_folder["icon"]) == 2
-            ):
-                icon: tuple[str, str] = default_folder["icon"]
-            elif path.isdir(default_folder["path"]):
-                icon: tuple[str, str] = icon_utils.get_icon_for_folder(
-                    default_folder["name"]
-                )
-            else:
-                icon: tuple[str, str] = icon_utils.get_icon_for_file(
-                    default_folder["name"]
-                )
-            if not (
-                isinstance(default_folder["path"], str)
-                and isinstance(default_folder["name"], str)
-            ):
-                # just ignore, shouldn't happen
-                continue
-            new_id = f"{path_utils.compress(default_folder['path'])}-default"
-            if new_id not in id_list:
-                self.list_of_options.append(
-                    PinnedSidebarOption(
-                        icon=icon,
-                        label=default_folder["name"],
-                        id=new_id,
-                    )
+        pin_paths = [
+            item["path"]
+            for item in (*available_pins["default"], *available_pins["pins"])
+            if isinstance(item, dict)
+            and isinstance(item.get("path"), str)
+            and item["path"] != pin_utils.TRASH
+        ]
+        known = reachability.known([*pin_paths, *self.DRIVES])
+        if known is not None:
+            options, id_list = self._pin_options(available_pins, known)
+            options.extend(self._drive_options(self.DRIVES, known, id_list))
+            if self.app.return_code is not None:
+                self.tlock.release()
+                return
+            self.app.call_from_thread(self.set_options, options)
+            if prev_highlighted < len(options):
+                self.app.call_from_thread(
+                    setattr, self, "highlighted", prev_highlighted
                 )
-                id_list.append(new_id)
-        self.list_of_options.append(
-            Option(" Pinned", id="pinned-header", disabled=True)
+        statuses = reachability.check_paths(
+            pin_paths, on_late_answer=self._on_late_answer
         )
-        for pin in pins:
-            try:
-                pin["path"]
-            except KeyError:
-                continue
-            if not isinstance(pin["path"], str):
-                # same thing, just ignore this
-                continue
-            if not path.isdir(pin["path"]):
-                if path.exists(pin["path"]):
+        self.list_of_options, id_list = self._pin_options(available_pins, statuses)
+        if self.app.return_code is not None:
+            self.tlock.release()
+            return
+        if known is None:
+            # nothing to show yet, so show the pins while drives are listed
+            self.app.call_from_thread(self.set_options, self.list_of_options)
+        if prev_highlighted < len(self.list_of_options):
+            if known is None:
+                self.app.call_from_thread(
+                    setattr, self, "highlighted", prev_highlighted
+                )
+            self.app.call_next(self.refresh_drives, id_list, None)
+        else:
+            self.app.call_next(self.refresh_drives, id_list, prev_highlighted)
+
+    def _pin_options(
+        self,
+        available_pins: pin_utils.PinsDict,
+        statuses: dict[str, reachability.PathStatus],
+    ) -> tuple[list[Option], list[str]]:
+        """Build the options for the default folders and pins.
+
+        Args:
+            available_pins (PinsDict): the pins to show
+            statuses (dict[str, PathStatus]): the status of each pin's path
+
+        Returns:
+            tuple[list[Option], list[str]]: the options, and their ids
+
+        Raises:
+            FolderNotFileError: If the pin location is a file, and not a folder.
+        """
+        options: list[Option] = []
+        id_list: list[str] = []
+        for section, suffix in (("default", "default"), ("pins", "pinned")):
+            if section == "pins":
+                options.append(Option(" Pinned", id="pinned-header", disabled=True))
+            for pin in available_pins[section]:
+                if not isinstance(pin, dict) or not isinstance(pin.get("path"), str):
+                    # just ignore, shouldn't happen
+                    continue
+                if pin["path"] == pin_utils.TRASH:
+                    if section != "default":
+                        continue
+                    new_id = f"{path_utils.compress(pin_utils.TRASH)}-default"
+                    if new_id not in id_list:
+                        options.append(
+                            PinnedSidebarOption(
+                                icon=icon_utils.get_icon("general", "trash"),
+                                label=pin["name"]
+                                if isinstance(pin.get("name"), str)
+                                else "Trash",
+                                id=new_id,
+                            )
+                        )
+                        id_list.append(new_id)
+                    continue
+                status = statuses.get(pin["path"], "stale")
+                if status == "file":
                     raise FolderNotFileError(
                         f"Expected a folder but got a file: {pin['path']}"
                     )
+                if not isinstance(pin.get("name"), str):
+                    # just ignore, shouldn't happen
+                    continue
+                if (
+                    "icon" in pin
+                    and isinstance(pin["icon"], list)
+                    and len(pin["icon"]) == 2
+                ):
+                    # statically analyzed, it is impossible, but because there
+                    # is no way to tell json it is an immutable list, and type
+                    # hint is tuple for pin["icon"], this will work in runtime,
+                    # just wont work when statically analysed.
+                    icon: tuple[str, str] = pin["icon"]
+                elif status == "missing":
+                    icon = icon_utils.get_icon_for_file(pin["name"])
                 else:
-                    pass
-            if (
-                "icon" in pin
-                and isinstance(pin["icon"], list)
-                and len(pin["icon"]) == 2
-            ):
-                # statically analyzed, it is impossible, but because there
-                # is no way to tell json it is an immutable list, and type
-                # hint is tuple for pin["icon"], this will work in runtime,
-                # just wont work when statically analysed.
-                icon = pin["icon"]
-            elif path.isdir(pin["path"]):
-                icon: tuple[str, str] = icon_utils.get_icon_for_folder(pin["name"])
-            else:
-                icon: tuple[str, str] = icon_utils.get_icon_for_file(pin["name"])
-            if not (isinstance(pin["path"], str) and isinstance(pin["name"], str)):
-                # just ignore, shouldn't happen
+                    icon = icon_utils.get_icon_for_folder(pin["name"])
+                new_id = f"{path_utils.compress(pin['path'])}-{suffix}"
+                if new_id not in id_list:
+                    options.append(
+                        PinnedSidebarOption(
+                            icon=icon,
+                            label=pin["name"],
+                            id=new_id,
+                            stale=status == "stale",
+                        )
+                    )
+                    id_list.append(new_id)
+        options.append(Option(" Drives", id="drives-header", disabled=True))
+        return options, id_list
+
+    def _drive_options(
+        self,
+        drives: list[str],
+        statuses: dict[str, reachability.PathStatus],
+        id_list: list[str],
+    ) -> list[PinnedSidebarOption]:
+        new_options: list[PinnedSidebarOption] = []
+        for drive in drives:
+            status = statuses.get(drive, "stale")
+            # unreadable drives are left out, but ones that did not respond
+            # are shown, so it is clear that they are there
+            if status not in ("folder", "stale"):
                 continue
-            new_id = f"{path_utils.compress(pin['path'])}-pinned"
+            new_id = f"{path_utils.compress(drive)}-drives"
             if new_id not in id_list:
-                self.list_of_options.append(
+                new_options.append(
                     PinnedSidebarOption(
-                        icon=icon,
-                        label=pin["name"],
+                        icon=icon_utils.get_icon("folder", ":/drive:"),
+                        label=drive,
                         id=new_id,
+                        stale=status == "stale",
                     )
                 )
                 id_list.append(new_id)
-        self.list_of_options.append(
-            Option(" Drives", id="drives-header", disabled=True)
-        )
-        if self.app.return_code is not None:
-            return
-        self.app.call_from_thread(self.set_options, self.list_of_options)
-        if prev_highlighted < len(self.list_of_options):
-            self.app.call_from_thread(setattr, self, "highlighted", prev_highlighted)
-            self.app.call_next(self.refresh_drives, id_list, None)
-        else:
-            self.app.call_next(self.refresh_drives, id_list, prev_highlighted)
+        return new_options
+
+    def _on_late_answer(self) -> None:
+        # a pin or drive that was not responding answered after all
+        with suppress(RuntimeError):
+            self.app.call_from_thread(self.reload_pins)
 
     @work(thread=True)
     def refresh_drives(
@@ -165,47 +198,20 @@ class PinnedSidebar(Actionable, OptionList, inherit_bindings=False):
     ) -> None:
         # force refresh
         try:
-            if self.app.MULTIPROCESSING_PROCESS_ALLOWED:
-                result_queue: multiprocessing.Queue[list[str]] = multiprocessing.Queue()
-                process = multiprocessing.Process(
-                    target=drive_utils.get_mounted_drives_worker,
-                    args=(result_queue, sys.platform, config),
-                )
-                multiprocessing_utils.start_process(process)
-                process.join(timeout=2.0)
-
-                if process.is_alive():
-                    process.terminate()
-                    process.join(timeout=0.5)
-                    if process.is_alive():
-                        process.kill()
-                    return
-
-                if result_queue.empty():
-                    return
-
-                drives = result_queue.get_nowait()
-            else:
-                drives = drive_utils.get_mounted_drives(sys.platform, config)
+            drives = drive_utils.list_drives(
+                sys.platform, config, self.app.MULTIPROCESSING_PROCESS_ALLOWED
+            )
         except Exception as exc:
             if not multiprocessing_process_error_checker(self.app, exc):
+                self.tlock.release()
                 return
             drives = drive_utils.get_mounted_drives(sys.platform, config)
+        if drives is None:
+            self.tlock.release()
+            return
         self.DRIVES = drives
-        new_options: list[PinnedSidebarOption] = []
-        for drive in drives:
-            if access(drive, R_OK):
-                new_id = f"{path_utils.compress(drive)}-drives"
-                if new_id not in id_list:
-                    new_options.append(
-                        PinnedSidebarOption(
-                            icon=icon_utils.get_icon("folder", ":/drive:"),
-                            label=drive,
-                            id=new_id,
-                        )
-                    )
-                    id_list.append(new_id)
-        self.list_of_options.extend(new_options)
+        statuses = reachability.check_paths(drives, on_late_answer=self._on_late_answer)
+        self.list_of_options.extend(self._drive_options(drives, statuses, id_list))
         try:
             self.app.call_from_thread(self.set_options, self.list_of_options)
             if prev_highlighted is not None and prev_highlighted < len(
@@ -255,6 +261,15 @@ class PinnedSidebar(Actionable, OptionList, inherit_bindings=False):
         if file_path == pin_utils.TRASH:
             self.app.open_recycle_bin()
             return
+        if reachability.statuses.get(file_path) == "stale":
+            # checking it again here would freeze the app until it times out
+            self.notify(
+                f"{file_path} is not responding.",
+                title="Pinned Sidebar",
+                severity="warning",
+                markup=False,
+            )
+            return
         if not path.isdir(file_path):
             if path.exists(file_path):
                 raise FolderNotFileError(
@@ -233,7 +233,7 @@ class FirstLaunchApp(App, inherit_bindings=False):
                 yield Switch(which("pdftoppm") is not None)
                 yield Static("[u]poppler[/] integration")
             with HorizontalGroup(id="plugins-zoxide"):
-                yield Switch(which("zoxide") is not None)
+                yield Switch(True)
                 yield Static("[u]zoxide[/] integration")
             with HorizontalGroup(id="plugins-file"):
                 yield Switch(which("file") is not None)
@@ -305,7 +305,7 @@ class FirstLaunchApp(App, inherit_bindings=False):
             "#plugins-rg": "Uses ripgrep to search all files for content quickly",
             "#plugins-fd": "Uses fd to quickly search for files and directories (and other weird path types)",
             "#plugins-bat": "Uses bat as an alternate previewer",
-            "#plugins-zoxide": "Uses zoxide to zip around directories quickly",
+            "#plugins-zoxide": "Zips around frequently visited directories quickly, like zoxide (and imports its database)",
             "#plugins-poppler": "Uses poppler-utils to preview PDF files",
             "#plugins-file": "Uses the file(1) command to get better file type information",
             "#compact-buttons": "Makes the header area a bit more compact (5 char tall instead of 7)",
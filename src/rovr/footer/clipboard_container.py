@@ -8,7 +8,6 @@ from textual.binding import BindingType
 from textual.content import Content
 from textual.widgets import Button, SelectionList
 from textual.widgets.option_list import OptionDoesNotExist
-from textual.worker import Worker
 
 from rovr.classes.mixins import CheckboxRenderingMixin
 from rovr.classes.textual_options import ClipboardSelection, ClipboardSelectionValue
@@ -25,15 +24,11 @@ class Clipboard(CheckboxRenderingMixin, SelectionList, inherit_bindings=False):
     def __init__(self) -> None:
         super().__init__(id="clipboard")
         self.clipboard_contents = []
-        self._checker_worker: Worker | None = None
         self._options: list[ClipboardSelection] = []
 
     def on_mount(self) -> None:
         self.paste_button: Button = self.app.query_one("#paste", Button)
         self.paste_button.disabled = True
-        self.set_interval(
-            5, self.checker_wrapper, name="Check existence of clipboard items"
-        )
 
     @property
     def options(self) -> Sequence[ClipboardSelection]:
@@ -166,21 +161,22 @@ class Clipboard(CheckboxRenderingMixin, SelectionList, inherit_bindings=False):
         except (KeyError, OptionDoesNotExist):
             return
 
+    def remove_missing_items(self) -> None:
+        """Remove items that no longer exist. Called from a thread, by the
+        app's poller."""
+        for option in list(self.options):
+            if not path.lexists(option.value.path):
+                assert isinstance(option.id, str)
+                self.app.call_from_thread(self.safe_remove_option, option.id)
+
     @work(thread=True)
     def check_clipboard_existence(self) -> None:
         """Check if the files in the clipboard still exist."""
-        re_call = False
-        for option in self.options:
-            if not path.lexists(option.value.path):
-                assert isinstance(option.id, str)
-                self.call_later(self.safe_remove_option, option.id)
-                re_call = True
-        if re_call:
-            self.call_next(self.check_clipboard_existence)
+        self.remove_missing_items()
 
     def checker_wrapper(self) -> None:
-        if self._checker_worker is None or not self._checker_worker.is_running:
-            self._checker_worker: Worker = self.check_clipboard_existence()
+        """Check the clipboard on the poller's next pass."""
+        self.app.poller.run_soon("clipboard")
 
     def action_delete(self) -> None:
         """Delete the selected files from the clipboard."""
@@ -4,10 +4,11 @@ import sys
 import time
 import zipfile
 from contextlib import suppress
+from functools import cache
 from os import path
+from types import ModuleType
 from typing import Callable, Literal, cast
 
-from pytrash import RecycleBin
 from rich.markup import escape
 from textual import work
 from textual.color import Gradient
@@ -22,6 +23,8 @@ from rovr.classes.type_aliases import BarPanicDismissible, BarPanicNotify
 from rovr.functions import icons as icon_utils
 from rovr.functions import path as path_utils
 from rovr.functions.cwd import getcwd
+from rovr.functions.delete import DeleteCancelled, DeleteProgress, TreeDeleter
+from rovr.functions.trash import RECYCLE_BATCH_SIZE, get_recycle_bin
 from rovr.functions.utils import is_being_used, should_cancel
 from rovr.screens import (
     Dismissible,
@@ -31,12 +34,19 @@ from rovr.screens import (
 )
 from rovr.variables.constants import config, scroll_bindings
 
-if sys.version_info.major == 3 and sys.version_info.minor <= 13:
-    from backports.zstd import tarfile  # ty: ignore[unresolved-import]
-else:
-    import tarfile
 
-recycle_bin = RecycleBin()
+@cache
+def get_tarfile() -> ModuleType:
+    """The tarfile module, with zstd support on python 3.13 and older.
+
+    Returns:
+        ModuleType: backports.zstd's tarfile, or the standard library's one
+    """
+    if sys.version_info.major == 3 and sys.version_info.minor <= 13:
+        from backports.zstd import tarfile  # ty: ignore[unresolved-import]
+    else:
+        import tarfile
+    return tarfile
 
 
 class ThickBar(BarRenderable):
@@ -332,7 +342,7 @@ class ProcessContainer(Actionable, VerticalScroll):
     def is_archive_member_directory(self, member: object) -> bool:
         if isinstance(member, zipfile.ZipInfo):
             return member.is_dir()
-        if isinstance(member, tarfile.TarInfo):
+        if isinstance(member, get_tarfile().TarInfo):
             return member.isdir()
         is_dir_attr = getattr(member, "isdir", None)
         if callable(is_dir_attr):
@@ -371,6 +381,9 @@ class ProcessContainer(Actionable, VerticalScroll):
         """
         Permanently remove files from the filesystem, bypassing the recycle bin.
 
+        Folders are deleted while they are walked, by a TreeDeleter, so the
+        bar's total grows as more of them is found.
+
         Args:
             files (list[str]): List of file paths to remove.
         """
@@ -384,81 +397,63 @@ class ProcessContainer(Actionable, VerticalScroll):
             bar.update_text,
             "Getting files to delete...",
         )
-        # get files to delete
-        files_to_delete = []
-        folders_to_delete = []
-        for file in files:
-            if path.isdir(file):
-                folders_to_delete.append(file)
-            files_to_add, folders_to_add = path_utils.get_recursive_files(
-                file, with_folders=True
-            )
-            files_to_delete.extend(files_to_add)
-            folders_to_delete.extend(folders_to_add)
-        self.app.call_from_thread(bar.update_progress, total=len(files_to_delete) + 1)
         action_on_file_in_use = "ask"
-        last_update_time = time.monotonic()
-        for i, item_dict in enumerate(files_to_delete):
-            current_time = time.monotonic()
-            if (
-                current_time - last_update_time > 0.25
-                or i == len(files_to_delete) - 1
-                or i == 0
-            ):
-                self.app.call_from_thread(
-                    bar.update_text,
-                    item_dict["relative_loc"],
+        self.has_perm_error = False
+        self.has_in_use_error = False
+
+        def on_error(item_path: str, exc: OSError, retry: Callable[[], None]) -> bool:
+            nonlocal action_on_file_in_use
+            # Try to detect if file is in use on Windows
+            if (is_file_in_use := is_being_used(exc)) and sys.platform == "win32":
+                current_action, action_on_file_in_use = self.handle_file_in_use_error(
+                    action_on_file_in_use, item_path, retry
                 )
-                self.app.call_from_thread(bar.update_progress, progress=i + 1)
-                last_update_time = current_time
-            if path.lexists(item_dict["path"]):
+                if current_action == "cancel":
+                    raise DeleteCancelled
+                return current_action == "try_again"
+            elif is_file_in_use:
+                # cannot do anything
+                self.has_in_use_error = True
+                return False
+            # fallback for regular permission issues
+            if path_utils.force_obtain_write_permission(item_path):
                 try:
-                    os.remove(item_dict["path"])
+                    retry()
+                    return True
                 except FileNotFoundError:
-                    # it's deleted, so why care?
+                    return True
+                except OSError:
                     pass
-                except (PermissionError, OSError) as exc:
-                    # Try to detect if file is in use on Windows
-                    if (
-                        is_file_in_use := is_being_used(exc)
-                    ) and sys.platform == "win32":
-                        current_action, action_on_file_in_use = (
-                            self.handle_file_in_use_error(
-                                action_on_file_in_use,
-                                item_dict["relative_loc"],
-                                lambda: os.remove(item_dict["path"]),
-                            )
-                        )
-                        if current_action == "cancel":
-                            bar.panic()
-                            return
-                        elif current_action == "skip":
-                            pass  # Skip this file, continue to next
-                        continue
-                    elif is_file_in_use:
-                        # need to ensure unix users see an
-                        # error so they create an issue
-                        self.app.panic()
-                    # fallback for regular permission issues
-                    if path_utils.force_obtain_write_permission(item_dict["path"]):
-                        os.remove(item_dict["path"])
-                except Exception as exc:
-                    # TODO: should probably let it continue, then have a summary
-                    path_utils.dump_exc(self, exc)
-                    bar.panic(
-                        dismiss_with={
-                            "message": f"Deleting failed due to\n{exc}\nProcess Aborted.",
-                            "subtitle": "If this is a bug, please file an issue!",
-                        },
-                        bar_text="Unhandled Error",
-                    )
-                    return
-        # The reason for an extra +1 in the total is for this
-        # handling folders
-        self.has_perm_error = False
-        self.has_in_use_error = False
-        for folder in folders_to_delete:
-            shutil.rmtree(folder, onexc=self.rmtree_fixer)
+            if isinstance(exc, PermissionError):
+                self.has_perm_error = True
+                return False
+            raise exc
+
+        def on_progress(progress: DeleteProgress) -> None:
+            self.app.call_from_thread(bar.update_text, progress.current)
+            self.app.call_from_thread(
+                bar.update_progress,
+                total=progress.found + 1,
+                progress=progress.entries,
+            )
+
+        deleter = TreeDeleter(on_error=on_error, on_progress=on_progress)
+        try:
+            deleter.delete(files)
+        except DeleteCancelled:
+            bar.panic()
+            return
+        except Exception as exc:
+            # TODO: should probably let it continue, then have a summary
+            path_utils.dump_exc(self, exc)
+            bar.panic(
+                dismiss_with={
+                    "message": f"Deleting failed due to\n{exc}\nProcess Aborted.",
+                    "subtitle": "If this is a bug, please file an issue!",
+                },
+                bar_text="Unhandled Error",
+            )
+            return
         if self.has_in_use_error:
             bar.panic(
                 notify={
@@ -475,14 +470,13 @@ class ProcessContainer(Actionable, VerticalScroll):
                 },
             )
             return
-        # if there weren't any files, show something useful
-        # aside from 'Getting files to delete...'
-        if files_to_delete == [] and folders_to_delete != []:
-            self.app.call_from_thread(
-                bar.update_text,
-                files[-1],
-            )
-        elif files_to_delete == folders_to_delete == []:
+        # The reason for an extra +1 in the total is for this
+        self.app.call_from_thread(
+            bar.update_progress,
+            total=deleter.progress.found + 1,
+            progress=deleter.progress.found,
+        )
+        if deleter.progress.entries == 0:
             # this cannot happen, but just as an easter egg
             self.app.call_from_thread(
                 bar.update_text, "Successfully deleted nothing!", False
@@ -508,7 +502,8 @@ class ProcessContainer(Actionable, VerticalScroll):
 
         Top-level items are recycled as whole units, so that a selected
         folder becomes a single trash entry instead of one entry per file
-        it contains.
+        it contains. They are sent in batches of RECYCLE_BATCH_SIZE, and a
+        batch that fails is retried one item at a time to handle the error.
 
         Args:
             files (list[str]): List of top-level file/folder paths to trash.
@@ -536,102 +531,132 @@ class ProcessContainer(Actionable, VerticalScroll):
         self.has_perm_error = False
         self.has_in_use_error = False
         last_update_time = time.monotonic()
-        for i, item_path in enumerate(files):
-            current_time = time.monotonic()
-            if current_time - last_update_time > 0.25 or i == len(files) - 1 or i == 0:
-                self.app.call_from_thread(bar.update_text, item_path)
-                self.app.call_from_thread(bar.update_progress, progress=i + 1)
-                last_update_time = current_time
-            if not path.lexists(item_path):
-                continue
-            try:
-                if not skip_trash:
-                    try:
-                        path_to_trash = item_path
-                        if sys.platform == "win32":
-                            # An inherent issue with long paths on windows
-                            path_to_trash = path_to_trash.replace("/", "\\")
-                        recycle_bin.recycle([path_to_trash])
-                        continue
-                    except (PermissionError, OSError) as exc:
-                        # On Windows, a file being used by another process
-                        # raises a PermissionError/OSError with winerror 32.
-                        if (
-                            is_file_in_use := is_being_used(exc)
-                        ) and sys.platform == "win32":
-                            current_action, action_on_file_in_use = (
-                                self.handle_file_in_use_error(
-                                    action_on_file_in_use,
-                                    item_path,
-                                    lambda: recycle_bin.recycle([path_to_trash]),
+        for start in range(0, len(files), RECYCLE_BATCH_SIZE):
+            batch = files[start : start + RECYCLE_BATCH_SIZE]
+            to_recycle = [
+                item_path.replace("/", "\\") if sys.platform == "win32" else item_path
+                for item_path in batch
+                if path.lexists(item_path)
+            ]
+            if not skip_trash and to_recycle:
+                try:
+                    get_recycle_bin().recycle(to_recycle)
+                except Exception:
+                    # one of them could not be trashed, so go through them
+                    # one by one below to handle it. the ones before it are
+                    # already in the bin by now, so they get skipped
+                    pass
+                else:
+                    self.app.call_from_thread(bar.update_text, batch[-1])
+                    self.app.call_from_thread(
+                        bar.update_progress, progress=start + len(batch)
+                    )
+                    last_update_time = time.monotonic()
+                    continue
+            for i, item_path in enumerate(batch, start):
+                current_time = time.monotonic()
+                if (
+                    current_time - last_update_time > 0.25
+                    or i == len(files) - 1
+                    or i == 0
+                ):
+                    self.app.call_from_thread(bar.update_text, item_path)
+                    self.app.call_from_thread(bar.update_progress, progress=i + 1)
+                    last_update_time = current_time
+                if not path.lexists(item_path):
+                    continue
+                try:
+                    if not skip_trash:
+                        try:
+                            path_to_trash = item_path
+                            if sys.platform == "win32":
+                                # An inherent issue with long paths on windows
+                                path_to_trash = path_to_trash.replace("/", "\\")
+                            get_recycle_bin().recycle([path_to_trash])
+                            continue
+                        except (PermissionError, OSError) as exc:
+                            # On Windows, a file being used by another process
+                            # raises a PermissionError/OSError with winerror 32.
+                            if (
+                                is_file_in_use := is_being_used(exc)
+                            ) and sys.platform == "win32":
+                                current_action, action_on_file_in_use = (
+                                    self.handle_file_in_use_error(
+                                        action_on_file_in_use,
+                                        item_path,
+                                        lambda: get_recycle_bin().recycle([
+                                            path_to_trash
+                                        ]),
+                                    )
                                 )
+                                if current_action == "cancel":
+                                    bar.panic()
+                                    return
+                                continue
+                            elif is_file_in_use:
+                                # need to ensure unix users see an
+                                # error so they create an issue
+                                raise
+                            # fallback for regular permission issues
+                            if path_utils.force_obtain_write_permission(item_path):
+                                self.permanently_delete_item(item_path)
+                        except Exception as exc:
+                            path_utils.dump_exc(self, exc)
+                            do_what = self.app.call_from_thread(
+                                self.app.push_screen_wait,
+                                YesOrNo(
+                                    f"Trashing failed due to\n{exc}\nDo Permanent Deletion?",
+                                    with_toggle=True,
+                                    border_subtitle="If this is a bug, please file an issue!",
+                                    destructive=True,
+                                ),
+                            )
+                            do_what = cast(YesOrNo.ReturnType, do_what)
+                            if do_what["toggle"]:
+                                skip_trash = do_what["value"]
+                            if do_what["value"]:
+                                self.permanently_delete_item(item_path)
+                            else:
+                                continue
+                    else:
+                        self.permanently_delete_item(item_path)
+                except FileNotFoundError:
+                    # it's deleted, so why care?
+                    pass
+                except (PermissionError, OSError) as exc:
+                    # Try to detect if file is in use on Windows
+                    if (
+                        is_file_in_use := is_being_used(exc)
+                    ) and sys.platform == "win32":
+                        current_action, action_on_file_in_use = (
+                            self.handle_file_in_use_error(
+                                action_on_file_in_use,
+                                item_path,
+                                lambda: self.permanently_delete_item(item_path),
                             )
-                            if current_action == "cancel":
-                                bar.panic()
-                                return
-                            continue
-                        elif is_file_in_use:
-                            # need to ensure unix users see an
-                            # error so they create an issue
-                            raise
-                        # fallback for regular permission issues
-                        if path_utils.force_obtain_write_permission(item_path):
-                            self.permanently_delete_item(item_path)
-                    except Exception as exc:
-                        path_utils.dump_exc(self, exc)
-                        do_what = self.app.call_from_thread(
-                            self.app.push_screen_wait,
-                            YesOrNo(
-                                f"Trashing failed due to\n{exc}\nDo Permanent Deletion?",
-                                with_toggle=True,
-                                border_subtitle="If this is a bug, please file an issue!",
-                                destructive=True,
-                            ),
-                        )
-                        do_what = cast(YesOrNo.ReturnType, do_what)
-                        if do_what["toggle"]:
-                            skip_trash = do_what["value"]
-                        if do_what["value"]:
-                            self.permanently_delete_item(item_path)
-                        else:
-                            continue
-                else:
-                    self.permanently_delete_item(item_path)
-            except FileNotFoundError:
-                # it's deleted, so why care?
-                pass
-            except (PermissionError, OSError) as exc:
-                # Try to detect if file is in use on Windows
-                if (is_file_in_use := is_being_used(exc)) and sys.platform == "win32":
-                    current_action, action_on_file_in_use = (
-                        self.handle_file_in_use_error(
-                            action_on_file_in_use,
-                            item_path,
-                            lambda: self.permanently_delete_item(item_path),
                         )
+                        if current_action == "cancel":
+                            bar.panic()
+                            return
+                        continue
+                    elif is_file_in_use:
+                        # need to ensure unix users see an
+                        # error so they create an issue
+                        self.app.panic()
+                    # fallback for regular permission issues
+                    if path_utils.force_obtain_write_permission(item_path):
+                        self.permanently_delete_item(item_path)
+                except Exception as exc:
+                    # TODO: should probably let it continue, then have a summary
+                    path_utils.dump_exc(self, exc)
+                    bar.panic(
+                        dismiss_with={
+                            "message": f"Deleting failed due to\n{exc}\nProcess Aborted.",
+                            "subtitle": "If this is a bug, please file an issue!",
+                        },
+                        bar_text="Unhandled Error",
                     )
-                    if current_action == "cancel":
-                        bar.panic()
-                        return
-                    continue
-                elif is_file_in_use:
-                    # need to ensure unix users see an
-                    # error so they create an issue
-                    self.app.panic()
-                # fallback for regular permission issues
-                if path_utils.force_obtain_write_permission(item_path):
-                    self.permanently_delete_item(item_path)
-            except Exception as exc:
-                # TODO: should probably let it continue, then have a summary
-                path_utils.dump_exc(self, exc)
-                bar.panic(
-                    dismiss_with={
-                        "message": f"Deleting failed due to\n{exc}\nProcess Aborted.",
-                        "subtitle": "If this is a bug, please file an issue!",
-                    },
-                    bar_text="Unhandled Error",
-                )
-                return
+                    return
         if self.has_in_use_error:
             bar.panic(
                 notify={
@@ -669,6 +694,8 @@ class ProcessContainer(Actionable, VerticalScroll):
             files (list[str]): List of file paths to compress.
             archive_name (str): Path for the output archive.
         """
+        from rovr.functions import archive_writer
+
         bar = self.threaded_new_process_bar(classes="active")
         self.app.call_from_thread(
             bar.update_icon,
@@ -676,66 +703,25 @@ class ProcessContainer(Actionable, VerticalScroll):
         )
         self.app.call_from_thread(bar.update_text, "Getting files to archive...", False)
 
-        files_to_archive = []
-        for p in files:
-            if path.isdir(p):
-                if not os.listdir(p):  # empty directory
-                    files_to_archive.append(p)
-                else:
-                    for dirpath, _, filenames in os.walk(p):
-                        for f in filenames:
-                            files_to_archive.append(path.join(dirpath, f))
-            else:
-                files_to_archive.append(p)
-
-        files_to_archive = sorted(list(set(files_to_archive)))
+        sources = archive_writer.collect_sources(files)
+        total_size = sum(source.size for source in sources)
+        # progress is in bytes, with an extra 1 for finishing up
+        self.app.call_from_thread(bar.update_progress, total=total_size + 1)
 
-        self.app.call_from_thread(bar.update_progress, total=len(files_to_archive) + 1)
+        last_update_time = time.monotonic()
 
-        if len(files) == 1:
-            base_path = path.dirname(files[0])
-        else:
-            base_path = path.commonpath(files)
+        def on_progress(done: int, current: str) -> None:
+            nonlocal last_update_time
+            current_time = time.monotonic()
+            if current_time - last_update_time > 0.25:
+                self.app.call_from_thread(bar.update_text, current)
+                self.app.call_from_thread(bar.update_progress, progress=done)
+                last_update_time = current_time
 
         try:
-            from multiarchive import Archive
-
-            with Archive(archive_name, algo, "w", level) as archive:
-                assert archive._archive is not None
-                last_update_time = time.monotonic()
-                for i, file_path in enumerate(files_to_archive):
-                    archive_name = path.relpath(file_path, base_path)
-                    current_time = time.monotonic()
-                    if (
-                        current_time - last_update_time > 0.25
-                        or i == len(files_to_archive) - 1
-                    ):
-                        self.app.call_from_thread(
-                            bar.update_text,
-                            archive_name,
-                        )
-                        self.app.call_from_thread(bar.update_progress, progress=i + 1)
-                        last_update_time = current_time
-                    _archive = archive._archive
-                    if _archive:
-                        if archive._archive_type == "zip":
-                            assert isinstance(_archive, zipfile.ZipFile)
-                            _archive.write(file_path, arcname=archive_name)
-                        else:
-                            assert isinstance(_archive, tarfile.TarFile)
-                            _archive.add(file_path, arcname=archive_name)
-                for p in files:
-                    if path.isdir(p) and not os.listdir(p):
-                        archive_name = path.relpath(p, base_path)
-                        _archive = archive._archive
-                        if _archive:
-                            if archive._archive_type == "zip":
-                                assert isinstance(_archive, zipfile.ZipFile)
-                                _archive.write(p, arcname=archive_name)
-                            else:
-                                assert isinstance(_archive, tarfile.TarFile)
-                                _archive.add(p, arcname=archive_name)
-
+            archive_writer.write_archive(
+                sources, archive_name, algo, level, on_progress
+            )
         except Exception as exc:
             path_utils.dump_exc(self, exc)
             bar.panic(
@@ -746,6 +732,9 @@ class ProcessContainer(Actionable, VerticalScroll):
             )
             return
 
+        if sources:
+            self.app.call_from_thread(bar.update_text, sources[-1].arcname)
+        self.app.call_from_thread(bar.update_progress, progress=total_size)
         bar.ok()
 
     @work(thread=True)
@@ -908,7 +897,12 @@ class ProcessContainer(Actionable, VerticalScroll):
                                 bar_text="Permission Error",
                             )
                             return
-        except (zipfile.BadZipFile, tarfile.TarError, ValueError, RuntimeError) as exc:
+        except (
+            zipfile.BadZipFile,
+            get_tarfile().TarError,
+            ValueError,
+            RuntimeError,
+        ) as exc:
             dismiss_with: BarPanicDismissible
             if isinstance(exc, NotImplementedError):
                 if "ZIP" in exc.__str__():
@@ -1,15 +1,228 @@
+import re
 from functools import lru_cache
+from typing import NamedTuple
 
 from rich.color import Color
 from rich.style import Style
 from rich.text import Span, Text
 
+# one pass over the text, only stopping at escape sequences
+# - csi: `ESC [ params final`, only SGR (final == "m") matters
+# - osc: `ESC ] ... BEL` or `ESC ] ... ST`, only OSC 8 (hyperlinks) matters
+# - truncated: an unterminated sequence, which ends the output
+# - anything else is a two character escape that gets skipped
+ANSI_TOKEN = re.compile(
+    r"\x1b(?:"
+    r"\[(?P<csi>[^@-~]*)(?P<final>[@-~])"
+    r"|\](?P<osc>[\s\S]*?)(?:\x07|\x1b\\)"
+    r"|(?P<truncated>(?:\[[^@-~]*|\][\s\S]*)?\Z)"
+    r"|[\s\S]"
+    r")"
+)
+
+
+class SGRState(NamedTuple):
+    foreground: Color | None = None
+    background: Color | None = None
+    bold: bool | None = None
+    dim: bool | None = None
+    italic: bool | None = None
+    underline: bool | None = None
+    blink: bool | None = None
+    blink2: bool | None = None
+    reverse: bool | None = None
+    conceal: bool | None = None
+    strike: bool | None = None
+    underline2: bool | None = None
+    frame: bool | None = None
+    encircle: bool | None = None
+    overline: bool | None = None
+    link: str | None = None
+
+
+EMPTY_STATE = SGRState()
+
 
 @lru_cache(maxsize=256)  # obviously 256 because of the 256-color palette
 def get_ansi_color(number: int) -> Color:
     return Color.from_ansi(number)
 
 
+@lru_cache(maxsize=1024)
+def get_rgb_color(red: int, green: int, blue: int) -> Color:
+    return Color.from_rgb(red, green, blue)
+
+
+@lru_cache(maxsize=4096)
+def get_style(state: SGRState) -> Style | None:
+    """Intern a Style for a given SGR state.
+
+    Returns:
+        Style: the shared Style object for this state
+        None: if the state has no styling at all
+    """
+    if state == EMPTY_STATE:
+        return None
+    return Style(
+        color=state.foreground,
+        bgcolor=state.background,
+        bold=state.bold,
+        dim=state.dim,
+        italic=state.italic,
+        underline=state.underline,
+        blink=state.blink,
+        blink2=state.blink2,
+        reverse=state.reverse,
+        conceal=state.conceal,
+        strike=state.strike,
+        underline2=state.underline2,
+        frame=state.frame,
+        encircle=state.encircle,
+        overline=state.overline,
+        link=state.link,
+    )
+
+
+@lru_cache(maxsize=4096)
+def apply_sgr(state: SGRState, parameters: str) -> SGRState:
+    """Apply the parameters of an SGR sequence to a state.
+
+    Highlighters emit the same handful of sequences over and over, so the
+    transition itself is cached instead of re-parsing the parameters.
+
+    Returns:
+        SGRState: the state after applying the sequence
+    """
+    codes = [
+        min(255, int(code) if code else 0)
+        for code in parameters.split(";")
+        if code.isdigit() or code == ""
+    ]
+    (
+        foreground,
+        background,
+        bold,
+        dim,
+        italic,
+        underline,
+        blink,
+        blink2,
+        reverse,
+        conceal,
+        strike,
+        underline2,
+        frame,
+        encircle,
+        overline,
+        link,
+    ) = state
+    code_index = 0
+    while code_index < len(codes):
+        match codes[code_index]:
+            case 0:
+                foreground = background = None
+                bold = dim = italic = underline = None
+                blink = blink2 = reverse = conceal = None
+                strike = underline2 = frame = encircle = overline = None
+                link = None
+            case 1:
+                bold = True
+            case 2:
+                dim = True
+            case 3:
+                italic = True
+            case 4:
+                underline = True
+            case 5:
+                blink = True
+            case 6:
+                blink2 = True
+            case 7:
+                reverse = True
+            case 8:
+                conceal = True
+            case 9:
+                strike = True
+            case 21:
+                underline2 = True
+            case 22:
+                bold = dim = False
+            case 23:
+                italic = False
+            case 24:
+                underline = False
+            case 25:
+                blink = False
+            case 26:
+                blink2 = False
+            case 27:
+                reverse = False
+            case 28:
+                conceal = False
+            case 29:
+                strike = False
+            case code if 30 <= code <= 37:
+                foreground = get_ansi_color(code - 30)
+            case 39:
+                foreground = Color.default()
+            case code if 40 <= code <= 47:
+                background = get_ansi_color(code - 40)
+            case 49:
+                background = Color.default()
+            case 51:
+                frame = True
+            case 52:
+                encircle = True
+            case 53:
+                overline = True
+            case 54:
+                frame = encircle = False
+            case 55:
+                overline = False
+            case code if 90 <= code <= 97:
+                foreground = get_ansi_color(code - 82)
+            case code if 100 <= code <= 107:
+                background = get_ansi_color(code - 92)
+            case code if code in (38, 48) and code_index + 1 < len(codes):
+                code_index += 1
+                color_type = codes[code_index]
+                color: Color | None = None
+                if color_type == 5 and code_index + 1 < len(codes):
+                    code_index += 1
+                    color = get_ansi_color(codes[code_index])
+                elif color_type == 2 and code_index + 3 < len(codes):
+                    color = get_rgb_color(
+                        codes[code_index + 1],
+                        codes[code_index + 2],
+                        codes[code_index + 3],
+                    )
+                    code_index += 3
+                if color is not None:
+                    if code == 38:
+                        foreground = color
+                    else:
+                        background = color
+        code_index += 1
+    return SGRState(
+        foreground,
+        background,
+        bold,
+        dim,
+        italic,
+        underline,
+        blink,
+        blink2,
+        reverse,
+        conceal,
+        strike,
+        underline2,
+        frame,
+        encircle,
+        overline,
+        link,
+    )
+
+
 def ansi_to_rich_text(terminal_text: str) -> Text:
     """Convert terminal output containing ANSI sequences to Rich text.
 
@@ -23,218 +236,43 @@ def ansi_to_rich_text(terminal_text: str) -> Text:
 
     parts: list[str] = []
     spans: list[Span] = []
-    style_cache: dict[tuple[object, ...], Style] = {}
-    rgb_cache: dict[tuple[int, int, int], Color] = {}
     text_length = 0
-
-    foreground: Color | None = None
-    background: Color | None = None
-    bold: bool | None = None
-    dim: bool | None = None
-    italic: bool | None = None
-    underline: bool | None = None
-    blink: bool | None = None
-    blink2: bool | None = None
-    reverse: bool | None = None
-    conceal: bool | None = None
-    strike: bool | None = None
-    underline2: bool | None = None
-    frame: bool | None = None
-    encircle: bool | None = None
-    overline: bool | None = None
-    link: str | None = None
+    state = EMPTY_STATE
+    style: Style | None = None
 
     def append_plain(plain: str) -> None:
         nonlocal text_length
-        if not plain:
-            return
-
         start = text_length
         text_length += len(plain)
         parts.append(plain)
-        style_key = (
-            foreground,
-            background,
-            bold,
-            dim,
-            italic,
-            underline,
-            blink,
-            blink2,
-            reverse,
-            conceal,
-            strike,
-            underline2,
-            frame,
-            encircle,
-            overline,
-            link,
-        )
-        if not any(value is not None for value in style_key):
-            return
-
-        style = style_cache.get(style_key)
         if style is None:
-            style = style_cache[style_key] = Style(
-                color=foreground,
-                bgcolor=background,
-                bold=bold,
-                dim=dim,
-                italic=italic,
-                underline=underline,
-                blink=blink,
-                blink2=blink2,
-                reverse=reverse,
-                conceal=conceal,
-                strike=strike,
-                underline2=underline2,
-                frame=frame,
-                encircle=encircle,
-                overline=overline,
-                link=link,
-            )
-        if spans and spans[-1].end == start and spans[-1].style == style:
-            previous = spans[-1]
-            spans[-1] = Span(previous.start, text_length, style)
+            return
+        # styles are interned, so an identity check is enough to merge spans
+        if spans and spans[-1].end == start and spans[-1].style is style:
+            spans[-1] = Span(spans[-1].start, text_length, style)
         else:
             spans.append(Span(start, text_length, style))
 
     position = 0
-    while position < len(terminal_text):
-        escape = terminal_text.find("\x1b", position)
-        if escape == -1:
-            append_plain(terminal_text[position:])
-            break
-        append_plain(terminal_text[position:escape])
-        if escape + 1 >= len(terminal_text):
-            break
+    for token in ANSI_TOKEN.finditer(terminal_text):
+        if token.start() > position:
+            append_plain(terminal_text[position : token.start()])
+        position = token.end()
 
-        sequence_type = terminal_text[escape + 1]
-        if sequence_type == "[":
-            sequence_end = escape + 2
-            while sequence_end < len(terminal_text) and not (
-                "@" <= terminal_text[sequence_end] <= "~"
-            ):
-                sequence_end += 1
-            if sequence_end >= len(terminal_text):
-                break
-
-            if terminal_text[sequence_end] == "m":
-                parameters = terminal_text[escape + 2 : sequence_end]
-                codes = [
-                    min(255, int(code) if code else 0)
-                    for code in parameters.split(";")
-                    if code.isdigit() or code == ""
-                ]
-                code_index = 0
-                while code_index < len(codes):
-                    match codes[code_index]:
-                        case 0:
-                            foreground = background = None
-                            bold = dim = italic = underline = None
-                            blink = blink2 = reverse = conceal = None
-                            strike = underline2 = frame = encircle = overline = None
-                            link = None
-                        case 1:
-                            bold = True
-                        case 2:
-                            dim = True
-                        case 3:
-                            italic = True
-                        case 4:
-                            underline = True
-                        case 5:
-                            blink = True
-                        case 6:
-                            blink2 = True
-                        case 7:
-                            reverse = True
-                        case 8:
-                            conceal = True
-                        case 9:
-                            strike = True
-                        case 21:
-                            underline2 = True
-                        case 22:
-                            bold = dim = False
-                        case 23:
-                            italic = False
-                        case 24:
-                            underline = False
-                        case 25:
-                            blink = False
-                        case 26:
-                            blink2 = False
-                        case 27:
-                            reverse = False
-                        case 28:
-                            conceal = False
-                        case 29:
-                            strike = False
-                        case code if 30 <= code <= 37:
-                            foreground = get_ansi_color(code - 30)
-                        case 39:
-                            foreground = Color.default()
-                        case code if 40 <= code <= 47:
-                            background = Color.from_ansi(code - 40)
-                        case 49:
-                            background = Color.default()
-                        case 51:
-                            frame = True
-                        case 52:
-                            encircle = True
-                        case 53:
-                            overline = True
-                        case 54:
-                            frame = encircle = False
-                        case 55:
-                            overline = False
-                        case code if 90 <= code <= 97:
-                            foreground = get_ansi_color(code - 82)
-                        case code if 100 <= code <= 107:
-                            background = get_ansi_color(code - 92)
-                        case code if code in (38, 48) and code_index + 1 < len(codes):
-                            code_index += 1
-                            color_type = codes[code_index]
-                            color: Color | None = None
-                            if color_type == 5 and code_index + 1 < len(codes):
-                                code_index += 1
-                                color = get_ansi_color(codes[code_index])
-                            elif color_type == 2 and code_index + 3 < len(codes):
-                                rgb = (
-                                    codes[code_index + 1],
-                                    codes[code_index + 2],
-                                    codes[code_index + 3],
-                                )
-                                color = rgb_cache.get(rgb)
-                                if color is None:
-                                    color = rgb_cache[rgb] = Color.from_rgb(*rgb)
-                                code_index += 3
-                            if color is not None:
-                                if code == 38:
-                                    foreground = color
-                                else:
-                                    background = color
-                    code_index += 1
-            position = sequence_end + 1
-            continue
-
-        if sequence_type == "]":
-            bell_end = terminal_text.find("\x07", escape + 2)
-            string_end = terminal_text.find("\x1b\\", escape + 2)
-            ends = [end for end in (bell_end, string_end) if end != -1]
-            if not ends:
-                break
-            sequence_end = min(ends)
-            osc = terminal_text[escape + 2 : sequence_end]
-            if osc.startswith("8;"):
-                _, separator, target = osc[2:].partition(";")
-                if separator:
-                    link = target or None
-            position = sequence_end + (2 if sequence_end == string_end else 1)
-            continue
-
-        position = escape + 2
+        if token.group("truncated") is not None:
+            break
+        if (parameters := token.group("csi")) is not None:
+            if token.group("final") == "m":
+                state = apply_sgr(state, parameters)
+                style = get_style(state)
+        elif (osc := token.group("osc")) is not None and osc.startswith("8;"):
+            _, separator, target = osc[2:].partition(";")
+            if separator:
+                state = state._replace(link=target or None)
+                style = get_style(state)
+    else:
+        if position < len(terminal_text):
+            append_plain(terminal_text[position:])
 
     return Text("".join(parts), spans=spans)
 
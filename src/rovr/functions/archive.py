@@ -0,0 +1,273 @@
+import posixpath
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple
+
+if TYPE_CHECKING:
+    from multiarchive._archive import Archive
+
+# how many members get turned into options in the archive preview
+ARCHIVE_PREVIEW_LIMIT: int = 1000
+# how many members are read before the preview gets a chance to update
+ARCHIVE_CHUNK_SIZE: int = 512
+# listings are big, so only keep the last few archives around
+ARCHIVE_CACHE_SIZE: int = 8
+
+
+class ArchiveMember(NamedTuple):
+    name: str
+    is_dir: bool
+    size: int
+
+
+class ArchiveCacheKey(NamedTuple):
+    file_path: str
+    mtime: int | float | None
+
+
+class ArchiveTreeEntry(NamedTuple):
+    path: str
+    name: str
+    is_dir: bool
+    size: int
+    """The uncompressed size, or the total of every file inside for folders"""
+    file_count: int
+    """The number of files inside, recursively. Always 0 for files"""
+
+
+class ArchiveTree:
+    """A virtual directory tree over the members of an archive.
+
+    Paths are kept in one sorted list, so the children of a folder are a
+    contiguous range that is found with a bisect. Only per-folder totals are
+    aggregated up front, and entries are created when a folder is listed,
+    so the cost of browsing scales with the folders that are open.
+    """
+
+    def __init__(self, members: Iterable[ArchiveMember]) -> None:
+        entries: dict[str, int] = {}
+        # folder path -> [file count, total size], "" being the root
+        folders: dict[str, list[int]] = {"": [0, 0]}
+        for member in members:
+            name = posixpath.normpath(member.name.replace("\\", "/")).lstrip("/")
+            if name in (".", "") or name.startswith("../"):
+                continue
+            if member.is_dir:
+                folders.setdefault(name, [0, 0])
+                continue
+            entries[name] = member.size
+            parent = name
+            while parent:
+                parent = parent.rpartition("/")[0]
+                totals = folders.setdefault(parent, [0, 0])
+                totals[0] += 1
+                totals[1] += member.size
+        # folders are marked with a negative size, including implicit ones
+        for folder in folders:
+            if folder:
+                entries.setdefault(folder, -1)
+        self._paths: list[str] = sorted(entries)
+        self._sizes: list[int] = [entries[name] for name in self._paths]
+        self._folders = folders
+
+    @property
+    def file_count(self) -> int:
+        return self._folders[""][0]
+
+    @property
+    def total_size(self) -> int:
+        return self._folders[""][1]
+
+    def is_dir(self, folder: str) -> bool:
+        return folder in self._folders
+
+    def iter_members(self) -> Iterator[ArchiveMember]:
+        for name, size in zip(self._paths, self._sizes):
+            if size < 0:
+                yield ArchiveMember(f"{name}/", True, 0)
+            else:
+                yield ArchiveMember(name, False, size)
+
+    def children(
+        self, folder: str = "", limit: int | None = None
+    ) -> tuple[list[ArchiveTreeEntry], int]:
+        """List the direct children of a folder, folders first.
+
+        Args:
+            folder: The folder inside the archive, "" for the root
+            limit: The maximum number of entries to return
+
+        Returns:
+            tuple[list[ArchiveTreeEntry], int]: the entries, and how many
+            children were left out because of the limit
+        """
+        prefix = f"{folder}/" if folder else ""
+        paths = self._paths
+        index = bisect_left(paths, prefix) if prefix else 0
+        # "0" sorts right after "/", so this is where the folder's range ends
+        end = bisect_left(paths, f"{folder}0") if prefix else len(paths)
+        folders: list[ArchiveTreeEntry] = []
+        files: list[ArchiveTreeEntry] = []
+        skipped = 0
+        while index < end:
+            name = paths[index][len(prefix) :]
+            child, separator, _ = name.partition("/")
+            if separator:
+                # everything inside a subfolder was already accounted for
+                index = bisect_left(paths, f"{prefix}{child}0", index, end)
+                continue
+            size = self._sizes[index]
+            if size < 0:
+                totals = self._folders[paths[index]]
+                folders.append(
+                    ArchiveTreeEntry(paths[index], child, True, totals[1], totals[0])
+                )
+            elif limit is None or len(files) < limit:
+                files.append(ArchiveTreeEntry(paths[index], child, False, size, 0))
+            else:
+                skipped += 1
+            index += 1
+        entries = folders + files
+        if limit is not None and len(entries) > limit:
+            skipped += len(entries) - limit
+            entries = entries[:limit]
+        return entries, skipped
+
+
+_listing_cache: OrderedDict[ArchiveCacheKey, ArchiveTree] = OrderedDict()
+_listing_cache_lock = threading.Lock()
+
+
+def iter_archive_members(archive: "Archive") -> Iterator[ArchiveMember]:
+    """Iterate through the members of an opened archive as they are read.
+
+    Skips multiarchive's `infolist`, which wraps every member (and parses
+    its timestamp) before returning anything. Zip and rar only read their
+    central directory, and tar is decompressed lazily while iterating.
+
+    Args:
+        archive: An archive opened in read mode
+
+    Yields:
+        ArchiveMember: the name, directory flag and uncompressed size
+
+    Raises:
+        BadArchiveError: If the archive is corrupted partway through
+    """
+    import tarfile
+    import zipfile
+
+    from multiarchive._archive import BadArchive, BadArchiveError
+
+    tar_types: tuple[type, ...] = (tarfile.TarFile,)
+    if sys.version_info < (3, 14):
+        try:
+            # what multiarchive opens tars with on python 3.13 and older
+            from backports.zstd import tarfile as zstd_tarfile  # ty: ignore[unresolved-import]
+        except ImportError:
+            pass
+        else:
+            tar_types += (zstd_tarfile.TarFile,)
+
+    # multiarchive does not expose the file it opened, so fall back to its
+    # `infolist` if that ever moves
+    backend = getattr(archive, "_archive", None)
+    try:
+        if isinstance(backend, zipfile.ZipFile):
+            for zip_info in backend.infolist():
+                yield ArchiveMember(
+                    zip_info.filename, zip_info.is_dir(), zip_info.file_size
+                )
+        elif isinstance(backend, tar_types):
+            # iterating a TarFile reads the next header on demand
+            for tar_info in backend:
+                yield ArchiveMember(tar_info.name, tar_info.isdir(), tar_info.size)
+        else:
+            for info in archive.infolist():
+                yield ArchiveMember(info.name, info.is_dir, info.uncompressed_size)
+    except BadArchive as exc:
+        raise BadArchiveError(f"Failed to list archive. {exc}") from exc
+
+
+def iter_archive_chunks(
+    file_path: str,
+    mtime: int | float | None,
+    chunk_size: int = ARCHIVE_CHUNK_SIZE,
+) -> Iterator[list[ArchiveMember]]:
+    """Stream the members of an archive in chunks, caching complete listings.
+
+    The listing is only cached (as an `ArchiveTree`) once the archive was read
+    to the end, so a preview that gets cancelled halfway does not leave a
+    partial listing behind.
+
+    Args:
+        file_path: Path to the archive
+        mtime: The last modified time of the archive, used for caching purposes
+        chunk_size: How many members to yield at a time
+
+    Yields:
+        list[ArchiveMember]: the next chunk of members
+
+    Raises:
+        BadArchiveError: If the archive cannot be opened or listed
+        FileNotFoundError: If the archive is no longer available
+    """  # noqa: DOC502
+    cached = get_archive_tree(file_path, mtime)
+    if cached is not None:
+        chunk: list[ArchiveMember] = []
+        for member in cached.iter_members():
+            chunk.append(member)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+
+    from multiarchive._archive import Archive
+
+    members: list[ArchiveMember] = []
+    chunk: list[ArchiveMember] = []
+    with Archive(file_path, mode="r") as archive:
+        for member in iter_archive_members(archive):
+            chunk.append(member)
+            if len(chunk) >= chunk_size:
+                members.extend(chunk)
+                yield chunk
+                chunk = []
+    if chunk:
+        members.extend(chunk)
+        yield chunk
+
+    tree = ArchiveTree(members)
+    key = ArchiveCacheKey(file_path, mtime)
+    with _listing_cache_lock:
+        _listing_cache[key] = tree
+        _listing_cache.move_to_end(key)
+        while len(_listing_cache) > ARCHIVE_CACHE_SIZE:
+            _listing_cache.popitem(last=False)
+
+
+def get_archive_tree(file_path: str, mtime: int | float | None) -> ArchiveTree | None:
+    """
+    Args:
+        file_path: Path to the archive
+        mtime: The last modified time of the archive
+
+    Returns:
+        ArchiveTree: the tree, if the archive was fully listed before
+        None: if `iter_archive_chunks` has not read this archive to the end
+    """
+    key = ArchiveCacheKey(file_path, mtime)
+    with _listing_cache_lock:
+        tree = _listing_cache.get(key)
+        if tree is not None:
+            _listing_cache.move_to_end(key)
+    return tree
+
+
+def clear_archive_cache() -> None:
+    with _listing_cache_lock:
+        _listing_cache.clear()
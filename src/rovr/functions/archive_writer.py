@@ -0,0 +1,427 @@
+import bz2
+import gzip
+import lzma
+import os
+import sys
+import tarfile
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from os import path
+from types import TracebackType
+from typing import IO, Callable, Literal, NamedTuple, Self, cast
+
+ArchiveAlgo = Literal["zip", "tar", "tar.gz", "tar.bz2", "tar.xz", "tar.zst"]
+# called with how many bytes of the sources were archived so far, and the
+# member being archived
+OnArchiveProgress = Callable[[int, str], None]
+
+# compression is what takes the time, so one thread per core
+ARCHIVE_WORKERS: int = os.cpu_count() or 1
+# tar.gz and tar.bz2 are compressed in independent pieces of this size,
+# which are concatenated into one valid multi-member file, like pigz does
+CHUNK_SIZE: int = 4 << 20
+# zip members are deflated in pieces of this size, each primed with the
+# 32 KiB before it, so they join into a single deflate stream
+ZIP_CHUNK_SIZE: int = 1 << 20
+_DEFLATE_WINDOW: int = 32 << 10
+# xz pieces are three times the preset's dictionary, the same as `xz -T`,
+# but capped to keep memory in check on the highest presets
+_XZ_DICT_SIZES: tuple[int, ...] = tuple(
+    size << 10
+    for size in (256, 1024, 2048, 4096, 4096, 8192, 8192, 16384, 32768, 65536)
+)
+_XZ_MAX_CHUNK: int = 64 << 20
+
+
+class ArchiveSource(NamedTuple):
+    path: str
+    arcname: str
+    size: int
+
+
+def collect_sources(files: list[str]) -> list[ArchiveSource]:
+    """
+    Args:
+        files (list[str]): the selected files and folders
+
+    Returns:
+        list[ArchiveSource]: every file under them, sorted, followed by the
+        selected folders that are empty, named relative to the folder they
+        were selected in
+    """
+    base_path = path.dirname(files[0]) if len(files) == 1 else path.commonpath(files)
+    found: set[str] = set()
+    empty_folders: list[str] = []
+    for file in files:
+        if not path.isdir(file):
+            found.add(file)
+        elif not os.listdir(file):
+            empty_folders.append(file)
+        else:
+            for dirpath, _, filenames in os.walk(file):
+                found.update(path.join(dirpath, filename) for filename in filenames)
+    sources: list[ArchiveSource] = []
+    for file_path in sorted(found):
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = 0
+        sources.append(
+            ArchiveSource(file_path, path.relpath(file_path, base_path), size)
+        )
+    sources.extend(
+        ArchiveSource(folder, path.relpath(folder, base_path), 0)
+        for folder in empty_folders
+    )
+    return sources
+
+
+class ParallelCompressor:
+    """A file that compresses what is written to it in pieces, on a pool of
+    threads, and writes them out in order.
+
+    Each piece is compressed on its own, so the result is several compressed
+    streams back to back, which gzip, bzip2 and xz all read as one.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        compress: Callable[[bytes], bytes],
+        chunk_size: int = CHUNK_SIZE,
+        workers: int = ARCHIVE_WORKERS,
+    ) -> None:
+        # tarfile uses this to leave the archive itself out
+        self.name = path.abspath(file_path)
+        self._file = open(file_path, "wb")  # noqa: SIM115
+        self._compress = compress
+        self._chunk_size = chunk_size
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="rovr-compress")
+        # pieces still being compressed, in the order they are written. kept
+        # short, so reading never runs far ahead of compressing
+        self._pending: deque[Future[bytes]] = deque()
+        self._max_pending = workers * 2
+        self._buffer = bytearray()
+        self._position = 0
+        self._submitted = False
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self._chunk_size:
+            chunk = bytes(self._buffer[: self._chunk_size])
+            del self._buffer[: self._chunk_size]
+            self._submit(chunk)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def _submit(self, chunk: bytes) -> None:
+        self._submitted = True
+        self._pending.append(self._pool.submit(self._compress, chunk))
+        while len(self._pending) > self._max_pending:
+            self._file.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        """Compress whatever is left, and write everything out."""
+        if self._file.closed:
+            return
+        try:
+            if self._buffer or not self._submitted:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+            self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # leave the rest, as it is going to be an incomplete archive anyway
+        self._pool.shutdown(cancel_futures=True)
+        self._file.close()
+
+
+class _CountingReader:
+    def __init__(self, file: IO[bytes], on_read: Callable[[int], None]) -> None:
+        self._file = file
+        self._on_read = on_read
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._on_read(len(data))
+        return data
+
+
+def _zstd_file(archive_path: str, level: int, workers: int) -> IO[bytes]:
+    if sys.version_info >= (3, 14):
+        from compression.zstd import CompressionParameter, ZstdFile
+    else:
+        from backports.zstd import (  # ty: ignore[unresolved-import]
+            CompressionParameter,
+            ZstdFile,
+        )
+
+    options = {CompressionParameter.compression_level: level}
+    # zstd splits the work across its own threads when it was built to
+    if workers > 1 and CompressionParameter.nb_workers.bounds()[1] > 0:
+        options[CompressionParameter.nb_workers] = workers
+    return cast(IO[bytes], ZstdFile(archive_path, "w", options=options))
+
+
+def _open_compressed(
+    archive_path: str, algo: ArchiveAlgo, level: int, workers: int
+) -> IO[bytes] | ParallelCompressor:
+    match algo:
+        case "tar.gz":
+            return ParallelCompressor(
+                archive_path,
+                partial(gzip.compress, compresslevel=level, mtime=0),
+                workers=workers,
+            )
+        case "tar.bz2":
+            return ParallelCompressor(
+                archive_path,
+                partial(bz2.compress, compresslevel=level),
+                workers=workers,
+            )
+        case "tar.xz":
+            return ParallelCompressor(
+                archive_path,
+                partial(lzma.compress, preset=level),
+                min(_XZ_MAX_CHUNK, max(CHUNK_SIZE, 3 * _XZ_DICT_SIZES[level])),
+                workers,
+            )
+        case "tar.zst":
+            return _zstd_file(archive_path, level, workers)
+        case _:
+            return open(archive_path, "wb")  # noqa: SIM115
+
+
+def _write_tar(
+    sources: list[ArchiveSource],
+    archive_path: str,
+    algo: ArchiveAlgo,
+    level: int,
+    workers: int,
+    on_progress: OnArchiveProgress,
+) -> None:
+    done = 0
+    current = ""
+
+    def on_read(size: int) -> None:
+        nonlocal done
+        done += size
+        on_progress(done, current)
+
+    with (
+        _open_compressed(archive_path, algo, level, workers) as out,
+        tarfile.open(fileobj=out, mode="w") as tar,  # ty: ignore[no-matching-overload]
+    ):
+        for source in sources:
+            current = source.arcname
+            info = tar.gettarinfo(source.path, source.arcname)
+            if info.isreg():
+                with open(source.path, "rb") as f:
+                    tar.addfile(info, _CountingReader(f, on_read))
+            else:
+                tar.add(source.path, arcname=source.arcname)
+                # a symlink is stored as one, but counted as what it points to
+                done += source.size
+            on_progress(done, current)
+
+
+def _deflate(chunk: bytes, zdict: bytes, level: int, last: bool) -> bytes:
+    compressor = (
+        zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict)
+        if zdict
+        else zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    )
+    # a sync flush ends on a byte boundary without ending the stream, so the
+    # next piece carries on from it
+    return compressor.compress(chunk) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
+
+
+class _ZipPipeline:
+    """Deflates zip members on a pool of threads, while writing them into
+    the archive in order from the calling one.
+
+    zipfile can only compress a member on the thread writing it, so the
+    headers are written here the same way ZipFile.open does for a seekable
+    file: with placeholder sizes first, then again once the data is in.
+
+    `_start` and `_finish` mirror CPython's `ZipFile._open_to_write` and
+    `_ZipWriteFile.close`, and use the same private parts of ZipFile
+    (`_writecheck`, `_didModify`, `start_dir`, `FileHeader`, `NameToInfo`).
+    If those change, tests/test_functions_archive_writer.py reads the
+    headers back and should catch it.
+    """
+
+    def __init__(
+        self,
+        archive: zipfile.ZipFile,
+        level: int,
+        workers: int,
+        on_progress: OnArchiveProgress,
+    ) -> None:
+        self._archive = archive
+        self._level = level
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="rovr-deflate")
+        self._max_pending = workers * 2
+        self._pending = 0
+        # everything still to be written to the archive, in order
+        self._writes: deque[Callable[[], None]] = deque()
+        self._on_progress = on_progress
+        self._done = 0
+
+    def add(self, source: ArchiveSource) -> None:
+        zinfo = zipfile.ZipInfo.from_file(source.path, source.arcname)
+        if zinfo.is_dir():
+            self.drain()
+            self._archive.write(source.path, source.arcname)
+            return
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.compress_level = self._level
+        zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        self._writes.append(partial(self._start, zinfo, zip64))
+        crc = size = 0
+        zdict = b""
+        with open(source.path, "rb") as f:
+            chunk = f.read(ZIP_CHUNK_SIZE)
+            while True:
+                next_chunk = f.read(ZIP_CHUNK_SIZE) if chunk else b""
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                last = not next_chunk
+                future = self._pool.submit(_deflate, chunk, zdict, self._level, last)
+                self._pending += 1
+                self._writes.append(
+                    partial(self._write, zinfo, future, len(chunk), source.arcname)
+                )
+                self.drain(self._max_pending)
+                if last:
+                    break
+                zdict = chunk[-_DEFLATE_WINDOW:]
+                chunk = next_chunk
+        self._writes.append(partial(self._finish, zinfo, zip64, crc, size))
+
+    def drain(self, keep_pending: int = 0) -> None:
+        """Write out members until at most `keep_pending` pieces are still
+        being compressed, or everything if it is 0."""
+        while self._writes and (not keep_pending or self._pending > keep_pending):
+            self._writes.popleft()()
+
+    def close(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+
+    def _start(self, zinfo: zipfile.ZipInfo, zip64: bool) -> None:
+        archive = self._archive
+        assert archive.fp is not None
+        zinfo.compress_size = 0
+        zinfo.CRC = 0
+        zinfo.flag_bits = 0
+        archive.fp.seek(archive.start_dir)
+        zinfo.header_offset = archive.fp.tell()
+        archive._writecheck(zinfo)
+        archive._didModify = True
+        archive.fp.write(zinfo.FileHeader(zip64))
+
+    def _write(
+        self, zinfo: zipfile.ZipInfo, future: Future[bytes], size: int, arcname: str
+    ) -> None:
+        assert self._archive.fp is not None
+        data = future.result()
+        self._pending -= 1
+        self._archive.fp.write(data)
+        zinfo.compress_size += len(data)
+        self._done += size
+        self._on_progress(self._done, arcname)
+
+    def _finish(self, zinfo: zipfile.ZipInfo, zip64: bool, crc: int, size: int) -> None:
+        archive = self._archive
+        assert archive.fp is not None
+        zinfo.CRC = crc
+        zinfo.file_size = size
+        if not zip64 and max(size, zinfo.compress_size) > zipfile.ZIP64_LIMIT:
+            raise zipfile.LargeZipFile(
+                f"{zinfo.filename} grew past 4 GiB while it was being archived"
+            )
+        # rewrite the header, now that the sizes are known
+        archive.start_dir = archive.fp.tell()
+        archive.fp.seek(zinfo.header_offset)
+        archive.fp.write(zinfo.FileHeader(zip64))
+        archive.fp.seek(archive.start_dir)
+        archive.filelist.append(zinfo)
+        archive.NameToInfo[zinfo.filename] = zinfo
+
+
+def _write_zip(
+    sources: list[ArchiveSource],
+    archive_path: str,
+    level: int,
+    workers: int,
+    on_progress: OnArchiveProgress,
+) -> None:
+    with zipfile.ZipFile(
+        archive_path, "w", zipfile.ZIP_DEFLATED, compresslevel=level
+    ) as archive:
+        pipeline = _ZipPipeline(archive, level, workers, on_progress)
+        try:
+            for source in sources:
+                pipeline.add(source)
+            pipeline.drain()
+        finally:
+            pipeline.close()
+
+
+def write_archive(
+    sources: list[ArchiveSource],
+    archive_path: str,
+    algo: ArchiveAlgo,
+    level: int,
+    on_progress: OnArchiveProgress = lambda done, current: None,
+    workers: int = ARCHIVE_WORKERS,
+) -> None:
+    """Create an archive, reading the sources while earlier parts of it are
+    compressed on other threads.
+
+    Zip members are deflated in parallel pieces. tar.gz, tar.bz2 and tar.xz
+    are compressed in parallel pieces too, and tar.zst uses zstd's own
+    threads.
+
+    Args:
+        sources (list[ArchiveSource]): what to put in it, from collect_sources
+        archive_path (str): where to create it
+        algo (ArchiveAlgo): the kind of archive
+        level (int): the compression level, in the range of the algorithm
+        on_progress (OnArchiveProgress): called as the sources are archived
+        workers (int): how many threads compress at once
+    """
+    workers = max(1, workers)
+    if algo == "zip":
+        _write_zip(sources, archive_path, level, workers, on_progress)
+    else:
+        _write_tar(sources, archive_path, algo, level, workers, on_progress)
@@ -1,6 +1,7 @@
 import json
 import marshal
 import os
+import zlib
 from functools import cache
 from importlib import resources
 from importlib.metadata import PackageNotFoundError, version
@@ -55,7 +56,7 @@ def get_schema_validator() -> tuple[dict, Callable[[dict], None]]:
     if path.isfile(schema_bin):
         try:
             with open(schema_bin, "rb") as f:
-                cached_mtime, schema_dict, code = marshal.load(f)
+                cached_mtime, schema_dict, code = marshal.loads(f.read())
             if cached_mtime == mtime:
                 namespace: dict = {}
                 exec(code, namespace)
@@ -76,6 +77,95 @@ def get_schema_validator() -> tuple[dict, Callable[[dict], None]]:
         return schema_dict, fastjsonschema.compile(schema_dict)
 
 
+@cache
+def asset_path(name: str) -> str:
+    return traverser.joinpath(name).as_posix()
+
+
+def _stat_key(file_path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _content_key(file_path: str) -> int | None:
+    try:
+        with open(file_path, "rb") as f:
+            return zlib.crc32(f.read())
+    except OSError:
+        return None
+
+
+def config_snapshot_key(user_config_path: str) -> tuple:
+    """Describe every input of the merged config, without parsing any of them
+
+    Args:
+        user_config_path (str): path to the user's config.toml
+
+    Returns:
+        tuple: the version, the user config path, the mtime and size of the
+        template, the schema and the user config (None if missing), and a
+        checksum of the user config, since a quick edit can keep its mtime on
+        coarse filesystems
+    """
+    return (
+        get_version(),
+        user_config_path,
+        _stat_key(asset_path("config.toml")),
+        _stat_key(asset_path("schema.json")),
+        _stat_key(user_config_path),
+        _content_key(user_config_path),
+    )
+
+
+def load_config_snapshot(key: tuple) -> tuple[dict, dict] | None:
+    """Load the merged and validated config saved by a previous launch
+
+    Args:
+        key (tuple): the key from config_snapshot_key
+
+    Returns:
+        tuple[dict, dict] | None: the schema and the config, or None if there
+        is no snapshot or it was made from different files
+    """
+    try:
+        # marshal.load on a file reads it in small pieces, so read it in one go
+        with open(path.join(RovrVars.ROVRTEMP, "config.marshal"), "rb") as f:
+            cached_key, schema_dict, config_dict = marshal.loads(f.read())
+    except Exception:
+        return None
+    if cached_key != key:
+        return None
+    return schema_dict, config_dict
+
+
+def save_config_snapshot(key: tuple, schema_dict: dict, config_dict: dict) -> None:
+    """Save the merged and validated config, for load_config_snapshot
+
+    Args:
+        key (tuple): the key from config_snapshot_key, taken before the files
+            were read
+        schema_dict (dict): the schema
+        config_dict (dict): the config, before any environment specific values
+            are filled in
+    """
+    try:
+        data = marshal.dumps((key, schema_dict, config_dict))
+        os.makedirs(RovrVars.ROVRTEMP, exist_ok=True)
+        snapshot_bin = path.join(RovrVars.ROVRTEMP, "config.marshal")
+        # write then rename, so another instance never reads half a snapshot
+        temp_bin = f"{snapshot_bin}.{os.getpid()}"
+        with open(temp_bin, "wb") as f:
+            f.write(data)
+        os.replace(temp_bin, snapshot_bin)
+    except Exception:
+        # values marshal can't handle (like toml datetimes), or an unwritable
+        # temp folder, just mean the next launch parses the config again
+        pass
+
+
 def deep_merge(old: dict, new: dict) -> dict:
     """Mini lodash merge
 
@@ -540,6 +630,11 @@ def load_config() -> tuple[dict, RovrConfig]:
     else:
         schema_ref = f"refs/tags/v{current_version}"
 
+    snapshot_key = config_snapshot_key(user_config_path)
+    if (snapshot := load_config_snapshot(snapshot_key)) is not None:
+        schema_dict, config_dict = snapshot
+        return schema_dict, resolve_config(config_dict)
+
     # Startup path should remain read-only for existing user config.
     # Any schema header normalization is intentionally left for explicit
     # config migration/update flows, not hot startup.
@@ -555,6 +650,7 @@ def load_config() -> tuple[dict, RovrConfig]:
 
     user_config = {}
     user_config_content = ""
+    header_updated = False
     if path.exists(user_config_path):
         with open(user_config_path, "r", encoding="utf-8") as f:
             user_config_content = f.read()
@@ -576,6 +672,7 @@ def load_config() -> tuple[dict, RovrConfig]:
 
                         with open(user_config_path, "w", encoding="utf-8") as f:
                             f.write("\n".join(lines))
+                        header_updated = True
 
                         display_version = (
                             f"v{current_version}"
@@ -605,6 +702,23 @@ def load_config() -> tuple[dict, RovrConfig]:
             schema_dump(user_config_path, exception, user_config_content, schema_dict)
         exit(1)
 
+    # the key was taken before the user config was read, so a rewritten header
+    # (or an edit made while loading) is picked up by the next launch instead
+    if not header_updated:
+        save_config_snapshot(snapshot_key, schema_dict, config_dict)
+    return schema_dict, resolve_config(config_dict)
+
+
+def resolve_config(config_dict: dict) -> RovrConfig:
+    """Fill in the parts of the config that depend on the environment, which
+    are never part of the snapshot
+
+    Args:
+        config_dict (dict): the merged and validated config
+
+    Returns:
+        RovrConfig: the config, with editors and the poppler folder resolved
+    """
     for key in ["file", "folder", "bulk_editor"]:
         raw_run = config_dict["settings"]["editor"][key]["run"]
         if isinstance(raw_run, list):
@@ -639,4 +753,4 @@ def load_config() -> tuple[dict, RovrConfig]:
         # in the config schema, but pdfinfo_path can be None when
         # resolved from PATH, so we suppress the type error
         config_dict["plugins"]["poppler"]["poppler_folder"] = pdfinfo_path
-    return schema_dict, cast(RovrConfig, config_dict)
+    return cast(RovrConfig, config_dict)
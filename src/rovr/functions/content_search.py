@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import as_completed
+from typing import Callable, Iterator, NamedTuple
+
+from rovr.functions.file_index import REGEX_CHARACTERS
+from rovr.functions.multiprocessing_utils import safe_path_process_pool
+from rovr.functions.search_workers import content_search_worker
+
+CONTENT_SEARCH_WORKERS: int = os.cpu_count() or 1
+# below this many files, starting a process pool costs more than it saves
+CONTENT_POOL_THRESHOLD: int = 512
+# files per task, small enough to keep every worker busy until the end
+CONTENT_BATCH_SIZE: int = 64
+
+
+class ContentMatch(NamedTuple):
+    path: str
+    """The path relative to the searched folder"""
+    count: int
+    """The number of lines that matched"""
+
+
+def search_content(
+    root: str,
+    relative_paths: list[str],
+    pattern: str,
+    case_sensitive: bool,
+    should_stop: Callable[[], bool] = lambda: False,
+) -> Iterator[list[ContentMatch]]:
+    """Search the contents of files for a pattern, without rg.
+
+    The pattern is treated as a regex, unless it has no regex characters, in
+    which case it is searched for with `bytes.find`. Large sets of files are
+    split between a pool of processes, so the search scales with the cores
+    available. Binary files (with a NUL byte near the start) are skipped.
+
+    Args:
+        root: The folder the paths are relative to
+        relative_paths: The files to search, usually from `FileIndex.files`
+        pattern: The search term
+        case_sensitive: Whether the search is case sensitive
+        should_stop: Checked between batches, to give up early
+
+    Yields:
+        list[ContentMatch]: the matches from the next batch of files
+    """
+    is_regex = not REGEX_CHARACTERS.isdisjoint(pattern)
+    batches = [
+        (
+            root,
+            relative_paths[start : start + CONTENT_BATCH_SIZE],
+            pattern,
+            is_regex,
+            case_sensitive,
+        )
+        for start in range(0, len(relative_paths), CONTENT_BATCH_SIZE)
+    ]
+    if len(relative_paths) < CONTENT_POOL_THRESHOLD or CONTENT_SEARCH_WORKERS == 1:
+        for batch in batches:
+            if should_stop():
+                return
+            yield [ContentMatch(*match) for match in content_search_worker(batch)]
+        return
+
+    with safe_path_process_pool(
+        max_workers=min(CONTENT_SEARCH_WORKERS, len(batches))
+    ) as executor:
+        futures = [executor.submit(content_search_worker, batch) for batch in batches]
+        for future in as_completed(futures):
+            if should_stop():
+                for pending in futures:
+                    pending.cancel()
+                return
+            yield [ContentMatch(*match) for match in future.result()]
@@ -0,0 +1,313 @@
+import errno
+import os
+import stat
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from functools import partial
+from os import path
+from time import monotonic
+from typing import Callable
+
+# deleting mostly waits on the filesystem, so it is worth having more
+# threads than cores
+DELETE_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+# seconds between progress reports
+PROGRESS_INTERVAL: float = 0.25
+# entries deleted before the shared counters are updated
+_COUNT_EVERY: int = 256
+
+# whether folders can be walked and emptied relative to an open descriptor,
+# the same check shutil.rmtree makes. that way a path is never resolved
+# again from the top, and a folder swapped for a symlink midway is not
+# followed
+_use_fd: bool = (
+    {os.open, os.stat, os.unlink, os.rmdir} <= os.supports_dir_fd
+    and os.scandir in os.supports_fd
+    and os.stat in os.supports_follow_symlinks
+)
+_OPEN_DIR_FLAGS: int = (
+    os.O_RDONLY
+    | getattr(os, "O_DIRECTORY", 0)
+    | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_NONBLOCK", 0)
+)
+
+OnDeleteError = Callable[[str, OSError, Callable[[], None]], bool]
+"""Called with a path that could not be deleted, the error, and a function
+that tries again. Returns whether the path is gone now, and raising stops
+the whole delete."""
+
+
+class DeleteCancelled(Exception):
+    """Raised from an OnDeleteError to stop deleting."""
+
+
+@dataclass
+class DeleteProgress:
+    found: int = 0
+    """Entries seen so far, which grows as folders are walked."""
+    entries: int = 0
+    """Entries deleted, folders included."""
+    bytes: int = 0
+    """Size of the files deleted."""
+    current: str = ""
+    """The last thing deleted, relative to the folder it was selected in."""
+
+
+def _is_junction(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_junction()
+    except OSError:
+        return False
+
+
+class TreeDeleter:
+    """Deletes files and folders while walking them, instead of listing
+    everything first.
+
+    Folders are emptied through descriptors where the platform allows it,
+    with `unlink` and `rmdir` relative to the folder being emptied. The
+    subfolders go to a pool of threads while there are idle ones, and are
+    otherwise emptied by the thread that found them. A symlink or junction is
+    removed itself, never what it points to.
+    """
+
+    def __init__(
+        self,
+        on_error: OnDeleteError | None = None,
+        on_progress: Callable[[DeleteProgress], None] | None = None,
+        workers: int = DELETE_WORKERS,
+    ) -> None:
+        """
+        Args:
+            on_error (OnDeleteError | None): called for anything that could
+                not be deleted, except for things that are already gone. If
+                None, the error is raised instead
+            on_progress (Callable[[DeleteProgress], None] | None): called with
+                a copy of the progress, at most every PROGRESS_INTERVAL
+            workers (int): how many threads delete at once, including the
+                calling one
+        """
+        self.progress = DeleteProgress()
+        self._on_error = on_error
+        self._on_progress = on_progress
+        self._workers = max(1, workers)
+        self._lock = threading.Lock()
+        # one error is handled at a time, as handling one may ask the user
+        self._error_lock = threading.Lock()
+        # a subfolder is only handed to the pool while this can be acquired,
+        # so whatever waits on one never waits for a thread to free up
+        self._slots = threading.Semaphore(self._workers - 1)
+        self._pool: ThreadPoolExecutor | None = None
+        self._stopped = threading.Event()
+        self._error: BaseException | None = None
+        self._last_report: float = 0.0
+
+    def delete(self, paths: list[str]) -> None:
+        """Delete every path, and whatever is inside the folders among them.
+        Blocks until done, and raises the first error that stopped it, which
+        is DeleteCancelled if on_error cancelled it.
+
+        Args:
+            paths (list[str]): the files and folders to delete
+        """
+        self._stopped.clear()
+        self._error = None
+        with ThreadPoolExecutor(
+            self._workers - 1 or 1, thread_name_prefix="rovr-delete"
+        ) as self._pool:
+            futures: list[Future[bool]] = []
+            try:
+                for item_path in paths:
+                    self._check_stopped()
+                    result = self._run(self._delete_top, item_path)
+                    if isinstance(result, Future):
+                        futures.append(result)
+            except BaseException as exc:
+                self._fail(exc)
+            finally:
+                wait(futures)
+        self._pool = None
+        if self._error is not None:
+            raise self._error
+        self._report(force=True)
+
+    def _fail(self, exc: BaseException) -> None:
+        # the others stop as soon as they see this, with a DeleteCancelled
+        # that should not hide what actually went wrong
+        with self._lock:
+            if self._error is None:
+                self._error = exc
+        self._stopped.set()
+
+    def _check_stopped(self) -> None:
+        if self._stopped.is_set():
+            raise DeleteCancelled
+
+    def _run(self, function: Callable[..., bool], *args: object) -> Future[bool] | bool:
+        if self._pool is not None and self._slots.acquire(blocking=False):
+            return self._pool.submit(self._in_slot, function, *args)
+        return function(*args)
+
+    def _in_slot(self, function: Callable[..., bool], *args: object) -> bool:
+        try:
+            return function(*args)
+        except BaseException as exc:
+            self._fail(exc)
+            raise
+        finally:
+            self._slots.release()
+
+    def _attempt(self, action: Callable[[], None], full_path: str) -> bool:
+        try:
+            action()
+            return True
+        except FileNotFoundError:
+            return True
+        except OSError as exc:
+            return self._handle(exc, full_path, action)
+
+    def _handle(self, exc: OSError, full_path: str, retry: Callable[[], None]) -> bool:
+        if self._on_error is None:
+            raise exc
+        with self._error_lock:
+            self._check_stopped()
+            return self._on_error(full_path, exc, retry)
+
+    def _count(self, found: int, entries: int, size: int, current: str) -> None:
+        with self._lock:
+            self.progress.found += found
+            self.progress.entries += entries
+            self.progress.bytes += size
+            if current:
+                self.progress.current = current
+        self._report()
+
+    def _report(self, force: bool = False) -> None:
+        if self._on_progress is None:
+            return
+        now = monotonic()
+        with self._lock:
+            if not force and now - self._last_report < PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+            snapshot = replace(self.progress)
+        self._on_progress(snapshot)
+
+    def _delete_top(self, item_path: str) -> bool:
+        rel = path.basename(item_path.rstrip("/\\")) or item_path
+        try:
+            item_stat = os.lstat(item_path)
+        except FileNotFoundError:
+            return True
+        self._count(1, 0, 0, "")
+        is_junction = path.isjunction(item_path)
+        if stat.S_ISDIR(item_stat.st_mode) and not is_junction:
+            return self._delete_dir(None, item_path, item_path, rel)
+        remove = os.rmdir if is_junction else os.unlink
+        if not self._attempt(partial(remove, item_path), item_path):
+            return False
+        self._count(0, 1, item_stat.st_size, rel)
+        return True
+
+    def _delete_dir(
+        self, dir_fd: int | None, name: str, full_path: str, rel: str
+    ) -> bool:
+        """
+        Args:
+            dir_fd (int | None): the folder that `name` is relative to
+            name (str): the folder to delete
+            full_path (str): its full path, for errors
+            rel (str): its path relative to where it was selected, for progress
+
+        Returns:
+            bool: whether it is gone now
+        """
+        if _use_fd:
+            try:
+                fd = os.open(name, _OPEN_DIR_FLAGS, dir_fd=dir_fd)
+            except FileNotFoundError:
+                return True
+            except OSError as exc:
+                if exc.errno in (errno.ELOOP, errno.ENOTDIR):
+                    # swapped for a file or a symlink since it was listed
+                    return self._attempt(
+                        partial(os.unlink, name, dir_fd=dir_fd), full_path
+                    )
+                # it cannot be emptied, but can still go if it is empty
+                return self._handle(
+                    exc, full_path, partial(os.rmdir, name, dir_fd=dir_fd)
+                )
+            try:
+                emptied = self._delete_contents(fd, full_path, rel)
+            finally:
+                os.close(fd)
+        else:
+            emptied = self._delete_contents(None, full_path, rel)
+        if not emptied:
+            # whatever is left was already reported
+            return False
+        if not self._attempt(partial(os.rmdir, name, dir_fd=dir_fd), full_path):
+            return False
+        self._count(0, 1, 0, rel)
+        return True
+
+    def _delete_contents(self, fd: int | None, full_path: str, rel: str) -> bool:
+        entries: list[os.DirEntry] = []
+
+        def scan() -> None:
+            with os.scandir(full_path if fd is None else fd) as it:
+                entries[:] = it
+
+        if not self._attempt(scan, full_path):
+            return False
+        self._count(len(entries), 0, 0, "")
+        gone = True
+        futures: list[Future[bool]] = []
+        deleted = size = 0
+        try:
+            for entry in entries:
+                self._check_stopped()
+                child_path = path.join(full_path, entry.name)
+                child_rel = f"{rel}/{entry.name}"
+                # relative to this folder's descriptor, or else the full path
+                child_name = child_path if fd is None else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir and not _is_junction(entry):
+                    result = self._run(
+                        self._delete_dir, fd, child_name, child_path, child_rel
+                    )
+                    if isinstance(result, Future):
+                        futures.append(result)
+                    else:
+                        gone &= result
+                    continue
+                try:
+                    entry_size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    entry_size = 0
+                remove = os.rmdir if is_dir else os.unlink
+                if self._attempt(partial(remove, child_name, dir_fd=fd), child_path):
+                    deleted += 1
+                    size += entry_size
+                    if deleted == _COUNT_EVERY:
+                        self._count(0, deleted, size, child_rel)
+                        deleted = size = 0
+                else:
+                    gone = False
+        except BaseException as exc:
+            self._fail(exc)
+            raise
+        finally:
+            # the subfolders are opened relative to this folder, so it has to
+            # stay open until they are done
+            wait(futures)
+            if deleted:
+                self._count(0, deleted, size, f"{rel}/{entries[-1].name}")
+        for future in futures:
+            gone &= future.result()
+        return gone
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import multiprocessing
+import os
+import queue
 import re
+import select
 import subprocess
+import threading
+from contextlib import suppress
 from fnmatch import fnmatch
+from functools import cache
+from multiprocessing.process import BaseProcess
 from os import path
+from typing import BinaryIO, cast
 
 from rovr.classes.config import RovrConfig
+from rovr.functions import multiprocessing_utils
 
 _OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
 
@@ -134,19 +143,205 @@ def get_mounted_drives(platform: str, config: "RovrConfig") -> list[str]:
     return drives
 
 
-def get_mounted_drives_worker(
-    queue: "multiprocessing.Queue[list[str]]", platform: str, config: "RovrConfig"
+def _drive_probe_worker(
+    requests: "multiprocessing.Queue[tuple[str, RovrConfig] | None]",
+    results: "multiprocessing.Queue[list[str]]",
 ) -> None:
     """
-    Multiprocessing worker that gets mounted drives and puts result in a queue.
+    Long-lived helper process that answers drive probes until told to stop,
+    or until rovr itself is gone.
+
+    Args:
+        requests: (platform, config) for each probe, or None to stop
+        results: Multiprocessing queue to put each list of drives into
+    """
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            request = requests.get(timeout=5)
+        except queue.Empty:
+            if parent is not None and not parent.is_alive():
+                return
+            continue
+        if request is None:
+            return
+        try:
+            results.put(get_mounted_drives(*request))
+        except Exception:
+            results.put([])
+
+
+class DriveProbe:
+    """Runs get_mounted_drives in one helper process that is kept around
+    between probes, so a probe that hangs (on an unreachable network mount,
+    say) can be killed without rovr hanging with it."""
+
+    def __init__(self, timeout: float = 2.0) -> None:
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._process: BaseProcess | None = None
+        self._requests: multiprocessing.Queue[tuple[str, RovrConfig] | None]
+        self._results: multiprocessing.Queue[list[str]]
+
+    def _start(self) -> BaseProcess:
+        self._requests = multiprocessing.Queue()
+        self._results = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=_drive_probe_worker,
+            args=(self._requests, self._results),
+            daemon=True,
+        )
+        multiprocessing_utils.start_process(process)
+        self._process = process
+        return process
+
+    def probe(self, platform: str, config: "RovrConfig") -> list[str] | None:
+        """
+        Args:
+            platform: System platform ("win32", "darwin", "linux", etc.)
+            config: Application config dict
+
+        Returns:
+            list[str] | None: the mounted drives, or None if the helper did
+            not answer in time (it is killed, and started again next time)
+        """
+        # the helper only needs the exclusions, so don't pickle the rest
+        slim = cast(
+            "RovrConfig",
+            {
+                "settings": {
+                    "drive_exclude": config.get("settings", {}).get("drive_exclude", [])
+                }
+            },
+        )
+        with self._lock:
+            process = self._process
+            if process is None or not process.is_alive():
+                process = self._start()
+            self._requests.put((platform, slim))
+            try:
+                return self._results.get(timeout=self.timeout)
+            except queue.Empty:
+                self._kill(process)
+                return None
+
+    def _kill(self, process: BaseProcess) -> None:
+        process.terminate()
+        process.join(timeout=0.5)
+        if process.is_alive():
+            process.kill()
+        self._process = None
+
+    def close(self) -> None:
+        """Stop the helper process, if it was started."""
+        with self._lock:
+            process = self._process
+            if process is None:
+                return
+            with suppress(Exception):
+                self._requests.put(None)
+            process.join(timeout=0.5)
+            if process.is_alive():
+                self._kill(process)
+            self._process = None
+
+
+@cache
+def get_drive_probe() -> DriveProbe:
+    return DriveProbe()
+
+
+def probe_can_hang(platform: str) -> bool:
+    """
+    Args:
+        platform: System platform ("win32", "darwin", "linux", etc.)
+
+    Returns:
+        bool: whether listing drives can block (on `df`, or a network drive
+        that stopped responding), rather than only reading procfs
+    """
+    return platform != "linux" or not os.access("/proc/mounts", os.R_OK)
+
+
+def list_drives(
+    platform: str, config: "RovrConfig", allow_process: bool
+) -> list[str] | None:
+    """
+    Get the mounted drives, through the shared helper process where the
+    probe can hang.
 
     Args:
-        queue: Multiprocessing queue to put the result into
         platform: System platform ("win32", "darwin", "linux", etc.)
         config: Application config dict
+        allow_process: whether a helper process may be used at all
+
+    Returns:
+        list[str] | None: the mounted drives, or None if the probe timed out
     """
-    try:
-        result = get_mounted_drives(platform, config)
-        queue.put(result)
-    except Exception:
-        queue.put([])
+    if allow_process and probe_can_hang(platform):
+        return get_drive_probe().probe(platform, config)
+    return get_mounted_drives(platform, config)
+
+
+class MountMonitor:
+    """Tells whether the mounted drives may have changed since it was last
+    asked, as cheaply as the platform allows, so drives are only listed again
+    once they have.
+
+    - Linux: `/proc/self/mounts` is polled for POLLPRI, which the kernel
+      raises whenever the mount table changes.
+    - Windows: the GetLogicalDrives bitmask is compared.
+    - macOS: the mtime of /Volumes is compared, as mounting adds to it.
+    - Anywhere else, every check counts as a change.
+    """
+
+    def __init__(self, platform: str) -> None:
+        self.platform = platform
+        self._mounts: BinaryIO | None = None
+        self._poll: select.poll | None = None
+        self._first = True
+        self._last: object = None
+        if platform == "linux" and hasattr(select, "poll"):
+            try:
+                self._mounts = open("/proc/self/mounts", "rb")  # noqa: SIM115
+                self._poll = select.poll()
+                self._poll.register(self._mounts, select.POLLPRI | select.POLLERR)
+            except OSError:
+                self.close()
+
+    def _key(self) -> object:
+        try:
+            if self.platform == "win32":
+                import ctypes
+
+                return ctypes.windll.kernel32.GetLogicalDrives()
+            if self.platform == "darwin":
+                return os.stat("/Volumes").st_mtime_ns
+        except (OSError, AttributeError):
+            pass
+        return None
+
+    def changed(self) -> bool:
+        """
+        Returns:
+            bool: True on the first call, and afterwards whenever the mount
+            table (may have) changed since the previous call
+        """
+        first, self._first = self._first, False
+        if self._poll is not None:
+            # the kernel clears the event for this file once it is reported
+            return bool(self._poll.poll(0)) or first
+        key = self._key()
+        changed = first or key is None or key != self._last
+        self._last = key
+        return changed
+
+    def reset(self) -> None:
+        """Report a change on the next call, so a failed probe is retried."""
+        self._first = True
+
+    def close(self) -> None:
+        if self._mounts is not None:
+            self._mounts.close()
+        self._mounts = None
+        self._poll = None
@@ -0,0 +1,720 @@
+import contextlib
+import hashlib
+import json
+import os
+import re
+import stat
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import path
+from queue import Empty, SimpleQueue
+from typing import Callable, Iterable, NamedTuple
+
+from rovr.variables.maps import RovrVars
+
+# bump this whenever the on-disk format changes, old indexes are rebuilt
+INDEX_VERSION: int = 1
+INDEX_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+# folders stat-ed per task when checking an existing index for changes
+PROBE_BATCH_SIZE: int = 256
+IGNORE_FILES: tuple[str, ...] = (".gitignore", ".ignore", ".fdignore")
+# fd skips these even with --hidden, so the index does as well
+ALWAYS_SKIPPED: frozenset[str] = frozenset({".git"})
+# characters that make a search term a regex instead of a plain substring
+REGEX_CHARACTERS = frozenset("\\.^$*+?{}[]|()")
+# every index holds a whole tree in memory, so only keep a few around
+FILE_INDEX_CACHE_SIZE: int = 4
+
+
+class IndexOptions(NamedTuple):
+    root: str
+    hidden: bool
+    follow_symlinks: bool
+    no_ignore_parent: bool
+
+
+class IndexedDirectory(NamedTuple):
+    mtime: int
+    """st_mtime_ns of the directory, which changes when entries are added or removed"""
+    ignore_mtime: int
+    """The newest st_mtime_ns of the ignore files inside, 0 if there are none"""
+    names: tuple[str, ...]
+    kinds: str
+    """One fd type alias (f, d, l, s, p, c or b) per name, ? if unknown"""
+
+
+class FileIndexMatch(NamedTuple):
+    path: str
+    """The path relative to the root of the index, using forward slashes"""
+    kind: str
+
+
+class IgnoreRule(NamedTuple):
+    pattern: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+def _translate_glob(glob: str) -> str:
+    """Translate a gitignore glob (without the anchoring slash) to a regex.
+
+    Returns:
+        str: the regex, which has to match the whole relative path
+    """
+    result: list[str] = []
+    index = 0
+    while index < len(glob):
+        character = glob[index]
+        if glob.startswith("**/", index) and (index == 0 or glob[index - 1] == "/"):
+            result.append("(?:.*/)?")
+            index += 3
+            continue
+        if glob.startswith("**", index) and index + 2 == len(glob):
+            result.append(".*")
+            index += 2
+            continue
+        match character:
+            case "*":
+                result.append("[^/]*")
+            case "?":
+                result.append("[^/]")
+            case "\\" if index + 1 < len(glob):
+                index += 1
+                result.append(re.escape(glob[index]))
+            case "[":
+                end = glob.find("]", index + 2)
+                if end == -1:
+                    result.append(re.escape(character))
+                else:
+                    body = glob[index + 1 : end].replace("\\", "\\\\")
+                    if body.startswith("!"):
+                        body = f"^{body[1:]}"
+                    result.append(f"[{body}]")
+                    index = end
+            case _:
+                result.append(re.escape(character))
+        index += 1
+    return "".join(result)
+
+
+def parse_ignore_lines(lines: Iterable[str]) -> tuple[IgnoreRule, ...]:
+    """Parse the lines of a gitignore-style file.
+
+    Returns:
+        tuple[IgnoreRule, ...]: the rules, in file order
+    """
+    rules: list[IgnoreRule] = []
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        # trailing spaces are ignored unless they are escaped
+        while line.endswith(" ") and not line.endswith("\\ "):
+            line = line[:-1]
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated or line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        # a slash anywhere but the end anchors the pattern to the ignore file
+        anchored = "/" in line
+        regex = _translate_glob(line.lstrip("/"))
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+        try:
+            pattern = re.compile(f"{regex}\\Z", re.DOTALL)
+        except re.error:
+            continue
+        rules.append(IgnoreRule(pattern, negated, dir_only))
+    return tuple(rules)
+
+
+class IgnoreFile(NamedTuple):
+    directory: str
+    """The directory the rules are relative to, as an absolute path"""
+    rules: tuple[IgnoreRule, ...]
+
+    def check(self, full_path: str, is_dir: bool) -> bool | None:
+        """
+        Returns:
+            bool: whether the last matching rule ignores the path
+            None: if no rule matches
+        """
+        # every path that gets checked is inside the ignore file's directory
+        relative = full_path[len(self.directory) :].lstrip("/\\").replace("\\", "/")
+        for rule in reversed(self.rules):
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.pattern.match(relative):
+                return not rule.negated
+        return None
+
+
+def read_ignore_files(directory: str) -> tuple[tuple[IgnoreFile, ...], int]:
+    """Read the ignore files directly inside a directory.
+
+    Returns:
+        tuple[tuple[IgnoreFile, ...], int]: the parsed files, and the newest
+        modification time among them (0 if there are none)
+    """
+    found: list[IgnoreFile] = []
+    newest = 0
+    for name in IGNORE_FILES:
+        file_path = path.join(directory, name)
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="replace") as file:
+                newest = max(newest, os.fstat(file.fileno()).st_mtime_ns)
+                rules = parse_ignore_lines(file)
+        except OSError:
+            continue
+        if rules:
+            found.append(IgnoreFile(directory, rules))
+    return tuple(found), newest
+
+
+def ignore_files_mtime(directory: str) -> int:
+    """
+    Returns:
+        int: the newest modification time of the ignore files directly inside
+        a directory, without reading them (0 if there are none)
+    """
+    newest = 0
+    for name in IGNORE_FILES:
+        with contextlib.suppress(OSError):
+            newest = max(newest, os.stat(path.join(directory, name)).st_mtime_ns)
+    return newest
+
+
+def is_ignored(
+    ignore_files: tuple[IgnoreFile, ...], full_path: str, is_dir: bool
+) -> bool:
+    """Check a path against a stack of ignore files, the deepest one winning.
+
+    Returns:
+        bool: whether the path should be left out
+    """
+    for ignore_file in reversed(ignore_files):
+        verdict = ignore_file.check(full_path, is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def _entry_kind(entry: os.DirEntry, follow_symlinks: bool) -> str:
+    try:
+        if entry.is_symlink() and not follow_symlinks:
+            return "l"
+        if entry.is_dir(follow_symlinks=follow_symlinks):
+            return "d"
+        if entry.is_file(follow_symlinks=follow_symlinks):
+            return "f"
+        mode = entry.stat(follow_symlinks=follow_symlinks).st_mode
+    except OSError:
+        # a dangling symlink while following symlinks
+        return "l" if follow_symlinks else "?"
+    if stat.S_ISSOCK(mode):
+        return "s"
+    if stat.S_ISFIFO(mode):
+        return "p"
+    if stat.S_ISCHR(mode):
+        return "c"
+    if stat.S_ISBLK(mode):
+        return "b"
+    return "?"
+
+
+class _ScanResult(NamedTuple):
+    relative: str
+    identity: tuple[int, int]
+    record: IndexedDirectory
+    ignore_files: tuple[IgnoreFile, ...]
+
+
+class FileIndex:
+    """An in-memory index of every file name below a root directory.
+
+    The tree is crawled with a pool of `os.scandir` workers. Each directory
+    keeps its own modification time, so `update` only has to stat the
+    directories it already knows about and rescan the ones that changed,
+    instead of walking the whole tree again.
+    """
+
+    def __init__(self, options: IndexOptions) -> None:
+        self.options = options
+        self.directories: dict[str, IndexedDirectory] = {}
+        self.ready: bool = False
+        self._lock = threading.Lock()
+        self._ignore_stacks: dict[str, tuple[IgnoreFile, ...]] = {}
+        # parallel arrays over every indexed entry, rebuilt after changes
+        self._flat: tuple[list[str], list[str], str] | None = None
+        self._lowered: list[str] | None = None
+
+    # building
+
+    def _full_path(self, relative: str) -> str:
+        return path.join(self.options.root, relative) if relative else self.options.root
+
+    def _parent_ignore_files(self) -> tuple[IgnoreFile, ...]:
+        """The ignore files of the folders above the root, outermost first.
+
+        Returns:
+            tuple[IgnoreFile, ...]: the ignore files
+        """
+        if self.options.no_ignore_parent:
+            return ()
+        parents: list[str] = []
+        current = path.dirname(self.options.root)
+        while current and current not in parents:
+            parents.append(current)
+            if path.isdir(path.join(current, ".git")):
+                # like git, stop at the root of the repository
+                break
+            next_parent = path.dirname(current)
+            if next_parent == current:
+                break
+            current = next_parent
+        stack: tuple[IgnoreFile, ...] = ()
+        for parent in reversed(parents):
+            stack += read_ignore_files(parent)[0]
+        return stack
+
+    def _ignore_stack(self, relative: str) -> tuple[IgnoreFile, ...]:
+        """The ignore files that apply to the entries of a directory.
+
+        Returns:
+            tuple[IgnoreFile, ...]: the ignore files, outermost first
+        """
+        stack = self._ignore_stacks.get(relative)
+        if stack is not None:
+            return stack
+        if relative:
+            parent_stack = self._ignore_stack(relative.rpartition("/")[0])
+        else:
+            parent_stack = self._parent_ignore_files()
+        stack = parent_stack + read_ignore_files(self._full_path(relative))[0]
+        self._ignore_stacks[relative] = stack
+        return stack
+
+    def _scan(self, relative: str, parent_stack: tuple[IgnoreFile, ...]) -> _ScanResult:
+        full_path = self._full_path(relative)
+        directory_stat = os.stat(full_path)
+        own_ignore_files, ignore_mtime = read_ignore_files(full_path)
+        ignore_stack = parent_stack + own_ignore_files
+        names: list[str] = []
+        kinds: list[str] = []
+        with os.scandir(full_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in ALWAYS_SKIPPED or (
+                    not self.options.hidden and name.startswith(".")
+                ):
+                    continue
+                kind = _entry_kind(entry, self.options.follow_symlinks)
+                if ignore_stack and is_ignored(ignore_stack, entry.path, kind == "d"):
+                    continue
+                names.append(name)
+                kinds.append(kind)
+        return _ScanResult(
+            relative,
+            (directory_stat.st_dev, directory_stat.st_ino),
+            IndexedDirectory(
+                directory_stat.st_mtime_ns,
+                ignore_mtime,
+                tuple(names),
+                "".join(kinds),
+            ),
+            ignore_stack,
+        )
+
+    def _remove_tree(self, relative: str) -> None:
+        prefix = f"{relative}/" if relative else ""
+        for known in [
+            known
+            for known in self.directories
+            if known == relative or known.startswith(prefix)
+        ]:
+            del self.directories[known]
+            self._ignore_stacks.pop(known, None)
+
+    def _crawl(
+        self,
+        pool: ThreadPoolExecutor,
+        starts: Iterable[str],
+        should_stop: Callable[[], bool],
+    ) -> bool:
+        """Scan directories, and any subdirectory that is not indexed yet.
+
+        Returns:
+            bool: False if the crawl was stopped halfway
+        """
+        visited: set[tuple[int, int]] = set()
+        finished: SimpleQueue[Future[_ScanResult]] = SimpleQueue()
+        outstanding = 0
+
+        def submit(relative: str, parent_stack: tuple[IgnoreFile, ...]) -> None:
+            nonlocal outstanding
+            outstanding += 1
+            pool.submit(self._scan, relative, parent_stack).add_done_callback(
+                finished.put
+            )
+
+        for relative in starts:
+            submit(
+                relative,
+                self._ignore_stack(relative.rpartition("/")[0])
+                if relative
+                else self._parent_ignore_files(),
+            )
+        while outstanding:
+            if should_stop():
+                pool.shutdown(wait=False, cancel_futures=True)
+                return False
+            try:
+                future = finished.get(timeout=0.1)
+            except Empty:
+                continue
+            outstanding -= 1
+            try:
+                result = future.result()
+            except OSError:
+                continue
+            if result.identity in visited:
+                # a symlink loop, or a folder reachable through two links
+                continue
+            visited.add(result.identity)
+            previous = self.directories.get(result.relative)
+            self.directories[result.relative] = result.record
+            self._ignore_stacks[result.relative] = result.ignore_files
+            prefix = f"{result.relative}/" if result.relative else ""
+            subfolders = [
+                f"{prefix}{name}"
+                for name, kind in zip(result.record.names, result.record.kinds)
+                if kind == "d"
+            ]
+            if previous is not None:
+                if previous.ignore_mtime != result.record.ignore_mtime:
+                    # every subfolder has to be rescanned with the new rules
+                    keep = set()
+                else:
+                    keep = set(subfolders)
+                # folders that disappeared take their whole subtree with them
+                for name, kind in zip(previous.names, previous.kinds):
+                    if kind == "d" and f"{prefix}{name}" not in keep:
+                        self._remove_tree(f"{prefix}{name}")
+            for subfolder in subfolders:
+                if subfolder not in self.directories:
+                    submit(subfolder, result.ignore_files)
+        return True
+
+    def _probe(
+        self, items: list[tuple[str, IndexedDirectory]]
+    ) -> list[tuple[str, str]]:
+        statuses: list[tuple[str, str]] = []
+        for relative, record in items:
+            full_path = self._full_path(relative)
+            try:
+                mtime = os.stat(full_path).st_mtime_ns
+            except OSError:
+                statuses.append((relative, "gone"))
+                continue
+            # new or removed ignore files change the folder's mtime, and get
+            # picked up by the rescan, so only edits to existing ones need a stat
+            if (
+                record.ignore_mtime
+                and ignore_files_mtime(full_path) != record.ignore_mtime
+            ):
+                statuses.append((relative, "ignore"))
+            elif mtime != record.mtime:
+                statuses.append((relative, "changed"))
+        return statuses
+
+    def update(self, should_stop: Callable[[], bool] = lambda: False) -> bool:
+        """Build the index, or bring an existing one up to date.
+
+        Only directories whose modification time (or ignore files) changed
+        are scanned again, and only new subdirectories are crawled.
+
+        Args:
+            should_stop: Checked between scans, to give up early
+
+        Returns:
+            bool: whether anything in the index changed
+        """
+        with (
+            self._lock,
+            ThreadPoolExecutor(
+                max_workers=INDEX_WORKERS, thread_name_prefix="rovr-index"
+            ) as pool,
+        ):
+            if not self.ready:
+                self.directories.clear()
+                self._ignore_stacks.clear()
+                if not self._crawl(pool, [""], should_stop):
+                    self.directories.clear()
+                    return False
+                self.ready = True
+                self._flat = None
+                return True
+
+            changed: list[str] = []
+            removed = False
+            items = list(self.directories.items())
+            batches = [
+                items[start : start + PROBE_BATCH_SIZE]
+                for start in range(0, len(items), PROBE_BATCH_SIZE)
+            ]
+            statuses = [
+                status for batch in pool.map(self._probe, batches) for status in batch
+            ]
+            for relative, status in statuses:
+                if relative not in self.directories:
+                    continue
+                if status == "changed":
+                    changed.append(relative)
+                    continue
+                # gone, or its ignore files changed, so the subtree is stale
+                self._remove_tree(relative)
+                removed = True
+                if status == "ignore":
+                    changed.append(relative)
+            if not changed and not removed:
+                return False
+            if not self._crawl(pool, changed, should_stop):
+                # the index is half updated, so rebuild it next time
+                self.ready = False
+            self._flat = None
+            self._lowered = None
+            return True
+
+    # searching
+
+    def _snapshot(self) -> tuple[list[str], list[str], str]:
+        """Parallel lists of names, their parent folders and their kinds.
+
+        Returns:
+            tuple[list[str], list[str], str]: names, parents and kinds
+        """
+        flat = self._flat
+        if flat is not None:
+            return flat
+        # waits for an update that is still running
+        with self._lock:
+            if self._flat is None:
+                names: list[str] = []
+                parents: list[str] = []
+                kinds: list[str] = []
+                for relative, record in self.directories.items():
+                    names.extend(record.names)
+                    parents.extend([relative] * len(record.names))
+                    kinds.append(record.kinds)
+                self._flat = (names, parents, "".join(kinds))
+                self._lowered = None
+            return self._flat
+
+    def _lowered_names(self, names: list[str]) -> list[str]:
+        lowered = self._lowered
+        if lowered is None or len(lowered) != len(names):
+            lowered = self._lowered = [name.lower() for name in names]
+        return lowered
+
+    def _has_type(self, relative: str, kind: str, types: frozenset[str]) -> bool:
+        if kind in types:
+            return True
+        if "x" in types and kind == "f":
+            return os.access(self._full_path(relative), os.X_OK)
+        if "e" in types:
+            if kind == "d":
+                record = self.directories.get(relative)
+                return record is not None and not record.names
+            if kind == "f":
+                try:
+                    return os.stat(self._full_path(relative)).st_size == 0
+                except OSError:
+                    return False
+        return False
+
+    def search(
+        self,
+        pattern: str,
+        types: Iterable[str] = (),
+        should_stop: Callable[[], bool] = lambda: False,
+    ) -> list[FileIndexMatch]:
+        """Find entries whose name matches a pattern, the way fd does.
+
+        The pattern is a regex searched for in the file name, and is case
+        insensitive unless it contains an uppercase letter. Patterns without
+        any regex characters skip the regex engine entirely.
+
+        Args:
+            pattern: The search term
+            types: fd type aliases to keep, (f, d, l, x, e, s, p, c or b),
+                everything is kept if empty
+            should_stop: Checked between batches, to give up early
+
+        Returns:
+            list[FileIndexMatch]: the matches, grouped by folder
+        """
+        names, parents, kinds = self._snapshot()
+        case_sensitive = pattern != pattern.lower()
+        haystack = names if case_sensitive else self._lowered_names(names)
+        if REGEX_CHARACTERS.isdisjoint(pattern):
+            needle = pattern if case_sensitive else pattern.lower()
+
+            def matches(name: str) -> bool:
+                return needle in name
+
+        else:
+            try:
+                compiled = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+            except re.error:
+                compiled = re.compile(
+                    re.escape(pattern), 0 if case_sensitive else re.IGNORECASE
+                )
+            haystack = names
+
+            def matches(name: str) -> bool:
+                return compiled.search(name) is not None
+
+        wanted = frozenset(types)
+        found: list[FileIndexMatch] = []
+        batch = 65536
+        for start in range(0, len(haystack), batch):
+            if should_stop():
+                break
+            for index in [
+                start + offset
+                for offset, name in enumerate(haystack[start : start + batch])
+                if matches(name)
+            ]:
+                parent = parents[index]
+                relative = f"{parent}/{names[index]}" if parent else names[index]
+                if wanted and not self._has_type(relative, kinds[index], wanted):
+                    continue
+                found.append(FileIndexMatch(relative, kinds[index]))
+        return found
+
+    def files(self) -> list[str]:
+        """
+        Returns:
+            list[str]: every regular file in the index, relative to the root
+        """
+        names, parents, kinds = self._snapshot()
+        return [
+            f"{parents[index]}/{names[index]}" if parents[index] else names[index]
+            for index, kind in enumerate(kinds)
+            if kind == "f"
+        ]
+
+    # persisting
+
+    def save(self) -> None:
+        """Write the index to the cache folder, so the next session only refreshes it.
+
+        Every field is separated by a NUL, which cannot appear in a file name,
+        and the whole thing is compressed with zlib.
+        """
+        with self._lock:
+            if not self.ready:
+                return
+            fields = [
+                json.dumps({"version": INDEX_VERSION, "options": list(self.options)})
+            ]
+            for relative, record in self.directories.items():
+                fields.extend((
+                    relative,
+                    str(record.mtime),
+                    str(record.ignore_mtime),
+                    str(len(record.names)),
+                    record.kinds,
+                ))
+                fields.extend(record.names)
+        data = zlib.compress("\0".join(fields).encode("utf-8", "surrogateescape"), 1)
+        cache_path = index_cache_path(self.options)
+        temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(path.dirname(cache_path), exist_ok=True)
+            with open(temporary_path, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(temporary_path)
+
+    @classmethod
+    def load(cls, options: IndexOptions) -> "FileIndex | None":
+        """
+        Returns:
+            FileIndex: the index saved for these options, to be updated
+            None: if there is no usable saved index
+        """
+        try:
+            with open(index_cache_path(options), "rb") as file:
+                data = zlib.decompress(file.read())
+            fields = data.decode("utf-8", "surrogateescape").split("\0")
+            header = json.loads(fields[0])
+            if header.get("version") != INDEX_VERSION or header.get("options") != list(
+                options
+            ):
+                return None
+            index = cls(options)
+            position = 1
+            while position < len(fields):
+                relative, mtime, ignore_mtime, count, kinds = fields[
+                    position : position + 5
+                ]
+                position += 5
+                names = tuple(fields[position : position + int(count)])
+                position += int(count)
+                if len(names) != len(kinds):
+                    return None
+                index.directories[relative] = IndexedDirectory(
+                    int(mtime), int(ignore_mtime), names, kinds
+                )
+        except (OSError, zlib.error, ValueError, AttributeError):
+            return None
+        index.ready = True
+        return index
+
+
+def index_cache_path(options: IndexOptions) -> str:
+    digest = hashlib.sha1(
+        json.dumps(list(options)).encode(), usedforsecurity=False
+    ).hexdigest()
+    return path.join(RovrVars.ROVRCACHE, "file_index", f"{digest[:16]}.idx")
+
+
+_indexes: OrderedDict[IndexOptions, FileIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_file_index(options: IndexOptions) -> FileIndex:
+    """Get the index for a root and set of options.
+
+    Indexes are kept in memory for the session, and loaded from the cache
+    folder the first time they are needed. Either way, the index might be
+    stale (or not built at all), so call `FileIndex.update` before trusting it.
+
+    Returns:
+        FileIndex: the index
+    """
+    with _indexes_lock:
+        index = _indexes.get(options)
+        if index is not None:
+            _indexes.move_to_end(options)
+            return index
+    index = FileIndex.load(options) or FileIndex(options)
+    with _indexes_lock:
+        index = _indexes.setdefault(options, index)
+        _indexes.move_to_end(options)
+        while len(_indexes) > FILE_INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+    return index
+
+
+def clear_file_indexes() -> None:
+    with _indexes_lock:
+        _indexes.clear()
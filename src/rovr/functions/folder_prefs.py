@@ -1,87 +1,263 @@
 import json
-from os import makedirs, path
-from typing import TypedDict, cast
+import re
+from contextlib import suppress
+from functools import cache
+from os import path, remove
+from typing import Any, NotRequired, TypedDict, TypeGuard
 
 from rovr.classes.type_aliases import SortByOptions
 from rovr.variables.maps import RovrVars
 
 from .path import normalise
+from .persistence import get_writer
 
 
 class FolderPrefDict(TypedDict):
     sort_by: SortByOptions
     sort_descending: bool
+    # also applies to every folder below this one, unless it has its own
+    recursive: NotRequired[bool]
 
 
 folder_prefs: dict[str, FolderPrefDict] = {}
+# lines in the log, including ones that were overwritten or removed since
+_log_lines: int = 0
+
+
+class _PrefNode:
+    """A folder in the index of folder_prefs, keyed by path component."""
+
+    __slots__ = ("children", "folder_path", "pref")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefNode] = {}
+        self.folder_path: str = ""
+        self.pref: FolderPrefDict | None = None
+
+
+# folder_prefs as a trie, so a lookup walks the path once instead of
+# checking every preference, and finds inherited ones on the way
+_index = _PrefNode()
+
+
+def _components(normalised: str) -> list[str]:
+    # "/" is the root itself, and "C:" is a component of its own
+    return [part for part in normalised.split("/") if part]
+
+
+def _index_set(normalised: str, pref: FolderPrefDict) -> None:
+    node = _index
+    for part in _components(normalised):
+        node = node.children.setdefault(part, _PrefNode())
+    node.folder_path = normalised
+    node.pref = pref
+
+
+def _index_remove(normalised: str) -> None:
+    parts = _components(normalised)
+    trail = [_index]
+    for part in parts:
+        child = trail[-1].children.get(part)
+        if child is None:
+            return
+        trail.append(child)
+    trail[-1].pref = None
+    # drop the folders that only led up to it
+    for depth in range(len(parts), 0, -1):
+        node = trail[depth]
+        if node.pref is not None or node.children:
+            break
+        del trail[depth - 1].children[parts[depth - 1]]
+
+
+def _rebuild_index() -> None:
+    global _index
+    _index = _PrefNode()
+    for folder_path, pref in folder_prefs.items():
+        _index_set(folder_path, pref)
+
+
+def _legacy_prefs_file() -> str:
+    # where preferences used to be kept, as a single JSON map that was
+    # rewritten on every change
+    return path.join(RovrVars.ROVRCONFIG, "folder_preferences.json")
+
+
+def _prefs_file() -> str:
+    # one JSON object per line, for every change made, in order. a change only
+    # appends to it, and it is compacted once most of it is overwritten
+    return path.join(RovrVars.ROVRCONFIG, "folder_preferences.jsonl")
+
+
+@cache
+def _path_vars() -> dict[str, str]:
+    return {
+        var: value
+        for var, value in vars(RovrVars).items()
+        if not var.startswith(("__", "ROVR")) and isinstance(value, str)
+    }
+
+
+@cache
+def _expander() -> re.Pattern[str]:
+    # longest names first, so a name that is a prefix of another never wins
+    names = sorted(_path_vars(), key=len, reverse=True)
+    return re.compile(r"\$(" + "|".join(map(re.escape, names)) + ")")
+
+
+@cache
+def _collapser() -> tuple[re.Pattern[str], dict[str, str]]:
+    # longest folders first, so $DOWNLOADS is used over $HOME/Downloads
+    by_value = {
+        value: var
+        for var, value in sorted(
+            _path_vars().items(), key=lambda item: len(item[1]), reverse=True
+        )
+        if value
+    }
+    pattern = re.compile("(" + "|".join(map(re.escape, by_value)) + ")(?=/|$)")
+    return pattern, by_value
+
+
+def _expand(folder_path: str) -> str:
+    path_vars = _path_vars()
+    return _expander().sub(lambda match: path_vars[match.group(1)], folder_path)
+
+
+def _collapse(folder_path: str) -> str:
+    pattern, by_value = _collapser()
+    return pattern.sub(
+        lambda match: f"${by_value[match.group(1)]}", normalise(folder_path)
+    )
+
+
+def _is_pref(pref: object) -> TypeGuard[dict[str, Any]]:
+    return (
+        isinstance(pref, dict)
+        and isinstance(pref.get("sort_by"), str)
+        and isinstance(pref.get("sort_descending"), bool)
+    )
+
+
+def _as_pref(pref: dict[str, Any]) -> FolderPrefDict:
+    folder_pref = FolderPrefDict(
+        sort_by=pref["sort_by"], sort_descending=pref["sort_descending"]
+    )
+    if pref.get("recursive") is True:
+        folder_pref["recursive"] = True
+    return folder_pref
+
+
+def _entry(folder_path: str, pref: FolderPrefDict | None) -> str:
+    entry: dict[str, object] = {"path": _collapse(folder_path)}
+    if pref is None:
+        entry["removed"] = True
+    else:
+        entry.update(pref)
+    return json.dumps(entry) + "\n"
 
 
 def load_folder_prefs() -> dict[str, FolderPrefDict]:
     """
-    Load folder preferences from the JSON file.
+    Load folder preferences, replaying the log over the old JSON map if it is
+    still around.
 
     Returns:
         dict: A dictionary mapping folder paths to their sort preferences.
     """
-    global folder_prefs
-    prefs_file = path.join(RovrVars.ROVRCONFIG, "folder_preferences.json")
-
-    if not path.exists(prefs_file):
-        folder_prefs = {}
-        return folder_prefs
-
-    try:
-        with open(prefs_file, "r", encoding="utf-8") as f:
-            loaded = json.load(f)
-        if not isinstance(loaded, dict):
-            # some stupid people will do some stupid things
+    global folder_prefs, _log_lines
+    prefs_file = _prefs_file()
+    legacy_file = _legacy_prefs_file()
+    get_writer().flush(prefs_file)
+
+    expanded: dict[str, FolderPrefDict] = {}
+    if path.exists(legacy_file):
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+            if not isinstance(loaded, dict):
+                # some stupid people will do some stupid things
+                loaded = {}
+        except (IOError, ValueError, json.JSONDecodeError):
             loaded = {}
-
-        # validate structure
-        expanded: dict[str, FolderPrefDict] = {}
         for folder_path, pref in loaded.items():
-            if (
-                isinstance(pref, dict)
-                and "sort_by" in pref
-                and "sort_descending" in pref
-                and isinstance(pref["sort_by"], str)
-                and isinstance(pref["sort_descending"], bool)
-            ):
-                for var in vars(RovrVars):
-                    if var.startswith(("__", "ROVR")):
-                        continue
-                    folder_path = folder_path.replace(f"${var}", getattr(RovrVars, var))
-                expanded[folder_path] = cast(FolderPrefDict, pref)
-
-        folder_prefs = expanded
-    except (IOError, ValueError, json.JSONDecodeError):
-        folder_prefs = {}
-
+            if _is_pref(pref):
+                expanded[normalise(_expand(folder_path))] = _as_pref(pref)
+
+    _log_lines = 0
+    with suppress(IOError), open(prefs_file, "r", encoding="utf-8") as f:
+        for line in f:
+            _log_lines += 1
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # a write that was cut short
+                continue
+            if not isinstance(entry, dict) or not isinstance(entry.get("path"), str):
+                continue
+            folder_path = normalise(_expand(entry.pop("path")))
+            if entry.get("removed"):
+                expanded.pop(folder_path, None)
+            elif _is_pref(entry):
+                expanded[folder_path] = _as_pref(entry)
+
+    folder_prefs = expanded
+    _rebuild_index()
+    if path.exists(legacy_file):
+        # move everything into the log, and only then drop the old map
+        save_folder_prefs()
+        get_writer().flush(prefs_file)
+        if path.exists(prefs_file):
+            with suppress(OSError):
+                remove(legacy_file)
     return folder_prefs
 
 
 def save_folder_prefs() -> None:
-    """Save folder preferences to the JSON file."""
-    global folder_prefs
-    prefs_file = path.join(RovrVars.ROVRCONFIG, "folder_preferences.json")
+    """Rewrite the log with only the current folder preferences."""
+    global _log_lines
+    get_writer().replace(
+        _prefs_file(),
+        "".join(
+            _entry(folder_path, pref) for folder_path, pref in folder_prefs.items()
+        ),
+    )
+    _log_lines = len(folder_prefs)
 
-    collapsed: dict[str, FolderPrefDict] = {}
-    for folder_path, pref in folder_prefs.items():
-        folder_path = normalise(folder_path)
-        for var, dir_path_val in vars(RovrVars).items():
-            if var.startswith(("__", "ROVR")):
-                continue
-            folder_path = folder_path.replace(dir_path_val, f"${var}")
-        collapsed[folder_path] = pref
 
-    if not path.exists(RovrVars.ROVRCONFIG):
-        makedirs(RovrVars.ROVRCONFIG, exist_ok=True)
-    try:
-        with open(prefs_file, "w", encoding="utf-8") as f:
-            json.dump(collapsed, f, indent=2)
-    except (IOError, OSError):
-        # something beyond our control
-        pass
+def _log_change(folder_path: str, pref: FolderPrefDict | None) -> None:
+    global _log_lines
+    if _log_lines >= 2 * len(folder_prefs) + 64:
+        # mostly overwritten entries by now
+        save_folder_prefs()
+        return
+    get_writer().append(_prefs_file(), _entry(folder_path, pref))
+    _log_lines += 1
+
+
+def find_folder_pref(folder_path: str) -> tuple[str, FolderPrefDict] | None:
+    """
+    Find the sort preference that applies to a folder: its own, or else the
+    closest one above it that also applies to subfolders.
+
+    Args:
+        folder_path: The path to the folder.
+
+    Returns:
+        The folder the preference was set on, and the preference, or None.
+    """
+    found: tuple[str, FolderPrefDict] | None = None
+    node = _index
+    for part in _components(normalise(folder_path)):
+        if node.pref is not None and node.pref.get("recursive"):
+            found = (node.folder_path, node.pref)
+        child = node.children.get(part)
+        if child is None:
+            return found
+        node = child
+    if node.pref is not None:
+        return node.folder_path, node.pref
+    return found
 
 
 def get_folder_pref(folder_path: str) -> FolderPrefDict | None:
@@ -92,14 +268,18 @@ def get_folder_pref(folder_path: str) -> FolderPrefDict | None:
         folder_path: The path to the folder.
 
     Returns:
-        FolderPrefDict if a custom preference exists, None otherwise.
+        FolderPrefDict if a custom preference exists, or is inherited from a
+        folder above it, None otherwise.
     """
-    normalised = normalise(folder_path)
-    return folder_prefs.get(normalised)
+    found = find_folder_pref(folder_path)
+    return None if found is None else found[1]
 
 
 def set_folder_pref(
-    folder_path: str, sort_by: SortByOptions, sort_descending: bool
+    folder_path: str,
+    sort_by: SortByOptions,
+    sort_descending: bool,
+    recursive: bool | None = None,
 ) -> None:
     """
     Set the sort preference for a specific folder.
@@ -108,13 +288,22 @@ def set_folder_pref(
         folder_path: The path to the folder.
         sort_by: The sort method (name, size, modified, created, extension, natural).
         sort_descending: Whether to sort in descending order.
+        recursive: Whether it applies to subfolders too. If None, keeps what
+            the folder had.
     """
     global folder_prefs
     normalised = normalise(folder_path)
-    folder_prefs[normalised] = FolderPrefDict(
-        sort_by=sort_by, sort_descending=sort_descending
-    )
-    save_folder_prefs()
+    previous = folder_prefs.get(normalised)
+    if recursive is None:
+        recursive = previous is not None and previous.get("recursive", False)
+    pref = FolderPrefDict(sort_by=sort_by, sort_descending=sort_descending)
+    if recursive:
+        pref["recursive"] = True
+    if previous == pref:
+        return
+    folder_prefs[normalised] = pref
+    _index_set(normalised, pref)
+    _log_change(normalised, pref)
 
 
 def remove_folder_pref(folder_path: str) -> None:
@@ -128,7 +317,8 @@ def remove_folder_pref(folder_path: str) -> None:
     normalised = normalise(folder_path)
     if normalised in folder_prefs:
         del folder_prefs[normalised]
-        save_folder_prefs()
+        _index_remove(normalised)
+        _log_change(normalised, None)
 
 
 def has_folder_pref(folder_path: str) -> bool:
@@ -0,0 +1,294 @@
+import struct
+import threading
+from os import environ, path
+from time import time
+from typing import NamedTuple
+
+from platformdirs import PlatformDirs
+
+from rovr.variables.maps import RovrVars
+
+from .path import normalise
+from .persistence import get_writer
+
+# the same limits and weights zoxide uses, so imported scores carry over
+FRECENCY_MAX_AGE: float = 10_000.0
+HOUR: int = 60 * 60
+DAY: int = 24 * HOUR
+WEEK: int = 7 * DAY
+ZOXIDE_DB_VERSION: int = 3
+# how many more records than folders the log can have before it is rewritten
+COMPACT_SLACK: int = 1000
+
+
+class FrecencyEntry(NamedTuple):
+    rank: float
+    """How often the folder was visited, decayed over time"""
+    last_accessed: int
+    """When the folder was last visited, in seconds since the epoch"""
+
+
+def frecency_score(entry: FrecencyEntry, now: int) -> float:
+    """
+    Returns:
+        float: the rank, weighted by how recently the folder was visited
+    """
+    elapsed = now - entry.last_accessed
+    if elapsed < HOUR:
+        return entry.rank * 4.0
+    elif elapsed < DAY:
+        return entry.rank * 2.0
+    elif elapsed < WEEK:
+        return entry.rank * 0.5
+    return entry.rank * 0.25
+
+
+def matches_keywords(lowered_path: str, keywords: list[str]) -> bool:
+    """Whether a path matches every keyword, like `zoxide query`.
+
+    The keywords have to appear in order, and the last one has to be in the
+    last component of the path, so `foo bar` matches `/foo/bar` but not
+    `/bar/foo`.
+
+    Args:
+        lowered_path: The path, in lowercase
+        keywords: The keywords, in lowercase
+
+    Returns:
+        bool: whether the path matches
+    """
+    if not keywords:
+        return True
+    if keywords[-1] not in lowered_path.rsplit("/", 1)[-1]:
+        return False
+    end = len(lowered_path)
+    for keyword in reversed(keywords):
+        end = lowered_path.rfind(keyword, 0, end)
+        if end == -1:
+            return False
+    return True
+
+
+def zoxide_database_path() -> str:
+    data_dir = (
+        environ.get("_ZO_DATA_DIR") or PlatformDirs("zoxide", False).user_data_dir
+    )
+    return path.join(data_dir, "db.zo")
+
+
+def parse_zoxide_database(data: bytes) -> dict[str, FrecencyEntry]:
+    """Read zoxide's database, which is bincode encoded.
+
+    Returns:
+        dict[str, FrecencyEntry]: the folders in it
+
+    Raises:
+        ValueError: when it is not a database this understands
+    """
+    try:
+        (version,) = struct.unpack_from("<I", data, 0)
+        if version != ZOXIDE_DB_VERSION:
+            raise ValueError(f"Unsupported zoxide database version {version}")
+        (count,) = struct.unpack_from("<Q", data, 4)
+        offset = 12
+        entries: dict[str, FrecencyEntry] = {}
+        for _ in range(count):
+            (length,) = struct.unpack_from("<Q", data, offset)
+            offset += 8
+            raw_path = data[offset : offset + length]
+            if len(raw_path) != length:
+                raise ValueError("Truncated zoxide database")
+            offset += length
+            rank, last_accessed = struct.unpack_from("<dQ", data, offset)
+            offset += 16
+            entries[normalise(raw_path.decode("utf-8", "surrogateescape"))] = (
+                FrecencyEntry(rank, last_accessed)
+            )
+    except struct.error as exc:
+        raise ValueError("Truncated zoxide database") from exc
+    return entries
+
+
+class FrecencyDatabase:
+    """Ranks visited folders by frequency and recency, in memory.
+
+    Changes are appended to a log, one record per line, so a visit costs one
+    small write. `+<n>` records add to a folder's rank and `=<n>` records set
+    it. The log is rewritten with one `=` record per folder once it has grown
+    well past the number of folders, or after the ranks were aged. Both go
+    through the shared writer, so nothing here waits on the disk except
+    `load`.
+    """
+
+    def __init__(self, log_path: str) -> None:
+        self.log_path = log_path
+        self.entries: dict[str, FrecencyEntry] = {}
+        self._lowered: dict[str, str] = {}
+        self._total_rank = 0.0
+        self._records = 0
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Replay the log, or import zoxide's database when there is no log yet."""
+        # anything still queued for it would be missed otherwise
+        get_writer().flush(self.log_path)
+        try:
+            with open(
+                self.log_path, encoding="utf-8", errors="surrogateescape"
+            ) as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            self.import_zoxide()
+            return
+        except OSError:
+            return
+        with self._lock:
+            for line in lines:
+                parts = line.split("\t", 2)
+                if len(parts) != 3 or parts[0][:1] not in "+=":
+                    continue
+                try:
+                    rank = float(parts[0][1:])
+                    last_accessed = int(parts[1])
+                except ValueError:
+                    continue
+                self._apply(parts[2], rank, last_accessed, parts[0][0] == "+")
+                self._records += 1
+            aged = self._age()
+        if aged:
+            self.compact()
+
+    def import_zoxide(self, database_path: str | None = None) -> int:
+        """Merge in the folders from zoxide's database.
+
+        Returns:
+            int: how many folders were imported
+        """
+        try:
+            with open(database_path or zoxide_database_path(), "rb") as file:
+                imported = parse_zoxide_database(file.read())
+        except (OSError, ValueError):
+            return 0
+        with self._lock:
+            for folder, entry in imported.items():
+                self._apply(folder, entry.rank, entry.last_accessed, True)
+            self._age()
+        self.compact()
+        return len(imported)
+
+    def add(self, directory: str, now: int | None = None) -> None:
+        """Record a visit to a folder."""
+        directory = normalise(directory)
+        now = int(time()) if now is None else now
+        with self._lock:
+            self._apply(directory, 1.0, now, True)
+            if self._age():
+                self._compact()
+            elif "\n" not in directory:
+                self._append(f"+1\t{now}\t{directory}\n")
+
+    def query(
+        self, keywords: list[str], exclude: str | None = None, now: int | None = None
+    ) -> list[tuple[str, float]]:
+        """Find the folders matching every keyword, best first.
+
+        Args:
+            keywords: The words to match, case insensitively
+            exclude: A folder to leave out, usually the current one
+            now: The time to score against, defaults to the current time
+
+        Returns:
+            list[tuple[str, float]]: the folders and their scores
+        """
+        now = int(time()) if now is None else now
+        lowered_keywords = [keyword.lower() for keyword in keywords]
+        with self._lock:
+            results = [
+                (folder, frecency_score(entry, now))
+                for folder, entry in self.entries.items()
+                if folder != exclude
+                and matches_keywords(self._lowered[folder], lowered_keywords)
+            ]
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results
+
+    def compact(self) -> None:
+        """Rewrite the log with a single record for each folder."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        # queued while holding the lock, so the writer gets the records in
+        # the same order as they were applied
+        lines = [
+            f"={entry.rank:g}\t{entry.last_accessed}\t{folder}\n"
+            for folder, entry in self.entries.items()
+            if "\n" not in folder
+        ]
+        self._records = len(lines)
+        get_writer().replace(self.log_path, "".join(lines))
+
+    def _apply(
+        self, directory: str, rank: float, last_accessed: int, relative: bool
+    ) -> None:
+        previous = self.entries.get(directory)
+        if previous is None:
+            self._lowered[directory] = directory.lower()
+        else:
+            self._total_rank -= previous.rank
+            if relative:
+                rank += previous.rank
+                last_accessed = max(last_accessed, previous.last_accessed)
+        self.entries[directory] = FrecencyEntry(rank, last_accessed)
+        self._total_rank += rank
+
+    def _age(self) -> bool:
+        """Scale every rank down once they add up to more than the maximum,
+        forgetting folders that have not been visited in a long time.
+
+        Returns:
+            bool: whether the ranks were aged
+        """
+        if self._total_rank <= FRECENCY_MAX_AGE:
+            return False
+        factor = 0.9 * FRECENCY_MAX_AGE / self._total_rank
+        aged: dict[str, FrecencyEntry] = {}
+        for folder, entry in self.entries.items():
+            rank = entry.rank * factor
+            if rank >= 1.0:
+                aged[folder] = FrecencyEntry(rank, entry.last_accessed)
+            else:
+                del self._lowered[folder]
+        self.entries = aged
+        self._total_rank = sum(entry.rank for entry in aged.values())
+        return True
+
+    def _append(self, record: str) -> None:
+        self._records += 1
+        if self._records > 2 * len(self.entries) + COMPACT_SLACK:
+            self._compact()
+        else:
+            get_writer().append(self.log_path, record)
+
+
+_database: FrecencyDatabase | None = None
+_database_lock = threading.Lock()
+
+
+def frecency_log_path() -> str:
+    return path.join(RovrVars.ROVRCONFIG, "frecency.log")
+
+
+def get_frecency_database() -> FrecencyDatabase:
+    """Get the frecency database, loading it the first time it is needed.
+
+    Returns:
+        FrecencyDatabase: the database
+    """
+    global _database
+    log_path = frecency_log_path()
+    with _database_lock:
+        if _database is None or _database.log_path != log_path:
+            _database = FrecencyDatabase(log_path)
+            _database.load()
+        return _database
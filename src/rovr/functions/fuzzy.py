@@ -0,0 +1,112 @@
+from typing import Sequence
+
+from textual.widgets.option_list import Option
+
+
+def char_mask(text: str) -> int:
+    """A bitmask of the characters in a (lowercased) string.
+
+    Characters are folded into 128 bits, so the mask can only rule a
+    candidate out. A candidate that passes still needs a real match.
+
+    Returns:
+        int: the mask
+    """
+    mask = 0
+    for character in set(text):
+        mask |= 1 << (ord(character) & 127)
+    return mask
+
+
+def is_subsequence(query: str, candidate: str) -> bool:
+    """Whether every character of query appears in candidate, in order.
+
+    Returns:
+        bool: whether the fuzzy matcher can give the candidate a score at all
+    """
+    characters = iter(candidate)
+    return all(character in characters for character in query)
+
+
+class FilterIndex:
+    """Precomputed labels, lowercase labels and character masks for a list of
+    options.
+
+    The index remembers which options matched the previous query. When the
+    new query still contains the previous one as a subsequence (which is
+    what typing another character does), only those options are rescanned.
+
+    Options that are built on demand (like FileList's rows) can have a
+    `labels()` method, so their labels are read without building them.
+    """
+
+    def __init__(self, options: Sequence[Option], always_add_disabled: bool) -> None:
+        self.source = options
+        self.size = len(options)
+        self.labels: list[str] = []
+        self.separators: list[bool] = []
+        get_labels = getattr(options, "labels", None)
+        if callable(get_labels):
+            # rows built on demand are never disabled
+            self.labels = list(get_labels())
+            self.separators = [False] * self.size
+        else:
+            for option in options:
+                self.labels.append(str(getattr(option, "label", "")))
+                self.separators.append(
+                    always_add_disabled
+                    and option.disabled
+                    or bool(getattr(option, "pseudo_disabled", False))
+                )
+        self.lowered: list[str] = [label.lower() for label in self.labels]
+        self.masks: list[int] = [char_mask(label) for label in self.lowered]
+        self._last_query: str = ""
+        self._last_matches: list[int] | None = None
+
+    def is_for(self, options: Sequence[Option]) -> bool:
+        """
+        Returns:
+            bool: whether this index was built for this exact list of options
+        """
+        return options is self.source and len(options) == self.size
+
+    def candidates(self, query: str) -> list[int]:
+        """Indexes of the options that can match the query, in list order.
+
+        Separators are always included, as they are always shown.
+
+        Returns:
+            list[int]: the candidate indexes
+        """
+        query = query.lower()
+        if self._last_matches is not None and is_subsequence(self._last_query, query):
+            pool = self._last_matches
+        else:
+            pool = range(self.size)
+        query_mask = char_mask(query)
+        lowered = self.lowered
+        masks = self.masks
+        separators = self.separators
+        return [
+            index
+            for index in pool
+            if separators[index]
+            or (
+                masks[index] & query_mask == query_mask
+                and is_subsequence(query, lowered[index])
+            )
+        ]
+
+    def remember(self, query: str, matches: list[int]) -> None:
+        """Store the result of a completed query, to narrow the next one.
+
+        Args:
+            query: The query that was completed
+            matches: The indexes that matched, including separators
+        """
+        self._last_query = query.lower()
+        self._last_matches = matches
+
+    def forget(self) -> None:
+        self._last_query = ""
+        self._last_matches = None
@@ -1,43 +1,131 @@
 import fnmatch
-from functools import lru_cache
+import re
+from functools import cache
 from os import path
+from typing import Any, Mapping, Sequence
 
 from rovr.variables.constants import config
 from rovr.variables.maps import (
     ASCII_ICONS,
     ASCII_TOGGLE_BUTTON_ICONS,
-    FILE_MAP,
-    FILES_MAP,
-    FOLDER_MAP,
     ICONS,
     TOGGLE_BUTTON_ICONS,
 )
 
+GLOB_CHARACTERS: frozenset[str] = frozenset("*?[")
 
-@lru_cache(maxsize=4096)
-def _icon_for_file_name(file_name: str) -> tuple[str, str]:
-    # 1. Check for custom icons if configured
-    if "icons" in config and "files" in config["icons"]:
-        for custom_icon in config["icons"]["files"]:
-            pattern = custom_icon["pattern"].lower()
-            if fnmatch.fnmatch(file_name, pattern):
-                return (custom_icon["icon"], custom_icon["color"])
 
-    # 2. Check for full filename match
-    if file_name in FILES_MAP:
-        icon_key = FILES_MAP[file_name]
-        return ICONS["file"].get(icon_key, ICONS["file"]["default"])
+class IconTable:
+    """Resolves a lowercase file or folder name to its icon.
 
-    # 3. Check for extension match
-    if "." in file_name:
-        # This is for hidden files like `.gitignore`
-        extension = "." + file_name.split(".")[-1]
-        if extension in FILE_MAP:
-            icon_key = FILE_MAP[extension]
-            return ICONS["file"].get(icon_key, ICONS["file"]["default"])
+    Custom patterns that are a plain name or a plain `*.ext` go into dicts,
+    and the rest are compiled into a single regex, so a lookup is a couple
+    of dict lookups and at most one regex match, without a cache. Earlier
+    custom patterns still win over later ones, and any custom pattern wins
+    over the built-in name and extension maps.
+    """
 
-    # 4. Default icon
-    return ICONS["file"]["default"]
+    def __init__(
+        self,
+        custom_icons: Sequence[Mapping[str, Any]],
+        names: dict[str, tuple[str, str]],
+        extensions: dict[str, tuple[str, str]],
+        default: tuple[str, str],
+    ) -> None:
+        """
+        Args:
+            custom_icons: The `pattern`/`icon`/`color` entries from the config
+            names: The built-in icons for full names
+            extensions: The built-in icons for extensions, with the dot
+            default: The icon for anything else
+        """
+        self.names = names
+        self.extensions = extensions
+        self.default = default
+        # (priority, icon), the priority being the position in the config
+        self.custom_names: dict[str, tuple[int, tuple[str, str]]] = {}
+        self.custom_extensions: dict[str, tuple[int, tuple[str, str]]] = {}
+        self.glob_icons: list[tuple[int, tuple[str, str]]] = []
+        globs: list[str] = []
+        for priority, custom_icon in enumerate(custom_icons):
+            pattern = custom_icon["pattern"].lower()
+            icon = (custom_icon["icon"], custom_icon["color"])
+            suffix = pattern[2:]
+            if GLOB_CHARACTERS.isdisjoint(pattern):
+                self.custom_names.setdefault(pattern, (priority, icon))
+            elif (
+                pattern.startswith("*.")
+                and GLOB_CHARACTERS.isdisjoint(suffix)
+                and "." not in suffix
+            ):
+                self.custom_extensions.setdefault(pattern[1:], (priority, icon))
+            else:
+                # fnmatch's translation is anchored at the end, so the first
+                # alternative that matches is the first pattern that matches
+                globs.append(f"(?P<g{len(globs)}>{fnmatch.translate(pattern)})")
+                self.glob_icons.append((priority, icon))
+        self.globs: re.Pattern[str] | None = (
+            re.compile("|".join(globs)) if globs else None
+        )
+        self.has_custom = bool(custom_icons)
+
+    def lookup(self, name: str) -> tuple[str, str]:
+        """
+        Returns:
+            tuple[str, str]: the icon and color for the (lowercase) name
+        """
+        extension = name[name.rindex(".") :] if "." in name else None
+        if self.has_custom and (custom := self._custom(name, extension)) is not None:
+            return custom
+        icon = self.names.get(name)
+        if icon is None and extension is not None:
+            icon = self.extensions.get(extension)
+        return self.default if icon is None else icon
+
+    def _custom(self, name: str, extension: str | None) -> tuple[str, str] | None:
+        """
+        Returns:
+            tuple[str, str] | None: the icon of the earliest custom pattern that matches
+        """
+        matches = [self.custom_names.get(name)]
+        if extension is not None:
+            matches.append(self.custom_extensions.get(extension))
+        if self.globs is not None and (match := self.globs.match(name)) is not None:
+            assert match.lastgroup is not None
+            matches.append(self.glob_icons[int(match.lastgroup[1:])])
+        best = min((found for found in matches if found is not None), default=None)
+        return None if best is None else best[1]
+
+
+@cache
+def _file_icons() -> IconTable:
+    from rovr.variables.icon_maps import FILE_MAP, FILES_MAP
+
+    file_icons = ICONS["file"]
+    default = file_icons["default"]
+    return IconTable(
+        config.get("icons", {}).get("files", []),
+        {name: file_icons.get(key, default) for name, key in FILES_MAP.items()},
+        {
+            extension: file_icons.get(key, default)
+            for extension, key in FILE_MAP.items()
+        },
+        default,
+    )
+
+
+@cache
+def _folder_icons() -> IconTable:
+    from rovr.variables.icon_maps import FOLDER_MAP
+
+    folder_icons = ICONS["folder"]
+    default = folder_icons["default"]
+    return IconTable(
+        config.get("icons", {}).get("folders", []),
+        {name: folder_icons.get(key, default) for name, key in FOLDER_MAP.items()},
+        {},
+        default,
+    )
 
 
 def get_icon_for_file(location: str, is_symlink: bool | None = None) -> tuple[str, str]:
@@ -63,25 +151,7 @@ def get_icon_for_file(location: str, is_symlink: bool | None = None) -> tuple[st
         else:
             return ICONS["general"]["broken_symlink"]
 
-    return _icon_for_file_name(path.basename(location).lower())
-
-
-@lru_cache(maxsize=1024)
-def _icon_for_folder_name(folder_name: str) -> tuple[str, str]:
-    # 1. Check for custom icons if configured
-    if "icons" in config and "folders" in config["icons"]:
-        for custom_icon in config["icons"]["folders"]:
-            pattern = custom_icon["pattern"].lower()
-            if fnmatch.fnmatch(folder_name, pattern):
-                return (custom_icon["icon"], custom_icon["color"])
-
-    # 2. Check for special folder types
-    if folder_name in FOLDER_MAP:
-        icon_key = FOLDER_MAP[folder_name]
-        return ICONS["folder"].get(icon_key, ICONS["folder"]["default"])
-
-    # 3. Default icon
-    return ICONS["folder"]["default"]
+    return _file_icons().lookup(path.basename(location).lower())
 
 
 def get_icon_for_folder(
@@ -112,7 +182,7 @@ def get_icon_for_folder(
         else:
             return ICONS["general"]["broken_symlink"]
 
-    return _icon_for_folder_name(path.basename(location).lower())
+    return _folder_icons().lookup(path.basename(location).lower())
 
 
 def get_icon_smart(location: str) -> tuple[str, str]:
@@ -0,0 +1,44 @@
+import sys
+from importlib import import_module
+from importlib.util import resolve_name
+from time import perf_counter
+from typing import Any, Callable, Mapping
+
+# every module imported through lazy_exports, and how long it took
+loaded: dict[str, float] = {}
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a module level `__getattr__` and `__dir__`, so names re-exported
+    by a package are only imported from their submodule once they are used.
+
+    Args:
+        package (str): the `__name__` of the module doing the re-exporting
+        exports (Mapping[str, str]): each name, and the module it comes from
+            (relative to `package` if it starts with a dot)
+
+    Returns:
+        tuple: the `__getattr__` and `__dir__` for the module
+    """
+    module = sys.modules[package]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source = resolve_name(exports[name], package)
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        start = perf_counter()
+        value = getattr(import_module(source), name)
+        loaded.setdefault(source, perf_counter() - start)
+        # cache it on the module, so this is only called once per name
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(module), *exports})
+
+    return __getattr__, __dir__
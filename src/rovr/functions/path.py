@@ -7,6 +7,8 @@ import re
 import shlex
 import stat
 import sys
+import threading
+from collections import OrderedDict
 from contextlib import suppress
 from functools import lru_cache, partial
 from os import path
@@ -209,6 +211,69 @@ def get_filtered_dir_names(cwd: str | bytes, show_hidden: bool = False) -> set[s
     return names
 
 
+SUBDIRECTORY_CACHE_SIZE: int = 128
+_subdirectories: OrderedDict[str, tuple[int, list[os.DirEntry]]] = OrderedDict()
+_subdirectories_lock = threading.Lock()
+
+
+def cache_subdirectories(
+    folder: str, mtime_ns: int, entries: list[os.DirEntry]
+) -> None:
+    """Remember the subfolders of a folder, as of its modification time.
+
+    Args:
+        folder: The folder that was listed
+        mtime_ns: The folder's `st_mtime_ns`, taken before it was listed
+        entries: Every subfolder in it, hidden or not
+    """
+    key = normalise(folder)
+    with _subdirectories_lock:
+        _subdirectories[key] = (mtime_ns, entries)
+        _subdirectories.move_to_end(key)
+        while len(_subdirectories) > SUBDIRECTORY_CACHE_SIZE:
+            _subdirectories.popitem(last=False)
+
+
+def get_cached_subdirectories(folder: str) -> list[os.DirEntry] | None:
+    """The last known subfolders of a folder, without touching the filesystem.
+
+    Returns:
+        list[os.DirEntry]: the subfolders, which might be out of date
+        None: if the folder has not been listed yet
+    """
+    with _subdirectories_lock:
+        cached = _subdirectories.get(normalise(folder))
+    return None if cached is None else cached[1]
+
+
+def list_subdirectories(folder: str) -> tuple[list[os.DirEntry], bool]:
+    """Get the subfolders of a folder, only listing it again if it changed.
+
+    Returns:
+        tuple[list[os.DirEntry], bool]: the subfolders, and whether they
+        differ from what was cached before
+    """
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+    except OSError:
+        return [], get_cached_subdirectories(folder) is not None
+    with _subdirectories_lock:
+        cached = _subdirectories.get(normalise(folder))
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], False
+    entries: list[os.DirEntry] = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                with suppress(OSError):
+                    if entry.is_dir():
+                        entries.append(entry)
+    except OSError:
+        return [], cached is not None
+    cache_subdirectories(folder, mtime_ns, entries)
+    return entries, True
+
+
 class CWDObjectReturnDict(TypedDict):
     name: str
     icon: Callable[[], tuple[str, str]]
@@ -294,10 +359,14 @@ def sync_get_cwd_object(
     """
 
     try:
+        # taken first, so a change made while listing makes the cache stale
+        mtime_ns = os.stat(cwd).st_mtime_ns
         scanned_entries = os.scandir(cwd)
     except (PermissionError, FileNotFoundError, OSError):
         raise PermissionError(f"PermissionError: Unable to access {cwd}")
 
+    # hidden folders too, the path autocompletion shows them on request
+    subdirectories: list[os.DirEntry] = []
     with scanned_entries as entries:
         if (
             return_nothing_if_this_returns_true is not None
@@ -313,10 +382,13 @@ def sync_get_cwd_object(
         for item in entries:
             if not isinstance(item, os.DirEntry):
                 raise TypeError(f"Expected a DirEntry object but got {type(item)}")
+            is_dir = item.is_dir()
+            if is_dir:
+                subdirectories.append(item)
             if not show_hidden and is_hidden_file(item):
                 continue
 
-            if item.is_dir():
+            if is_dir:
                 folders.append({
                     "name": item.name,
                     "icon": lambda item=item: get_icon_for_folder(
@@ -340,6 +412,7 @@ def sync_get_cwd_object(
                 return None, None
 
     dom_node.log(f"Collected {len(folders)} folders and {len(files)} files in {cwd}")
+    cache_subdirectories(cwd, mtime_ns, subdirectories)
 
     # sort order
     match sort_by:
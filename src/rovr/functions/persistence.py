@@ -0,0 +1,174 @@
+import atexit
+import os
+import threading
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import cache
+from os import path
+from time import monotonic
+from typing import Callable
+
+ErrorHandler = Callable[[OSError], None]
+
+
+@dataclass
+class _Pending:
+    content: str | None = None
+    """Everything the file should contain, or None to only append."""
+    appended: list[str] = field(default_factory=list)
+    on_error: ErrorHandler | None = None
+
+
+class CoalescingWriter:
+    """Writes rovr's own files (state, pins, folder preferences) from a
+    background thread.
+
+    Writes to the same file within `delay` seconds of each other are
+    batched into one, but a file is never left pending for more than
+    `max_delay` seconds. Whole files are replaced atomically (written to a
+    temporary file, then renamed over), while appends are written in one go.
+
+    After each write the file's mtime and size are remembered, so a watcher
+    can tell its own writes apart from someone else's with `is_own_write`.
+    """
+
+    def __init__(self, delay: float = 0.5, max_delay: float = 2.0) -> None:
+        self.delay = delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        # held while writing, so a flush from the caller and from the
+        # background thread never write the same file out of order
+        self._io_lock = threading.Lock()
+        self._pending: dict[str, _Pending] = {}
+        self._first_pending: float = 0.0
+        self._due: float = 0.0
+        self._written: dict[str, tuple[int, int]] = {}
+        self._thread: threading.Thread | None = None
+
+    def replace(
+        self, file_path: str, content: str, on_error: ErrorHandler | None = None
+    ) -> None:
+        """Replace everything in a file, dropping any earlier pending write.
+
+        Args:
+            file_path (str): the file to write
+            content (str): what it should contain
+            on_error (ErrorHandler | None): called from the writer thread if
+                the write fails
+        """
+        with self._lock:
+            pending = self._queue(file_path, on_error)
+            pending.content = content
+            pending.appended.clear()
+
+    def append(
+        self, file_path: str, content: str, on_error: ErrorHandler | None = None
+    ) -> None:
+        """Add to the end of a file, after anything else pending for it.
+
+        Args:
+            file_path (str): the file to append to
+            content (str): what to add
+            on_error (ErrorHandler | None): called from the writer thread if
+                the write fails
+        """
+        with self._lock:
+            self._queue(file_path, on_error).appended.append(content)
+
+    def _queue(self, file_path: str, on_error: ErrorHandler | None) -> _Pending:
+        now = monotonic()
+        if not self._pending:
+            self._first_pending = now
+        pending = self._pending.setdefault(file_path, _Pending())
+        if on_error is not None:
+            pending.on_error = on_error
+        self._due = min(now + self.delay, self._first_pending + self.max_delay)
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="rovr-writer", daemon=True
+            )
+            self._thread.start()
+        self._wake.notify()
+        return pending
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._wake.wait()
+                while self._pending and (remaining := self._due - monotonic()) > 0:
+                    self._wake.wait(remaining)
+            self.flush()
+
+    def has_pending(self, file_path: str) -> bool:
+        with self._lock:
+            return file_path in self._pending
+
+    def flush(self, file_path: str | None = None) -> None:
+        """Write whatever is pending now, from the calling thread.
+
+        Args:
+            file_path (str | None): only write this file, instead of all of them
+        """
+        with self._io_lock:
+            with self._lock:
+                if file_path is None:
+                    batch, self._pending = self._pending, {}
+                elif file_path in self._pending:
+                    batch = {file_path: self._pending.pop(file_path)}
+                else:
+                    return
+            for pending_path, pending in batch.items():
+                self._write(pending_path, pending)
+
+    def _write(self, file_path: str, pending: _Pending) -> None:
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(path.dirname(file_path) or ".", exist_ok=True)
+            # surrogateescape, for paths that are not valid utf-8
+            if pending.content is not None:
+                with open(
+                    temp_path, "w", encoding="utf-8", errors="surrogateescape"
+                ) as f:
+                    f.write(pending.content)
+                    f.writelines(pending.appended)
+                os.replace(temp_path, file_path)
+            elif pending.appended:
+                with open(
+                    file_path, "a", encoding="utf-8", errors="surrogateescape"
+                ) as f:
+                    f.write("".join(pending.appended))
+            else:
+                return
+            stat = os.stat(file_path)
+        except OSError as exc:
+            with suppress(OSError):
+                os.remove(temp_path)
+            if pending.on_error is not None:
+                pending.on_error(exc)
+            return
+        with self._lock:
+            self._written[file_path] = (stat.st_mtime_ns, stat.st_size)
+
+    def is_own_write(self, file_path: str) -> bool:
+        """
+        Returns:
+            bool: whether the file is still as rovr last wrote it, so there is
+            no need to reload it
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        with self._lock:
+            return self._written.get(file_path) == (stat.st_mtime_ns, stat.st_size)
+
+
+@cache
+def get_writer() -> CoalescingWriter:
+    writer = CoalescingWriter()
+    # the writer thread is a daemon, so anything still pending at exit
+    # would otherwise be lost
+    atexit.register(writer.flush)
+    return writer
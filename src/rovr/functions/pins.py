@@ -1,12 +1,13 @@
 import contextlib
 import json
 from copy import deepcopy
-from os import makedirs, path
+from os import path
 from typing import NotRequired, TypedDict, cast
 
 from rovr.variables.maps import RovrVars
 
 from .path import dump_exc, normalise
+from .persistence import get_writer
 
 pins = {}
 raw_pins = {}
@@ -55,15 +56,18 @@ def _migrate_add_trash_pin(pins_dict: dict) -> None:
                 "path": TRASH,
             },
         )
-        try:
-            with open(PIN_PATH, "w") as f:
-                json.dump(pins_dict, f, indent=2)
-        except IOError as exc:
-            dump_exc(None, exc)
+        _write_pins(pins_dict)
     with contextlib.suppress(OSError):
         open(path.join(cache, "trash_pin_added"), "w").close()
 
 
+def _write_pins(pins_dict: PinsDict | dict) -> None:
+    def on_error(exc: OSError) -> None:
+        dump_exc(None, exc)
+
+    get_writer().replace(PIN_PATH, json.dumps(pins_dict, indent=2), on_error=on_error)
+
+
 def load_pins() -> PinsDict:
     """
     Load the pinned files from a JSON file in the user's config directory.
@@ -78,6 +82,8 @@ def load_pins() -> PinsDict:
     global pins, raw_pins
     _pins: PinsDict
     loaded_from_file = False
+    # read back what was written, rather than what was there before it
+    get_writer().flush(PIN_PATH)
 
     if not path.exists(PIN_PATH):
         _pins = {
@@ -141,7 +147,19 @@ def load_pins() -> PinsDict:
     # entries back exactly as they were, instead of re-deriving them from
     # the expanded form.
     raw_pins = deepcopy(_pins)
+    pins = _expand_pins(_pins)
+    return pins
+
 
+def _expand_pins(_pins: PinsDict) -> PinsDict:
+    """Expand the variables in every pin's path, in place.
+
+    Args:
+        _pins (PinsDict): pins, as written in pins.json
+
+    Returns:
+        PinsDict: the same pins, with usable paths
+    """
     for section_key in ("default", "pins"):
         for item in _pins[section_key]:
             if type(item) is dict and item.get("path") == TRASH:
@@ -159,10 +177,21 @@ def load_pins() -> PinsDict:
                     )
                 # Normalize to forward slashes
                 item["path"] = normalise(str(item["path"]))
-    pins = _pins
     return _pins
 
 
+def _save_pins(pins_to_write: PinsDict) -> None:
+    """Use `pins_to_write` from now on, and write it out in the background.
+
+    Args:
+        pins_to_write (PinsDict): pins, as they should be written in pins.json
+    """
+    global pins, raw_pins
+    raw_pins = pins_to_write
+    pins = _expand_pins(deepcopy(pins_to_write))
+    _write_pins(pins_to_write)
+
+
 def add_pin(pin_name: str, pin_path: str | bytes) -> None:
     """
     Add a pin to the pins file.
@@ -183,7 +212,7 @@ def add_pin(pin_name: str, pin_path: str | bytes) -> None:
 
     global raw_pins
 
-    pins_to_write = deepcopy(raw_pins)
+    pins_to_write = cast(PinsDict, deepcopy(raw_pins))
 
     pin_path_normalized = normalise(pin_path)
     pins_to_write.setdefault("pins", []).append({
@@ -191,16 +220,7 @@ def add_pin(pin_name: str, pin_path: str | bytes) -> None:
         "path": pin_path_normalized,
     })
 
-    if not path.exists(PIN_PATH):
-        makedirs(path.dirname(PIN_PATH), exist_ok=True)
-
-    try:
-        with open(PIN_PATH, "w") as f:
-            json.dump(pins_to_write, f, indent=2)
-    except IOError as exc:
-        dump_exc(None, exc)
-
-    load_pins()
+    _save_pins(pins_to_write)
 
 
 def remove_pin(pin_path: str | bytes) -> None:
@@ -212,7 +232,7 @@ def remove_pin(pin_path: str | bytes) -> None:
     """
     global raw_pins
 
-    pins_to_write = deepcopy(raw_pins)
+    pins_to_write = cast(PinsDict, deepcopy(raw_pins))
 
     pin_path_normalized = normalise(pin_path)
     # `pins` (expanded) and `raw_pins` (as-written) share the same order,
@@ -227,13 +247,7 @@ def remove_pin(pin_path: str | bytes) -> None:
             )
         ]
 
-    try:
-        with open(PIN_PATH, "w") as f:
-            json.dump(pins_to_write, f, indent=2)
-    except IOError as exc:
-        dump_exc(None, exc)
-
-    load_pins()  # Reload
+    _save_pins(pins_to_write)
 
 
 def toggle_pin(pin_name: str, pin_path: str) -> None:
@@ -2,14 +2,18 @@ import multiprocessing
 import multiprocessing.connection
 import stat
 import subprocess
+import threading
+from collections import OrderedDict
 from concurrent.futures import FIRST_COMPLETED, Future, wait
 from functools import lru_cache
-from os import path
+from os import environ, path
 from os import stat as os_stat
+from time import monotonic, sleep
 from typing import Literal, NamedTuple, TypeAlias
 
 from PIL import Image
 from PIL.Image import Image as PILImage
+from rich.text import Text
 
 from rovr.functions.multiprocessing_utils import (
     safe_path_process_pool,
@@ -27,6 +31,9 @@ from rovr.variables.constants import RESAMPLING_METHOD, config, file_one
 
 MAX_IMAGE_SIZE: tuple[int, int] = tuple(config["interface"]["image_viewer"]["max_size"])  # ty: ignore
 MAX_FONT_SIZE: tuple[int, int] = tuple(config["interface"]["font_preview"]["max_size"])  # ty: ignore
+# how long to wait for the highlight to settle before spawning bat
+BAT_DEBOUNCE: float = 0.1
+BAT_CACHE_SIZE: int = 128
 
 
 if hasattr(multiprocessing.connection, "PipeConnection"):
@@ -416,3 +423,79 @@ def get_mime_type(
     except FileNotFoundError:
         pass
     return None
+
+
+class BatCacheKey(NamedTuple):
+    file_path: str
+    mtime: int | float | None
+    height: int
+    style: str
+    theme: str
+
+
+_bat_cache: OrderedDict[BatCacheKey, Text] = OrderedDict()
+_bat_cache_lock = threading.Lock()
+
+
+def bat_cache_key(
+    file_path: str, mtime: int | float | None, height: int, style: str
+) -> BatCacheKey:
+    """Build the key used to look up rendered bat output.
+
+    Args:
+        file_path: Path of the file being previewed
+        mtime: The last modified time of the file
+        height: The number of lines requested from bat
+        style: The value passed to bat's --style
+
+    Returns:
+        BatCacheKey: the cache key, including the bat theme from the environment
+    """
+    return BatCacheKey(file_path, mtime, height, style, environ.get("BAT_THEME", ""))
+
+
+def get_cached_bat_output(key: BatCacheKey) -> Text | None:
+    """
+    Args:
+        key: The key from `bat_cache_key`
+
+    Returns:
+        Text: a copy of the cached output, so callers can mutate it freely
+        None: if bat has not rendered this key yet
+    """
+    with _bat_cache_lock:
+        text = _bat_cache.get(key)
+        if text is None:
+            return None
+        _bat_cache.move_to_end(key)
+    return text.copy()
+
+
+def cache_bat_output(key: BatCacheKey, text: Text) -> None:
+    with _bat_cache_lock:
+        _bat_cache[key] = text.copy()
+        _bat_cache.move_to_end(key)
+        while len(_bat_cache) > BAT_CACHE_SIZE:
+            _bat_cache.popitem(last=False)
+
+
+def clear_bat_cache() -> None:
+    with _bat_cache_lock:
+        _bat_cache.clear()
+
+
+def wait_for_debounce(delay: float = BAT_DEBOUNCE) -> bool:
+    """Wait for the highlight to settle, so only the final target gets rendered.
+
+    Args:
+        delay: How long to wait, in seconds
+
+    Returns:
+        bool: True if the worker is still running afterwards, False if it was cancelled
+    """
+    deadline = monotonic() + delay
+    while (remaining := deadline - monotonic()) > 0:
+        if should_cancel():
+            return False
+        sleep(min(remaining, 0.02))
+    return not should_cancel()
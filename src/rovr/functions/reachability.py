@@ -0,0 +1,109 @@
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cache
+from os import R_OK, access, path
+from typing import Callable, Literal
+
+PathStatus = Literal["folder", "unreadable", "file", "missing", "stale"]
+"""What a pinned path or drive turned out to be. `stale` means it did not
+answer in time, like a network mount whose server went away."""
+
+# how long check_paths waits for every path to answer
+PATH_TIMEOUT: float = 1.0
+
+# the last answer from each path, so it can be shown before asking again
+statuses: dict[str, PathStatus] = {}
+# probes that have not answered yet. a stuck probe is never started twice,
+# so a dead mount holds up at most one thread of the pool
+_in_flight: dict[str, Future[PathStatus]] = {}
+_lock = threading.Lock()
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="rovr-reachability")
+
+
+def probe(path_str: str) -> PathStatus:
+    if path.isdir(path_str):
+        return "folder" if access(path_str, R_OK) else "unreadable"
+    return "file" if path.exists(path_str) else "missing"
+
+
+def known(paths: Iterable[str]) -> dict[str, PathStatus] | None:
+    """
+    Args:
+        paths (Iterable[str]): the paths to look up
+
+    Returns:
+        dict[str, PathStatus] | None: the last status of each path, or None if
+        any of them was never checked
+    """
+    with _lock:
+        try:
+            return {path_str: statuses[path_str] for path_str in paths}
+        except KeyError:
+            return None
+
+
+def check_paths(
+    paths: Iterable[str],
+    timeout: float = PATH_TIMEOUT,
+    on_late_answer: Callable[[], None] | None = None,
+) -> dict[str, PathStatus]:
+    """Check every path at the same time, instead of one after another.
+
+    Args:
+        paths (Iterable[str]): the paths to check
+        timeout (float): seconds to wait for them, after which the rest are
+            reported as stale
+        on_late_answer (Callable[[], None] | None): called (from a pool thread)
+            when a stale path answers after all
+
+    Returns:
+        dict[str, PathStatus]: the status of each path
+    """
+    futures: dict[str, Future[PathStatus]] = {}
+    started: dict[str, Future[PathStatus]] = {}
+    with _lock:
+        for path_str in dict.fromkeys(paths):
+            future = _in_flight.get(path_str)
+            if future is None:
+                future = started[path_str] = _in_flight[path_str] = _executor().submit(
+                    probe, path_str
+                )
+            futures[path_str] = future
+    # outside the lock, as a probe that already finished runs it right here
+    for path_str, future in started.items():
+        future.add_done_callback(
+            lambda done, path_str=path_str: _answered(path_str, done, on_late_answer)
+        )
+    wait(futures.values(), timeout=timeout)
+    result: dict[str, PathStatus] = {}
+    with _lock:
+        for path_str, future in futures.items():
+            if future.done():
+                result[path_str] = statuses[path_str] = _status_of(future)
+            else:
+                result[path_str] = statuses[path_str] = "stale"
+    return result
+
+
+def _status_of(future: Future[PathStatus]) -> PathStatus:
+    return "missing" if future.exception() is not None else future.result()
+
+
+def _answered(
+    path_str: str,
+    future: Future[PathStatus],
+    on_late_answer: Callable[[], None] | None,
+) -> None:
+    status = _status_of(future)
+    with _lock:
+        if _in_flight.get(path_str) is future:
+            del _in_flight[path_str]
+        was_stale = statuses.get(path_str) == "stale"
+        statuses[path_str] = status
+    if was_stale and on_late_answer is not None:
+        on_late_answer()
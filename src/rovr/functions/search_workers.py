@@ -0,0 +1,111 @@
+# like preview_workers.py, these are kept away from anything that imports
+# the config, because every process in the pool imports this module
+
+import mmap
+import os
+import re
+from os import path
+
+# how much of a file is checked for NUL bytes, the same heuristic rg uses
+BINARY_SNIFF_SIZE: int = 8192
+# files smaller than this are read outright, mapping them costs more
+MMAP_THRESHOLD: int = 1 << 16
+
+
+def compile_pattern(
+    pattern: str, is_regex: bool, case_sensitive: bool
+) -> re.Pattern[bytes] | None:
+    """
+    Returns:
+        re.Pattern: the compiled pattern, or an escaped one if it is not a valid regex
+        None: if the pattern is a case sensitive plain string, which `bytes.find` handles
+    """
+    if not is_regex and case_sensitive:
+        return None
+    flags = re.MULTILINE if case_sensitive else re.MULTILINE | re.IGNORECASE
+    encoded = pattern.encode("utf-8", "surrogateescape")
+    if is_regex:
+        try:
+            return re.compile(encoded, flags)
+        except re.error:
+            pass
+    return re.compile(re.escape(encoded), flags)
+
+
+def count_matching_lines(
+    data: bytes | mmap.mmap, needle: bytes, compiled: re.Pattern[bytes] | None
+) -> int:
+    """Count the lines with at least one match, like `rg --count`.
+
+    Returns:
+        int: the number of matching lines
+    """
+    count = 0
+    size = len(data)
+    position = 0
+    while position < size:
+        if compiled is None:
+            start = data.find(needle, position)
+            if start == -1:
+                break
+        else:
+            match = compiled.search(data, position)
+            if match is None:
+                break
+            start = match.start()
+        count += 1
+        # carry on from the next line, so each line is counted once
+        line_end = data.find(b"\n", start)
+        if line_end == -1:
+            break
+        position = line_end + 1
+    return count
+
+
+def count_in_file(
+    file_path: str, needle: bytes, compiled: re.Pattern[bytes] | None
+) -> int:
+    """
+    Returns:
+        int: the number of matching lines, 0 for binary or unreadable files
+    """
+    try:
+        with open(file_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return 0
+            if size < MMAP_THRESHOLD:
+                data = file.read()
+                if b"\0" in data[:BINARY_SNIFF_SIZE]:
+                    return 0
+                return count_matching_lines(data, needle, compiled)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped.find(b"\0", 0, BINARY_SNIFF_SIZE) != -1:
+                    return 0
+                return count_matching_lines(mapped, needle, compiled)
+    except (OSError, ValueError):
+        return 0
+
+
+def content_search_worker(
+    args: tuple[str, list[str], str, bool, bool],
+) -> list[tuple[str, int]]:
+    """Search a batch of files for a pattern.
+
+    Args:
+        args: The root folder, paths relative to it, the pattern, whether it
+            is a regex and whether the search is case sensitive
+
+    Returns:
+        list[tuple[str, int]]: the relative paths with matches, and how many
+        lines matched in each
+    """
+    root, relative_paths, pattern, is_regex, case_sensitive = args
+    compiled = compile_pattern(pattern, is_regex, case_sensitive)
+    needle = pattern.encode("utf-8", "surrogateescape")
+    results: list[tuple[str, int]] = []
+    for relative in relative_paths:
+        count = count_in_file(path.join(root, relative), needle, compiled)
+        if count:
+            results.append((relative, count))
+    return results
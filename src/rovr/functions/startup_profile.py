@@ -0,0 +1,188 @@
+import sys
+import threading
+from collections import defaultdict
+from collections.abc import Sequence
+from contextlib import suppress
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable
+
+from rovr import pprint
+from rovr.functions import lazy
+
+# seconds from `rovr` reading its arguments, to the first frame.
+# `rovr --profile-startup` exits with 1 when this is exceeded.
+FIRST_PAINT_BUDGET: float = 1.0
+
+
+class _ImportTimer(MetaPathFinder):
+    """Finds modules through the rest of `sys.meta_path`, and times how long
+    each one takes to run, both with and without the imports it makes."""
+
+    def __init__(self, profile: "StartupProfile") -> None:
+        self.profile = profile
+        self._local = threading.local()
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # builtin and frozen importers are classes shared by every module
+        # they load, and cost next to nothing anyway
+        if loader is not None and not isinstance(loader, type):
+            exec_module = getattr(loader, "exec_module", None)
+            if exec_module is not None and not hasattr(exec_module, "__timed__"):
+                with suppress(AttributeError):
+                    loader.exec_module = self._timed(exec_module)  # ty: ignore[invalid-assignment]
+        return spec
+
+    def _timed(self, exec_module: Callable[[ModuleType], None]) -> Any:
+        def timed_exec_module(module: ModuleType) -> None:
+            stack: list[float] = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0)
+            start = perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                total = perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += total
+                self.profile.imports[module.__name__] = (total, total - children)
+
+        timed_exec_module.__timed__ = True  # ty: ignore[unresolved-attribute]
+        return timed_exec_module
+
+
+class StartupProfile:
+    """Timings for `rovr --profile-startup`: every module imported, every
+    widget composed and mounted, and how long it took to draw the first
+    frame."""
+
+    def __init__(self) -> None:
+        self.started = perf_counter()
+        # module -> (seconds including its own imports, seconds excluding them)
+        self.imports: dict[str, tuple[float, float]] = {}
+        # widget -> event name -> seconds spent handling it
+        self.widgets: defaultdict[str, defaultdict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self.marks: dict[str, float] = {}
+        self._finder = _ImportTimer(self)
+        self._restore: Callable[[], None] | None = None
+
+    def install(self) -> None:
+        """Start timing imports, and every Compose and Mount event."""
+        sys.meta_path.insert(0, self._finder)
+
+        from textual import events
+        from textual.message import Message
+        from textual.message_pump import MessagePump
+
+        dispatch_message = MessagePump._dispatch_message
+        widgets = self.widgets
+
+        async def timed_dispatch_message(pump: MessagePump, message: Message) -> None:
+            if not isinstance(message, (events.Compose, events.Mount)):
+                return await dispatch_message(pump, message)
+            start = perf_counter()
+            try:
+                await dispatch_message(pump, message)
+            finally:
+                node_id = getattr(pump, "id", None)
+                name = type(pump).__name__ + (f"#{node_id}" if node_id else "")
+                widgets[name][type(message).__name__] += perf_counter() - start
+
+        MessagePump._dispatch_message = timed_dispatch_message  # ty: ignore[invalid-assignment]
+        self._restore = lambda: setattr(
+            MessagePump, "_dispatch_message", dispatch_message
+        )
+
+    def mark(self, name: str) -> None:
+        """Record how long it took to get to `name`, the first time it is
+        reached."""
+        self.marks.setdefault(name, perf_counter() - self.started)
+
+    def uninstall(self) -> None:
+        """Stop timing, so the report can be printed without adding to it."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        if self._restore is not None:
+            self._restore()
+            self._restore = None
+
+    def report(self, limit: int = 20) -> bool:
+        """Print the slowest imports and widgets, and the marks against the
+        budget.
+
+        Args:
+            limit (int): how many imports and widgets to show
+
+        Returns:
+            bool: whether the first frame was drawn within FIRST_PAINT_BUDGET
+        """
+        from rich.table import Table
+
+        imports = Table(title="Slowest imports", padding=(0, 1))
+        imports.add_column("Module")
+        imports.add_column("Self", justify="right")
+        imports.add_column("Total", justify="right")
+        for module, (total, own) in sorted(
+            self.imports.items(), key=lambda item: item[1][1], reverse=True
+        )[:limit]:
+            imports.add_row(module, _ms(own), _ms(total))
+        pprint(imports)
+
+        deferred = Table(title="Deferred imports that were used", padding=(0, 1))
+        deferred.add_column("Module")
+        deferred.add_column("Total", justify="right")
+        for module, seconds in lazy.loaded.items():
+            deferred.add_row(module, _ms(seconds))
+        pprint(deferred)
+
+        widgets = Table(title="Slowest widgets (including children)", padding=(0, 1))
+        widgets.add_column("Widget")
+        widgets.add_column("Compose", justify="right")
+        widgets.add_column("Mount", justify="right")
+        for widget, timings in sorted(
+            self.widgets.items(), key=lambda item: sum(item[1].values()), reverse=True
+        )[:limit]:
+            widgets.add_row(
+                widget, _ms(timings.get("Compose", 0)), _ms(timings.get("Mount", 0))
+            )
+        pprint(widgets)
+
+        marks = Table(title="Startup", padding=(0, 1))
+        marks.add_column("Reached")
+        marks.add_column("After", justify="right")
+        for name, seconds in self.marks.items():
+            marks.add_row(name, _ms(seconds))
+        pprint(marks)
+
+        first_paint = self.marks.get("first paint")
+        if first_paint is None:
+            pprint("[bold red]The first frame was never drawn.[/]")
+            return False
+        within = first_paint <= FIRST_PAINT_BUDGET
+        pprint(
+            f"[bold {'green' if within else 'red'}]First paint took "
+            f"{_ms(first_paint)}, against a budget of {_ms(FIRST_PAINT_BUDGET)}.[/]"
+        )
+        return within
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
@@ -0,0 +1,119 @@
+import os
+import sys
+import threading
+from functools import cache
+from os import path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pytrash import RecycleBin, TrashEntry
+
+# how many items go to the recycle bin in one call, so a failure still
+# leaves most of them done, and progress can be shown in between
+RECYCLE_BATCH_SIZE: int = 64
+
+Signature = tuple[tuple[str, int, int], ...]
+
+# the last listing, and the state of the trash folders when it was taken
+_cached: tuple[Signature, list["TrashEntry"]] | None = None
+_lock = threading.Lock()
+
+
+@cache
+def get_recycle_bin() -> "RecycleBin":
+    from pytrash import RecycleBin
+
+    return RecycleBin()
+
+
+def _mount_points() -> list[str]:
+    points: list[str] = []
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            for row in f:
+                parts = row.split()
+                if len(parts) >= 2:
+                    points.append(parts[1].replace("\\040", " "))
+    except OSError:
+        pass
+    return points
+
+
+def metadata_dirs() -> list[str]:
+    """
+    Returns:
+        list[str]: the folders the recycle bin keeps one file per entry in,
+        whether or not they exist. Anything trashed, restored or purged
+        changes at least one of them.
+    """
+    if sys.platform == "win32":
+        dirs: list[str] = []
+        for drive in os.listdrives():
+            bin_dir = path.join(drive, "$Recycle.Bin")
+            try:
+                # one folder per user, named after their SID
+                dirs.extend(path.join(bin_dir, sid) for sid in os.listdir(bin_dir))
+            except OSError:
+                continue
+        return dirs
+    if sys.platform == "darwin":
+        return [path.expanduser("~/.Trash")]
+    data_home = os.environ.get("XDG_DATA_HOME") or path.expanduser("~/.local/share")
+    dirs = [path.join(data_home, "Trash", "info")]
+    trash_name = f".Trash-{os.getuid()}"
+    dirs.extend(
+        path.join(mount_point, trash_name, "info") for mount_point in _mount_points()
+    )
+    return dirs
+
+
+def signature() -> Signature:
+    """
+    Returns:
+        Signature: the mtime and number of entries of every metadata folder
+        that exists, which changes whenever the recycle bin does
+    """
+    found: list[tuple[str, int, int]] = []
+    for dir_path in dict.fromkeys(metadata_dirs()):
+        try:
+            # the count catches changes within the mtime's granularity
+            found.append((
+                dir_path,
+                os.stat(dir_path).st_mtime_ns,
+                len(os.listdir(dir_path)),
+            ))
+        except OSError:
+            continue
+    return tuple(found)
+
+
+def list_entries(recycle_bin: "RecycleBin") -> list["TrashEntry"]:
+    """List the recycle bin, reusing the last listing if nothing changed since.
+
+    Parsing every entry's metadata is what makes a large recycle bin slow to
+    list, while checking whether it changed only looks at a few folders.
+
+    Args:
+        recycle_bin (RecycleBin): the recycle bin to list
+
+    Returns:
+        list[TrashEntry]: the entries, most recently deleted first
+    """
+    global _cached
+    # taken before listing, so anything that changes while listing is picked
+    # up by the next call instead of being hidden behind this one
+    current = signature()
+    with _lock:
+        if _cached is not None and _cached[0] == current:
+            return list(_cached[1])
+    entries = recycle_bin.entries()
+    with _lock:
+        _cached = (current, entries)
+    return list(entries)
+
+
+def invalidate() -> None:
+    """Forget the last listing, after rovr changed the recycle bin itself."""
+    global _cached
+    with _lock:
+        _cached = None
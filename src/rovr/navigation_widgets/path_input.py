@@ -1,36 +1,33 @@
 import os
 import sys
 from os import path
-from pathlib import Path
-from typing import ClassVar, Generator, cast
+from typing import ClassVar, NamedTuple, cast
 
 from rich.text import Text
-from textual import events
+from textual import events, work
 from textual.binding import Binding, BindingType
 from textual.css.query import NoMatches
 from textual.validation import Function
 from textual.widgets import Input
-from textual_autocomplete import DropdownItem, PathAutoComplete, TargetState
+from textual.worker import get_current_worker
+from textual_autocomplete import (
+    DropdownItem,
+    DropdownItemHit,
+    PathAutoComplete,
+    TargetState,
+)
 
 from rovr.classes.mixins import Action, Actionable
 from rovr.classes.textual_options import PathDropdownItem
+from rovr.functions import path as path_utils
 from rovr.functions.cwd import getcwd
+from rovr.functions.fuzzy import is_subsequence
 from rovr.functions.icons import get_icon
-from rovr.functions.path import is_hidden_file
+from rovr.functions.path import is_hidden_file, normalise
 from rovr.functions.utils import check_key
 from rovr.variables.constants import config
 
 
-def get_subdirectories(parent: str | os.PathLike) -> Generator[os.DirEntry, None, None]:
-    try:
-        with os.scandir(parent) as it:
-            for entry in it:
-                if entry.is_dir():
-                    yield entry
-    except (FileNotFoundError, OSError):
-        return
-
-
 def should_exclude_hidden(path_str: str) -> bool:
     """Decide whether hidden entries must be excluded from autocomplete results.
 
@@ -67,62 +64,82 @@ def should_exclude_hidden(path_str: str) -> bool:
     return not tail.startswith(".")
 
 
-def _unix_get_candidates(path_str: str) -> list[DropdownItem]:
-    # Case 1: nothing
-    if not path_str:
-        return [PathDropdownItem("/", "/")]
+class FolderCandidates(NamedTuple):
+    folder: str
+    """The folder that was listed, normalised"""
+    entries: list[os.DirEntry]
+    """Its subfolders, as cached by `list_subdirectories`"""
+    everything: list[DropdownItem]
+    visible: list[DropdownItem]
+    """The candidates without hidden folders"""
 
-    # Reject relative paths - must be absolute
-    if not path.isabs(path_str):
-        return []
 
-    # User is going up, no need to provide autocomplete.
-    if path_str.endswith(".."):
-        return []
+def completion_folder(path_str: str) -> str | None:
+    """The folder whose subfolders complete a path.
+
+    Args:
+        path_str: The raw value inside the path input widget.
 
-    # We treat differently for "/path/to/folder" and "/path/to/folder/",
-    # but `Path.resolve` will strip the trailing "/",
-    # so sometimes we have to check against the original `path_str`.
-    ppath = Path(path_str).expanduser().resolve()
-
-    # Case 2: exact directory match
-    # User typed path of a particular folder already (but without the trailing "/")
-    if (
-        not path_str.endswith(".")
-        and not path_str.endswith("/")
-        and ppath.exists()
-        and ppath.is_dir()
-    ):
-        return [PathDropdownItem(f"{ppath.name}/", str(ppath))]
-
-    # Case 3: list contents of parent
+    Returns:
+        str: the folder, normalised
+        None: when the path is relative or going up, so nothing is completed
+    """
+    # Reject relative paths - must be absolute
+    # and when the user is going up, there is no need to provide autocomplete.
+    if not path.isabs(path_str) or path_str.endswith(".."):
+        return None
     # - User typed a directory path with trailing "/" -> show subdirectories
     # - User typed a partial directory path (like "/home/user/.local/sh")
     #   -> we determine the parent ("~/.local") then show subdirectories ("share")
-    parent = ppath if ppath.is_dir() else ppath.parent
-    items: list[DropdownItem] = []
-    should_filter = should_exclude_hidden(path_str)
-    for entry in get_subdirectories(parent):
-        if should_filter and is_hidden_file(entry):
-            continue
-        items.append(PathDropdownItem(f"{entry.name}/", entry.path))
-    items.sort(key=lambda x: x.path.lower())
-    return items
+    if path_str.endswith(("/", path.sep)):
+        return normalise(path_str)
+    return normalise(path.dirname(path_str))
+
+
+def build_folder_candidates(
+    folder: str, entries: list[os.DirEntry]
+) -> FolderCandidates:
+    """Build the dropdown items for a folder, resolving every icon once.
+
+    Returns:
+        FolderCandidates: the items, with and without hidden folders
+    """
+    separator = "\\" if sys.platform == "win32" else "/"
+    everything: list[DropdownItem] = []
+    visible: list[DropdownItem] = []
+    for entry in sorted(entries, key=lambda entry: entry.path.lower()):
+        item = PathDropdownItem(
+            f"{entry.name}{separator}",
+            entry.path,
+            is_symlink=entry.is_symlink() or entry.is_junction(),
+        )
+        everything.append(item)
+        if not is_hidden_file(entry):
+            visible.append(item)
+    return FolderCandidates(folder, entries, everything, visible)
+
 
+def _unix_get_root_candidates(path_str: str) -> list[DropdownItem] | None:
+    """
+    Returns:
+        list[DropdownItem]: the candidates, when they do not come from a folder
+        None: when the subfolders of `completion_folder` should be listed
+    """
+    # Case 1: nothing
+    if not path_str:
+        return [PathDropdownItem("/", "/")]
+    return None
 
-def _win_get_candidates(path_str: str) -> list[DropdownItem]:
-    """Windows-specific path autocomplete using ``scandir`` and ``DirEntry``.
 
-    Handles drive-letter discovery, bare/drive inputs (``C``, ``C:``), and
-    directory traversal on Windows.  Hidden directories are filtered unless
-    the terminal component starts with a dot.
+def _win_get_root_candidates(path_str: str) -> list[DropdownItem] | None:
+    """Windows-specific drive-letter discovery, for bare/drive inputs (``C``, ``C:``).
 
     Args:
         path_str: The raw value inside the Windows path input widget.
 
     Returns:
-        A list of ``DropdownItem`` suggestions, or an empty list when no
-        candidates are available.
+        list[DropdownItem]: the candidates, when they do not come from a folder
+        None: when the subfolders of `completion_folder` should be listed
     """
     # Case 1: Empty string - return available drives
     if not path_str:
@@ -142,37 +159,7 @@ def _win_get_candidates(path_str: str) -> list[DropdownItem]:
         if path.exists(drive):
             return [PathDropdownItem(drive, drive)]
         return []
-
-    # Reject relative paths - must be absolute (has drive letter)
-    if not path.isabs(path_str):
-        return []
-
-    ppath = Path(path_str).expanduser().resolve()
-    if path_str.endswith(".."):
-        return []
-
-    # Case 3: exact directory match
-    # User typed path of a particular folder already (but without the trailing "\")
-    if (
-        not path_str.endswith(".")
-        and not path_str.endswith(("\\", "/"))
-        and ppath.exists()
-        and ppath.is_dir()
-    ):
-        return [PathDropdownItem(f"{ppath.name}{os.path.sep}", str(ppath))]
-
-    # Case 4: list contents of parent
-    # - Path ends with "/" -> show subdirectories
-    # - Partial path like "C:\Users\Admin\Doc" -> parent is "C:\Users\Admin"
-    parent = ppath if ppath.exists() else ppath.parent
-    items: list[DropdownItem] = []
-    should_filter = should_exclude_hidden(path_str)
-    for entry in get_subdirectories(parent):
-        if should_filter and is_hidden_file(entry):
-            continue
-        items.append(PathDropdownItem(f"{entry.name}\\", entry.path))
-    items.sort(key=lambda x: x.path.lower())
-    return items
+    return None
 
 
 class PathAutoCompleteInput(PathAutoComplete):
@@ -192,6 +179,11 @@ class PathAutoCompleteInput(PathAutoComplete):
         self.file_prefix = " " + get_icon("file", "default")[0] + " "
         self._target: Input = target
         assert isinstance(self._target, Input)
+        self._folder_candidates: FolderCandidates | None = None
+        self._checked_folder: str | None = None
+        self._last_matches: (
+            tuple[list[DropdownItem], str, list[DropdownItem]] | None
+        ) = None
 
     def _get_target_state(self) -> TargetState:
         return TargetState(
@@ -325,9 +317,101 @@ class PathAutoCompleteInput(PathAutoComplete):
             super()._listen_to_messages(event)
 
     def get_candidates(self, target_state: TargetState) -> list[DropdownItem]:
+        path_str = target_state.text
         if sys.platform == "win32":
-            return _win_get_candidates(target_state.text)
-        return _unix_get_candidates(target_state.text)
+            candidates = _win_get_root_candidates(path_str)
+        else:
+            candidates = _unix_get_root_candidates(path_str)
+        if candidates is not None:
+            return candidates
+        folder = completion_folder(path_str)
+        if folder is None:
+            return []
+        if folder != self._checked_folder:
+            # check each folder once as it is typed into, not on every keystroke
+            self._checked_folder = folder
+            self.list_folder(folder)
+        folder_candidates = self._folder_candidates
+        if folder_candidates is None or folder_candidates.folder != folder:
+            # `list_folder` updates the dropdown once it is done
+            return []
+
+        # User typed path of a particular folder already (but without the trailing "/")
+        name = path.normcase(path.basename(path_str))
+        if name and name != ".":
+            for item in folder_candidates.everything:
+                if path.normcase(item.value[:-1]) == name:
+                    return [item]
+
+        if should_exclude_hidden(path_str):
+            return folder_candidates.visible
+        return folder_candidates.everything
+
+    def get_matches(
+        self,
+        target_state: TargetState,
+        candidates: list[DropdownItem],
+        search_string: str,
+    ) -> list[DropdownItem]:
+        """Fuzzy match the candidates, only rescanning the last matches while typing.
+
+        Returns:
+            list[DropdownItem]: the highlighted matches, best first
+        """
+        if not search_string:
+            self._last_matches = None
+            return candidates
+        pool = candidates
+        if self._last_matches is not None:
+            last_candidates, last_search, last_matched = self._last_matches
+            # a longer query can only match fewer candidates
+            if last_candidates is candidates and is_subsequence(
+                last_search.lower(), search_string.lower()
+            ):
+                pool = last_matched
+        matched: list[DropdownItem] = []
+        hits: list[tuple[DropdownItem, float]] = []
+        for candidate in pool:
+            score, offsets = self.match(search_string, candidate.value)
+            if score > 0:
+                matched.append(candidate)
+                hits.append((
+                    DropdownItemHit(
+                        main=self.apply_highlights(candidate.main, offsets),
+                        prefix=candidate.prefix,
+                        id=candidate.id,
+                        disabled=candidate.disabled,
+                    ),
+                    score,
+                ))
+        self._last_matches = (candidates, search_string, matched)
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        return [hit for hit, _ in hits]
+
+    @work(thread=True, exclusive=True, group="path_autocomplete")
+    def list_folder(self, folder: str) -> None:
+        """List a folder off the event loop, sharing the file list's cache."""
+        entries, changed = path_utils.list_subdirectories(folder)
+        current = self._folder_candidates
+        if (
+            not changed
+            and current is not None
+            and current.folder == folder
+            and current.entries is entries
+        ):
+            return
+        folder_candidates = build_folder_candidates(folder, entries)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self.show_folder_candidates, folder_candidates)
+
+    def show_folder_candidates(self, folder_candidates: FolderCandidates) -> None:
+        self._folder_candidates = folder_candidates
+        if folder_candidates.folder == self._checked_folder and self.target.has_focus:
+            self._handle_target_update()
+
+    def forget_checked_folder(self) -> None:
+        """Check the folder again the next time it is typed into."""
+        self._checked_folder = None
 
     def _align_to_target(self) -> None:
         """Empty function that was supposed to align the completion box to the cursor."""
@@ -471,6 +555,7 @@ class PathInput(Actionable, Input, inherit_bindings=False):
 
     def on_blur(self) -> None:
         self.auto_completer.action_hide()
+        self.auto_completer.forget_checked_folder()
 
     def on_focus(self) -> None:
         self.app.call_after_refresh(
@@ -1,20 +1,50 @@
-from .archive_creator import ArchiveCreationScreen
-from .common_file_name_do_what import FileNameConflict
-from .delete_files import DeleteFiles
-from .dismissible import Dismissible
-from .fd_search import FileSearch
-from .file_in_use import FileInUse
-from .input import ModalInput
-from .keybinds import Keybinds
-from .paste_drop import PasteDropScreen
-from .paste_screen import PasteScreen
-from .rg_search import ContentSearch
-from .shell_exec import ShellExec
-from .theme_chooser import ThemeChooser
-from .trash import TrashScreen
-from .way_too_small import TerminalTooSmall
-from .yes_or_no import YesOrNo
-from .zd_to_directory import ZDToDirectory
+from typing import TYPE_CHECKING
+
+from rovr.functions.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .archive_creator import ArchiveCreationScreen
+    from .common_file_name_do_what import FileNameConflict
+    from .delete_files import DeleteFiles
+    from .dismissible import Dismissible
+    from .fd_search import FileSearch
+    from .file_in_use import FileInUse
+    from .input import ModalInput
+    from .keybinds import Keybinds
+    from .paste_drop import PasteDropScreen
+    from .paste_screen import PasteScreen
+    from .rg_search import ContentSearch
+    from .shell_exec import ShellExec
+    from .theme_chooser import ThemeChooser
+    from .trash import TrashScreen
+    from .way_too_small import TerminalTooSmall
+    from .yes_or_no import YesOrNo
+    from .zd_to_directory import ZDToDirectory
+
+# screens are only pushed on demand, so each one (and whatever it imports,
+# like pytrash for the trash screen) is loaded the first time it is used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ArchiveCreationScreen": ".archive_creator",
+        "ContentSearch": ".rg_search",
+        "DeleteFiles": ".delete_files",
+        "Dismissible": ".dismissible",
+        "FileInUse": ".file_in_use",
+        "FileNameConflict": ".common_file_name_do_what",
+        "FileSearch": ".fd_search",
+        "Keybinds": ".keybinds",
+        "ModalInput": ".input",
+        "PasteDropScreen": ".paste_drop",
+        "PasteScreen": ".paste_screen",
+        "ShellExec": ".shell_exec",
+        "TerminalTooSmall": ".way_too_small",
+        "ThemeChooser": ".theme_chooser",
+        "TrashScreen": ".trash",
+        "YesOrNo": ".yes_or_no",
+        "ZDToDirectory": ".zd_to_directory",
+    },
+)
 
 __all__ = [
     "ArchiveCreationScreen",
@@ -1,7 +1,7 @@
 import asyncio
 import contextlib
 from functools import partial
-from os import path
+from os import getcwd, path
 from time import time
 from typing import ClassVar
 
@@ -17,9 +17,15 @@ from textual.worker import get_current_worker
 from rovr.classes.mixins import CheckboxRenderingMixin
 from rovr.classes.textual_options import OptionWithValue
 from rovr.components import ModalSearchScreen
+from rovr.components.base_search_screen import CachedSearch, can_refine
 from rovr.components.special_option_lists import DoubleClickableScrollOffOptionList
 from rovr.functions import path as path_utils
-from rovr.functions.icons import get_icon_for_file, get_icon_for_folder
+from rovr.functions.file_index import FileIndexMatch, IndexOptions, get_file_index
+from rovr.functions.icons import (
+    get_icon_for_file,
+    get_icon_for_folder,
+    get_icon_smart,
+)
 from rovr.variables.constants import bindings, config
 from rovr.variables.maps import FD_TYPE_TO_ALIAS
 
@@ -72,15 +78,24 @@ class FileSearchToggles(CheckboxRenderingMixin, SelectionList, inherit_bindings=
 
 
 class FileSearch(ModalSearchScreen):
-    """Search for files recursively using fd."""
+    """Search for files recursively using fd, or the built-in file index."""
 
     STREAM_BATCH_TIME: float = 0.25
+    INDEX_BATCH_SIZE: int = 1000
+
+    def __init__(self, use_index: bool = False) -> None:
+        super().__init__()
+        self.use_index = use_index
 
     def compose(self) -> ComposeResult:
         with VerticalGroup(id="file_search_group", classes="file_search_group"):
             yield Input(
                 id="file_search_input",
-                placeholder="Type to search files (fd)",
+                placeholder=(
+                    "Type to search files (index)"
+                    if self.use_index
+                    else "Type to search files (fd)"
+                ),
             )
             yield DoubleClickableScrollOffOptionList(
                 Option("  No input provided", disabled=True),
@@ -93,10 +108,20 @@ class FileSearch(ModalSearchScreen):
         super().on_mount()
         self.search_input.border_title = "Find Files"
         self.search_options.border_title = "Files"
-        self.fd_updater(Input.Changed(self.search_input, value=""))
+        self.on_input_changed(Input.Changed(self.search_input, value=""))
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        self.fd_updater(event=event)
+        if not self.use_index:
+            self.fd_updater(event=event)
+            return
+        options = IndexOptions(
+            path_utils.normalise(getcwd()),
+            config["plugins"]["fd"]["search_hidden"],
+            config["plugins"]["fd"]["follow_symlinks"],
+            config["plugins"]["fd"]["no_ignore_parent"],
+        )
+        self.ensure_index(options)
+        self.index_updater(options, event.value.strip())
 
     @work
     async def fd_updater(self, event: Input.Changed) -> None:
@@ -116,14 +141,32 @@ class FileSearch(ModalSearchScreen):
         for filter_type, should_use in FILTER_TYPES.items():
             if should_use:
                 fd_cmd.extend(["--type", FD_TYPE_TO_ALIAS[filter_type]])
-        if search_term:
-            fd_cmd.append("--")
-            fd_cmd.append(search_term)
-        else:
-            self.search_options.add_class("empty")
-            self.search_options.clear_options()
-            self.search_options.border_subtitle = ""
+        only_folders = [
+            filter_type
+            for filter_type, should_use in FILTER_TYPES.items()
+            if should_use
+        ] == ["directory"]
+        if not search_term:
+            self.show_empty()
+            return
+        search_key = (getcwd(), *fd_cmd)
+        previous = self._last_search
+        if (
+            previous is not None
+            and previous.key == search_key
+            and can_refine(
+                previous.term, search_term, previous.term != previous.term.lower()
+            )
+        ):
+            # fd only matches file names, so the last results can be filtered
+            options = self.refine(previous.options, search_term)
+            self._last_search = CachedSearch(search_key, search_term, options)
+            self.show_results(options)
             return
+        if not await self.wait_for_typing():
+            return
+        fd_cmd.append("--")
+        fd_cmd.append(search_term)
         self.search_options.set_options([Option("  Searching...", disabled=True)])
         fd_process = None
         stderr_task: asyncio.Task[bytes] | None = None
@@ -135,6 +178,7 @@ class FileSearch(ModalSearchScreen):
                 stderr_task = asyncio.create_task(fd_process.stderr.read())
 
             pending_options: list[OptionWithValue] = []
+            found: list[OptionWithValue] = []
             is_empty = True
             last_flush = time()
             self.is_loading = True
@@ -153,11 +197,12 @@ class FileSearch(ModalSearchScreen):
                 if not line:
                     break
 
-                option = self.create_option(line.decode(errors="replace"))
+                option = self.create_option(line.decode(errors="replace"), only_folders)
                 if option is None:
                     continue
 
                 pending_options.append(option)
+                found.append(option)
 
                 if time() - last_flush < self.STREAM_BATCH_TIME:
                     continue
@@ -192,6 +237,9 @@ class FileSearch(ModalSearchScreen):
             if self._active_worker is not get_current_worker():
                 return
 
+            if fd_process.returncode == 0:
+                self._last_search = CachedSearch(search_key, search_term, found)
+
             if not self.search_options.get_option_at_index(0).disabled:
                 if self.search_options.highlighted is None:
                     self.search_options.highlighted = 0
@@ -226,6 +274,49 @@ class FileSearch(ModalSearchScreen):
             if stderr_task is not None and not stderr_task.done():
                 stderr_task.cancel()
 
+    @work(thread=True, exclusive=True, group="file_index_search")
+    def index_updater(self, options: IndexOptions, search_term: str) -> None:
+        worker = get_current_worker()
+        if not search_term:
+            self.app.call_from_thread(self.show_empty)
+            return
+        index = get_file_index(options)
+        if not index.ready:
+            # `index_builder` searches again once the index is ready
+            self.app.call_from_thread(
+                self.search_options.set_options,
+                [Option("  Indexing...", disabled=True)],
+            )
+            return
+        matches = index.search(
+            search_term,
+            [
+                FD_TYPE_TO_ALIAS[filter_type]
+                for filter_type, should_use in FILTER_TYPES.items()
+                if should_use
+            ],
+            should_stop=lambda: worker.is_cancelled,
+        )
+        if worker.is_cancelled:
+            return
+        if not matches:
+            self.app.call_from_thread(self.show_batch, worker, [], True)
+            return
+        for start in range(0, len(matches), self.INDEX_BATCH_SIZE):
+            if worker.is_cancelled:
+                return
+            batch = [
+                self.create_index_option(match, options.root)
+                for match in matches[start : start + self.INDEX_BATCH_SIZE]
+            ]
+            self.app.call_from_thread(
+                self.show_batch,
+                worker,
+                batch,
+                start == 0,
+                start + self.INDEX_BATCH_SIZE >= len(matches),
+            )
+
     @on(SelectionList.SelectionToggled)
     def toggles_toggled(self, event: SelectionList.SelectionToggled) -> None:
         if event.selection.value in FILTER_TYPES:
@@ -240,18 +331,57 @@ class FileSearch(ModalSearchScreen):
             Input.Changed(self.search_input, value=self.search_input.value)
         )
 
-    def create_option(self, raw_line: str) -> OptionWithValue | None:
-        file_path = path_utils.normalise(raw_line.strip())
-        file_path_str = str(file_path)
-        if not file_path_str:
+    @staticmethod
+    def refine(
+        options: list[OptionWithValue], search_term: str
+    ) -> list[OptionWithValue]:
+        """Filter earlier results by file name, with fd's smart case.
+
+        Returns:
+            list[OptionWithValue]: the options whose name contains the term
+        """
+        if search_term != search_term.lower():
+            return [
+                option
+                for option in options
+                if search_term in path.basename(str(option.value))
+            ]
+        search_term = search_term.lower()
+        return [
+            option
+            for option in options
+            if search_term in path.basename(str(option.value)).lower()
+        ]
+
+    def create_option(
+        self, raw_line: str, only_folders: bool = False
+    ) -> OptionWithValue | None:
+        raw_path = raw_line.strip()
+        if not raw_path:
             return None
-        display_text = f" {file_path_str}"
-        if path.isdir(file_path_str):
-            icon_factory = partial(get_icon_for_folder, file_path_str)
+        # fd marks folders with a trailing separator, and older versions that
+        # do not are only stat-ed once the row is actually rendered
+        is_folder = only_folders or raw_path.endswith(("/", path.sep))
+        return self.make_option(path_utils.normalise(raw_path), is_folder or None)
+
+    def create_index_option(self, match: FileIndexMatch, root: str) -> OptionWithValue:
+        if config["plugins"]["fd"]["relative_paths"]:
+            file_path = path_utils.normalise(match.path)
+        else:
+            file_path = path_utils.normalise(root, match.path)
+        return self.make_option(file_path, match.kind == "d")
+
+    def make_option(self, file_path: str, is_dir: bool | None) -> OptionWithValue:
+        # None means unknown, which is checked when the icon is first rendered
+        display_text = f" {file_path}"
+        if is_dir is None:
+            icon_factory = partial(get_icon_smart, file_path)
+        elif is_dir:
+            icon_factory = partial(get_icon_for_folder, file_path)
         else:
-            icon_factory = partial(get_icon_for_file, file_path_str)
+            icon_factory = partial(get_icon_for_file, file_path)
         return OptionWithValue(
             icon_factory,
             display_text,
-            file_path_str,
+            file_path,
         )
@@ -1,8 +1,8 @@
 import asyncio
 import contextlib
 from functools import partial
-from os import path
-from time import time
+from os import getcwd
+from time import sleep, time
 from typing import ClassVar
 
 from textual import on, work
@@ -17,8 +17,11 @@ from textual.worker import get_current_worker
 from rovr.classes.mixins import CheckboxRenderingMixin, ScrollOffMixin
 from rovr.classes.textual_options import OptionWithValue
 from rovr.components import DoubleClickableOptionList, ModalSearchScreen
+from rovr.components.base_search_screen import CachedSearch, can_refine
 from rovr.functions import path as path_utils
-from rovr.functions.icons import get_icon_for_file, get_icon_for_folder
+from rovr.functions.content_search import search_content
+from rovr.functions.file_index import IndexOptions, get_file_index
+from rovr.functions.icons import get_icon_for_file
 from rovr.variables.constants import bindings, config
 
 
@@ -55,15 +58,25 @@ class ContentSearchToggles(ScrollOffMixin, CheckboxRenderingMixin, SelectionList
 
 
 class ContentSearch(ModalSearchScreen):
-    """Search file contents recursively using rg."""
+    """Search file contents recursively using rg, or the built-in search."""
 
     STREAM_BATCH_TIME: float = 0.25
+    REFINE_LIMIT: int = 256
+    """The most files from the last search that rg is pointed at to refine it"""
+
+    def __init__(self, use_builtin: bool = False) -> None:
+        super().__init__()
+        self.use_builtin = use_builtin
 
     def compose(self) -> ComposeResult:
         with VerticalGroup(id="content_search_group"):
             yield Input(
                 id="content_search_input",
-                placeholder="Type to search files (rg)",
+                placeholder=(
+                    "Type to search files (built-in)"
+                    if self.use_builtin
+                    else "Type to search files (rg)"
+                ),
             )
             yield DoubleClickableOptionList(
                 Option("  No input provided", disabled=True),
@@ -76,10 +89,21 @@ class ContentSearch(ModalSearchScreen):
         super().on_mount()
         self.search_input.border_title = "Find in files"
         self.search_options.border_title = "Results"
-        self.rg_updater(Input.Changed(self.search_input, value=""))
+        self.on_input_changed(Input.Changed(self.search_input, value=""))
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        self.rg_updater(event=event)
+        if not self.use_builtin:
+            self.rg_updater(event=event)
+            return
+        # the built-in search walks the same file index as the file search
+        options = IndexOptions(
+            path_utils.normalise(getcwd()),
+            config["plugins"]["rg"]["search_hidden"],
+            config["plugins"]["rg"]["follow_symlinks"],
+            config["plugins"]["rg"]["no_ignore_parent"],
+        )
+        self.ensure_index(options)
+        self.builtin_updater(options, event.value.strip())
 
     @work
     async def rg_updater(self, event: Input.Changed) -> None:
@@ -97,14 +121,38 @@ class ContentSearch(ModalSearchScreen):
             rg_cmd.append("--no-ignore-parent")
         if not config["plugins"]["rg"]["case_sensitive"]:
             rg_cmd.append("--ignore-case")
-        if search_term:
-            rg_cmd.append("--")
-            rg_cmd.append(search_term)
-        else:
+        if not search_term:
             self.search_options.add_class("empty")
             self.search_options.clear_options()
             self.search_options.border_subtitle = ""
             return
+        search_key = (getcwd(), *rg_cmd)
+        previous = self._last_search
+        refine_from: list[str] = []
+        if (
+            previous is not None
+            and previous.key == search_key
+            and len(previous.options) <= self.REFINE_LIMIT
+            and can_refine(
+                previous.term,
+                search_term,
+                config["plugins"]["rg"]["case_sensitive"],
+            )
+        ):
+            if not previous.options:
+                # nothing can match a longer term either
+                self._last_search = CachedSearch(search_key, search_term, [])
+                self.show_results([])
+                return
+            # only files that matched the last term can match this one
+            refine_from = [str(option.value) for option in previous.options]
+        elif not await self.wait_for_typing():
+            return
+        rg_cmd.append("--")
+        rg_cmd.append(search_term)
+        if refine_from:
+            rg_cmd.insert(-2, "--with-filename")
+            rg_cmd.extend(refine_from)
         self.search_options.set_options([Option("  Searching...", disabled=True)])
         rg_process = None
         stderr_task: asyncio.Task[bytes] | None = None
@@ -116,6 +164,7 @@ class ContentSearch(ModalSearchScreen):
                 stderr_task = asyncio.create_task(rg_process.stderr.read())
 
             pending_options: list[OptionWithValue] = []
+            found: list[OptionWithValue] = []
             is_empty = True
             last_flush = time()
             self.is_loading = True
@@ -139,6 +188,7 @@ class ContentSearch(ModalSearchScreen):
                     continue
 
                 pending_options.append(counted_option[1])
+                found.append(counted_option[1])
 
                 if time() - last_flush < self.STREAM_BATCH_TIME:
                     continue
@@ -173,6 +223,10 @@ class ContentSearch(ModalSearchScreen):
             if self._active_worker is not get_current_worker():
                 return
 
+            # rg exits with 1 when nothing matched, and 2 on errors
+            if rg_process.returncode in (0, 1):
+                self._last_search = CachedSearch(search_key, search_term, found)
+
             if not self.search_options.get_option_at_index(0).disabled:
                 if self.search_options.highlighted is None:
                     self.search_options.highlighted = 0
@@ -207,6 +261,71 @@ class ContentSearch(ModalSearchScreen):
             if stderr_task is not None and not stderr_task.done():
                 stderr_task.cancel()
 
+    @work(thread=True, exclusive=True, group="content_search")
+    def builtin_updater(self, options: IndexOptions, search_term: str) -> None:
+        worker = get_current_worker()
+        if not search_term:
+            self.app.call_from_thread(self.show_empty)
+            return
+        index = get_file_index(options)
+        if not index.ready:
+            # `index_builder` searches again once the index is ready
+            self.app.call_from_thread(
+                self.search_options.set_options,
+                [Option("  Indexing...", disabled=True)],
+            )
+            return
+        case_sensitive = config["plugins"]["rg"]["case_sensitive"]
+        search_key = (*map(str, options), str(case_sensitive))
+        previous = self._last_search
+        if (
+            previous is not None
+            and previous.key == search_key
+            and can_refine(previous.term, search_term, case_sensitive)
+        ):
+            # nothing is spawned, so every earlier match can be searched again
+            relative_paths = [str(option.value) for option in previous.options]
+        else:
+            sleep(self.LAUNCH_DEBOUNCE)
+            if worker.is_cancelled:
+                return
+            relative_paths = index.files()
+        self.app.call_from_thread(
+            self.search_options.set_options, [Option("  Searching...", disabled=True)]
+        )
+
+        found: list[OptionWithValue] = []
+        pending_options: list[OptionWithValue] = []
+        is_empty = True
+        last_flush = time()
+        for matches in search_content(
+            options.root,
+            relative_paths,
+            search_term,
+            case_sensitive,
+            should_stop=lambda: worker.is_cancelled,
+        ):
+            pending_options.extend(
+                self.make_option(path_utils.normalise(match.path), match.count)
+                for match in matches
+            )
+            if not pending_options or time() - last_flush < self.STREAM_BATCH_TIME:
+                continue
+            last_flush = time()
+            self.app.call_from_thread(
+                self.show_batch, worker, pending_options, is_empty, False
+            )
+            found.extend(pending_options)
+            pending_options = []
+            is_empty = False
+        if worker.is_cancelled:
+            return
+        found.extend(pending_options)
+        self.app.call_from_thread(
+            self.show_batch, worker, pending_options, is_empty, True
+        )
+        self._last_search = CachedSearch(search_key, search_term, found)
+
     @on(SelectionList.SelectionToggled)
     def toggles_toggled(self, event: SelectionList.SelectionToggled) -> None:
         if event.selection.value in config["plugins"]["rg"]:
@@ -230,16 +349,14 @@ class ContentSearch(ModalSearchScreen):
         if not file_path:
             return None
 
+        return (count, self.make_option(file_path, count))
+
+    def make_option(self, file_path: str, count: int) -> OptionWithValue:
         display_text = f" {file_path}:[dim]{count}[/]"
-        if path.isdir(file_path):
-            icon_factory = partial(get_icon_for_folder, file_path)
-        else:
-            icon_factory = partial(get_icon_for_file, file_path)
-        return (
-            count,
-            OptionWithValue(
-                icon_factory,
-                display_text,
-                file_path,
-            ),
+        # only files have contents to match, so there is nothing to stat
+        icon_factory = partial(get_icon_for_file, file_path)
+        return OptionWithValue(
+            icon_factory,
+            display_text,
+            file_path,
         )
@@ -1,7 +1,9 @@
 from datetime import datetime
+from functools import partial
+from itertools import batched
 from typing import Callable, ClassVar
 
-from pytrash import RecycleBin, TrashEntry
+from pytrash import TrashEntry
 from rich.cells import cell_len
 from rich.text import Text
 from textual import events, on, work
@@ -22,9 +24,11 @@ from rovr.classes.mixins import (
     SetOptionsSelectionList,
     SingleLineOptionLayoutMixin,
 )
+from rovr.classes.textual_options import LazySelection
 from rovr.functions import details as detail_utils
 from rovr.functions import icons as icon_utils
 from rovr.functions import path as path_utils
+from rovr.functions import trash as trash_utils
 from rovr.functions.utils import dismiss, get_shortest_bind, natural_size, s
 from rovr.variables.constants import bindings, config
 from rovr.variables.maps import RovrVars
@@ -36,6 +40,10 @@ cancel_bind = get_shortest_bind(config["keybinds"]["trash"]["cancel"])
 
 home = path_utils.normalise(RovrVars.HOME)
 
+# entries are added to the list this many at a time, so the first ones show
+# up without waiting for the whole recycle bin
+TRASH_PAGE_SIZE: int = 256
+
 _datetime_format = config["metadata"]["datetime_format"]
 TRASH_COLUMNS: tuple[detail_utils.DetailColumn, ...] = (
     detail_utils.DetailColumn(
@@ -48,10 +56,13 @@ TRASH_COLUMNS: tuple[detail_utils.DetailColumn, ...] = (
 )
 
 
-class TrashSelection(Selection):
-    """A recycle bin entry that can render its stats as detail columns."""
+class TrashSelection(LazySelection):
+    """A recycle bin entry that can render its stats as detail columns.
+    Its prompt is only formatted once it is drawn."""
 
-    def __init__(self, prompt: Text, value: str, entry: TrashEntry) -> None:
+    def __init__(
+        self, prompt: Callable[[], Text], value: str, entry: TrashEntry
+    ) -> None:
         super().__init__(prompt, value)
         self.entry = entry
 
@@ -189,7 +200,7 @@ class TrashScreen(Actionable, ModalScreen):
 
     def __init__(self) -> None:
         super().__init__()
-        self.recycle_bin = RecycleBin()
+        self.recycle_bin = trash_utils.get_recycle_bin()
         self.entries: list[TrashEntry] = []
         self._by_handle: dict[str, TrashEntry] = {}
         self.changed = False
@@ -268,7 +279,7 @@ class TrashScreen(Actionable, ModalScreen):
         prev_scroll = selection_list.scroll_offset.y
 
         try:
-            self.entries = self.recycle_bin.entries()
+            self.entries = trash_utils.list_entries(self.recycle_bin)
         except PermissionError as exc:
             # happens for macos when the user has not granted access to the trash folder
             self.notify(
@@ -282,15 +293,20 @@ class TrashScreen(Actionable, ModalScreen):
             self._handle_of(entry, index): entry
             for index, entry in enumerate(self.entries)
         }
-        self.app.call_from_thread(
-            selection_list.set_options,
-            [
+        pages = batched(
+            (
                 TrashSelection(
-                    self._format_entry(entry), self._handle_of(entry, index), entry
+                    partial(self._format_entry, entry),
+                    self._handle_of(entry, index),
+                    entry,
                 )
                 for index, entry in enumerate(self.entries)
-            ],
+            ),
+            TRASH_PAGE_SIZE,
         )
+        self.app.call_from_thread(selection_list.set_options, next(pages, ()))
+        for page in pages:
+            self.app.call_from_thread(selection_list.add_options, page)
 
         new_index: int | None = None
         if prev_handle is not None and prev_handle in self._by_handle:
@@ -420,4 +436,5 @@ class TrashScreen(Actionable, ModalScreen):
                 severity="error",
                 markup=False,
             )
+        trash_utils.invalidate()
         self.reload_entries()
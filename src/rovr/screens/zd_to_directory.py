@@ -1,22 +1,30 @@
 import asyncio
 import contextlib
 import subprocess
+from os import path
 from typing import cast
 
 from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import VerticalGroup
 from textual.widgets import Input, OptionList
-from textual.worker import WorkerCancelled
+from textual.worker import WorkerCancelled, get_current_worker
 
 from rovr.classes.textual_options import OptionWithValue
 from rovr.components import DoubleClickableOptionList, ModalSearchScreen
+from rovr.functions.cwd import getcwd
+from rovr.functions.frecency import get_frecency_database
+from rovr.functions.path import normalise
 from rovr.functions.utils import dismiss, should_cancel
 from rovr.variables.constants import config
 
 
 class ZDToDirectory(ModalSearchScreen):
-    """Screen with a dialog to z to a directory, using zoxide"""
+    """Screen with a dialog to z to a directory, using zoxide or the built-in ranker"""
+
+    def __init__(self, use_builtin: bool = True) -> None:
+        super().__init__()
+        self.use_builtin = use_builtin
 
     def compose(self) -> ComposeResult:
         with VerticalGroup(id="zoxide_group", classes="zoxide_group"):
@@ -32,12 +40,15 @@ class ZDToDirectory(ModalSearchScreen):
 
     def on_mount(self) -> None:
         super().on_mount()
-        self.search_input.border_title = "zoxide"
+        self.search_input.border_title = "z" if self.use_builtin else "zoxide"
         self.search_options.border_title = "Folders"
-        self.zoxide_updater(Input.Changed(self.search_input, value=""))
+        self.on_input_changed(Input.Changed(self.search_input, value=""))
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        self.zoxide_updater(event=event)
+        if self.use_builtin:
+            self.builtin_updater(event.value.strip())
+        else:
+            self.zoxide_updater(event=event)
 
     def _parse_zoxide_line(
         self, line: str, show_scores: bool
@@ -125,28 +136,55 @@ class ZDToDirectory(ModalSearchScreen):
                 return  # anyways
             if options is None:
                 return
-            if len(options) == len(self.search_options.options) and all(
-                isinstance(options[i], OptionWithValue)
-                and isinstance(self.search_options.options[i], OptionWithValue)
-                and options[i].value
-                == cast(OptionWithValue, self.search_options.options[i]).value
-                for i in range(len(options))
-            ):  # ie same~ish query, resulting in same result
-                pass
-            else:
-                self.search_options.set_options(options)
-                self.search_options.remove_class("empty")
-                self.search_options.highlighted = 0
-                if should_cancel():
-                    return
+            self.show_folders(options)
         else:
             # No Matches to the query text
+            self.show_folders([])
+
+    @work(thread=True, exclusive=True, group="frecency_query")
+    def builtin_updater(self, search_term: str) -> None:
+        worker = get_current_worker()
+        results = get_frecency_database().query(
+            search_term.split(), exclude=normalise(getcwd())
+        )
+        show_scores = config["plugins"]["zoxide"].get("show_scores", False)
+        options: list[OptionWithValue] = []
+        score_width = 0
+        for folder, score in results:
+            if worker.is_cancelled:
+                return
+            # folders on drives that are not mounted stay in the database
+            if not path.isdir(folder):
+                continue
+            if show_scores:
+                score_str = f"{score:.1f}"
+                # the first score is the largest, so its width fits every score
+                score_width = score_width or len(score_str)
+                display_text = f" {score_str:>{score_width}} │ {folder}"
+            else:
+                display_text = f" {folder}"
+            options.append(OptionWithValue(None, display_text, folder))
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self.show_folders, options)
+
+    def show_folders(self, options: list[OptionWithValue]) -> None:
+        if not options:
             self.search_options.clear_options()
             self.search_options.add_option(
                 OptionWithValue(None, "  --No matches found--", disabled=True),
             )
             self.search_options.add_class("empty")
             self.search_options.border_subtitle = "0/0"
+            return
+        if len(options) == len(self.search_options.options) and all(
+            isinstance(option, OptionWithValue) and option.value == new_option.value
+            for option, new_option in zip(self.search_options.options, options)
+        ):
+            # same~ish query, resulting in same result
+            return
+        self.search_options.set_options(options)
+        self.search_options.remove_class("empty")
+        self.search_options.highlighted = 0
 
     @work(exclusive=True)
     @on(OptionList.OptionSelected)
@@ -162,9 +200,11 @@ class ZDToDirectory(ModalSearchScreen):
         if selected_value is None:
             dismiss(self, None)
             return None
-        # ignore if zoxide got uninstalled, why are you doing this
-        with contextlib.suppress(subprocess.TimeoutExpired, OSError):
-            await self._run_subprocess(["zoxide", "add", selected_value], 3)
+        if not self.use_builtin:
+            # ignore if zoxide got uninstalled, why are you doing this
+            # (the built-in ranker is fed by every cd instead)
+            with contextlib.suppress(subprocess.TimeoutExpired, OSError):
+                await self._run_subprocess(["zoxide", "add", selected_value], 3)
         if not event.option.disabled:
             dismiss(self, selected_value)
         else:
@@ -10,12 +10,14 @@ from textual.widget import Widget
 from rovr.classes.type_aliases import SortByOptions
 from rovr.functions.config import get_version
 from rovr.functions.folder_prefs import (
+    find_folder_pref,
     get_folder_pref,
     load_folder_prefs,
     remove_folder_pref,
     set_folder_pref,
 )
 from rovr.functions.path import normalise
+from rovr.functions.persistence import get_writer
 from rovr.variables.maps import RovrVars
 
 
@@ -62,6 +64,11 @@ class StateManager(Widget):
         self._skip_save = True
         self._is_loading = False
         self._current_folder: str = ""  # Track current folder for custom sort
+        # the folder the custom sort in effect was set on, which is either
+        # the current folder or one above it that applies to subfolders
+        self._pref_folder: str = ""
+        # (sort_by, sort_descending) as in state.toml, None if it has none
+        self._global_sort: tuple[SortByOptions, bool] | None = None
         load_folder_prefs()  # Load folder preferences at startup
         self._load_state()
         self._skip_save = False
@@ -71,6 +78,7 @@ class StateManager(Widget):
 
     def _load_state(self) -> None:
         self._is_loading = True
+        get_writer().flush(self.state_file)
         if path.exists(self.state_file):
             try:
                 with open(self.state_file, "rb") as f:
@@ -116,6 +124,7 @@ class StateManager(Widget):
                         sort_descending := loaded_state.get("sort_descending", False)
                     ):
                         self.sort_descending = sort_descending
+                    self._global_sort = (sort_by, sort_descending)
             except (tomli.TOMLDecodeError, OSError):
                 self._create_default_state()
         else:
@@ -133,26 +142,31 @@ class StateManager(Widget):
     def _save_state(self, force: bool = False) -> None:
         if self._skip_save and not force:
             return
-        try:
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                # peak hardcoding
-                # i refuse to add tomli-w just for this, and
-                # tomllib is still read only, so writing manually
-                # is the best option for now (source: trust me bro)
-                f.write(f"""current_version = "{self.current_version}"
+        self._global_sort = (self.sort_by, self.sort_descending)
+        # peak hardcoding
+        # i refuse to add tomli-w just for this, and
+        # tomllib is still read only, so writing manually
+        # is the best option for now (source: trust me bro)
+        get_writer().replace(
+            self.state_file,
+            f"""current_version = "{self.current_version}"
 pinned_sidebar_visible = {str(self.pinned_sidebar_visible).lower()}
 preview_sidebar_visible = {str(self.preview_sidebar_visible).lower()}
 footer_visible = {str(self.footer_visible).lower()}
 menu_wrapper_visible = {str(self.menu_wrapper_visible).lower()}
 sort_by = "{self.sort_by}"
 sort_descending = {str(self.sort_descending).lower()}
-""")
-        except (OSError, PermissionError) as exc:
-            self.notify(
-                f"Attempted to write state file, but {type(exc).__name__} occurred\n{exc}",
-                severity="error",
-                markup=False,
-            )
+""",
+            on_error=self._on_save_error,
+        )
+
+    def _on_save_error(self, exc: OSError) -> None:
+        # called from the writer thread, which notify is fine with
+        self.notify(
+            f"Attempted to write state file, but {type(exc).__name__} occurred\n{exc}",
+            severity="error",
+            markup=False,
+        )
 
     def watch_pinned_sidebar_visible(self, visible: bool) -> None:
         if self._is_loading:
@@ -210,8 +224,8 @@ sort_descending = {str(self.sort_descending).lower()}
         if self._is_loading:
             return
         # Save to folder prefs if custom sort is enabled, otherwise save global
-        if self.custom_sort_enabled and self._current_folder:
-            set_folder_pref(self._current_folder, value, self.sort_descending)
+        if self.custom_sort_enabled and self._pref_folder:
+            set_folder_pref(self._pref_folder, value, self.sort_descending)
         else:
             self._save_state()
         # Update sort button icon
@@ -222,8 +236,8 @@ sort_descending = {str(self.sort_descending).lower()}
         if self._is_loading:
             return
         # Save to folder prefs if custom sort is enabled, otherwise save global
-        if self.custom_sort_enabled and self._current_folder:
-            set_folder_pref(self._current_folder, self.sort_by, value)
+        if self.custom_sort_enabled and self._pref_folder:
+            set_folder_pref(self._pref_folder, self.sort_by, value)
         else:
             self._save_state()
         # Update sort button icon
@@ -266,12 +280,13 @@ sort_descending = {str(self.sort_descending).lower()}
             folder_path: The path to the folder being navigated to.
         """
         self._current_folder = normalise(folder_path)
-        folder_pref = get_folder_pref(self._current_folder)
+        found = find_folder_pref(self._current_folder)
 
         self._is_loading = True  # Prevent watchers during state load
 
-        if folder_pref:
-            # Folder has custom sort preferences
+        if found:
+            # Folder has custom sort preferences, of its own or inherited
+            self._pref_folder, folder_pref = found
             self.custom_sort_enabled = True
             if self.sort_by != folder_pref["sort_by"]:
                 self.sort_by = folder_pref["sort_by"]
@@ -279,6 +294,7 @@ sort_descending = {str(self.sort_descending).lower()}
                 self.sort_descending = folder_pref["sort_descending"]
         else:
             # No custom preferences, use global settings
+            self._pref_folder = ""
             self.custom_sort_enabled = False
             self._apply_global_sort()
 
@@ -286,46 +302,62 @@ sort_descending = {str(self.sort_descending).lower()}
 
     def _apply_global_sort(self) -> None:
         """Apply the global sort settings from state.toml."""
-        if not path.exists(self.state_file):
+        # kept from the last time state.toml was read or written, so this
+        # neither reads it on every cd, nor sees it before a pending write
+        if self._global_sort is None:
             return
-        try:
-            with open(self.state_file, "rb") as f:
-                loaded_state: StateDict = cast(StateDict, tomli.load(f))
-                sort_by = loaded_state.get("sort_by", "name")
-                if sort_by not in _sort_by_options:
-                    sort_by = "name"
-                sort_descending = loaded_state.get("sort_descending", False)
-
-                self._is_loading = True
-                if self.sort_by != sort_by:
-                    self.sort_by = sort_by
-                if self.sort_descending != sort_descending:
-                    self.sort_descending = sort_descending
-                self._is_loading = False
-        except (tomli.TOMLDecodeError, OSError):
-            # if any issue, just use defaults
-            pass
+        sort_by, sort_descending = self._global_sort
+        self._is_loading = True
+        if self.sort_by != sort_by:
+            self.sort_by = sort_by
+        if self.sort_descending != sort_descending:
+            self.sort_descending = sort_descending
+        self._is_loading = False
 
     def toggle_custom_sort(self) -> None:
         """
         Toggle the custom sort preference for the current folder.
 
         If enabling: saves current sort as the folder's custom preference.
-        If disabling: removes the folder's custom preference and reverts to global.
+        If disabling: removes the custom preference in effect (which may be
+        inherited from a folder above) and reverts to global.
         """
         if not self._current_folder:
             return
 
         if self.custom_sort_enabled:
             # Disabling: remove folder pref and revert to global
-            remove_folder_pref(self._current_folder)
-            self.custom_sort_enabled = False
-            self._apply_global_sort()
+            remove_folder_pref(self._pref_folder or self._current_folder)
+            self.apply_folder_sort_prefs(self._current_folder)
         else:
             # Enabling: save current sort as folder pref
             set_folder_pref(self._current_folder, self.sort_by, self.sort_descending)
+            self._pref_folder = self._current_folder
             self.custom_sort_enabled = True
 
+    @property
+    def custom_sort_recursive(self) -> bool:
+        """Whether the custom sort in effect also applies to subfolders."""
+        folder_pref = (
+            get_folder_pref(self._pref_folder) if self.custom_sort_enabled else None
+        )
+        return bool(folder_pref and folder_pref.get("recursive"))
+
+    def toggle_custom_sort_recursive(self) -> None:
+        """
+        Toggle whether the custom sort in effect applies to subfolders too,
+        enabling custom sort for the current folder first if needed.
+        """
+        if not self._current_folder:
+            return
+        recursive = not self.custom_sort_recursive
+        if not self.custom_sort_enabled:
+            self._pref_folder = self._current_folder
+            self.custom_sort_enabled = True
+        set_folder_pref(
+            self._pref_folder, self.sort_by, self.sort_descending, recursive
+        )
+
     def get_current_folder(self) -> str:
         return self._current_folder
 
@@ -377,9 +409,9 @@ sort_descending = {str(self.sort_descending).lower()}
             self.sort_descending = sort_descending
 
         # Persist the change
-        if self.custom_sort_enabled and self._current_folder:
+        if self.custom_sort_enabled and self._pref_folder:
             # Save to folder preferences
-            set_folder_pref(self._current_folder, self.sort_by, self.sort_descending)
+            set_folder_pref(self._pref_folder, self.sort_by, self.sort_descending)
         else:
             # Save to global state
             self._save_state()
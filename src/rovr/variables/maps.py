@@ -370,473 +370,6 @@ ICONS = {
     },
 }
 
-FOLDER_MAP = {
-    # api
-    "api": "api",
-    # assets
-    "assets": "assets",
-    "fonts": "assets",
-    "icons": "icons",
-    "images": "pictures",
-    "textures": "pictures",
-    # audio
-    "audio": "audio",
-    "music": "music",
-    "songs": "music",
-    "sounds": "music",
-    # backups
-    "backups": "backups",
-    "backup": "backups",
-    # build
-    "build": "build",
-    "dist": "dist",
-    "release": "dist",
-    "releases": "dist",
-    "out": "dist",
-    "output": "dist",
-    # cache
-    ".cache": "cache",
-    "cache": "cache",
-    ".ccls-cache": "cache",
-    ".mypy_cache": "cache",
-    "__pycache__": "cache",
-    # cargo
-    "cargo": "cargo",
-    ".cargo": "cargo",
-    # config
-    ".atom": "atom",
-    ".bpython_history": "py",
-    ".config": "config",
-    "conf": "conf",
-    "conf.d": "conf",
-    "config": "config",
-    # content
-    "content": "content",
-    # css
-    "css": "css",
-    "sass": "sass",
-    "scss": "sass",
-    "styles": "styles",
-    # desktop
-    "desktop": "desktop",
-    # development
-    ".dbus": "dev",
-    ".doom.d": "dev",
-    ".electron-gyp": "dev",
-    ".emacs.d": "dev",
-    ".idlerc": "dev",
-    ".java": "java",
-    ".jupyter": "py",
-    ".node-gyp": "js",
-    ".npm": "js",
-    ".nvm": "js",
-    ".pyenv": "py",
-    ".python-version": "py",
-    ".rustup": "cargo",
-    ".rvm": "rb",
-    ".tox": "py",
-    ".venv": "py",
-    "dev": "src",
-    "venv": "py",
-    # documents
-    "book": "documents",
-    "books": "documents",
-    "doc": "doc",
-    "docs": "documents",
-    "documents": "documents",
-    "licenses": "documents",
-    # downloads
-    "download": "downloads",
-    "downloads": "downloads",
-    # git
-    ".git": "git",
-    ".github": "github",
-    ".gitlab": "gitlab",
-    ".gitlab-ci": "gitlab",
-    # gradle
-    "gradle": "gradle",
-    # home
-    "home": "home",
-    # include
-    "include": "include",
-    # java
-    "java": "java",
-    # js
-    "js": "js",
-    "jsx": "js",
-    "mjs": "js",
-    "node_modules": "node_modules",
-    "ts": "ts",
-    "tsx": "ts",
-    # lib
-    "lib": "lib",
-    "lib32": "lib",
-    "lib64": "lib",
-    "library": "lib",
-    "libraries": "lib",
-    "libexec": "lib",
-    # logs
-    "log": "log",
-    "logs": "log",
-    # media
-    "media": "media",
-    # onedrive
-    "onedrive": "onedrive",
-    # pictures
-    "img": "pictures",
-    "image": "pictures",
-    "photos": "pictures",
-    "pictures": "pictures",
-    # rovr
-    "rovr": "rovr",
-    # scripts
-    "bin": "bin",
-    "script": "scripts",
-    "scripts": "scripts",
-    # src
-    "source": "src",
-    "src": "src",
-    # static
-    "static": "static",
-    # templates
-    "template": "templates",
-    "templates": "templates",
-    # tests
-    "specs": "tests",
-    "test": "tests",
-    "tests": "tests",
-    # vendor
-    "vendor": "vendor",
-    "vendors": "vendor",
-    # videos
-    "movies": "videos",
-    "video": "videos",
-    "videos": "videos",
-    # vscode
-    ".vscode": "vscode",
-    # frameworks
-    ".astro": "astro",
-    ".gradle": "gradle",
-    ".pnpm": "pnpm",
-}
-
-FILE_MAP = {
-    # Text files
-    ".log": "log",
-    ".markdown": "markdown",
-    ".md": "markdown",
-    ".mdx": "markdown",
-    ".rdoc": "markdown",
-    ".rst": "rst",
-    ".text": "text",
-    ".txt": "txt",
-    # Image files
-    ".ai": "ai",
-    ".apng": "image",
-    ".avif": "image",
-    ".bmp": "image",
-    ".gif": "image",
-    ".heic": "image",
-    ".heif": "image",
-    ".heix": "image",
-    ".ico": "image",
-    ".jpeg": "image",
-    ".jpg": "image",
-    ".png": "image",
-    ".psd": "psd",
-    ".pxm": "image",
-    ".svg": "image",
-    ".webp": "image",
-    ".xcf": "image",
-    # Audio files
-    ".ape": "audio",
-    ".cue": "audio",
-    ".flac": "audio",
-    ".m4a": "audio",
-    ".mp3": "audio",
-    ".ogg": "audio",
-    ".opus": "audio",
-    ".vlc": "audio",
-    ".wav": "audio",
-    ".wma": "audio",
-    ".wpl": "audio",
-    # Video files
-    ".avi": "video",
-    ".flv": "video",
-    ".m4v": "video",
-    ".mkv": "video",
-    ".mov": "video",
-    ".mp4": "video",
-    ".ogv": "video",
-    ".webm": "video",
-    ".wmv": "video",
-    # Subtitle files
-    ".sbv": "text",
-    ".scc": "text",
-    ".smi": "text",
-    ".srt": "text",
-    ".sub": "text",
-    ".vtt": "text",
-    # Document files
-    ".csv": "csv",
-    ".doc": "msword",
-    ".docx": "msword",
-    ".gdoc": "msword",
-    ".gform": "gform",
-    ".gsheet": "msexcel",
-    ".gslides": "msppt",
-    ".ics": "ics",
-    ".odp": "msppt",
-    ".ods": "msexcel",
-    ".odt": "msword",
-    ".one": "msonenote",
-    ".onetoc2": "msonenote",
-    ".pdf": "pdf",
-    ".ppt": "msppt",
-    ".pptx": "msppt",
-    ".rtf": "text",
-    ".xls": "msexcel",
-    ".xlsx": "msexcel",
-    # Ebook files
-    ".ebook": "ebook",
-    ".epub": "ebook",
-    ".mobi": "ebook",
-    # Archive files
-    ".7z": "zip",
-    ".ar": "zip",
-    ".bz2": "zip",
-    ".deb": "deb",
-    ".gz": "zip",
-    ".iso": "iso",
-    ".lz": "zip",
-    ".pkg": "zip",
-    ".rar": "zip",
-    ".rpm": "rpm",
-    ".tar": "zip",
-    ".tbz": "zip",
-    ".tbz2": "zip",
-    ".tgz": "zip",
-    ".xbps": "zip",
-    ".xz": "zip",
-    ".zip": "zip",
-    ".zst": "zip",
-    # Programming files
-    ".a": "a",
-    ".asm": "asm",
-    ".asp": "html",
-    ".astro": "astro",
-    ".awk": "shell",
-    ".bash": "shell",
-    ".bat": "shell",
-    ".c": "c",
-    ".cc": "cc",
-    ".cjs": "cjs",
-    ".class": "java",
-    ".clj": "clj",
-    ".cljs": "clj",
-    ".cmd": "cmd",
-    ".coffee": "coffee",
-    ".cpp": "cpp",
-    ".cp": "cpp",
-    ".cs": "cs",
-    ".csh": "shell",
-    ".css": "css",
-    ".csproj": "cs",
-    ".cshtml": "html",
-    ".csx": "cs",
-    ".cts": "ts",
-    ".c++": "cpp",
-    ".cxx": "cpp",
-    ".cypher": "db",
-    ".dart": "dart",
-    ".el": "emacs",
-    ".elc": "emacs",
-    ".elm": "elm",
-    ".elv": "shell",
-    ".erb": "rb",
-    ".erl": "erlang",
-    ".ex": "elixir",
-    ".exs": "elixir",
-    ".f": "f",
-    ".fish": "fish",
-    ".fnl": "lua",
-    ".fs": "fs",
-    ".fsi": "fs",
-    ".fsx": "fs",
-    ".go": "go",
-    ".gradle": "gradle",
-    ".groovy": "groovy",
-    ".h": "h",
-    ".haml": "haml",
-    ".hbs": "hbs",
-    ".hh": "h",
-    ".hpp": "hpp",
-    ".hs": "hs",
-    ".htm": "html",
-    ".html": "html",
-    ".hx": "hx",
-    ".ipynb": "py",
-    ".jade": "jade",
-    ".jar": "java",
-    ".java": "java",
-    ".jinja": "html",
-    ".jl": "jl",
-    ".js": "js",
-    ".json": "json",
-    ".jsonc": "json",
-    ".jsx": "jsx",
-    ".jule": "jule",
-    ".kt": "kt",
-    ".kts": "kt",
-    ".less": "less",
-    ".lhs": "hs",
-    ".lisp": "lisp",
-    ".lua": "lua",
-    ".malloy": "sql",
-    ".mjs": "mjs",
-    ".ml": "ml",
-    ".mli": "ml",
-    ".mll": "ml",
-    ".mly": "ml",
-    ".mts": "ts",
-    ".mustache": "mustache",
-    ".nim": "nim",
-    ".nimble": "nim",
-    ".nix": "nix",
-    ".nu": "shell",
-    ".otf": "font",
-    ".php": "php",
-    ".phar": "php",
-    ".pl": "pl",
-    ".plx": "pl",
-    ".pm": "pl",
-    ".pod": "pl",
-    ".pp": "rb",
-    ".prql": "sql",
-    ".ps1": "pwsh",
-    ".pug": "pug",
-    ".py": "py",
-    ".pyc": "py",
-    ".pyw": "py",
-    ".r": "r",
-    ".rb": "rb",
-    ".rdata": "r",
-    ".rdb": "rdb",
-    ".rds": "r",
-    ".rlib": "rs",
-    ".rl": "shell",
-    ".rs": "rs",
-    ".rproj": "r",
-    ".rq": "sql",
-    ".sass": "sass",
-    ".scala": "scala",
-    ".scss": "scss",
-    ".sh": "sh",
-    ".shell": "shell",
-    ".sol": "sol",
-    ".sql": "sql",
-    ".styl": "styl",
-    ".stylus": "styl",
-    ".svelte": "svelte",
-    ".swift": "swift",
-    ".tcss": "css",
-    ".tex": "tex",
-    ".ts": "ts",
-    ".tsx": "tsx",
-    ".ttf": "font",
-    ".twig": "twig",
-    ".typ": "typst",
-    ".typst": "typst",
-    ".vim": "vim",
-    ".vue": "vue",
-    ".woff": "font",
-    ".woff2": "font",
-    ".zig": "zig",
-    ".zon": "toml",
-    ".zsh": "shell",
-    # Config files
-    ".cfg": "cfg",
-    ".conf": "conf",
-    ".editorconfig": "conf",
-    ".env": "env",
-    ".flake": "nix",
-    ".ini": "ini",
-    ".lock": "lock",
-    ".npmignore": "npmignore",
-    ".properties": "json",
-    ".toml": "toml",
-    ".yaml": "yaml",
-    ".yml": "yml",
-    # Git
-    ".gitattributes": "git",
-    ".gitignore": "git",
-    ".gitmodules": "git",
-    ".gitkeep": "git",
-    # Binary files
-    ".bin": "binary",
-    ".dll": "windows",
-    ".elf": "binary",
-    ".exe": "windows",
-    ".o": "o",
-    ".so": "so",
-    ".sym": "binary",
-    # Installable
-    ".apk": "apk",
-    ".msi": "installable",
-    ".whl": "installable",
-    # Compiled
-    ".crate": "crate",
-    # Certificates
-    ".gpg": "shield_lock",
-    ".age": "shield_lock",
-    ".signature": "signed_file",
-    ".sha1": "shield_check",
-    ".sha224": "shield_check",
-    ".sha256": "shield_check",
-    ".sha384": "shield_check",
-    ".sha512": "shield_check",
-    ".cert": "certificate",
-    ".asc": "shield_lock",
-    ".cer": "certificate",
-    ".crt": "certificate",
-    ".pem": "certificate",
-    ".pub": "pub",
-    ".sig": "signed_file",
-    # Other
-    ".bak": "log",
-    ".db": "db",
-    ".dat": "db",
-    ".diff": "diff",
-    ".dump": "db",
-    ".font": "font",
-    ".gb": "gb",
-    ".graphql": "graphql",
-    ".gv": "gv",
-    ".iml": "iml",
-    ".ino": "ino",
-    ".ko": "ko",
-    ".kusto": "db",
-    ".ldb": "db",
-    ".ld": "binary",
-    ".nc": "nc",
-    ".old": "log",
-    ".orig": "log",
-    ".part": "binary",
-    ".patch": "patch",
-    ".pdb": "binary",
-    ".prisma": "prisma",
-    ".rmd": "markdown",
-    ".shp": "shp",
-    ".sqlite": "sqlite",
-    ".sqlite3": "sqlite",
-    ".swp": "vim",
-    ".tf": "tf",
-    ".timestamp": "log",
-    ".torrent": "link",
-    ".xml": "xml",
-    ".xul": "xml",
-}
-
 EXT_TO_LANG_MAP = {
     ".py": "python",
     ".md": "markdown",
@@ -857,188 +390,6 @@ EXT_TO_LANG_MAP = {
     ".lock": "toml",
 }
 
-FILES_MAP = {
-    # python
-    ".python-version": "py",
-    "pyproject.toml": "package",
-    "py.typed": "py",
-    "requirements.txt": "package",
-    "runtime.txt": "py",
-    "setup.py": "py",
-    "tox.ini": "py",
-    "poetry.lock": "version_lock",
-    "uv.lock": "version_lock",
-    "Pipfile.lock": "version_lock",
-    # rust
-    "cargo.lock": "version_lock",
-    "cargo.toml": "package",
-    "rustfmt.toml": "rs",
-    ".release.toml": "rs",
-    # npm
-    ".npmignore": "npmignore",
-    ".npmrc": "npmignore",
-    "npmignore": "npmignore",
-    "package-lock.json": "version_lock",
-    "package.json": "package",
-    "yarn.lock": "version_lock",
-    ".yarnrc": "package",
-    # bun
-    "bunfig.toml": "bun",
-    "bun.lockb": "bun",
-    # web
-    "favicon.ico": "html",
-    "robots.txt": "robots",
-    # shell
-    ".bash_history": "shell",
-    ".bash_logout": "shell",
-    ".bash_profile": "shell",
-    ".bashrc": "shell",
-    ".cshrc": "shell",
-    ".kshrc": "shell",
-    ".shellcheckrc": "shell",
-    ".zlogin": "shell",
-    ".zlogout": "shell",
-    ".zprofile": "shell",
-    ".zsh_history": "shell",
-    ".zshrc": "shell",
-    # build files
-    "gruntfile.js": "gruntfile.js",
-    "gulpfile.js": "gulpfile.js",
-    "makefile": "makefile",
-    "makefile.ac": "makefile",
-    # git
-    ".gitattributes": "git",
-    ".gitconfig": "git",
-    ".git-credentials": "key",
-    ".gitignore": "git",
-    ".gitkeep": "git",
-    ".gitmodules": "git",
-    # docker
-    "containerfile": "dockerfile",
-    "docker-compose.yml": "dockerfile",
-    # config
-    ".bpython_history": "py",
-    ".clang-format": "cfg",
-    ".editorconfig": "cfg",
-    ".env": "env",
-    ".eslintrc.js": "js",
-    ".eslintrc.json": "json",
-    ".eslintrc.yml": "yml",
-    ".htaccess": "cfg",
-    ".htpasswd": "cfg",
-    ".inputrc": "cfg",
-    ".lynxrc": "cfg",
-    ".mailcap": "cfg",
-    ".mime.types": "cfg",
-    ".muttrc": "cfg",
-    ".neomuttrc": "cfg",
-    ".python_history": "py",
-    ".sqlite_history": "db",
-    ".viminfo": "vim",
-    ".vimrc": "vim",
-    ".wgetrc": "cfg",
-    ".xinitrc": "cfg",
-    ".xmodmap": "cfg",
-    ".Xmodmap": "cfg",
-    ".xprofile": "cfg",
-    ".Xprofile": "cfg",
-    ".xresources": "cfg",
-    "bspwmrc": "cfg",
-    "config.ac": "cfg",
-    "config.el": "emacs",
-    "config.mk": "cfg",
-    "crypttab": "cfg",
-    "custom.el": "emacs",
-    "dockerfile": "dockerfile",
-    "environment": "env",
-    "fstab": "cfg",
-    "group": "cfg",
-    "gshadow": "cfg",
-    "hostname": "cfg",
-    "hosts": "cfg",
-    "htoprc": "cfg",
-    "init.el": "emacs",
-    "kdeglobals": "cfg",
-    "kdenliverc": "cfg",
-    "known_hosts": "cfg",
-    "lsb-release": "cfg",
-    "metadata.xml": "cfg",
-    "neomuttrc": "cfg",
-    "os-release": "cfg",
-    "packages.el": "emacs",
-    "passwd": "passwd",
-    "profile": "cfg",
-    ".profile": "cfg",
-    "shadow": "cfg",
-    "shells": "cfg",
-    "subgid": "cfg",
-    "subuid": "cfg",
-    "sudoers": "key",
-    "sxhkdrc": "cfg",
-    "tigrc": "cfg",
-    "timezone": "cfg",
-    "url": "link",
-    "user-dirs.dirs": "cfg",
-    "vimrc": "vim",
-    "xmonad.hs": "hs",
-    "zathurarc": "cfg",
-    # documentation
-    "changelog": "markdown",
-    "contributing": "markdown",
-    "copyright": "markdown",
-    "license.md": "license",
-    "license.txt": "license",
-    "security": "security",
-    "security.md": "security",
-    "unlicense": "license",
-    # ruby
-    "gemfile": "rb",
-    "gemfile.lock": "version_lock",
-    "procfile": "rb",
-    "rakefile": "rb",
-    "rubydoc": "rubydoc",
-    # gitlab
-    ".gitlab-ci.yml": "github",
-    # ci
-    ".travis.yml": "yml",
-    "appveyor.yml": "yml",
-    "heroku.yml": "yml",
-    "netlify.toml": "toml",
-    # frameworks
-    "webpack.config.js": "js",
-    # security
-    "authorized_keys": "key",
-    ".gnupg": "key",
-    ".pki": "key",
-    ".ssh": "key",
-    "id_dsa": "key",
-    "id_ecdsa": "key",
-    "id_rsa": "key",
-    # checksum
-    "md5sum": "log",
-    "sha256sum": "log",
-    # special
-    "a.out": "binary",
-    ".ds_store": "hidden",
-    "localized": "hidden",
-    "manifest": "json",
-    "module.symvers": "binary",
-    "pkgbuild": "package",
-    # bots
-    "agents.md": "robots",
-    "crush.md": "robots",
-    "gemini.md": "robots",
-    "claude.md": "robots",
-    "llms.txt": "robots",
-    # general
-    "license": "license",
-    "maintainers": "maintainers",
-    "magic": "binary",
-    "vagrantfile": "vagrantfile",
-    "jenkinsfile": "jenkinsfile",
-}
-
-
 PIL_EXTENSIONS = (
     # reminder that stuff can also not work, just remove it if it doesn't work
     ".avif",
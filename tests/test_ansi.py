@@ -40,3 +40,15 @@ def test_ansi_to_rich_text_parses_hyperlinks() -> None:
     assert text.plain == "link plain"
     assert text.get_style_at_offset(console, 0).link == "https://example.com"
     assert text.get_style_at_offset(console, 4).link is None
+
+
+def test_ansi_to_rich_text_stops_at_truncated_sequences() -> None:
+    assert ansi_to_rich_text("\x1b[31mred\x1b[1").plain == "red"
+    assert ansi_to_rich_text("before\x1b]8;;https://example.com").plain == "before"
+
+
+def test_ansi_to_rich_text_interns_styles() -> None:
+    text = ansi_to_rich_text("\x1b[1;31ma\x1b[0m \x1b[1;31mb\x1b[0m")
+
+    assert len(text.spans) == 2
+    assert text.spans[0].style is text.spans[1].style
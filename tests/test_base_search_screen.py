@@ -0,0 +1,66 @@
+import pytest
+
+from rovr.classes.textual_options import OptionWithValue
+from rovr.components.base_search_screen import can_refine
+from rovr.screens.fd_search import FileSearch
+
+
+@pytest.mark.parametrize(
+    ("previous", "current", "case_sensitive", "expected"),
+    [
+        ("conf", "config", False, True),
+        ("conf", "my_config", False, True),
+        ("conf", "Config", False, True),
+        ("Conf", "config", True, False),
+        ("Conf", "MyConfig", True, True),
+        ("config", "conf", False, False),
+        # a longer regex can match more than a shorter one
+        ("a", "a*", False, False),
+        ("main.", "main.py", False, False),
+    ],
+)
+def test_can_refine(
+    previous: str, current: str, case_sensitive: bool, expected: bool
+) -> None:
+    assert can_refine(previous, current, case_sensitive) is expected
+
+
+def make_options(*paths: str) -> list[OptionWithValue]:
+    return [OptionWithValue(None, f" {file_path}", file_path) for file_path in paths]
+
+
+def test_file_search_refine_matches_file_names_only() -> None:
+    options = make_options("config/main.py", "src/Config.toml", "src/app.py")
+
+    refined = FileSearch.refine(options, "config")
+
+    # folders higher up do not count, fd only matches the file name
+    assert [option.value for option in refined] == ["src/Config.toml"]
+
+
+def test_file_search_refine_uses_smart_case() -> None:
+    options = make_options("src/Config.toml", "src/config.py")
+
+    assert [option.value for option in FileSearch.refine(options, "Config")] == [
+        "src/Config.toml"
+    ]
+    assert len(FileSearch.refine(options, "config")) == 2
+
+
+def test_file_search_create_option_does_not_stat(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(*_: object) -> bool:
+        raise AssertionError("results should not be stat-ed while streaming")
+
+    monkeypatch.setattr("os.path.isdir", fail)
+    screen = FileSearch()
+
+    folder = screen.create_option("src/pkg/\n")
+    unknown = screen.create_option("src/main.py\n")
+
+    assert folder is not None
+    assert folder.value == "src/pkg"
+    assert unknown is not None
+    assert unknown.value == "src/main.py"
+    assert screen.create_option("\n") is None
@@ -1,7 +1,78 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 from rovr.__main__ import _build_parser
+from rovr.functions.startup_profile import StartupProfile
 
 
 def test_parser_accepts_multiple_paths() -> None:
     args = _build_parser().parse_args([".", ".."])
 
     assert args.paths == [".", ".."]
+
+
+def test_startup_does_not_import_deferred_modules() -> None:
+    # a fresh interpreter, since the test session has imported everything
+    deferred = [
+        "backports.zstd",
+        "multiarchive",
+        "puremagic",
+        "pygments",
+        "pytrash",
+        "rovr.components.base_search_screen",
+        "rovr.functions.content_search",
+        "rovr.functions.file_index",
+        "rovr.screens.archive_creator",
+        "rovr.screens.delete_files",
+        "rovr.screens.fd_search",
+        "rovr.screens.keybinds",
+        "rovr.screens.rg_search",
+        "rovr.screens.theme_chooser",
+        "rovr.screens.trash",
+        "rovr.screens.zd_to_directory",
+        "rovr.variables.icon_maps",
+        "textual.highlight",
+    ]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, rovr.app; print('\\n'.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert set(deferred).isdisjoint(result.stdout.splitlines())
+
+
+def test_startup_profile_times_imports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from textual.message_pump import MessagePump
+
+    (tmp_path / "profiled_inner.py").write_text("VALUE = 1\n")
+    (tmp_path / "profiled_outer.py").write_text("import profiled_inner\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    dispatch_message = MessagePump._dispatch_message
+
+    profile = StartupProfile()
+    profile.install()
+    try:
+        importlib.import_module("profiled_outer")
+        profile.mark("imported")
+    finally:
+        profile.uninstall()
+        sys.modules.pop("profiled_outer", None)
+        sys.modules.pop("profiled_inner", None)
+
+    outer_total, outer_own = profile.imports["profiled_outer"]
+    inner_total, _ = profile.imports["profiled_inner"]
+    assert outer_own == pytest.approx(outer_total - inner_total)
+    assert profile.marks["imported"] > 0
+    assert MessagePump._dispatch_message is dispatch_message
@@ -199,3 +199,83 @@ def test_get_mounted_drives_windows_normalises_and_applies_exclusions(
     drives = drive_workers.get_mounted_drives("win32", config)
 
     assert drives == ["C:/", "D:/"]
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="polls /proc/self/mounts")
+def test_mount_monitor_only_reports_mount_table_changes() -> None:
+    monitor = drive_workers.MountMonitor("linux")
+    try:
+        assert monitor._poll is not None
+        assert monitor.changed()
+        # nothing was mounted in between
+        assert not monitor.changed()
+        monitor.reset()
+        assert monitor.changed()
+        assert not monitor.changed()
+    finally:
+        monitor.close()
+
+
+def test_mount_monitor_compares_the_drive_bitmask(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_kernel32 = MagicMock()
+    fake_kernel32.GetLogicalDrives.return_value = 0b100
+    monkeypatch.setattr(
+        ctypes, "windll", MagicMock(kernel32=fake_kernel32), raising=False
+    )
+    monitor = drive_workers.MountMonitor("win32")
+
+    assert monitor.changed()
+    assert not monitor.changed()
+    fake_kernel32.GetLogicalDrives.return_value = 0b110
+    assert monitor.changed()
+    assert not monitor.changed()
+
+
+def test_mount_monitor_without_a_signal_always_reports_a_change() -> None:
+    monitor = drive_workers.MountMonitor("sunos5")
+    assert monitor.changed()
+    assert monitor.changed()
+
+
+def test_list_drives_reads_procfs_without_a_process(
+    monkeypatch: pytest.MonkeyPatch, config: RovrConfig
+) -> None:
+    monkeypatch.setattr(drive_workers, "probe_can_hang", lambda platform: False)
+    monkeypatch.setattr(drive_workers, "get_drive_probe", MagicMock())
+    monkeypatch.setattr(drive_workers, "_get_linux_drives", lambda: ["/"])
+
+    assert drive_workers.list_drives("linux", config, allow_process=True) == ["/"]
+    drive_workers.get_drive_probe.assert_not_called()
+
+
+def test_drive_probe_reuses_one_helper_process(config: RovrConfig) -> None:
+    probe = drive_workers.DriveProbe(timeout=30)
+    try:
+        first = probe.probe(sys.platform, config)
+        process = probe._process
+        assert process is not None
+        second = probe.probe(sys.platform, config)
+        assert first == second
+        assert first is not None
+        assert probe._process is process
+    finally:
+        probe.close()
+    assert probe._process is None
+    assert not process.is_alive()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="polls /proc/self/mounts")
+@pytest.mark.asyncio
+async def test_app_closes_the_mount_monitor_on_exit(tmp_path: Path) -> None:
+    from rovr.app import Application
+
+    app = Application(startup_path=tmp_path.as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        await pilot.pause()
+        monitor = app._mount_monitor
+        assert monitor is not None
+        mounts = monitor._mounts
+        assert mounts is not None
+    assert mounts.closed
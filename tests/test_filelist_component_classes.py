@@ -149,3 +149,43 @@ async def test_checked_clipboard_option_renders(tmp_path: Path) -> None:
             "selection-list--option-checked"
         ]
         assert app.Clipboard.render_line(0).text.strip()
+
+
+@pytest.mark.asyncio
+async def test_rows_are_only_rendered_again_when_they_change(tmp_path: Path) -> None:
+    for i in range(20):
+        (tmp_path / f"file{i:02}").touch()
+
+    app = Application(tmp_path.as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        await pilot.pause()
+        worker = cast(Worker, app.file_list.update_file_list(add_to_session=False))
+        await worker.wait()
+        await pilot.pause()
+
+        file_list = app.file_list
+        rendered: list[int] = []
+        render_row = file_list._render_row
+
+        def counting_render_row(y: int) -> Any:
+            row = file_list.scroll_offset.y + y
+            if row < 20:  # below the rows are blank lines
+                rendered.append(row)
+            return render_row(y)
+
+        file_list._render_row = counting_render_row  # ty: ignore[invalid-assignment]
+        file_list.highlighted = 0
+        await pilot.pause()
+        rendered.clear()
+
+        file_list.action_cursor_down()
+        await pilot.pause()
+        assert sorted(set(rendered)) == [0, 1]
+
+        rendered.clear()
+        highlighted_line = file_list.render_line(1)
+        app.query_one("#path_switcher").focus()
+        await pilot.pause()
+        # losing focus restyles the highlighted row
+        assert 1 in rendered
+        assert file_list.render_line(1) != highlighted_line
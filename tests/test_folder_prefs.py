@@ -2,12 +2,14 @@ import json
 from pathlib import Path
 
 from rovr.functions.folder_prefs import (
+    find_folder_pref,
     get_folder_pref,
     has_folder_pref,
     load_folder_prefs,
     remove_folder_pref,
     set_folder_pref,
 )
+from rovr.functions.persistence import get_writer
 from rovr.variables.maps import RovrVars
 
 
@@ -55,3 +57,86 @@ def test_load_folder_prefs_expands_variable_paths() -> None:
 
     loaded = load_folder_prefs()
     assert f"{RovrVars.HOME}/fixture" in loaded
+
+
+def test_folder_pref_changes_are_appended_to_the_log(tmp_path: Path) -> None:
+    prefs_file = Path(RovrVars.ROVRCONFIG) / "folder_preferences.jsonl"
+    load_folder_prefs()
+    get_writer().flush()
+    lines_before = (
+        len(prefs_file.read_text().splitlines()) if prefs_file.exists() else 0
+    )
+
+    first = (tmp_path / "first").as_posix()
+    second = (tmp_path / "second").as_posix()
+    set_folder_pref(first, "size", True)
+    set_folder_pref(second, "modified", False)
+    remove_folder_pref(first)
+    get_writer().flush()
+
+    lines = prefs_file.read_text().splitlines()
+    assert len(lines) == lines_before + 3
+    assert json.loads(lines[-1]) == {"path": first, "removed": True}
+    loaded = load_folder_prefs()
+    assert first not in loaded
+    assert loaded[second] == {"sort_by": "modified", "sort_descending": False}
+
+
+def test_load_folder_prefs_migrates_the_json_map(tmp_path: Path) -> None:
+    folder = (tmp_path / "legacy").as_posix()
+    legacy_file = Path(RovrVars.ROVRCONFIG) / "folder_preferences.json"
+    legacy_file.parent.mkdir(parents=True, exist_ok=True)
+    legacy_file.write_text(
+        json.dumps({folder: {"sort_by": "size", "sort_descending": True}})
+    )
+
+    assert load_folder_prefs()[folder] == {"sort_by": "size", "sort_descending": True}
+    assert not legacy_file.exists()
+    assert load_folder_prefs()[folder] == {"sort_by": "size", "sort_descending": True}
+
+
+def test_recursive_folder_pref_is_inherited_by_subfolders(tmp_path: Path) -> None:
+    parent = (tmp_path / "inherit").as_posix()
+    child = (tmp_path / "inherit" / "a" / "b").as_posix()
+    override = (tmp_path / "inherit" / "a").as_posix()
+    set_folder_pref(parent, "size", True)
+
+    assert get_folder_pref(child) is None
+
+    set_folder_pref(parent, "size", True, recursive=True)
+    assert find_folder_pref(child) == (
+        parent,
+        {"sort_by": "size", "sort_descending": True, "recursive": True},
+    )
+    assert not has_folder_pref(child)
+
+    set_folder_pref(override, "name", False)
+    assert find_folder_pref(child) == (
+        parent,
+        {"sort_by": "size", "sort_descending": True, "recursive": True},
+    )
+    assert get_folder_pref(override) == {"sort_by": "name", "sort_descending": False}
+
+    # changing the sort keeps it recursive, and it survives a reload
+    set_folder_pref(parent, "modified", False)
+    load_folder_prefs()
+    assert get_folder_pref(child) == {
+        "sort_by": "modified",
+        "sort_descending": False,
+        "recursive": True,
+    }
+
+    remove_folder_pref(parent)
+    assert get_folder_pref(child) is None
+    assert get_folder_pref(override) == {"sort_by": "name", "sort_descending": False}
+
+
+def test_folder_pref_paths_are_collapsed_into_variables() -> None:
+    folder = f"{RovrVars.DOWNLOADS}/sorted"
+    set_folder_pref(folder, "natural", False)
+    get_writer().flush()
+
+    prefs_file = Path(RovrVars.ROVRCONFIG) / "folder_preferences.jsonl"
+    last = json.loads(prefs_file.read_text().splitlines()[-1])
+    assert last["path"] == "$DOWNLOADS/sorted"
+    assert load_folder_prefs()[folder]["sort_by"] == "natural"
@@ -61,6 +61,40 @@ def test_deep_merge_append_bool_key_untouched() -> None:
     assert result == {"append_new_tabs": False}
 
 
+def test_config_snapshot_skips_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    user_config = config_dir / "config.toml"
+    user_config.write_text("[interface]\nshow_hidden_files = true\n")
+    monkeypatch.setenv("ROVR_CONFIG_FOLDER", str(config_dir))
+    monkeypatch.setattr(config.RovrVars, "ROVRTEMP", str(tmp_path / "temp"))
+
+    # the first load adds the schema header, which leaves the snapshot for
+    # the next launch, since the file changed after it was read
+    config.load_config()
+    assert not (tmp_path / "temp" / "config.marshal").exists()
+    _, parsed = config.load_config()
+    assert (tmp_path / "temp" / "config.marshal").exists()
+
+    def fail(*_args: Any) -> dict:
+        raise AssertionError("the config was parsed again")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(config.tomli, "loads", fail)
+        patched.setattr(config, "get_schema_validator", fail)
+        _, cached = config.load_config()
+    assert cached == parsed
+    assert cached["interface"]["show_hidden_files"] is True
+
+    user_config.write_text(
+        user_config.read_text().replace("true", "false"), encoding="utf-8"
+    )
+    _, edited = config.load_config()
+    assert edited["interface"]["show_hidden_files"] is False
+
+
 def test_natural_size() -> None:
     assert utils.natural_size(1024, "binary", 2) == "1.00 KiB"
     assert utils.natural_size(1024, "decimal", 2) == "1.02 kB"
@@ -0,0 +1,137 @@
+import tarfile
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from rovr.functions import archive as archive_utils
+from rovr.functions.archive import (
+    ArchiveMember,
+    ArchiveTree,
+    clear_archive_cache,
+    iter_archive_chunks,
+    iter_archive_members,
+)
+
+
+def make_zip(archive_path: Path, count: int) -> None:
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("folder/", "")
+        for index in range(count):
+            archive.writestr(f"folder/file{index}.txt", "x" * index)
+
+
+def test_iter_archive_chunks_streams_zip_members(tmp_path: Path) -> None:
+    clear_archive_cache()
+    archive_path = tmp_path / "test.zip"
+    make_zip(archive_path, 5)
+
+    chunks = list(iter_archive_chunks(str(archive_path), 1.0, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2]
+    members = [member for chunk in chunks for member in chunk]
+    assert members[0] == ArchiveMember("folder/", True, 0)
+    assert members[-1] == ArchiveMember("folder/file4.txt", False, 4)
+
+
+def test_iter_archive_chunks_reads_tar_lazily(tmp_path: Path) -> None:
+    clear_archive_cache()
+    source = tmp_path / "source.txt"
+    source.write_text("hello")
+    archive_path = tmp_path / "test.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        for index in range(3):
+            archive.add(source, arcname=f"file{index}.txt")
+
+    members = [
+        member
+        for chunk in iter_archive_chunks(str(archive_path), 1.0)
+        for member in chunk
+    ]
+
+    assert [member.name for member in members] == [
+        "file0.txt",
+        "file1.txt",
+        "file2.txt",
+    ]
+    assert all(member.size == 5 and not member.is_dir for member in members)
+
+
+def test_iter_archive_members_falls_back_to_infolist() -> None:
+    # an archive that does not expose the file it opened
+    info = SimpleNamespace(name="folder/file.txt", is_dir=False, uncompressed_size=3)
+    archive = SimpleNamespace(infolist=lambda: [info])
+
+    assert list(iter_archive_members(cast(Any, archive))) == [
+        ArchiveMember("folder/file.txt", False, 3)
+    ]
+
+
+def test_iter_archive_chunks_caches_complete_listings(tmp_path: Path) -> None:
+    clear_archive_cache()
+    archive_path = tmp_path / "test.zip"
+    make_zip(archive_path, 3)
+    first = [m for chunk in iter_archive_chunks(str(archive_path), 1.0) for m in chunk]
+    archive_path.unlink()
+
+    # served from the cache, even though the archive is gone
+    second = [m for chunk in iter_archive_chunks(str(archive_path), 1.0) for m in chunk]
+    assert first == second
+
+    # a different mtime means the archive changed
+    with pytest.raises(FileNotFoundError):
+        list(iter_archive_chunks(str(archive_path), 2.0))
+
+
+def test_iter_archive_chunks_skips_cache_when_cancelled(tmp_path: Path) -> None:
+    clear_archive_cache()
+    archive_path = tmp_path / "test.zip"
+    make_zip(archive_path, 5)
+
+    chunks = iter_archive_chunks(str(archive_path), 1.0, chunk_size=2)
+    next(chunks)
+    chunks.close()
+
+    assert archive_utils._listing_cache == {}
+
+
+def test_archive_tree_aggregates_folders() -> None:
+    tree = ArchiveTree([
+        ArchiveMember("src/", True, 0),
+        ArchiveMember("src/app.py", False, 10),
+        ArchiveMember("src/lib/util.py", False, 5),
+        ArchiveMember("src-old.txt", False, 1),
+        ArchiveMember("./README.md", False, 2),
+        ArchiveMember("empty/", True, 0),
+    ])
+
+    assert tree.file_count == 4
+    assert tree.total_size == 18
+
+    root, skipped = tree.children()
+    assert skipped == 0
+    assert [(entry.name, entry.is_dir) for entry in root] == [
+        ("empty", True),
+        ("src", True),
+        ("README.md", False),
+        ("src-old.txt", False),
+    ]
+    src = root[1]
+    assert (src.file_count, src.size) == (2, 15)
+
+    children, _ = tree.children("src")
+    assert [entry.path for entry in children] == ["src/lib", "src/app.py"]
+    # implicit folders get aggregated too
+    assert (children[0].file_count, children[0].size) == (1, 5)
+    assert tree.children("empty") == ([], 0)
+
+
+def test_archive_tree_children_respects_limit() -> None:
+    tree = ArchiveTree(ArchiveMember(f"file{index}", False, 1) for index in range(10))
+
+    entries, skipped = tree.children(limit=3)
+
+    assert len(entries) == 3
+    assert skipped == 7
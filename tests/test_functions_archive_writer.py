@@ -0,0 +1,164 @@
+import gzip
+import os
+import struct
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from rovr.functions import archive_writer
+from rovr.functions.archive_writer import (
+    ParallelCompressor,
+    collect_sources,
+    write_archive,
+)
+
+if sys.version_info >= (3, 14):
+    import tarfile
+else:
+    from backports.zstd import tarfile  # ty: ignore[unresolved-import]
+
+
+def make_sources(root: Path) -> dict[str, bytes]:
+    """
+    Returns:
+        dict[str, bytes]: the content of each file, by its name in an archive
+    """
+    contents = {
+        "selected/small.txt": b"hello",
+        "selected/empty.txt": b"",
+        # several times ZIP_CHUNK_SIZE in the tests, with repeats that span
+        # pieces, so a piece primed with the wrong window would show
+        "selected/nested/big.txt": b"".join(
+            f"line {index % 700}\n".encode() for index in range(20000)
+        ),
+        "selected/nested/random.bin": os.urandom(50000),
+    }
+    for name, content in contents.items():
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_bytes(content)
+    (root / "empty_folder").mkdir()
+    return contents
+
+
+def test_collect_sources(tmp_path: Path) -> None:
+    contents = make_sources(tmp_path)
+    sources = collect_sources([
+        (tmp_path / "selected").as_posix(),
+        (tmp_path / "empty_folder").as_posix(),
+    ])
+
+    assert [source.arcname.replace("\\", "/") for source in sources] == [
+        *sorted(contents),
+        "empty_folder",
+    ]
+    assert sum(source.size for source in sources) == sum(map(len, contents.values()))
+
+
+@pytest.mark.parametrize(
+    ("algo", "level"),
+    [
+        ("zip", 6),
+        ("zip", 0),
+        ("tar", 0),
+        ("tar.gz", 6),
+        ("tar.bz2", 1),
+        ("tar.xz", 0),
+        ("tar.zst", 3),
+    ],
+)
+def test_write_archive_round_trips(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, algo: str, level: int
+) -> None:
+    monkeypatch.setattr(archive_writer, "ZIP_CHUNK_SIZE", 16 << 10)
+    contents = make_sources(tmp_path)
+    sources = collect_sources([
+        (tmp_path / "selected").as_posix(),
+        (tmp_path / "empty_folder").as_posix(),
+    ])
+    archive_path = (tmp_path / f"out.{algo}").as_posix()
+    progress: list[int] = []
+
+    write_archive(
+        sources,
+        archive_path,
+        algo,  # ty: ignore[invalid-argument-type]
+        level,
+        lambda done, current: progress.append(done),
+        workers=4,
+    )
+
+    assert progress[-1] == sum(source.size for source in sources)
+    assert progress == sorted(progress)
+    if algo == "zip":
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.testzip() is None
+            assert "empty_folder/" in archive.namelist()
+            for name, content in contents.items():
+                assert archive.read(name) == content
+    else:
+        with tarfile.open(archive_path, "r:*") as archive:
+            assert archive.getmember("empty_folder").isdir()
+            for name, content in contents.items():
+                member = archive.extractfile(name)
+                assert member is not None
+                assert member.read() == content
+
+
+def test_zip_headers_match_what_zipfile_writes(tmp_path: Path) -> None:
+    # the pipeline writes zip headers by hand, like ZipFile._open_to_write,
+    # so check them against the real ZIP_CHUNK_SIZE and an empty member
+    big = tmp_path / "selected" / "big.bin"
+    big.parent.mkdir()
+    big.write_bytes(os.urandom(1000) * (2 * archive_writer.ZIP_CHUNK_SIZE // 1000 + 7))
+    (tmp_path / "selected" / "empty.txt").write_bytes(b"")
+    archive_path = tmp_path / "out.zip"
+
+    write_archive(
+        collect_sources([(tmp_path / "selected").as_posix()]),
+        archive_path.as_posix(),
+        "zip",
+        6,
+        workers=4,
+    )
+
+    data = archive_path.read_bytes()
+    with zipfile.ZipFile(archive_path) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ["selected/big.bin", "selected/empty.txt"]
+        assert archive.read("selected/big.bin") == big.read_bytes()
+        assert archive.read("selected/empty.txt") == b""
+        for info in archive.infolist():
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            # the local header was rewritten with the final sizes
+            _, _, flags, method, _, _, crc, compressed, size, _, _ = struct.unpack_from(
+                "<4s5H3I2H", data, info.header_offset
+            )
+            assert (flags, method) == (0, zipfile.ZIP_DEFLATED)
+            assert (crc, compressed, size) == (
+                info.CRC,
+                info.compress_size,
+                info.file_size,
+            )
+
+
+def test_parallel_compressor_writes_pieces_in_order(tmp_path: Path) -> None:
+    data = b"".join(f"{index}\n".encode() for index in range(100000))
+    archive_path = (tmp_path / "out.gz").as_posix()
+
+    with ParallelCompressor(
+        archive_path, gzip.compress, chunk_size=4096, workers=4
+    ) as compressor:
+        for start in range(0, len(data), 1000):
+            compressor.write(data[start : start + 1000])
+        assert compressor.tell() == len(data)
+
+    assert gzip.decompress(Path(archive_path).read_bytes()) == data
+
+
+def test_parallel_compressor_writes_a_valid_empty_file(tmp_path: Path) -> None:
+    archive_path = (tmp_path / "out.gz").as_posix()
+    with ParallelCompressor(archive_path, gzip.compress):
+        pass
+    assert gzip.decompress(Path(archive_path).read_bytes()) == b""
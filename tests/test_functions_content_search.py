@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from rovr.functions import content_search
+from rovr.functions.content_search import ContentMatch, search_content
+from rovr.functions.search_workers import (
+    MMAP_THRESHOLD,
+    compile_pattern,
+    count_matching_lines,
+)
+
+
+def search(
+    root: Path, files: list[str], pattern: str, case_sensitive: bool = True
+) -> list[ContentMatch]:
+    return sorted(
+        match
+        for batch in search_content(str(root), files, pattern, case_sensitive)
+        for match in batch
+    )
+
+
+@pytest.mark.parametrize(
+    ("pattern", "case_sensitive", "expected"),
+    [
+        ("hello", True, 3),
+        ("Hello", True, 1),
+        ("HELLO", False, 4),
+        (r"^hel+o$", True, 1),
+        ("o", True, 5),
+        # invalid regexes are searched for literally
+        ("hello(", True, 1),
+    ],
+)
+def test_count_matching_lines(
+    pattern: str, case_sensitive: bool, expected: int
+) -> None:
+    data = b"hello hello\nHello\nworld\nhello\nhello(\n"
+    compiled = compile_pattern(pattern, pattern != "hello", case_sensitive)
+
+    assert count_matching_lines(data, pattern.encode(), compiled) == expected
+
+
+def test_search_content_skips_binary_files(tmp_path: Path) -> None:
+    (tmp_path / "text.txt").write_text("needle\nhay\nneedle\n")
+    (tmp_path / "binary.bin").write_bytes(b"needle\x00\x01\x02")
+    (tmp_path / "none.txt").write_text("hay\n")
+
+    assert search(tmp_path, ["text.txt", "binary.bin", "none.txt"], "needle") == [
+        ContentMatch("text.txt", 2)
+    ]
+
+
+def test_search_content_maps_large_files(tmp_path: Path) -> None:
+    line = b"x" * 99 + b"\n"
+    (tmp_path / "large.txt").write_bytes(
+        line * (MMAP_THRESHOLD // len(line) + 10) + b"needle\n"
+    )
+
+    assert search(tmp_path, ["large.txt"], "needle") == [ContentMatch("large.txt", 1)]
+
+
+def test_search_content_uses_a_process_pool(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(content_search, "CONTENT_POOL_THRESHOLD", 2)
+    monkeypatch.setattr(content_search, "CONTENT_SEARCH_WORKERS", 2)
+    monkeypatch.setattr(content_search, "CONTENT_BATCH_SIZE", 2)
+    files = []
+    for index in range(6):
+        (tmp_path / f"file{index}.txt").write_text("match\n" * index)
+        files.append(f"file{index}.txt")
+
+    assert search(tmp_path, files, "MATCH", case_sensitive=False) == [
+        ContentMatch(f"file{index}.txt", index) for index in range(1, 6)
+    ]
+
+
+def test_search_content_stops_early(tmp_path: Path) -> None:
+    (tmp_path / "file.txt").write_text("match\n")
+
+    assert (
+        list(search_content(str(tmp_path), ["file.txt"], "match", True, lambda: True))
+        == []
+    )
@@ -0,0 +1,135 @@
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from rovr.functions import delete
+from rovr.functions.delete import DeleteCancelled, DeleteProgress, TreeDeleter
+
+
+def make_tree(root: Path) -> int:
+    """
+    Returns:
+        int: how many files and folders were made, root included
+    """
+    made = 1
+    root.mkdir()
+    for outer in range(3):
+        for inner in range(4):
+            folder = root / f"outer{outer}" / f"inner{inner}"
+            folder.mkdir(parents=True)
+            made += 1 + (inner == 0)
+            for index in range(5):
+                (folder / f"{index}.txt").write_text("12345")
+                made += 1
+    return made
+
+
+@pytest.mark.parametrize("workers", [1, 8])
+def test_deletes_everything_and_counts_it(tmp_path: Path, workers: int) -> None:
+    tree = tmp_path / "tree"
+    made = make_tree(tree)
+    single = tmp_path / "single.txt"
+    single.write_text("1234567890")
+    reports: list[DeleteProgress] = []
+
+    deleter = TreeDeleter(on_progress=reports.append, workers=workers)
+    deleter.delete([tree.as_posix(), single.as_posix(), (tmp_path / "gone").as_posix()])
+
+    assert not tree.exists()
+    assert not single.exists()
+    assert deleter.progress.found == deleter.progress.entries == made + 1
+    assert deleter.progress.bytes == 3 * 4 * 5 * 5 + 10
+    # the last report is always sent, with everything in it
+    assert reports[-1] == deleter.progress
+
+
+def test_symlinks_are_removed_but_not_followed(tmp_path: Path) -> None:
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep.txt").write_text("")
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    try:
+        (tree / "link").symlink_to(target, target_is_directory=True)
+        (tmp_path / "top_link").symlink_to(target, target_is_directory=True)
+    except (OSError, NotImplementedError) as exc:
+        pytest.skip(f"Symlink not supported: {exc}")
+
+    TreeDeleter().delete([tree.as_posix(), (tmp_path / "top_link").as_posix()])
+
+    assert not tree.exists()
+    assert not os.path.lexists(tmp_path / "top_link")
+    assert (target / "keep.txt").exists()
+
+
+def fail_on(
+    monkeypatch: pytest.MonkeyPatch, name: str, exc: OSError
+) -> Callable[[], None]:
+    # unlinking `name` fails until the returned function is called
+    original = os.unlink
+    failing = [True]
+
+    def unlink(path: str, *args: object, **kwargs: object) -> None:
+        if failing[0] and os.path.basename(path) == name:
+            raise exc
+        original(path, *args, **kwargs)  # ty: ignore[invalid-argument-type]
+
+    monkeypatch.setattr(delete.os, "unlink", unlink)
+    return lambda: failing.__setitem__(0, False)
+
+
+def test_a_file_left_behind_keeps_its_folders(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tree = tmp_path / "tree"
+    make_tree(tree)
+    fail_on(monkeypatch, "3.txt", PermissionError("denied"))
+    errors: list[str] = []
+
+    def on_error(item_path: str, exc: OSError, retry: Callable[[], None]) -> bool:
+        errors.append(os.path.basename(item_path))
+        return False
+
+    TreeDeleter(on_error=on_error).delete([tree.as_posix()])
+
+    assert errors == ["3.txt"] * 12
+    remaining = sorted(path.name for path in tree.rglob("*") if path.is_file())
+    assert remaining == ["3.txt"] * 12
+
+
+def test_retrying_from_on_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tree = tmp_path / "tree"
+    make_tree(tree)
+    stop_failing = fail_on(monkeypatch, "0.txt", PermissionError("denied"))
+
+    def on_error(item_path: str, exc: OSError, retry: Callable[[], None]) -> bool:
+        stop_failing()
+        retry()
+        return True
+
+    TreeDeleter(on_error=on_error).delete([tree.as_posix()])
+    assert not tree.exists()
+
+
+@pytest.mark.parametrize("workers", [1, 8])
+def test_cancelling_and_unhandled_errors_stop_it(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, workers: int
+) -> None:
+    tree = tmp_path / "tree"
+    make_tree(tree)
+    fail_on(monkeypatch, "2.txt", OSError("broken"))
+
+    def on_error(item_path: str, exc: OSError, retry: Callable[[], None]) -> bool:
+        raise DeleteCancelled
+
+    with pytest.raises(DeleteCancelled):
+        TreeDeleter(on_error=on_error, workers=workers).delete([tree.as_posix()])
+    assert tree.exists()
+
+    # the error itself, and not the others being stopped because of it
+    with pytest.raises(OSError, match="broken"):
+        TreeDeleter(workers=workers).delete([tree.as_posix()])
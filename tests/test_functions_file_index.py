@@ -0,0 +1,178 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from rovr.functions import file_index
+from rovr.functions.file_index import (
+    FileIndex,
+    FileIndexMatch,
+    IndexOptions,
+    clear_file_indexes,
+    get_file_index,
+    parse_ignore_lines,
+)
+from rovr.variables.maps import RovrVars
+
+
+def bump_mtime(target: Path) -> None:
+    # timestamps come from a coarse clock, so changes made right after a
+    # scan can end up with the same mtime
+    stat = target.stat()
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def make_tree(root: Path) -> None:
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "build").mkdir()
+    (root / ".hidden").mkdir()
+    (root / "src" / "main.py").write_text("print()")
+    (root / "src" / "pkg" / "Module.py").write_text("")
+    (root / "build" / "out.o").write_text("")
+    (root / ".hidden" / "secret.txt").write_text("")
+    (root / "README.md").write_text("# readme")
+    (root / ".gitignore").write_text("build/\n*.o\n")
+
+
+def paths(matches: list[FileIndexMatch]) -> list[str]:
+    return sorted(match.path for match in matches)
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "tree"
+    root.mkdir()
+    make_tree(root)
+    return root
+
+
+def test_update_respects_hidden_and_ignore_files(tree: Path) -> None:
+    index = FileIndex(IndexOptions(str(tree), False, False, True))
+
+    assert index.update() is True
+
+    assert sorted(index.directories) == ["", "src", "src/pkg"]
+    assert paths(index.search("")) == [
+        "README.md",
+        "src",
+        "src/main.py",
+        "src/pkg",
+        "src/pkg/Module.py",
+    ]
+
+
+def test_update_includes_hidden_files_when_asked(tree: Path) -> None:
+    index = FileIndex(IndexOptions(str(tree), True, False, True))
+    index.update()
+
+    assert ".hidden/secret.txt" in paths(index.search("secret"))
+    assert ".gitignore" in paths(index.search("gitignore"))
+
+
+def test_search_uses_smart_case_and_regex(tree: Path) -> None:
+    index = FileIndex(IndexOptions(str(tree), False, False, True))
+    index.update()
+
+    assert paths(index.search("module")) == ["src/pkg/Module.py"]
+    assert paths(index.search("Module")) == ["src/pkg/Module.py"]
+    assert paths(index.search("MODULE")) == []
+    assert paths(index.search(r"\.py$")) == ["src/main.py", "src/pkg/Module.py"]
+    # invalid regexes are searched for literally
+    assert paths(index.search("main(")) == []
+
+
+def test_search_filters_by_type(tree: Path) -> None:
+    index = FileIndex(IndexOptions(str(tree), False, False, True))
+    index.update()
+
+    assert paths(index.search("", ["d"])) == ["src", "src/pkg"]
+    assert paths(index.search("", ["e"])) == ["src/pkg/Module.py"]
+
+
+def test_update_only_rescans_changed_folders(tree: Path) -> None:
+    index = FileIndex(IndexOptions(str(tree), False, False, True))
+    index.update()
+    assert index.update() is False
+
+    (tree / "src" / "new").mkdir()
+    (tree / "src" / "new" / "added.txt").write_text("")
+    bump_mtime(tree / "src")
+    assert index.update() is True
+    assert paths(index.search("added")) == ["src/new/added.txt"]
+
+    for child in (tree / "src" / "pkg").iterdir():
+        child.unlink()
+    (tree / "src" / "pkg").rmdir()
+    bump_mtime(tree / "src")
+    assert index.update() is True
+    assert "src/pkg" not in index.directories
+    assert paths(index.search("Module")) == []
+
+
+def test_update_reapplies_edited_ignore_files(tree: Path) -> None:
+    index = FileIndex(IndexOptions(str(tree), False, False, True))
+    index.update()
+
+    (tree / ".gitignore").write_text("*.o\n")
+    bump_mtime(tree / ".gitignore")
+    assert index.update() is True
+
+    assert "build" in index.directories
+    assert paths(index.search("build")) == ["build"]
+    assert paths(index.search(r"\.o$")) == []
+
+
+def test_parse_ignore_lines() -> None:
+    rules = parse_ignore_lines(["# comment", "", "*.log", "!keep.log", "/dist/"])
+
+    assert [(rule.negated, rule.dir_only) for rule in rules] == [
+        (False, False),
+        (True, False),
+        (False, True),
+    ]
+    assert rules[0].pattern.match("deep/folder/debug.log")
+    assert rules[2].pattern.match("dist")
+    assert not rules[2].pattern.match("src/dist")
+
+
+def test_save_and_load_round_trip(
+    tree: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(RovrVars, "ROVRCACHE", str(tmp_path / "cache"))
+    options = IndexOptions(str(tree), False, False, True)
+    index = FileIndex(options)
+    index.update()
+    index.save()
+
+    loaded = FileIndex.load(options)
+
+    assert loaded is not None
+    assert loaded.ready
+    assert loaded.directories == index.directories
+    assert FileIndex.load(options._replace(hidden=True)) is None
+
+
+def test_load_rejects_corrupted_indexes(
+    tree: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(RovrVars, "ROVRCACHE", str(tmp_path / "cache"))
+    options = IndexOptions(str(tree), False, False, True)
+    cache_path = Path(file_index.index_cache_path(options))
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_bytes(b"not an index")
+
+    assert FileIndex.load(options) is None
+
+
+def test_get_file_index_reuses_indexes(
+    tree: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(RovrVars, "ROVRCACHE", str(tmp_path / "cache"))
+    clear_file_indexes()
+    options = IndexOptions(str(tree), False, False, True)
+
+    index = get_file_index(options)
+
+    assert index is get_file_index(options)
+    assert not index.ready
+    clear_file_indexes()
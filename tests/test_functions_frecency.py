@@ -0,0 +1,145 @@
+import struct
+from pathlib import Path
+
+import pytest
+
+from rovr.functions import frecency
+from rovr.functions.frecency import (
+    DAY,
+    HOUR,
+    WEEK,
+    FrecencyDatabase,
+    FrecencyEntry,
+    frecency_score,
+    matches_keywords,
+    parse_zoxide_database,
+)
+from rovr.functions.persistence import get_writer
+
+NOW = 1_700_000_000
+
+
+def zoxide_database(entries: dict[str, tuple[float, int]]) -> bytes:
+    data = struct.pack("<IQ", 3, len(entries))
+    for folder, (rank, last_accessed) in entries.items():
+        encoded = folder.encode()
+        data += struct.pack("<Q", len(encoded)) + encoded
+        data += struct.pack("<dQ", rank, last_accessed)
+    return data
+
+
+@pytest.mark.parametrize(
+    ("lowered_path", "keywords", "expected"),
+    [
+        ("/home/user/projects/rovr", [], True),
+        ("/home/user/projects/rovr", ["rovr"], True),
+        ("/home/user/projects/rovr", ["pro", "rovr"], True),
+        ("/home/user/projects/rovr", ["rovr", "pro"], False),
+        # the last keyword has to be in the last component
+        ("/home/user/projects/rovr", ["projects"], False),
+        ("/home/user/projects/rovr", ["missing"], False),
+    ],
+)
+def test_matches_keywords(
+    lowered_path: str, keywords: list[str], expected: bool
+) -> None:
+    assert matches_keywords(lowered_path, keywords) is expected
+
+
+@pytest.mark.parametrize(
+    ("elapsed", "weight"),
+    [(0, 4.0), (HOUR, 2.0), (DAY, 0.5), (WEEK, 0.25)],
+)
+def test_frecency_score_weights_recent_visits(elapsed: int, weight: float) -> None:
+    assert frecency_score(FrecencyEntry(2.0, NOW - elapsed), NOW) == 2.0 * weight
+
+
+def test_query_ranks_by_frecency(tmp_path: Path) -> None:
+    database = FrecencyDatabase(str(tmp_path / "frecency.log"))
+    database.add("/home/user/old", now=NOW - WEEK)
+    database.add("/home/user/old", now=NOW - WEEK)
+    database.add("/home/user/new", now=NOW)
+
+    assert [folder for folder, _ in database.query([], now=NOW)] == [
+        "/home/user/new",
+        "/home/user/old",
+    ]
+    assert database.query(["OLD"], now=NOW) == [("/home/user/old", 0.5)]
+    assert database.query([], exclude="/home/user/new", now=NOW) == [
+        ("/home/user/old", 0.5)
+    ]
+
+
+def test_log_is_replayed_and_compacted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(frecency, "COMPACT_SLACK", 1)
+    log_path = tmp_path / "frecency.log"
+    database = FrecencyDatabase(str(log_path))
+    for _ in range(3):
+        database.add("/srv/data", now=NOW)
+    get_writer().flush()
+    assert log_path.read_text().splitlines() == [f"+1\t{NOW}\t/srv/data"] * 3
+
+    database.add("/srv/data", now=NOW + 1)
+    get_writer().flush()
+
+    # four records for one folder is past the slack, so it was rewritten
+    assert log_path.read_text().splitlines() == [f"=4\t{NOW + 1}\t/srv/data"]
+    reloaded = FrecencyDatabase(str(log_path))
+    reloaded.load()
+    assert reloaded.entries == {"/srv/data": FrecencyEntry(4.0, NOW + 1)}
+
+
+def test_ranks_are_aged_past_the_maximum(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(frecency, "FRECENCY_MAX_AGE", 10.0)
+    database = FrecencyDatabase(str(tmp_path / "frecency.log"))
+    database.add("/rare", now=NOW)
+    for _ in range(10):
+        database.add("/common", now=NOW)
+
+    assert set(database.entries) == {"/common"}
+    assert database.entries["/common"].rank == pytest.approx(10 * 9 / 11)
+
+
+def test_parse_zoxide_database() -> None:
+    data = zoxide_database({"/home/user": (3.5, NOW), "/tmp/space dir": (1.0, NOW)})
+
+    assert parse_zoxide_database(data) == {
+        "/home/user": FrecencyEntry(3.5, NOW),
+        "/tmp/space dir": FrecencyEntry(1.0, NOW),
+    }
+    with pytest.raises(ValueError):
+        parse_zoxide_database(data[:-4])
+    with pytest.raises(ValueError):
+        parse_zoxide_database(struct.pack("<IQ", 2, 0))
+
+
+def test_zoxide_database_is_imported_without_a_log(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "zoxide").mkdir()
+    (tmp_path / "zoxide" / "db.zo").write_bytes(
+        zoxide_database({"/home/user": (3.5, NOW)})
+    )
+    monkeypatch.setenv("_ZO_DATA_DIR", str(tmp_path / "zoxide"))
+    log_path = tmp_path / "frecency.log"
+
+    database = FrecencyDatabase(str(log_path))
+    database.load()
+
+    assert database.entries == {"/home/user": FrecencyEntry(3.5, NOW)}
+    get_writer().flush()
+    assert log_path.read_text() == f"=3.5\t{NOW}\t/home/user\n"
+
+
+def test_visits_still_queued_are_replayed(tmp_path: Path) -> None:
+    log_path = str(tmp_path / "frecency.log")
+    FrecencyDatabase(log_path).add("/srv/data", now=NOW)
+
+    # load flushes what is queued for the log before reading it
+    reloaded = FrecencyDatabase(log_path)
+    reloaded.load()
+    assert reloaded.entries == {"/srv/data": FrecencyEntry(1.0, NOW)}
@@ -0,0 +1,77 @@
+from typing import Never, Sequence
+
+from textual.widgets.option_list import Option
+
+from rovr.functions.fuzzy import FilterIndex, char_mask, is_subsequence
+
+
+class LabelledOption(Option):
+    def __init__(self, label: str, disabled: bool = False) -> None:
+        super().__init__(label, disabled=disabled)
+        self.label = label
+
+
+def test_is_subsequence() -> None:
+    assert is_subsequence("fl", "file_list.py")
+    assert is_subsequence("", "anything")
+    assert not is_subsequence("lf", "file")
+
+
+def test_char_mask_rules_out_missing_characters() -> None:
+    query = char_mask("xyz")
+    assert char_mask("file") & query != query
+    assert char_mask("xyzzy") & query == query
+
+
+def test_filter_index_candidates_keep_separators() -> None:
+    options = [
+        LabelledOption("--section--", disabled=True),
+        LabelledOption("Readme.md"),
+        LabelledOption("main.py"),
+    ]
+    index = FilterIndex(options, always_add_disabled=True)
+
+    assert index.candidates("RM") == [0, 1]
+    assert index.candidates("py") == [0, 2]
+
+
+def test_filter_index_narrows_previous_matches() -> None:
+    options = [LabelledOption(name) for name in ("apple", "apricot", "banana")]
+    index = FilterIndex(options, always_add_disabled=True)
+
+    index.remember("ap", index.candidates("ap"))
+    # pretend "apricot" was not a match, narrowing must only look at the rest
+    index.remember("ap", [0])
+    assert index.candidates("apr") == []
+    assert index.candidates("app") == [0]
+
+    # a query that does not extend the previous one rescans everything
+    assert index.candidates("ban") == [2]
+
+
+def test_filter_index_is_for_detects_new_lists() -> None:
+    options = [LabelledOption("a")]
+    index = FilterIndex(options, always_add_disabled=True)
+
+    assert index.is_for(options)
+    options.append(LabelledOption("b"))
+    assert not index.is_for(options)
+    assert not index.is_for(list(options))
+
+
+class UnbuiltRows(Sequence[Option]):
+    def __len__(self) -> int:
+        return 2
+
+    def __getitem__(self, index: int | slice) -> Never:
+        raise AssertionError("rows should not be built to index them")
+
+    def labels(self) -> list[str]:
+        return ["apple", "banana"]
+
+
+def test_filter_index_reads_labels_without_building_rows() -> None:
+    index = FilterIndex(UnbuiltRows(), always_add_disabled=True)
+
+    assert index.labels == ["apple", "banana"]
+    assert index.candidates("nan") == [1]
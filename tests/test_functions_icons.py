@@ -49,3 +49,30 @@ def test_smart(tmp_path: Path) -> None:
         else:
             junction_icon = icons.get_icon_for_folder((tmp_path / "folder").as_posix())
             assert junction_icon == ICONS["general"]["symlink"]
+
+
+def test_icon_table_priorities() -> None:
+    table = icons.IconTable(
+        [
+            {"pattern": "*.PY", "icon": "ext", "color": "red"},
+            {"pattern": "setup.py", "icon": "name", "color": "red"},
+            {"pattern": "test_?.txt", "icon": "glob", "color": "red"},
+            {"pattern": "readme*", "icon": "readme", "color": "red"},
+            {"pattern": "readme.md", "icon": "later", "color": "red"},
+        ],
+        {"package.json": ("json-name", "blue"), "notes.py": ("py-name", "blue")},
+        {".json": ("json", "blue"), ".md": ("md", "blue")},
+        ("default", "white"),
+    )
+
+    # earlier custom patterns win, whatever kind of pattern they are
+    assert table.lookup("setup.py") == ("ext", "red")
+    assert table.lookup("readme.md") == ("readme", "red")
+    # custom patterns win over the built-in names
+    assert table.lookup("notes.py") == ("ext", "red")
+    assert table.lookup("test_a.txt") == ("glob", "red")
+    assert table.lookup("test_ab.txt") == ("default", "white")
+    assert table.lookup("package.json") == ("json-name", "blue")
+    assert table.lookup("other.json") == ("json", "blue")
+    assert table.lookup(".md") == ("md", "blue")
+    assert table.lookup("makefile") == ("default", "white")
@@ -94,3 +94,22 @@ def test_resolved_path_is_not_allowed_to_escape_destination(tmp_path: Path) -> N
     assert not ProcessContainer.is_resolved_path_within_directory(
         destination.as_posix(), (destination / "link" / "file.txt").as_posix()
     )
+
+
+def test_list_subdirectories_only_rescans_changed_folders(tmp_path: Path) -> None:
+    (tmp_path / "first").mkdir()
+    (tmp_path / "file.txt").write_text("")
+    folder = tmp_path.as_posix()
+    assert path_utils.get_cached_subdirectories(folder) is None
+
+    entries, changed = path_utils.list_subdirectories(folder)
+    assert changed
+    assert [entry.name for entry in entries] == ["first"]
+    assert path_utils.list_subdirectories(folder) == (entries, False)
+
+    (tmp_path / "second").mkdir()
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    entries, changed = path_utils.list_subdirectories(folder)
+    assert changed
+    assert sorted(entry.name for entry in entries) == ["first", "second"]
@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 import rovr.functions.pins as pins_module
+from rovr.functions.persistence import get_writer
 from rovr.functions.pins import add_pin, load_pins, remove_pin, toggle_pin
 from rovr.variables.maps import RovrVars
 
@@ -68,6 +69,7 @@ def test_add_pin_appears_in_pins_and_persisted(tmp_path: Path) -> None:
     add_pin("Project", target)
 
     assert any(p.get("path") == target for p in pins_module.pins["pins"])
+    get_writer().flush()
     saved = json.loads(Path(pins_module.PIN_PATH).read_text())
     assert any(p.get("name") == "Project" for p in saved["pins"])
 
@@ -0,0 +1,58 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from rovr.functions import reachability
+
+
+def test_check_paths_reports_each_kind_of_path(tmp_path: Path) -> None:
+    folder = tmp_path / "folder"
+    folder.mkdir()
+    file = tmp_path / "file.txt"
+    file.write_text("")
+    missing = tmp_path / "missing"
+    paths = [folder.as_posix(), file.as_posix(), missing.as_posix()]
+
+    assert reachability.known(paths) is None
+    statuses = reachability.check_paths(paths)
+
+    assert statuses == {
+        folder.as_posix(): "folder",
+        file.as_posix(): "file",
+        missing.as_posix(): "missing",
+    }
+    assert reachability.known(paths) == statuses
+
+
+def test_a_hanging_path_is_stale_without_holding_up_the_rest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hanging = (tmp_path / "nfs").as_posix()
+    fine = tmp_path.as_posix()
+    release = threading.Event()
+    probes: list[str] = []
+    real_probe = reachability.probe
+
+    def probe(path_str: str) -> reachability.PathStatus:
+        probes.append(path_str)
+        if path_str == hanging:
+            release.wait(10)
+            return "folder"
+        return real_probe(path_str)
+
+    monkeypatch.setattr(reachability, "probe", probe)
+    answered = threading.Event()
+
+    statuses = reachability.check_paths(
+        [hanging, fine], timeout=0.2, on_late_answer=answered.set
+    )
+    assert statuses == {hanging: "stale", fine: "folder"}
+
+    # still stuck, so it is not probed a second time
+    assert reachability.check_paths([hanging], timeout=0.05) == {hanging: "stale"}
+    assert probes.count(hanging) == 1
+
+    release.set()
+    assert answered.wait(5)
+    assert reachability.known([hanging]) == {hanging: "folder"}
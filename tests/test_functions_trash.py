@@ -0,0 +1,143 @@
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from pytrash import TrashEntry
+
+from rovr.app import Application
+from rovr.functions import trash
+
+from .conftest import iter_until
+
+
+class FakeRecycleBin:
+    def __init__(self, fail_once_after: int | None = None) -> None:
+        self.listed = 0
+        self.recycled: list[list[str]] = []
+        self.fail_once_after = fail_once_after
+
+    def entries(self) -> list[TrashEntry]:
+        self.listed += 1
+        return [TrashEntry("notes.txt", "/home/notes.txt", datetime.now())]
+
+    def recycle(self, items: list[str]) -> None:
+        self.recycled.append(items)
+        for index, item in enumerate(items):
+            if index == self.fail_once_after:
+                self.fail_once_after = None
+                raise OSError("device busy")
+            os.remove(item)
+
+
+@pytest.fixture
+def info_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    info_dir = tmp_path / "info"
+    info_dir.mkdir()
+    monkeypatch.setattr(trash, "metadata_dirs", lambda: [info_dir.as_posix()])
+    trash.invalidate()
+    return info_dir
+
+
+def test_listing_is_reused_until_the_trash_changes(info_dir: Path) -> None:
+    recycle_bin = FakeRecycleBin()
+    first = trash.list_entries(cast(Any, recycle_bin))
+    assert trash.list_entries(cast(Any, recycle_bin)) == first
+    assert recycle_bin.listed == 1
+
+    (info_dir / "other.txt.trashinfo").write_text("")
+    trash.list_entries(cast(Any, recycle_bin))
+    assert recycle_bin.listed == 2
+
+    trash.invalidate()
+    trash.list_entries(cast(Any, recycle_bin))
+    assert recycle_bin.listed == 3
+
+
+def test_missing_metadata_folders_are_left_out(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    existing = tmp_path / "info"
+    existing.mkdir()
+    monkeypatch.setattr(
+        trash,
+        "metadata_dirs",
+        lambda: [existing.as_posix(), (tmp_path / "missing").as_posix()],
+    )
+    assert [entry[0] for entry in trash.signature()] == [existing.as_posix()]
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"), reason="FreeDesktop.org trash only"
+)
+def test_home_trash_is_under_xdg_data_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_DATA_HOME", tmp_path.as_posix())
+    assert trash.metadata_dirs()[0] == (tmp_path / "Trash" / "info").as_posix()
+
+
+@pytest.mark.asyncio
+async def test_trash_files_recycles_in_batches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from rovr.footer import process_container
+    from rovr.footer.process_container import ProcessContainer
+
+    files = []
+    for index in range(trash.RECYCLE_BATCH_SIZE + 6):
+        file = tmp_path / f"{index}.txt"
+        file.write_text("")
+        files.append(file.as_posix())
+    # the first batch gives up halfway, so the rest of it is trashed one by one
+    recycle_bin = FakeRecycleBin(fail_once_after=10)
+    monkeypatch.setattr(process_container, "get_recycle_bin", lambda: recycle_bin)
+
+    app = Application(startup_path=tmp_path.as_posix())
+    async with app.run_test(size=(143, 37)):
+        worker = app.query_one(ProcessContainer).trash_files(files)
+        await worker.wait()
+
+    assert not any(os.path.lexists(file) for file in files)
+    assert [len(items) for items in recycle_bin.recycled] == [
+        trash.RECYCLE_BATCH_SIZE,
+        *[1] * (trash.RECYCLE_BATCH_SIZE - 10),
+        6,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_trash_screen_pages_in_entries_and_formats_them_lazily(
+    info_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from rovr.screens.trash import (
+        TRASH_PAGE_SIZE,
+        TrashScreen,
+        TrashSelection,
+        TrashSelectionList,
+    )
+
+    entries = [
+        TrashEntry(f"{index}.txt", f"/home/{index}.txt", datetime.now())
+        for index in range(TRASH_PAGE_SIZE * 2 + 1)
+    ]
+    recycle_bin = FakeRecycleBin()
+    monkeypatch.setattr(recycle_bin, "entries", lambda: entries)
+    monkeypatch.setattr(trash, "get_recycle_bin", lambda: recycle_bin)
+
+    app = Application(startup_path=info_dir.as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        screen = TrashScreen()
+        await app.push_screen(screen)
+        selection_list = screen.query_one(TrashSelectionList)
+        await iter_until(
+            pilot, lambda: selection_list.option_count == len(entries), timeout=5
+        )
+        last = selection_list.get_option_at_index(len(entries) - 1)
+        assert isinstance(last, TrashSelection)
+        assert last.entry is entries[-1]
+        # only the rows that were drawn have been formatted
+        assert last._prompt is None
+        assert selection_list.get_option_at_index(0)._prompt is not None
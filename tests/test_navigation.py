@@ -5,6 +5,7 @@ import pytest
 from textual import events
 
 from rovr.app import Application
+from rovr.classes.textual_options import FileListRows
 from rovr.components import SearchInput
 from rovr.functions.cwd import getcwd
 from rovr.header.tabs import TablineTab
@@ -251,9 +252,38 @@ async def test_tab_multiselection(tmp_path: Path) -> None:
 
         assert app.file_list.select_mode == "explicit"
         indexes = [0, 2, 4, 7]
-        for selected_id in app.file_list.selected:
-            assert app.file_list.get_option_index(selected_id) in indexes
-            indexes.remove(app.file_list.get_option_index(selected_id))
+        # the values of the rows are their indexes in the listing
+        for selected in app.file_list.selected:
+            assert selected in indexes
+            indexes.remove(selected)
+
+
+@pytest.mark.asyncio
+async def test_search_selection_does_not_follow_into_other_folders(
+    tmp_path: Path,
+) -> None:
+    for folder in ("a", "b"):
+        os.mkdir(tmp_path / folder)
+        for i in range(5):
+            open(tmp_path / folder / f"{folder}_file{i}", "w").close()
+
+    app = Application(startup_path=(tmp_path / "a").as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        await iter_until(pilot, lambda: len(app.file_list.options) == 5)
+        await app.file_list.toggle_mode()
+        app.file_list.select(app.file_list.get_option_at_index(2))
+        app.file_list.input.value = "file"
+        await workers_finished(pilot, app.file_list.input)
+        assert app.file_list.selected == [2]
+
+        app.cd((tmp_path / "b").as_posix())
+        await workers_finished(pilot, app.file_list)
+        await iter_until(pilot, lambda: getcwd() == (tmp_path / "b").as_posix())
+        app.file_list.input.value = "file"
+        await workers_finished(pilot, app.file_list.input)
+
+        # row 2 of the last folder is a different file here
+        assert app.file_list.selected == []
 
 
 @pytest.mark.asyncio
@@ -291,3 +321,90 @@ async def test_right_click_empty(tmp_path: Path) -> None:
             control=False,
             times=1,
         )
+
+
+@pytest.mark.asyncio
+async def test_large_folder_only_builds_visible_rows(tmp_path: Path) -> None:
+    for i in range(2000):
+        open(tmp_path / f"file{i:04}", "w").close()
+
+    app = Application(startup_path=tmp_path.as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        await iter_until(pilot, lambda: len(app.file_list.options) == 2000)
+        await pilot.pause()
+        rows = app.file_list.options
+        assert isinstance(rows, FileListRows)
+        assert len(rows.built()) < 100
+
+        app.file_list.action_last()
+        await pilot.pause()
+        last = app.file_list.highlighted_option
+        assert last is not None
+        assert last.dir_entry.name == "file1999"
+        assert last.id is not None
+        assert app.file_list.get_option_index(last.id) == 1999
+        assert app.file_list.virtual_size.height == 2000
+        assert len(rows.built()) < 200
+
+
+@pytest.mark.asyncio
+async def test_search_only_builds_matching_rows(tmp_path: Path) -> None:
+    for i in range(2000):
+        open(tmp_path / f"file{i:04}", "w").close()
+
+    app = Application(startup_path=tmp_path.as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        await iter_until(pilot, lambda: len(app.file_list.options) == 2000)
+        await pilot.pause()
+        rows = app.file_list.list_of_options
+        assert isinstance(rows, FileListRows)
+
+        visible = {index for index, _ in rows.built()}
+
+        app.file_list.input.value = "file199"
+        await iter_until(pilot, lambda: len(app.file_list.options) < 2000)
+        await workers_finished(pilot, app.file_list.input)
+
+        shown = {option.value for option in app.file_list.options}
+        assert set(range(1990, 2000)) <= shown
+        # only the rows that were already visible, and the matches
+        assert {index for index, _ in rows.built()} == visible | shown
+
+
+@pytest.mark.asyncio
+async def test_bulk_selection_does_not_build_rows(tmp_path: Path) -> None:
+    for i in range(2000):
+        open(tmp_path / f"file{i:04}", "w").close()
+
+    app = Application(startup_path=tmp_path.as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        await iter_until(pilot, lambda: len(app.file_list.options) == 2000)
+        await pilot.pause()
+        rows = app.file_list.options
+        assert isinstance(rows, FileListRows)
+        built = len(rows.built())
+
+        await app.file_list.action_toggle_all()
+        await pilot.pause()
+        assert len(app.file_list.selected) == 2000
+        await app.file_list.action_toggle_all()
+        assert app.file_list.selected == []
+
+        await app.file_list.select_range(1990, 1995)
+        await pilot.pause()
+        selected = await app.file_list.get_selected_objects()
+        assert selected == [
+            (tmp_path / f"file{i}").as_posix() for i in range(1990, 1996)
+        ]
+        assert len(rows.built()) == built
+
+        # restoring after a rebuild finds the rows by name, even if they moved
+        session = app.tabWidget.active_tab.session
+        open(tmp_path / "file0000a", "w").close()
+        worker = app.file_list.update_file_list(add_to_session=False)
+        await worker.wait()
+        app.file_list.update_from_session(
+            session,
+            {name: i for i, name in enumerate(sorted(os.listdir(tmp_path)))},
+        )
+        assert app.file_list.selected == list(range(1991, 1997))
@@ -1,8 +1,14 @@
+import os
 import sys
+from pathlib import Path
 
 import pytest
 
-from rovr.navigation_widgets.path_input import should_exclude_hidden
+from rovr.navigation_widgets.path_input import (
+    build_folder_candidates,
+    completion_folder,
+    should_exclude_hidden,
+)
 
 
 def test_should_exclude_hidden_empty() -> None:
@@ -45,3 +51,32 @@ def test_should_exclude_hidden_trailing_slashes_no_separator() -> None:
     """Path with trailing slashes but no final component still filters
     (same behaviour as the original implementation)."""
     assert should_exclude_hidden("/home/foo///")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses unix paths")
+def test_completion_folder() -> None:
+    assert completion_folder("/usr/li") == "/usr"
+    assert completion_folder("/usr/lib/") == "/usr/lib"
+    assert completion_folder("/usr/.") == "/usr"
+    assert completion_folder("/") == "/"
+    assert completion_folder("relative/path") is None
+    assert completion_folder("/usr/..") is None
+
+
+def test_build_folder_candidates_splits_hidden_folders(tmp_path: Path) -> None:
+    for name in ("beta", ".hidden", "Alpha"):
+        (tmp_path / name).mkdir()
+    entries = list(os.scandir(tmp_path))
+
+    candidates = build_folder_candidates(tmp_path.as_posix(), entries)
+
+    separator = "\\" if sys.platform == "win32" else "/"
+    assert [item.value for item in candidates.everything] == [
+        f".hidden{separator}",
+        f"Alpha{separator}",
+        f"beta{separator}",
+    ]
+    assert [item.value for item in candidates.visible] == [
+        f"Alpha{separator}",
+        f"beta{separator}",
+    ]
@@ -0,0 +1,68 @@
+import os
+import time
+from pathlib import Path
+
+from rovr.functions.persistence import CoalescingWriter
+
+
+def test_writes_to_one_file_are_coalesced(tmp_path: Path) -> None:
+    writer = CoalescingWriter(delay=60, max_delay=60)
+    target = (tmp_path / "state.toml").as_posix()
+    for i in range(5):
+        writer.replace(target, f"value = {i}\n")
+
+    assert not os.path.exists(target)
+    assert writer.has_pending(target)
+    writer.flush()
+    assert Path(target).read_text() == "value = 4\n"
+    assert writer.is_own_write(target)
+    assert not writer.has_pending(target)
+
+
+def test_appends_follow_a_pending_replace(tmp_path: Path) -> None:
+    writer = CoalescingWriter(delay=60, max_delay=60)
+    target = (tmp_path / "log.jsonl").as_posix()
+    writer.replace(target, "a\n")
+    writer.append(target, "b\n")
+    writer.flush(target)
+    writer.append(target, "c\n")
+    writer.append(target, "d\n")
+    writer.flush(target)
+
+    assert Path(target).read_text() == "a\nb\nc\nd\n"
+    assert writer.is_own_write(target)
+
+
+def test_background_thread_writes_after_the_delay(tmp_path: Path) -> None:
+    writer = CoalescingWriter(delay=0.05, max_delay=0.1)
+    target = tmp_path / "pins.json"
+    writer.replace(target.as_posix(), "{}")
+
+    for _ in range(100):
+        if target.exists():
+            break
+        time.sleep(0.02)
+    assert target.read_text() == "{}"
+
+
+def test_is_own_write_ignores_only_its_own_writes(tmp_path: Path) -> None:
+    writer = CoalescingWriter()
+    target = tmp_path / "pins.json"
+    writer.replace(target.as_posix(), "{}")
+    writer.flush()
+    assert writer.is_own_write(target.as_posix())
+
+    target.write_text('{"pins": []}')
+    assert not writer.is_own_write(target.as_posix())
+
+
+def test_failed_writes_are_reported(tmp_path: Path) -> None:
+    writer = CoalescingWriter()
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    errors: list[OSError] = []
+    writer.replace((blocker / "state.toml").as_posix(), "", on_error=errors.append)
+    writer.flush()
+
+    assert len(errors) == 1
+    assert not writer.is_own_write((blocker / "state.toml").as_posix())
@@ -0,0 +1,65 @@
+import threading
+
+from rovr.classes.poller import Poller, PollJob
+
+
+def test_due_jobs_run_cheapest_first() -> None:
+    poller = Poller()
+    ran: list[str] = []
+    poller.add("drives", lambda: ran.append("drives"), 1, "expensive", delay=0)
+    poller.add("theme", lambda: ran.append("theme"), 1, "moderate", delay=0)
+    poller.add("cwd", lambda: ran.append("cwd"), 1, delay=0)
+    poller.run(lambda: len(ran) == 3)
+    assert ran == ["cwd", "theme", "drives"]
+
+
+def test_backs_off_while_blurred_and_resets_on_focus() -> None:
+    poller = Poller()
+    cheap = poller.add("cwd", lambda: None, 1)
+    expensive = poller.add("drives", lambda: None, 1, "expensive")
+    poller.set_blurred(True)
+    for _ in range(10):
+        poller.run_job(cheap)
+        poller.run_job(expensive)
+    assert cheap.interval == 4
+    assert expensive.interval == 16
+
+    poller.set_blurred(False)
+    assert cheap.interval == expensive.interval == 1
+    assert cheap.next_run == expensive.next_run
+    poller.run_job(cheap)
+    assert cheap.interval == 1
+
+
+def test_errors_are_counted_and_reported() -> None:
+    failures: list[tuple[str, str]] = []
+
+    def fail() -> None:
+        raise OSError("gone")
+
+    poller = Poller(on_error=lambda job, exc: failures.append((job.name, str(exc))))
+    job = poller.add("pins", fail, 1)
+    poller.run_job(job)
+    poller.run_job(job)
+    assert failures == [("pins", "gone"), ("pins", "gone")]
+    metrics = poller.metrics()["pins"]
+    assert metrics["runs"] == 2
+    assert metrics["errors"] == 2
+    assert metrics["interval"] == 1
+
+
+def test_run_soon_and_stop_wake_the_poller() -> None:
+    poller = Poller()
+    ran = threading.Event()
+    poller.add("clipboard", ran.set, 60)
+    thread = threading.Thread(target=poller.run, daemon=True)
+    thread.start()
+    poller.run_soon("clipboard")
+    assert ran.wait(2)
+    poller.stop()
+    thread.join(2)
+    assert not thread.is_alive()
+
+
+def test_mean_duration_without_runs() -> None:
+    assert PollJob("idle", lambda: None, 1).mean_duration == 0.0
@@ -1,10 +1,17 @@
 import asyncio
+import zipfile
+from pathlib import Path
 
 import pytest
 from textual.app import App, ComposeResult
 
+from rovr.app import Application
+from rovr.classes.textual_options import ArchiveFileListSelection
+from rovr.core import FileList
 from rovr.core.preview_container import ExitNow, PreviewContainer, preview_token
 
+from .conftest import iter_until
+
 
 class PreviewTestApp(App[None]):
     def compose(self) -> ComposeResult:
@@ -30,3 +37,53 @@ async def test_call_from_thread_rejects_stale_preview() -> None:
         preview._active_preview_token = object()
         with pytest.raises(ExitNow):
             await asyncio.to_thread(call_with, current_token)
+
+
+def archive_rows(preview: PreviewContainer) -> list[str]:
+    return [
+        option.archive_path or ""
+        for file_list in preview.query(FileList)
+        for option in file_list.options
+        if isinstance(option, ArchiveFileListSelection)
+    ]
+
+
+async def test_archive_folders_open_from_the_keyboard(tmp_path: Path) -> None:
+    with zipfile.ZipFile(tmp_path / "archive.zip", "w") as archive:
+        archive.writestr("docs/guide/intro.txt", "hello")
+        archive.writestr("docs/readme.txt", "hello")
+        archive.writestr("top.txt", "hello")
+
+    app = Application(startup_path=tmp_path.as_posix())
+    async with app.run_test(size=(143, 37)) as pilot:
+        preview = app.query_one(PreviewContainer)
+        await iter_until(
+            pilot, lambda: archive_rows(preview) == ["docs", "top.txt"], timeout=10
+        )
+        await pilot.press("i")
+        file_list = preview.query_one(FileList)
+        assert app.focused is file_list
+
+        await pilot.press("down")
+        assert file_list.highlighted == 0
+        await pilot.press("enter")
+        assert archive_rows(preview) == [
+            "docs",
+            "docs/guide",
+            "docs/readme.txt",
+            "top.txt",
+        ]
+        # already open, so this steps into it
+        await pilot.press("right")
+        await pilot.press("right")
+        assert archive_rows(preview)[2] == "docs/guide/intro.txt"
+        await pilot.press("down", "down")
+        assert file_list.highlighted_option.archive_path == "docs/readme.txt"
+
+        # back to the folder it is in, then close it
+        await pilot.press("left")
+        assert file_list.highlighted == 0
+        await pilot.press("left")
+        assert archive_rows(preview) == ["docs", "top.txt"]
+        assert file_list.highlighted == 0
+        assert not file_list.selected
@@ -1,9 +1,16 @@
 from pathlib import Path
 
+import pytest
 from PIL import Image
+from rich.text import Text
 
+from rovr.functions import preview_utils
 from rovr.functions.preview_utils import (
     MAX_IMAGE_SIZE,
+    bat_cache_key,
+    cache_bat_output,
+    clear_bat_cache,
+    get_cached_bat_output,
     resample_batch_sync,
     resample_file_sync,
     resample_sync,
@@ -33,3 +40,45 @@ def test_resample_batch_sync_preserves_aspect_ratio() -> None:
         MAX_IMAGE_SIZE[0],
         MAX_IMAGE_SIZE[1] // 2,
     )
+
+
+def test_bat_cache_roundtrip_returns_copy() -> None:
+    clear_bat_cache()
+    key = bat_cache_key("file.py", 1.0, 20, "plain")
+    assert get_cached_bat_output(key) is None
+
+    cache_bat_output(key, Text("hello", style="bold"))
+    cached = get_cached_bat_output(key)
+    assert cached is not None
+    assert cached.plain == "hello"
+
+    cached.append(" world")
+    assert get_cached_bat_output(key).plain == "hello"
+
+
+def test_bat_cache_key_changes_with_mtime_and_height() -> None:
+    clear_bat_cache()
+    cache_bat_output(bat_cache_key("file.py", 1.0, 20, "plain"), Text("old"))
+
+    assert get_cached_bat_output(bat_cache_key("file.py", 2.0, 20, "plain")) is None
+    assert get_cached_bat_output(bat_cache_key("file.py", 1.0, 30, "plain")) is None
+    assert get_cached_bat_output(bat_cache_key("file.py", 1.0, 20, "numbers")) is None
+
+
+def test_bat_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clear_bat_cache()
+    monkeypatch.setattr(preview_utils, "BAT_CACHE_SIZE", 2)
+    first, second, third = (
+        bat_cache_key(name, 1.0, 20, "plain") for name in ("a", "b", "c")
+    )
+    cache_bat_output(first, Text("a"))
+    cache_bat_output(second, Text("b"))
+    # touch the first entry so the second becomes the oldest
+    assert get_cached_bat_output(first) is not None
+    cache_bat_output(third, Text("c"))
+
+    assert get_cached_bat_output(second) is None
+    assert get_cached_bat_output(first) is not None
+    assert get_cached_bat_output(third) is not None
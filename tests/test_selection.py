@@ -0,0 +1,60 @@
+import pytest
+
+from rovr.classes.selection import RowSelection, SelectionBits
+
+
+def test_selection_bits_add_and_discard() -> None:
+    bits = SelectionBits()
+    assert not bits
+    assert bits.add(3)
+    assert not bits.add(3)
+    assert bits.add(70)
+    assert list(bits) == [3, 70]
+    assert len(bits) == 2
+    assert 70 in bits and 4 not in bits and -1 not in bits
+    assert bits.discard(3)
+    assert not bits.discard(3)
+    assert list(bits) == [70]
+
+
+@pytest.mark.parametrize(
+    ("first", "last"),
+    [(0, 0), (2, 5), (3, 8), (5, 30), (0, 63), (9, 1000)],
+)
+def test_selection_bits_ranges(first: int, last: int) -> None:
+    bits = SelectionBits()
+    bits.add(1)
+    bits.set_range(first, last)
+    expected = {1, *range(first, last + 1)}
+    assert list(bits) == sorted(expected)
+
+    bits.invert_range(0, last + 3)
+    assert list(bits) == sorted(set(range(last + 4)) - expected)
+
+    bits.set_range(0, last + 3, selected=False)
+    assert not bits
+
+
+def test_selection_bits_copy_is_independent() -> None:
+    bits = SelectionBits()
+    bits.set_range(0, 9)
+    copy = bits.copy()
+    copy.discard(0)
+    assert copy != bits
+    assert len(bits) == 10 and len(copy) == 9
+
+
+def test_row_selection_acts_like_a_dict() -> None:
+    selected = RowSelection()
+    selected[4] = None
+    selected[""] = None
+    assert 4 in selected and "" in selected and 5 not in selected
+    assert list(selected) == [4, ""]
+    assert len(selected) == 2
+    del selected[4]
+    with pytest.raises(KeyError):
+        del selected[4]
+    with pytest.raises(KeyError):
+        selected[4]
+    selected.clear()
+    assert not selected
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from rovr.functions.folder_prefs import set_folder_pref
+from rovr.functions.folder_prefs import has_folder_pref, set_folder_pref
 from rovr.state_manager import StateManager
 
 
@@ -30,3 +30,23 @@ def test_toggle_custom_sort_adds_and_removes_folder_pref(tmp_path: Path) -> None
     manager.toggle_custom_sort()
     assert manager.custom_sort_enabled is False
     assert manager.get_sort_prefs(target_folder) == ("name", False)
+
+
+def test_subfolders_follow_a_recursive_custom_sort(tmp_path: Path) -> None:
+    parent = (tmp_path / "recursive-sort").as_posix()
+    child = (tmp_path / "recursive-sort" / "child").as_posix()
+    set_folder_pref(parent, "size", False)
+    manager = StateManager()
+    manager.apply_folder_sort_prefs(parent)
+    manager.toggle_custom_sort_recursive()
+
+    manager.apply_folder_sort_prefs(child)
+    assert manager.custom_sort_enabled is True
+    assert manager.custom_sort_recursive is True
+    assert manager.sort_by == "size"
+    assert manager.get_sort_prefs(child) == ("size", False)
+
+    # turning it off in a subfolder turns off the folder it was set on
+    manager.toggle_custom_sort()
+    assert manager.custom_sort_enabled is False
+    assert not has_folder_pref(parent)